@@ -1,32 +1,72 @@
+# 기동 리포트 (STARTUP_REPORT=true이면 이후 import 시간 측정을 위해 가장 먼저 import)
+from services import startup
+import importlib
 from flask import Flask, request
 from datetime import datetime
-from flask_restx import Api, Resource, fields
+from typing import Iterable, Optional
+from flask_restx import Api, Namespace, Resource, fields
 from config import Config
 from extensions import db, migrate, bcrypt, jwt, cors
 from models import User
-from blueprints.auth import auth_ns
-from blueprints.market_diagnosis import market_diagnosis_bp
-from blueprints.industry_analysis import industry_analysis_bp
-from blueprints.regional_analysis import regional_analysis_bp
-from blueprints.scoring import scoring_bp
-from blueprints.recommendations import recommendations_bp
-from blueprints.core_diagnosis import core_diagnosis_ns
-from blueprints.risk_classification import risk_classification_bp
-from blueprints.strategy_cards import strategy_cards_bp
-from blueprints.support_tools import support_tools_bp
-from blueprints.map_visualization import map_visualization_bp
+from services import api_spec, db_engine, metrics, password_hashing, profiling, query_counter, timing
 
-def create_app(config_object: type = Config) -> Flask:
+# 등록 가능한 API 컴포넌트: 이름 -> (모듈, 객체 이름, URL prefix)
+# Namespace는 api.add_namespace, Blueprint는 app.register_blueprint로 등록 (등록 순서 유지)
+COMPONENTS = {
+    "auth": ("blueprints.auth", "auth_ns", "/sodam/auth"),
+    "market_diagnosis": ("blueprints.market_diagnosis", "market_diagnosis_bp", "/api/v1/market-diagnosis"),
+    "industry_analysis": ("blueprints.industry_analysis", "industry_analysis_bp", "/api/v1/industry-analysis"),
+    "regional_analysis": ("blueprints.regional_analysis", "regional_analysis_bp", "/api/v1/regional-analysis"),
+    "scoring": ("blueprints.scoring", "scoring_bp", "/api/v1/scoring"),
+    "recommendations": ("blueprints.recommendations", "recommendations_bp", "/api/v1/recommendations"),
+    "core_diagnosis": ("blueprints.core_diagnosis", "core_diagnosis_ns", "/sodam/core-diagnosis"),
+    "risk_classification": ("blueprints.risk_classification", "risk_classification_bp", "/api/v1/risk-classification"),
+    "strategy_cards": ("blueprints.strategy_cards", "strategy_cards_bp", "/api/v1/strategy-cards"),
+    "support_tools": ("blueprints.support_tools", "support_tools_bp", "/api/v1/support-tools"),
+    "map_visualization": ("blueprints.map_visualization", "map_visualization_bp", "/api/v1/map-visualization"),
+    "admin": ("blueprints.admin", "admin_bp", "/api/v1/admin"),
+}
+
+# APP_ROLE별 등록 컴포넌트
+# auth: 로그인/회원가입 전용 티어 (pandas/numpy와 분석 서비스를 불러오지 않아 빠르게 기동)
+ROLES = {
+    "full": tuple(COMPONENTS),
+    "auth": ("auth", "admin"),
+}
+
+# 데이터셋/분석 서비스가 필요 없는 컴포넌트
+LIGHTWEIGHT_COMPONENTS = {"auth", "admin"}
+
+def create_app(config_object: type = Config, components: Optional[Iterable[str]] = None) -> Flask:
+    """
+    애플리케이션 팩토리
+    components를 지정하지 않으면 APP_ROLE 설정(기본 full)에 해당하는 컴포넌트를 등록한다.
+    """
+    startup.begin()
     app = Flask(__name__)
     app.config.from_object(config_object)
 
-    # Extensions 초기화
+    if components is None:
+        role = app.config.get("APP_ROLE", "full")
+        if role not in ROLES:
+            raise ValueError(f"알 수 없는 APP_ROLE: {role} (가능한 값: {', '.join(ROLES)})")
+        components = ROLES[role]
+    components = [name for name in COMPONENTS if name in set(components)]
+    # 분석 API가 하나라도 있으면 결과 캐시/공유 배열/데이터셋 사전 로드 사용
+    analytics = any(name not in LIGHTWEIGHT_COMPONENTS for name in components)
+
+    # Extensions 초기화 (DB 엔진 프로파일: 엔진 옵션은 생성 전, SQLite PRAGMA는 생성 후 등록)
+    db_engine.configure(app)
     db.init_app(app)
+    db_engine.init_app(app)
     migrate.init_app(app, db)
     bcrypt.init_app(app)
     jwt.init_app(app)
     
-    # Flask-RESTX API 설정
+    startup.checkpoint("extensions")
+    
+    # Flask-RESTX API 설정 (SWAGGER_MODE=off이면 문서 경로를 등록하지 않음)
+    swagger_enabled = app.config.get("SWAGGER_MODE", "live") != "off"
     api = Api(
         app,
         version='1.0',
@@ -70,7 +110,7 @@ def create_app(config_object: type = Config) -> Flask:
         - 식음료업, 쇼핑업, 숙박업, 여가서비스업, 운송업
         - 의료업, 교육업, 문화업, 스포츠업, 기타서비스업
         ''',
-        doc='/docs/',  # Swagger UI 경로
+        doc='/docs/' if swagger_enabled else False,  # Swagger UI 경로
         prefix='/api/v1',
         catch_all_404s=True,  # 404 에러를 API에서 처리
         contact='SODAM Development Team',
@@ -79,6 +119,55 @@ def create_app(config_object: type = Config) -> Flask:
         license_url='https://opensource.org/licenses/MIT'
     )
     
+    # 요청 단위 단계별 시간 측정 (Server-Timing 헤더)
+    timing.init_app(app, api)
+    
+    # 엔드포인트별 요청/에러/응답 시간 메트릭
+    metrics.init_app(app)
+    
+    # 요청별 DB 쿼리 수 (엔드포인트 상한 초과 시 경고, 테스트에서는 예외)
+    query_counter.init_app(app)
+    
+    # 서비스 결과 캐시 (single-flight)
+    if analytics:
+        from services import result_cache, shared_arrays, shared_cache
+        result_cache.init_app(app)
+        shared_cache.init_app(app)
+        shared_arrays.init_app(app)
+        
+        # 유동인구/매출 집계 테이블 증분 갱신 + flask rollups CLI
+        from services import rollups
+        rollups.init_app(app)
+        
+        # 유동인구/매출 CSV 일괄 적재 (flask ingest CLI)
+        from services import bulk_ingest
+        bulk_ingest.init_app(app)
+        
+        # 리스크 분류 결과 저장소 (백그라운드 재분류 + flask risk CLI)
+        from services import risk_store
+        risk_store.init_app(app)
+        
+        # 지원 정책 카탈로그 (flask policies CLI)
+        from services import policy_catalog
+        policy_catalog.init_app(app)
+        
+        # 사업체 위치 공간 인덱스 (business_data 생성 시 R*Tree/트리거 함께 생성)
+        from services import spatial_index  # noqa: F401
+        
+        # 경쟁 사업체 밀도 (business_data 기반 상권 x 업종 밀도 표)
+        from services import competitor_density
+        competitor_density.init_app(app)
+        
+        # 사업체 생존/폐업 분석 (business_data 개업일/폐업일 기반 Kaplan-Meier)
+        from services import business_survival
+        business_survival.init_app(app)
+    
+    # 온디맨드 요청 프로파일링 (cProfile + 스택 샘플링)
+    profiling.init_app(app)
+    
+    # 비밀번호 해싱 풀 (bcrypt 비용, 동시 처리 한도)
+    password_hashing.init_app(app)
+    
     # CORS 설정
     cors.init_app(app, resources={
         r"/*": {
@@ -98,6 +187,13 @@ def create_app(config_object: type = Config) -> Flask:
         response.headers.add('Access-Control-Allow-Credentials', 'true')
         return response
 
+    # 첫 요청 시점 기록 (기동 리포트)
+    @app.before_request
+    def mark_first_request():
+        startup.mark("first_request")
+
+    startup.checkpoint("api_and_hooks")
+
     # 기본 엔드포인트들 (Flask-RESTX와 충돌 방지)
     @app.route('/health')
     def health_check():
@@ -106,6 +202,10 @@ def create_app(config_object: type = Config) -> Flask:
     # Swagger 네임스페이스 정의
     ns = api.namespace('sodam', description='SODAM API operations')
     
+    # 상권/진단 경로는 분석 API가 있는 역할에서만 등록 (auth 티어에서는 404)
+    def analytics_route(*args, **kwargs):
+        return ns.route(*args, **kwargs) if analytics else (lambda resource: resource)
+    
     # Swagger 모델 정의
     market_model = api.model('Market', {
         'id': fields.Integer(required=True, description='상권 ID'),
@@ -137,7 +237,7 @@ def create_app(config_object: type = Config) -> Flask:
                 ]
             }, 200
     
-    @ns.route('/markets')
+    @analytics_route('/markets')
     class MarketList(Resource):
         @ns.doc('get_markets')
         @ns.marshal_list_with(market_model)
@@ -162,7 +262,7 @@ def create_app(config_object: type = Config) -> Flask:
                 'status': 'success'
             }, 200
     
-    @ns.route('/test-real-apis')
+    @analytics_route('/test-real-apis')
     class TestRealAPIs(Resource):
         @ns.doc('test_real_apis')
         def get(self):
@@ -463,8 +563,16 @@ def create_app(config_object: type = Config) -> Flask:
             try:
                 # 사용자 찾기
                 user = User.query.filter_by(username=username).first()
-                if not user or not bcrypt.check_password_hash(user.password_hash, password):
+                if not user or not password_hashing.check_password(user.password_hash, password):
                     return {'message': 'Invalid username or password'}, 401
+
+                # 해시 비용 설정이 바뀌었으면 로그인 성공 시 새 비용으로 다시 저장
+                if password_hashing.needs_rehash(user.password_hash):
+                    try:
+                        user.password_hash = password_hashing.hash_password(password)
+                        db.session.commit()
+                    except password_hashing.HashingBusyError:
+                        db.session.rollback()
                 
                 # JWT 토큰 생성 (간단한 더미 토큰)
                 from flask_jwt_extended import create_access_token
@@ -481,6 +589,8 @@ def create_app(config_object: type = Config) -> Flask:
                     }
                 }, 200
                 
+            except password_hashing.HashingBusyError as e:
+                return {'message': str(e)}, 503, {'Retry-After': '1'}
             except Exception as e:
                 return {'message': str(e)}, 500
     
@@ -512,7 +622,7 @@ def create_app(config_object: type = Config) -> Flask:
                     return {'message': 'Email already exists'}, 409
                 
                 # 비밀번호 해싱
-                pw_hash = bcrypt.generate_password_hash(password).decode()
+                pw_hash = password_hashing.hash_password(password)
                 
                 # 사용자 생성
                 user = User(
@@ -536,12 +646,14 @@ def create_app(config_object: type = Config) -> Flask:
                     }
                 }, 201
                 
+            except password_hashing.HashingBusyError as e:
+                return {'message': str(e)}, 503, {'Retry-After': '1'}
             except Exception as e:
                 db.session.rollback()
                 return {'message': str(e)}, 500
     
     # 상권 진단 API
-    @ns.route('/market-diagnosis/markets')
+    @analytics_route('/market-diagnosis/markets')
     class MarketDiagnosisMarkets(Resource):
         @ns.doc('market_diagnosis_markets')
         def get(self):
@@ -561,7 +673,7 @@ def create_app(config_object: type = Config) -> Flask:
             except Exception as e:
                 return {'message': str(e)}, 500
     
-    @ns.route('/market-diagnosis/markets/<string:market_code>')
+    @analytics_route('/market-diagnosis/markets/<string:market_code>')
     class MarketDiagnosisMarketDetail(Resource):
         @ns.doc('market_diagnosis_market_detail')
         def get(self, market_code):
@@ -582,7 +694,7 @@ def create_app(config_object: type = Config) -> Flask:
                 return {'message': str(e)}, 500
     
     # 핵심 진단 API
-    @ns.route('/core-diagnosis/foot-traffic/<string:market_code>')
+    @analytics_route('/core-diagnosis/foot-traffic/<string:market_code>')
     class CoreDiagnosisFootTraffic(Resource):
         @ns.doc('core_diagnosis_foot_traffic')
         def get(self, market_code):
@@ -606,7 +718,7 @@ def create_app(config_object: type = Config) -> Flask:
             except Exception as e:
                 return {'message': str(e)}, 500
     
-    @ns.route('/core-diagnosis/card-sales/<string:market_code>')
+    @analytics_route('/core-diagnosis/card-sales/<string:market_code>')
     class CoreDiagnosisCardSales(Resource):
         @ns.doc('core_diagnosis_card_sales')
         def get(self, market_code):
@@ -630,7 +742,7 @@ def create_app(config_object: type = Config) -> Flask:
             except Exception as e:
                 return {'message': str(e)}, 500
     
-    @ns.route('/core-diagnosis/same-industry/<string:market_code>')
+    @analytics_route('/core-diagnosis/same-industry/<string:market_code>')
     class CoreDiagnosisSameIndustry(Resource):
         @ns.doc('core_diagnosis_same_industry')
         def get(self, market_code):
@@ -654,7 +766,7 @@ def create_app(config_object: type = Config) -> Flask:
             except Exception as e:
                 return {'message': str(e)}, 500
     
-    @ns.route('/core-diagnosis/business-rates/<string:market_code>')
+    @analytics_route('/core-diagnosis/business-rates/<string:market_code>')
     class CoreDiagnosisBusinessRates(Resource):
         @ns.doc('core_diagnosis_business_rates')
         def get(self, market_code):
@@ -678,7 +790,7 @@ def create_app(config_object: type = Config) -> Flask:
             except Exception as e:
                 return {'message': str(e)}, 500
     
-    @ns.route('/core-diagnosis/dwell-time/<string:market_code>')
+    @analytics_route('/core-diagnosis/dwell-time/<string:market_code>')
     class CoreDiagnosisDwellTime(Resource):
         @ns.doc('core_diagnosis_dwell_time')
         def get(self, market_code):
@@ -702,7 +814,7 @@ def create_app(config_object: type = Config) -> Flask:
             except Exception as e:
                 return {'message': str(e)}, 500
     
-    @ns.route('/core-diagnosis/health-score/<string:market_code>')
+    @analytics_route('/core-diagnosis/health-score/<string:market_code>')
     class CoreDiagnosisHealthScore(Resource):
         @ns.doc('core_diagnosis_health_score')
         def get(self, market_code):
@@ -769,7 +881,7 @@ def create_app(config_object: type = Config) -> Flask:
             except Exception as e:
                 return {'message': str(e)}, 500
     
-    @ns.route('/core-diagnosis/comprehensive/<string:market_code>')
+    @analytics_route('/core-diagnosis/comprehensive/<string:market_code>')
     class CoreDiagnosisComprehensive(Resource):
         @ns.doc('core_diagnosis_comprehensive')
         def post(self, market_code):
@@ -840,17 +952,31 @@ def create_app(config_object: type = Config) -> Flask:
             except Exception as e:
                 return {'message': str(e)}, 500
 
-    # Blueprints 등록
-    api.add_namespace(auth_ns, path="/sodam/auth")
-    app.register_blueprint(market_diagnosis_bp, url_prefix="/api/v1/market-diagnosis")
-    app.register_blueprint(industry_analysis_bp, url_prefix="/api/v1/industry-analysis")
-    app.register_blueprint(regional_analysis_bp, url_prefix="/api/v1/regional-analysis")
-    app.register_blueprint(scoring_bp, url_prefix="/api/v1/scoring")
-    app.register_blueprint(recommendations_bp, url_prefix="/api/v1/recommendations")
-    api.add_namespace(core_diagnosis_ns, path="/sodam/core-diagnosis")
-    app.register_blueprint(risk_classification_bp, url_prefix="/api/v1/risk-classification")
-    app.register_blueprint(strategy_cards_bp, url_prefix="/api/v1/strategy-cards")
-    app.register_blueprint(support_tools_bp, url_prefix="/api/v1/support-tools")
-    app.register_blueprint(map_visualization_bp, url_prefix="/api/v1/map-visualization")
+    startup.checkpoint("routes")
+
+    # Blueprints 등록 (서비스 모듈은 블루프린트에서 첫 사용 시 import 됨)
+    for name in components:
+        module, attribute, url_prefix = COMPONENTS[name]
+        component = getattr(importlib.import_module(module), attribute)
+        if isinstance(component, Namespace):
+            api.add_namespace(component, path=url_prefix)
+        else:
+            app.register_blueprint(component, url_prefix=url_prefix)
+    app.config["REGISTERED_COMPONENTS"] = components
+    
+    # Swagger 스펙 사전 생성 (SWAGGER_MODE=static)
+    api_spec.init_app(app, api)
+    startup.checkpoint("components")
+    
+    # 데이터셋 사전 로드 (pre-fork 운영 서버에서는 워커 fork 전에 마스터에서 실행됨)
+    if analytics and app.config.get("PRELOAD_DATASETS"):
+        from services.data_loader import DataLoader
+        from services.lazy import instantiate_all
+        row_counts = DataLoader().preload()
+        instantiate_all()
+        app.logger.info(f"데이터셋 사전 로드 완료: {row_counts}")
+        startup.checkpoint("preload")
     
+    startup.mark("ready")
+    app.logger.info(startup.summary())
     return app
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+벤치마크 케이스 정의
+서비스별 공개 메서드 호출을 (이름, 서비스 생성 함수, 호출 함수) 형태로 정의한다.
+서비스는 SODAM_DATA_DIR 환경 변수가 가리키는 데이터 디렉터리의 DataLoader를 사용한다.
+DB 경로(집계 테이블, 경쟁 밀도, 생존 통계) 케이스는 run.py가 만든 앱 컨텍스트와 DB에서 실행된다.
+"""
+from datetime import date
+from typing import Any, Callable, List, NamedTuple
+
+from services import business_survival, commercial_areas, competitor_density
+from services.analytics_query_service import AnalyticsQueryService
+from services.core_diagnosis_service import CoreDiagnosisService
+from services.data_loader import DataLoader
+from services.map_visualization_service import MapVisualizationService
+from services.recommendation_service import RecommendationService
+from services.risk_analysis_service import RiskAnalysisService
+from services.scoring_service import ScoringService
+from services.strategy_card_service import StrategyCardService
+from services.support_tools_service import SupportToolsService
+
+MARKET_CODE = "DJ001"
+INDUSTRY = "식음료업"
+REGION = "대전광역시"
+DISTRICT = "유성구"
+# run.py 합성 DB의 마지막 달
+PERIOD = (date(2024, 12, 1), date(2024, 12, 31))
+
+USER_PROFILE = {
+    "userType": "ENTREPRENEUR",
+    "businessStage": "PLANNING",
+    "capital": 50000000,
+    "experience": "beginner",
+    "riskType": "유입 저조형",
+    "preferredAreas": [REGION],
+    "interestedBusinessTypes": [INDUSTRY],
+    "preferences": {
+        "interestedBusinessTypes": [INDUSTRY],
+        "preferredAreas": [REGION]
+    }
+}
+
+class Case(NamedTuple):
+    name: str
+    factory: Callable[[], Any]
+    call: Callable[[Any], Any]
+
+CASES: List[Case] = [
+    # DataLoader
+    Case("DataLoader.load_market_data", DataLoader, lambda s: s.load_market_data()),
+    Case("DataLoader.load_tourism_consumption", DataLoader, lambda s: s.load_tourism_consumption()),
+    Case("DataLoader.load_industry_expenditure", DataLoader, lambda s: s.load_industry_expenditure()),
+    Case("DataLoader.load_regional_expenditure", DataLoader, lambda s: s.load_regional_expenditure()),
+    Case("DataLoader.load_regional_population", DataLoader, lambda s: s.load_regional_population()),
+    Case("DataLoader.dataset_version", DataLoader, lambda s: s.dataset_version()),
+    Case("DataLoader.preload", DataLoader, lambda s: s.preload()),
+    Case("DataLoader.get_market_by_code", DataLoader, lambda s: s.get_market_by_code(MARKET_CODE)),
+    Case("DataLoader.get_markets_by_district", DataLoader, lambda s: s.get_markets_by_district(DISTRICT)),
+    Case("DataLoader.get_tourism_trend", DataLoader, lambda s: s.get_tourism_trend(REGION)),
+    Case("DataLoader.get_tourism_trend_by_industry", DataLoader, lambda s: s.get_tourism_trend_by_industry(REGION, INDUSTRY)),
+    Case("DataLoader.get_industry_ratios", DataLoader, lambda s: s.get_industry_ratios()),
+    Case("DataLoader.get_industry_ratio_by_category", DataLoader, lambda s: s.get_industry_ratio_by_category(INDUSTRY, "식음료")),
+    Case("DataLoader.get_regional_ratios", DataLoader, lambda s: s.get_regional_ratios()),
+    Case("DataLoader.get_regional_ratio_by_region", DataLoader, lambda s: s.get_regional_ratio_by_region(DISTRICT)),
+    Case("DataLoader.get_district_population", DataLoader, lambda s: s.get_district_population()),
+
+    # AnalyticsQueryService (월별은 집계 테이블, 기간/시간대별은 원본 테이블)
+    Case("AnalyticsQueryService.monthly_foot_traffic", AnalyticsQueryService, lambda s: s.monthly_foot_traffic(s.get_area_id(MARKET_CODE))),
+    Case("AnalyticsQueryService.monthly_sales", AnalyticsQueryService, lambda s: s.monthly_sales(s.get_area_id(MARKET_CODE), INDUSTRY)),
+    Case("AnalyticsQueryService.foot_traffic_by_hour", AnalyticsQueryService, lambda s: s.foot_traffic_by_hour(s.get_area_id(MARKET_CODE), *PERIOD)),
+    Case("AnalyticsQueryService.sales_by_business_type", AnalyticsQueryService, lambda s: s.sales_by_business_type(s.get_area_id(MARKET_CODE), *PERIOD)),
+    Case("commercial_areas.area_analytics", lambda: commercial_areas, lambda m: m.area_analytics(MARKET_CODE)),
+
+    # 경쟁 밀도 / 생존 통계 (cold는 business_data 전체로 표를 새로 계산, warm은 계산된 표 조회)
+    Case("competitor_density.market_competition", lambda: competitor_density, lambda m: m.market_competition(MARKET_CODE, INDUSTRY)),
+    Case("business_survival.group", lambda: business_survival, lambda m: m.group(MARKET_CODE, INDUSTRY)),
+
+    # CoreDiagnosisService
+    Case("CoreDiagnosisService.get_foot_traffic_analysis", CoreDiagnosisService, lambda s: s.get_foot_traffic_analysis(MARKET_CODE, INDUSTRY)),
+    Case("CoreDiagnosisService.get_card_sales_analysis", CoreDiagnosisService, lambda s: s.get_card_sales_analysis(MARKET_CODE, INDUSTRY)),
+    Case("CoreDiagnosisService.get_same_industry_analysis", CoreDiagnosisService, lambda s: s.get_same_industry_analysis(MARKET_CODE, INDUSTRY)),
+    Case("CoreDiagnosisService.get_business_rates_analysis", CoreDiagnosisService, lambda s: s.get_business_rates_analysis(MARKET_CODE)),
+    Case("CoreDiagnosisService.get_dwell_time_analysis", CoreDiagnosisService, lambda s: s.get_dwell_time_analysis(MARKET_CODE)),
+    Case("CoreDiagnosisService.calculate_health_score", CoreDiagnosisService, lambda s: s.calculate_health_score(MARKET_CODE, INDUSTRY, INDUSTRY, "식음료")),
+
+    # ScoringService
+    Case("ScoringService.calculate_market_score", ScoringService, lambda s: s.calculate_market_score(MARKET_CODE, INDUSTRY, DISTRICT)),
+
+    # RiskAnalysisService
+    Case("RiskAnalysisService.classify_risk_type", RiskAnalysisService, lambda s: s.classify_risk_type(MARKET_CODE, INDUSTRY)),
+    Case("RiskAnalysisService.get_detailed_risk_analysis", RiskAnalysisService, lambda s: s.get_detailed_risk_analysis(MARKET_CODE, "유입 저조형", INDUSTRY)),
+
+    # RecommendationService
+    Case("RecommendationService.get_personalized_recommendations", RecommendationService, lambda s: s.get_personalized_recommendations(USER_PROFILE)),
+
+    # StrategyCardService
+    Case("StrategyCardService.generate_strategy_cards", StrategyCardService, lambda s: s.generate_strategy_cards(MARKET_CODE, INDUSTRY, "유입 저조형", USER_PROFILE)),
+    Case("StrategyCardService.get_strategy_checklist", StrategyCardService, lambda s: s.get_strategy_checklist("marketing_boost")),
+    Case("StrategyCardService.get_success_cases", StrategyCardService, lambda s: s.get_success_cases(INDUSTRY)),
+
+    # SupportToolsService
+    Case("SupportToolsService.get_support_centers", SupportToolsService, lambda s: s.get_support_centers(REGION)),
+    Case("SupportToolsService.get_expert_consultation", SupportToolsService, lambda s: s.get_expert_consultation(REGION)),
+    Case("SupportToolsService.get_policy_recommendations", SupportToolsService, lambda s: s.get_policy_recommendations(USER_PROFILE)),
+    Case("SupportToolsService.get_success_cases_browse", SupportToolsService, lambda s: s.get_success_cases_browse(INDUSTRY, REGION)),
+
+    # MapVisualizationService
+    Case("MapVisualizationService.get_market_heatmap_data", MapVisualizationService, lambda s: s.get_market_heatmap_data(REGION)),
+    Case("MapVisualizationService.get_radius_analysis", MapVisualizationService, lambda s: s.get_radius_analysis(36.35, 127.38, 2.0)),
+    Case("MapVisualizationService.get_market_cluster_analysis", MapVisualizationService, lambda s: s.get_market_cluster_analysis(REGION)),
+    Case("MapVisualizationService.get_traffic_flow_analysis", MapVisualizationService, lambda s: s.get_traffic_flow_analysis(MARKET_CODE)),
+    Case("MapVisualizationService.get_accessibility_analysis", MapVisualizationService, lambda s: s.get_accessibility_analysis(MARKET_CODE)),
+]
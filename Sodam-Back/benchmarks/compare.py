@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+벤치마크 결과 비교 스크립트
+저장된 기준 결과(baseline)와 현재 결과의 중앙값을 비교하여 성능 저하를 표시한다.
+저하가 하나라도 있으면 종료 코드 1을 반환한다.
+
+사용법:
+    python benchmarks/compare.py benchmarks/results/latest.json
+    python benchmarks/compare.py current.json --baseline old.json --threshold 0.15
+"""
+import argparse
+import json
+import os
+import sys
+from typing import Any, Dict, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(BENCH_DIR, 'results', 'baseline.json')
+
+def load(path: str) -> Dict[str, Any]:
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float, min_delta_ms: float,
+            metric: str = 'median_ms') -> List[Dict[str, Any]]:
+    """케이스/모드별 비교 행 목록"""
+    rows = []
+    for name, modes in current["results"].items():
+        for mode, stats in modes.items():
+            if not isinstance(stats, dict):
+                continue
+            base_stats = baseline["results"].get(name, {}).get(mode)
+            if base_stats is None:
+                rows.append({"name": name, "mode": mode, "status": "new", "current": stats[metric]})
+                continue
+
+            base_value = base_stats[metric]
+            value = stats[metric]
+            delta = value - base_value
+            ratio = delta / base_value if base_value > 0 else 0.0
+
+            status = "ok"
+            if delta > min_delta_ms and ratio > threshold:
+                status = "regression"
+            elif -delta > min_delta_ms and -ratio > threshold:
+                status = "improved"
+
+            rows.append({
+                "name": name, "mode": mode, "status": status,
+                "baseline": base_value, "current": value, "change": ratio
+            })
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크 결과 비교")
+    parser.add_argument('current', help="현재 결과 JSON")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="기준 결과 JSON (기본: benchmarks/results/baseline.json)")
+    parser.add_argument('--threshold', type=float, default=0.10, help="저하로 판단할 변화율 (기본 0.10 = 10%%)")
+    parser.add_argument('--min-delta-ms', type=float, default=0.05, help="무시할 절대 변화량 (밀리초)")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.baseline):
+        print(f"기준 결과가 없습니다: {args.baseline} (run.py --save-baseline 으로 생성)")
+        sys.exit(2)
+
+    rows = compare(load(args.baseline), load(args.current), args.threshold, args.min_delta_ms)
+
+    markers = {"regression": "▲ 저하", "improved": "▼ 개선", "ok": "", "new": "신규"}
+    for row in rows:
+        if row["status"] == "new":
+            print(f"{row['name']:<58} {row['mode']:<5} {'-':>10} -> {row['current']:>10.3f}ms  {markers['new']}")
+            continue
+        print(f"{row['name']:<58} {row['mode']:<5} {row['baseline']:>10.3f} -> {row['current']:>10.3f}ms "
+              f"{row['change'] * 100:>+7.1f}%  {markers[row['status']]}")
+
+    regressions = [row for row in rows if row["status"] == "regression"]
+    print(f"\n저하 {len(regressions)}건 / 비교 {len(rows)}건 (기준: 중앙값 {args.threshold * 100:.0f}% 이상 증가)")
+    sys.exit(1 if regressions else 0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+경쟁 사업체 밀도 계산 벤치마크
+
+대전 일대에 합성 상권 경계(다각형) M개와 사업체 N개를 만들고 상권 x 업종 사업체 수를 계산한다.
+- vectorized: services.competitor_density.count_by_market (전체 상권을 배열 연산 한 번으로)
+- per-market: 상권마다 전체 사업체 배열에 경계 상자/반직선 교차 판정 (기준선, --baseline-markets 개만)
+두 방식의 결과가 같은지 확인한다. DB 조회 시간은 포함하지 않는다.
+
+사용법:
+    python benchmarks/competition.py --markets 2000 --stores 1000000
+    python benchmarks/competition.py --markets 500 --stores 200000 --output benchmarks/results/competition.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Dict
+
+import numpy as np
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(BENCH_DIR))
+
+from spatial import BUSINESS_TYPES, LAT_RANGE, LNG_RANGE  # noqa: E402
+
+def synthetic_markets(count: int, rng: np.random.Generator):
+    """중심 주변 반경 150~600m 꼭짓점 6~16개 다각형"""
+    from services.competitor_density import Geometry
+
+    parts = []
+    for _ in range(count):
+        center_lng, center_lat = rng.uniform(LNG_RANGE[0], LNG_RANGE[1]), rng.uniform(LAT_RANGE[0], LAT_RANGE[1])
+        vertex_count = int(rng.integers(6, 17))
+        angles = np.sort(rng.uniform(0, 2 * np.pi, vertex_count))
+        radii = rng.uniform(150, 600, vertex_count) / 111320
+        parts.append(np.c_[center_lng + radii * np.cos(angles) / np.cos(np.radians(center_lat)),
+                           center_lat + radii * np.sin(angles)])
+    offsets = np.zeros(count + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(part) for part in parts])
+    return Geometry(codes=[f"BM{index:05d}" for index in range(count)], districts=[None] * count,
+                    offsets=offsets, points=np.concatenate(parts), centers=np.zeros((0, 2)), radii=np.zeros(0))
+
+def per_market(lats, lngs, type_codes, type_count, geometry, limit: int) -> np.ndarray:
+    """기준선: 상권마다 전체 사업체 배열을 거름"""
+    counts = np.zeros((limit, type_count), dtype=np.int64)
+    for market in range(limit):
+        polygon = geometry.points[geometry.offsets[market]:geometry.offsets[market + 1]]
+        x1, y1 = polygon[:, 0], polygon[:, 1]
+        x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+        candidate = ((lats >= y1.min()) & (lats <= y1.max()) & (lngs >= x1.min()) & (lngs <= x1.max())).nonzero()[0]
+        inside = np.zeros(len(candidate), dtype=bool)
+        x, y = lngs[candidate], lats[candidate]
+        for edge in range(len(polygon)):
+            with np.errstate(divide="ignore", invalid="ignore"):
+                inside ^= ((y1[edge] > y) != (y2[edge] > y)) & (x < (x2[edge] - x1[edge]) * (y - y1[edge]) / (y2[edge] - y1[edge]) + x1[edge])
+        counts[market] = np.bincount(type_codes[candidate[inside]], minlength=type_count)
+    return counts
+
+def main():
+    parser = argparse.ArgumentParser(description="경쟁 사업체 밀도 계산 벤치마크")
+    parser.add_argument('--markets', type=int, default=2000, help="상권 수")
+    parser.add_argument('--stores', type=int, default=1_000_000, help="영업 중 사업체 수")
+    parser.add_argument('--baseline-markets', type=int, default=200, help="기준선으로 계산할 상권 수 (0이면 생략)")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=48)
+    parser.add_argument('--output', default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    from services.competitor_density import count_by_market, polygon_area_km2
+
+    rng = np.random.default_rng(args.seed)
+    geometry = synthetic_markets(args.markets, rng)
+    lats = rng.uniform(LAT_RANGE[0], LAT_RANGE[1], args.stores)
+    lngs = rng.uniform(LNG_RANGE[0], LNG_RANGE[1], args.stores)
+    type_codes = rng.integers(0, len(BUSINESS_TYPES), args.stores)
+
+    results: Dict[str, Any] = {}
+    timings = []
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        counts = count_by_market(lats, lngs, type_codes, len(BUSINESS_TYPES), geometry)
+        polygon_area_km2(geometry.offsets, geometry.points)
+        timings.append(time.perf_counter() - started)
+    results["vectorized"] = {"markets": args.markets, "seconds": round(min(timings), 3),
+                             "matched": int(counts.sum())}
+    print(f"  vectorized   상권 {args.markets:>6,}개 {results['vectorized']['seconds']:>8.3f}초")
+
+    if args.baseline_markets:
+        limit = min(args.baseline_markets, args.markets)
+        started = time.perf_counter()
+        expected = per_market(lats, lngs, type_codes, len(BUSINESS_TYPES), geometry, limit)
+        elapsed = time.perf_counter() - started
+        if not np.array_equal(expected, counts[:limit]):
+            raise SystemExit("vectorized/per-market 결과가 다릅니다")
+        results["per-market"] = {"markets": limit, "seconds": round(elapsed, 3),
+                                 "estimated_seconds": round(elapsed / limit * args.markets, 3)}
+        print(f"  per-market   상권 {limit:>6,}개 {elapsed:>8.3f}초 (전체 추정 {results['per-market']['estimated_seconds']:.1f}초)")
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({"options": vars(args), "results": results}, f, ensure_ascii=False, indent=2)
+
+if __name__ == '__main__':
+    main()
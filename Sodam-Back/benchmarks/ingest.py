@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+유동인구/카드매출 일괄 적재 처리량 벤치마크
+
+합성 시간대별 유동인구/일별 매출 CSV를 만든 뒤 새 SQLite DB에 다음 방식으로 적재하고
+행/초를 비교한다.
+- orm: 행마다 ORM 객체 생성 후 session.add (--orm-rows 행만, 기준선)
+- bulk-keep-indexes: flask ingest 와 같은 경로, 인덱스 유지
+- bulk: flask ingest 기본값 (인덱스 적재 후 재생성, 집계 청크별 반영)
+- bulk-rebuild-rollups: 집계를 적재 후 한 번에 재생성
+
+사용법:
+    python benchmarks/ingest.py --markets 50 --days 90
+    python benchmarks/ingest.py --markets 200 --days 365 --output benchmarks/results/ingest.json
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from typing import Any, Dict, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(BENCH_DIR))
+
+import synthetic  # noqa: E402
+
+FOOT_TRAFFIC_COLUMNS = ["area_code", "date", "hour", "foot_traffic_count", "age_20s", "age_30s", "age_40s",
+                        "age_50s", "age_60s", "male_count", "female_count", "dwell_time_avg"]
+SALES_COLUMNS = ["area_code", "date", "business_type", "total_sales", "transaction_count", "age_20s_sales",
+                 "age_30s_sales", "age_40s_sales", "age_50s_sales", "age_60s_sales", "male_sales", "female_sales"]
+
+def write_inputs(args, work_dir: str) -> Dict[str, Any]:
+    """상권별 합성 행을 CSV로 저장"""
+    dates = [date(2024, 12, 31) - timedelta(days=offset) for offset in range(args.days - 1, -1, -1)]
+    codes = [f"BM{index:05d}" for index in range(args.markets)]
+    paths = {"foot-traffic": os.path.join(work_dir, 'foot_traffic.csv'), "sales": os.path.join(work_dir, 'sales.csv')}
+    counts = {}
+    for kind, columns, generate in (("foot-traffic", FOOT_TRAFFIC_COLUMNS, synthetic.foot_traffic_rows),
+                                    ("sales", SALES_COLUMNS, synthetic.sales_rows)):
+        with open(paths[kind], 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            count = 0
+            for index, code in enumerate(codes):
+                for row in generate(args, 0, index, dates):
+                    row["area_code"] = code
+                    writer.writerow([row[column] for column in columns])
+                    count += 1
+        counts[kind] = count
+    return {"codes": codes, "paths": paths, "rows": counts}
+
+def create_database(path: str, codes: List[str]):
+    from sqlalchemy import create_engine, insert
+
+    from models import (CommercialArea, FootTrafficData, FootTrafficDailyRollup, FootTrafficMonthlyRollup,
+                        SalesData, SalesDailyRollup, SalesMonthlyRollup)
+
+    engine = create_engine(f"sqlite:///{path}")
+    CommercialArea.metadata.create_all(engine, tables=[
+        CommercialArea.__table__, FootTrafficData.__table__, SalesData.__table__,
+        FootTrafficDailyRollup.__table__, FootTrafficMonthlyRollup.__table__,
+        SalesDailyRollup.__table__, SalesMonthlyRollup.__table__
+    ])
+    with engine.begin() as connection:
+        connection.execute(insert(CommercialArea.__table__), [
+            {"area_code": code, "area_name": code, "address": "벤치마크", "latitude": 36.35, "longitude": 127.38}
+            for code in codes
+        ])
+    return engine
+
+def run_orm(engine, inputs: Dict[str, Any], limit: int) -> Dict[str, Any]:
+    """기준선: CSV 행마다 ORM 객체를 만들어 session.add (집계는 after_flush 이벤트 없이 원본만)"""
+    from sqlalchemy.orm import Session
+
+    from models import FootTrafficData
+    from services.bulk_ingest import _area_ids, _row_converter
+
+    started = time.perf_counter()
+    rows = 0
+    with open(inputs["paths"]["foot-traffic"], newline='', encoding='utf-8') as f, Session(engine) as session:
+        reader = csv.reader(f)
+        convert = _row_converter("foot-traffic", next(reader), _area_ids(engine))
+        for values in reader:
+            session.add(FootTrafficData(**convert(values)))
+            rows += 1
+            if rows % 1000 == 0:
+                session.commit()
+            if rows >= limit:
+                break
+        session.commit()
+    elapsed = time.perf_counter() - started
+    return {"rows": rows, "seconds": round(elapsed, 3), "rows_per_second": round(rows / elapsed)}
+
+def run_bulk(engine, inputs: Dict[str, Any], chunk_size: int, **options) -> Dict[str, Any]:
+    from services.bulk_ingest import ingest_csv
+
+    result = {"rows": 0, "seconds": 0.0}
+    for kind, path in inputs["paths"].items():
+        stats = ingest_csv(engine, kind, path, chunk_size=chunk_size, restart=True, **options)
+        result["rows"] += stats["rows"]
+        result["seconds"] += stats["seconds"]
+        result[kind] = {key: stats[key] for key in ("rows", "seconds", "rows_per_second", "load_seconds")}
+        result[kind].update({key: stats[key] for key in ("index_seconds", "rollup_seconds") if key in stats})
+    result["seconds"] = round(result["seconds"], 3)
+    result["rows_per_second"] = round(result["rows"] / result["seconds"]) if result["seconds"] else 0
+    return result
+
+SCENARIOS = {
+    "orm": None,
+    "bulk-keep-indexes": {"defer_indexes": False, "rollup_mode": "incremental"},
+    "bulk": {"defer_indexes": True, "rollup_mode": "incremental"},
+    "bulk-rebuild-rollups": {"defer_indexes": True, "rollup_mode": "rebuild"}
+}
+
+def main():
+    parser = argparse.ArgumentParser(description="CSV 일괄 적재 처리량 벤치마크")
+    parser.add_argument('--markets', type=int, default=50, help="상권 수")
+    parser.add_argument('--days', type=int, default=90, help="일수 (유동인구는 일 x 24행, 매출은 일 x 업종 6행)")
+    parser.add_argument('--chunk-size', type=int, default=10000)
+    parser.add_argument('--orm-rows', type=int, default=20000, help="ORM 기준선 측정 행 수 (0이면 생략)")
+    parser.add_argument('--scenario', action='append', choices=list(SCENARIOS), help="측정할 방식 (기본: 전체)")
+    parser.add_argument('--seed', type=int, default=31)
+    parser.add_argument('--output', default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='sodam-ingest-') as work_dir:
+        inputs = write_inputs(args, work_dir)
+        print(f"입력 생성: {inputs['rows']}")
+
+        results = {}
+        for name in args.scenario or list(SCENARIOS):
+            if name == "orm" and not args.orm_rows:
+                continue
+            db_path = os.path.join(work_dir, f"{name}.db")
+            engine = create_database(db_path, inputs["codes"])
+            if name == "orm":
+                results[name] = run_orm(engine, inputs, args.orm_rows)
+            else:
+                results[name] = run_bulk(engine, inputs, args.chunk_size, **SCENARIOS[name])
+            engine.dispose()
+            os.remove(db_path)
+            print(f"  {name:<22} {results[name]['rows']:>10,}행 {results[name]['seconds']:>8.2f}초 "
+                  f"{results[name]['rows_per_second']:>10,}행/초")
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({"options": vars(args), "inputs": inputs["rows"], "results": results},
+                      f, ensure_ascii=False, indent=2)
+
+if __name__ == '__main__':
+    main()
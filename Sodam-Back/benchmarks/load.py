@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+로컬 부하 테스트 스크립트
+
+모바일 앱의 실제 호출 흐름(로그인, 상권 목록, 건강 점수, 종합 진단, 리스크 분류,
+전략 카드 생성, 개인화 추천)을 가중치에 따라 섞어 동시에 호출하고
+경로별 처리량, p50/p95/p99 응답 시간, 에러율을 보고한다.
+--mix read / write 로 DB 읽기 위주(로그인, 건강 점수) / 쓰기 위주(회원가입) 조합을 선택할 수 있다.
+
+대상:
+- 기본: 프로세스 내부 앱 (Flask test client, 픽스처 데이터 + 임시 SQLite DB)
+- --url 지정 시: 실행 중인 로컬 서버 (HTTP keep-alive 연결)
+
+사용법:
+    python benchmarks/load.py --concurrency 8 --duration 30
+    python benchmarks/load.py --url http://127.0.0.1:5000 --concurrency 32 --duration 60
+    python benchmarks/load.py --mix health_score=50,market_list=50 --output /tmp/load.json
+    python benchmarks/load.py --mix write --db-profile sqlite --bcrypt-rounds 4   # DB 엔진 프로파일 비교
+    python benchmarks/load.py --mix write --db-profile none --bcrypt-rounds 4
+"""
+import argparse
+import http.client
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(BENCH_DIR))
+
+FIXTURES_DIR = os.path.join(BENCH_DIR, 'fixtures')
+
+LOAD_USER = {
+    "username": "loadtest_user",
+    "email": "loadtest@sodam.local",
+    "password": "loadtest-password",
+    "name": "부하테스트"
+}
+
+INDUSTRIES = ["식음료업", "쇼핑업", "숙박업", "여가서비스업", "여행업", "운송업"]
+RISK_TYPES = ["유입 저조형", "과포화 경쟁형", "소비력 약형", "성장 잠재형"]
+
+USER_PROFILE = {
+    "userType": "ENTREPRENEUR",
+    "businessStage": "PLANNING",
+    "capital": 50000000,
+    "experience": "beginner",
+    "preferences": {
+        "interestedBusinessTypes": ["식음료업"],
+        "preferredAreas": ["대전광역시"]
+    }
+}
+
+def _new_user(rng: random.Random) -> Dict[str, str]:
+    # 워밍업/측정 단계가 같은 시드를 쓰므로 이름은 시드와 무관하게 생성 (409 중복 방지)
+    suffix = uuid.uuid4().hex[:16]
+    return {"username": f"load_{suffix}", "email": f"load_{suffix}@sodam.local"}
+
+class Flow(NamedTuple):
+    name: str
+    weight: int
+    # (rng, market_code) -> (method, path, body)
+    build: Callable[[random.Random, str], Tuple[str, str, Optional[Dict[str, Any]]]]
+
+FLOWS: List[Flow] = [
+    Flow("login", 8, lambda rng, market: (
+        "POST", "/api/v1/sodam/auth/login",
+        {"username": LOAD_USER["username"], "password": LOAD_USER["password"]})),
+    Flow("market_list", 25, lambda rng, market: (
+        "GET", "/api/v1/market-diagnosis/markets?limit=50", None)),
+    Flow("health_score", 20, lambda rng, market: (
+        "POST", f"/api/v1/sodam/core-diagnosis/health-score/{market}",
+        {"industry": rng.choice(INDUSTRIES)})),
+    Flow("comprehensive", 10, lambda rng, market: (
+        "POST", f"/api/v1/sodam/core-diagnosis/comprehensive/{market}",
+        {"category": rng.choice(INDUSTRIES)})),
+    Flow("risk_classify", 15, lambda rng, market: (
+        "POST", f"/api/v1/risk-classification/classify/{market}",
+        {"industry": rng.choice(INDUSTRIES)})),
+    Flow("strategy_generate", 10, lambda rng, market: (
+        "POST", "/api/v1/strategy-cards/generate",
+        {"market_code": market, "industry": rng.choice(INDUSTRIES),
+         "risk_type": rng.choice(RISK_TYPES), "user_profile": USER_PROFILE})),
+    Flow("recommendations", 12, lambda rng, market: (
+        "POST", "/api/v1/recommendations/personalized",
+        {"user_profile": USER_PROFILE})),
+    # 쓰기 흐름 (요청마다 새 사용자 INSERT, 기본 조합에는 포함하지 않음)
+    Flow("register", 0, lambda rng, market: (
+        "POST", "/api/v1/sodam/auth/register",
+        dict(LOAD_USER, **_new_user(rng)))),
+]
+
+# 이름으로 지정하는 흐름 조합
+MIXES = {
+    "read": "login=20,market_list=20,health_score=40,comprehensive=20",
+    "write": "register=60,login=20,health_score=20",
+}
+
+class InProcessClient:
+    """Flask test client 기반 클라이언트 (스레드별 인스턴스)"""
+
+    def __init__(self, app):
+        self._client = app.test_client()
+
+    def request(self, method: str, path: str, body: Optional[Dict[str, Any]]) -> Tuple[int, bytes]:
+        response = self._client.open(path, method=method, json=body)
+        return response.status_code, response.get_data()
+
+class HTTPClient:
+    """keep-alive HTTP 클라이언트 (스레드별 인스턴스, 오류 시 재연결)"""
+
+    def __init__(self, base_url: str, timeout: float):
+        parts = urlsplit(base_url)
+        self._connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        self._netloc = parts.netloc
+        self._prefix = parts.path.rstrip('/')
+        self._timeout = timeout
+        self._connection = None
+
+    def request(self, method: str, path: str, body: Optional[Dict[str, Any]]) -> Tuple[int, bytes]:
+        if self._connection is None:
+            self._connection = self._connection_class(self._netloc, timeout=self._timeout)
+        headers = {"Accept": "application/json"}
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode('utf-8')
+            headers["Content-Type"] = "application/json"
+        try:
+            self._connection.request(method, self._prefix + path, body=payload, headers=headers)
+            response = self._connection.getresponse()
+            return response.status, response.read()
+        except (OSError, http.client.HTTPException):
+            self._connection.close()
+            self._connection = None
+            raise
+
+def parse_mix(mix: Optional[str]) -> List[Flow]:
+    """'이름=가중치,...' 형식 또는 MIXES 이름으로 기본 가중치 덮어쓰기 (지정하지 않은 흐름은 제외)"""
+    if not mix:
+        return [flow for flow in FLOWS if flow.weight > 0]
+    mix = MIXES.get(mix, mix)
+    weights = {}
+    for item in mix.split(','):
+        name, _, weight = item.partition('=')
+        weights[name.strip()] = int(weight or 1)
+    unknown = set(weights) - {flow.name for flow in FLOWS}
+    if unknown:
+        raise SystemExit(f"알 수 없는 흐름: {', '.join(sorted(unknown))} (가능: {', '.join(flow.name for flow in FLOWS)})")
+    return [flow._replace(weight=weights[flow.name]) for flow in FLOWS if weights.get(flow.name, 0) > 0]
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    """nearest-rank 백분위수"""
+    if not ordered:
+        return 0.0
+    index = max(0, min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+class Recorder:
+    """경로별 응답 시간/에러 집계 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.statuses: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def record(self, name: str, seconds: float, status: str, failed: bool):
+        with self._lock:
+            self.latencies[name].append(seconds)
+            self.statuses[name][status] += 1
+            if failed:
+                self.errors[name] += 1
+
+    def report(self, elapsed: float) -> Dict[str, Any]:
+        routes = {}
+        all_latencies = []
+        for name, samples in sorted(self.latencies.items()):
+            ordered = sorted(samples)
+            all_latencies.extend(ordered)
+            routes[name] = self._summary(ordered, self.errors[name], elapsed)
+            routes[name]["statuses"] = dict(self.statuses[name])
+        total = self._summary(sorted(all_latencies), sum(self.errors.values()), elapsed)
+        return {"elapsed_seconds": round(elapsed, 2), "routes": routes, "total": total}
+
+    @staticmethod
+    def _summary(ordered: List[float], errors: int, elapsed: float) -> Dict[str, Any]:
+        count = len(ordered)
+        return {
+            "requests": count,
+            "throughput_rps": round(count / elapsed, 2) if elapsed > 0 else 0.0,
+            "p50_ms": round(percentile(ordered, 0.50) * 1000, 2),
+            "p95_ms": round(percentile(ordered, 0.95) * 1000, 2),
+            "p99_ms": round(percentile(ordered, 0.99) * 1000, 2),
+            "max_ms": round(ordered[-1] * 1000, 2) if ordered else 0.0,
+            "error_rate": round(errors / count, 4) if count else 0.0
+        }
+
+def worker(client_factory, flows: List[Flow], market_codes: List[str], deadline: float,
+           recorder: Recorder, seed: int, think_time: float):
+    rng = random.Random(seed)
+    client = client_factory()
+    weights = [flow.weight for flow in flows]
+    while time.perf_counter() < deadline:
+        flow = rng.choices(flows, weights)[0]
+        method, path, body = flow.build(rng, rng.choice(market_codes))
+        started = time.perf_counter()
+        try:
+            status, _ = client.request(method, path, body)
+            recorder.record(flow.name, time.perf_counter() - started, str(status), status >= 400)
+        except Exception as e:
+            recorder.record(flow.name, time.perf_counter() - started, type(e).__name__, True)
+        if think_time:
+            time.sleep(rng.uniform(0, think_time * 2))
+
+def build_in_process_app(args):
+    """픽스처 데이터와 임시 SQLite DB를 사용하는 앱 생성 (import 전에 환경 변수 설정)"""
+    os.environ['SODAM_DATA_DIR'] = os.path.abspath(args.data_dir)
+    if args.db_profile:
+        os.environ['DB_ENGINE_PROFILE'] = args.db_profile
+    if args.bcrypt_rounds:
+        os.environ['BCRYPT_LOG_ROUNDS'] = str(args.bcrypt_rounds)
+    if args.database_url:
+        os.environ['DATABASE_URL'] = args.database_url
+    else:
+        db_path = os.path.join(tempfile.mkdtemp(prefix='sodam-load-'), 'load.db')
+        os.environ['DATABASE_URL'] = f"sqlite:///{db_path}"
+
+    from app import create_app
+    from config import Config
+    from extensions import db
+
+    app = create_app(Config)
+    with app.app_context():
+        db.create_all()
+    return app
+
+def load_market_codes(args) -> List[str]:
+    if args.markets:
+        return [code.strip() for code in args.markets.split(',') if code.strip()]
+    from services.data_loader import DataLoader
+    df = DataLoader(os.path.abspath(args.data_dir)).load_market_data()
+    return [str(code) for code in df['market_code'].head(args.market_count)] or ["DJ001"]
+
+def main():
+    parser = argparse.ArgumentParser(description="소담 API 부하 테스트")
+    parser.add_argument('--url', default=None, help="대상 서버 URL (미지정 시 프로세스 내부 앱)")
+    parser.add_argument('--concurrency', type=int, default=8, help="동시 사용자(스레드) 수")
+    parser.add_argument('--duration', type=float, default=30.0, help="측정 시간 (초)")
+    parser.add_argument('--warmup', type=float, default=2.0, help="측정 전 워밍업 시간 (초)")
+    parser.add_argument('--think-time', type=float, default=0.0, help="요청 간 평균 대기 시간 (초)")
+    parser.add_argument('--mix', default=None,
+                        help=f"흐름별 가중치 (예: health_score=50,market_list=50) 또는 조합 이름 ({', '.join(MIXES)})")
+    parser.add_argument('--markets', default=None, help="사용할 상권 코드 목록 (쉼표 구분)")
+    parser.add_argument('--market-count', type=int, default=20, help="데이터에서 사용할 상권 수")
+    parser.add_argument('--data-dir', default=FIXTURES_DIR, help="프로세스 내부 앱 데이터 디렉터리")
+    parser.add_argument('--database-url', default=None, help="프로세스 내부 앱 DB (기본: 임시 SQLite)")
+    parser.add_argument('--db-profile', default=None, choices=["auto", "sqlite", "server", "none"],
+                        help="프로세스 내부 앱 DB_ENGINE_PROFILE")
+    parser.add_argument('--bcrypt-rounds', type=int, default=None,
+                        help="프로세스 내부 앱 BCRYPT_LOG_ROUNDS (쓰기 조합에서 해싱 비용을 줄여 DB 비용을 측정)")
+    parser.add_argument('--timeout', type=float, default=30.0)
+    parser.add_argument('--seed', type=int, default=32)
+    parser.add_argument('--output', default=None, help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    flows = parse_mix(args.mix)
+    market_codes = load_market_codes(args)
+
+    if args.url:
+        client_factory = lambda: HTTPClient(args.url, args.timeout)
+    else:
+        app = build_in_process_app(args)
+        client_factory = lambda: InProcessClient(app)
+
+    # 로그인 흐름용 사용자 등록 (이미 있으면 409)
+    status, _ = client_factory().request("POST", "/api/v1/sodam/auth/register", LOAD_USER)
+    if status not in (200, 201, 409):
+        print(f"[경고] 부하 테스트 사용자 등록 실패 (HTTP {status}) - login 흐름은 에러로 집계됩니다.")
+
+    def run_phase(duration: float, recorder: Recorder) -> float:
+        started = time.perf_counter()
+        deadline = started + duration
+        threads = [
+            threading.Thread(target=worker, args=(client_factory, flows, market_codes, deadline, recorder,
+                                                  args.seed + index, args.think_time), daemon=True)
+            for index in range(args.concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return time.perf_counter() - started
+
+    target = args.url or "in-process"
+    if args.warmup > 0:
+        print(f"워밍업 {args.warmup:.0f}초 ({target})")
+        run_phase(args.warmup, Recorder())
+
+    print(f"측정 {args.duration:.0f}초, 동시 사용자 {args.concurrency}명, 상권 {len(market_codes)}개")
+    recorder = Recorder()
+    report = recorder.report(run_phase(args.duration, recorder))
+    report["options"] = {
+        "target": target, "concurrency": args.concurrency, "duration": args.duration,
+        "mix": {flow.name: flow.weight for flow in flows}, "markets": len(market_codes),
+        "db_profile": None if args.url else os.environ.get('DB_ENGINE_PROFILE', 'auto')
+    }
+
+    print(f"\n{'route':<20}{'requests':>10}{'rps':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'errors':>9}")
+    rows = list(report["routes"].items()) + [("TOTAL", report["total"])]
+    for name, stats in rows:
+        print(f"{name:<20}{stats['requests']:>10}{stats['throughput_rps']:>10.1f}{stats['p50_ms']:>8.1f}ms"
+              f"{stats['p95_ms']:>8.1f}ms{stats['p99_ms']:>8.1f}ms{stats['error_rate'] * 100:>8.1f}%")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+if __name__ == '__main__':
+    main()
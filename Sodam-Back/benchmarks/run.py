@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+서비스 핫패스 벤치마크 실행 스크립트
+
+각 서비스의 공개 메서드를 두 가지 모드로 측정한다.
+- cold: 데이터셋 캐시를 비우고 서비스를 새로 생성한 뒤 첫 호출 (최초 로드 비용 포함)
+- warm: 캐시가 채워진 서비스 인스턴스에서 반복 호출
+
+기본적으로 benchmarks/fixtures의 로컬 데이터만 사용하며 결과는 JSON으로 저장한다.
+케이스는 앱 컨텍스트 안에서 실행한다. --database-url이 없으면 임시 SQLite DB를 만들어
+픽스처 상권의 유동인구/매출(집계 테이블 포함)과 사업체 이력을 합성해 넣는다.
+결과 캐시(RESULT_CACHE_ENABLED)는 끄고 계산 자체를 측정한다.
+
+사용법:
+    python benchmarks/run.py
+    python benchmarks/run.py --filter CoreDiagnosisService --warm-repeat 50
+    python benchmarks/run.py --save-baseline
+    python benchmarks/run.py --data-dir benchmarks/data/x10 --database-url sqlite:///benchmarks/data/x10/app.db
+    python benchmarks/compare.py benchmarks/results/latest.json
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(BENCH_DIR))
+
+FIXTURES_DIR = os.path.join(BENCH_DIR, 'fixtures')
+RESULTS_DIR = os.path.join(BENCH_DIR, 'results')
+BASELINE_PATH = os.path.join(RESULTS_DIR, 'baseline.json')
+
+def summarize(samples: List[float]) -> Dict[str, Any]:
+    """측정값(초) 요약 (밀리초 단위)"""
+    ordered = sorted(samples)
+    p95_index = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+    return {
+        "runs": len(ordered),
+        "min_ms": round(ordered[0] * 1000, 4),
+        "median_ms": round(statistics.median(ordered) * 1000, 4),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 4),
+        "p95_ms": round(ordered[p95_index] * 1000, 4),
+        "max_ms": round(ordered[-1] * 1000, 4)
+    }
+
+def measure(call, instance) -> float:
+    started = time.perf_counter()
+    call(instance)
+    return time.perf_counter() - started
+
+def seed_database(days: int, businesses_per_market: int, seed: int) -> Dict[str, int]:
+    """픽스처 상권의 유동인구/매출(synthetic.populate_database)과 개업/폐업 이력이 있는 사업체 삽입"""
+    import numpy as np
+    from sqlalchemy import insert, select
+
+    from benchmarks.synthetic import BUSINESS_TYPES, populate_database
+    from extensions import db
+    from models import BusinessData, CommercialArea
+    from services.data_loader import DataLoader
+
+    loader = DataLoader()
+    markets = []
+    for row, market in loader.load_market_data().iterrows():
+        coordinates = loader.market_coordinates(row)
+        if not coordinates:
+            continue
+        center = (float(np.mean([point['lng'] for point in coordinates])),
+                  float(np.mean([point['lat'] for point in coordinates])))
+        markets.append(dict(market, center=center))
+
+    options = argparse.Namespace(database_url=str(db.engine.url), days=days, batch_size=10000, seed=seed)
+    counts = populate_database(options, markets)
+
+    rng = np.random.default_rng(seed)
+    as_of = date(2024, 12, 31)
+    area_ids = dict(db.session.execute(select(CommercialArea.area_code, CommercialArea.id)).all())
+    rows = []
+    for market in markets:
+        opened = rng.integers(0, 3650, businesses_per_market)
+        lifetime = rng.exponential(1500, businesses_per_market).astype(int)
+        lngs = market["center"][0] + rng.normal(0, 0.002, businesses_per_market)
+        lats = market["center"][1] + rng.normal(0, 0.002, businesses_per_market)
+        types = rng.integers(0, len(BUSINESS_TYPES), businesses_per_market)
+        for index in range(businesses_per_market):
+            closed = lifetime[index] < opened[index]
+            rows.append({
+                "area_id": area_ids[market["market_code"]], "business_type": BUSINESS_TYPES[types[index]],
+                "business_name": f"{market['market_code']}-{index}", "address": market["district_name"],
+                "latitude": float(lats[index]), "longitude": float(lngs[index]),
+                "status": "closed" if closed else ("new" if opened[index] < 365 else "active"),
+                "opened_date": as_of - timedelta(days=int(opened[index])),
+                "closed_date": as_of - timedelta(days=int(opened[index] - lifetime[index])) if closed else None
+            })
+    db.session.execute(insert(BusinessData.__table__), rows)
+    db.session.commit()
+    counts["business_data"] = len(rows)
+    return counts
+
+def build_app(args):
+    """케이스를 실행할 앱 (환경 변수는 main에서 import 전에 설정)"""
+    from app import create_app
+    from config import Config
+    from extensions import db
+
+    app = create_app(Config)
+    app.app_context().push()
+    db.create_all()
+    if not args.database_url:
+        counts = seed_database(args.seed_days, args.seed_businesses, args.seed)
+        print(f"합성 DB: {counts}")
+    return app
+
+def run_cold(case, repeat: int) -> List[float]:
+    from services import business_survival, competitor_density
+    from services.data_loader import DataLoader
+
+    samples = []
+    for _ in range(repeat):
+        DataLoader().clear_cache()
+        competitor_density.clear()
+        business_survival.clear()
+        gc.collect()
+        started = time.perf_counter()
+        case.call(case.factory())
+        samples.append(time.perf_counter() - started)
+    return samples
+
+def run_warm(case, repeat: int, warmup: int) -> List[float]:
+    instance = case.factory()
+    for _ in range(warmup):
+        case.call(instance)
+    gc.collect()
+    return [measure(case.call, instance) for _ in range(repeat)]
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCH_DIR,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def main():
+    parser = argparse.ArgumentParser(description="소담 서비스 벤치마크")
+    parser.add_argument('--data-dir', default=FIXTURES_DIR, help="데이터 디렉터리 (기본: benchmarks/fixtures)")
+    parser.add_argument('--database-url', default=None, help="DB 경로 케이스용 DB (기본: 합성 데이터를 넣은 임시 SQLite)")
+    parser.add_argument('--seed-days', type=int, default=90, help="임시 DB 유동인구/매출 데이터 일수")
+    parser.add_argument('--seed-businesses', type=int, default=200, help="임시 DB 상권당 사업체 수")
+    parser.add_argument('--seed', type=int, default=30)
+    parser.add_argument('--filter', default=None, help="케이스 이름에 포함된 문자열로 필터링")
+    parser.add_argument('--modes', default='cold,warm', help="측정 모드 (cold,warm)")
+    parser.add_argument('--cold-repeat', type=int, default=5)
+    parser.add_argument('--warm-repeat', type=int, default=30)
+    parser.add_argument('--warmup', type=int, default=3)
+    parser.add_argument('--output', default=None, help="결과 JSON 경로 (기본: benchmarks/results/<시각>.json)")
+    parser.add_argument('--save-baseline', action='store_true', help="결과를 baseline.json으로도 저장")
+    args = parser.parse_args()
+
+    # 서비스 모듈이 만드는 DataLoader가 픽스처 데이터를 사용하도록 import 전에 설정
+    os.environ['SODAM_DATA_DIR'] = os.path.abspath(args.data_dir)
+    os.environ['DATABASE_URL'] = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='sodam-bench-'), 'bench.db')}"
+    os.environ['RESULT_CACHE_ENABLED'] = 'false'
+    build_app(args)
+    from benchmarks.cases import CASES
+
+    modes = [mode.strip() for mode in args.modes.split(',') if mode.strip()]
+    cases = [case for case in CASES if not args.filter or args.filter in case.name]
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for case in cases:
+        results[case.name] = {}
+
+        # 오류 응답이나 결과 없음(DB 데이터 없음)을 반환하는 경로는 측정값이 의미 없으므로 결과에 표시
+        sample = case.call(case.factory())
+        error = sample["error"] if isinstance(sample, dict) and "error" in sample else "결과 없음" if sample is None else None
+        if error is not None:
+            results[case.name]['error'] = str(error)
+            print(f"[경고] {case.name}: {error}")
+
+        if 'cold' in modes:
+            results[case.name]['cold'] = summarize(run_cold(case, args.cold_repeat))
+        if 'warm' in modes:
+            results[case.name]['warm'] = summarize(run_warm(case, args.warm_repeat, args.warmup))
+
+        line = "  ".join(f"{mode} median {results[case.name][mode]['median_ms']:>9.3f}ms" for mode in modes)
+        print(f"{case.name:<58} {line}")
+
+    report = {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec='seconds'),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "data_dir": os.path.relpath(args.data_dir, os.path.dirname(BENCH_DIR)),
+            "database_url": args.database_url or "synthetic",
+            "cold_repeat": args.cold_repeat,
+            "warm_repeat": args.warm_repeat
+        },
+        "results": results
+    }
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    output = args.output or os.path.join(RESULTS_DIR, f"{datetime.now():%Y%m%dT%H%M%S}.json")
+    paths = [output, os.path.join(RESULTS_DIR, 'latest.json')]
+    if args.save_baseline:
+        paths.append(BASELINE_PATH)
+
+    for path in paths:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(f"\n결과 저장: {', '.join(os.path.relpath(path) for path in paths)}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+사업체 위치 반경 조회 벤치마크
+
+대전 일대에 합성 사업체 N개를 새 SQLite DB에 적재한 뒤, 임의의 중심에서
+"반경 R m 안의 영업 중인 업종 X 사업체 수"를 다음 방식으로 조회해 지연 시간을 비교한다.
+- scan: 위도/경도 범위 조건만 사용 (공간 인덱스 없음, 테이블 전체 스캔)
+- rtree: services.spatial_index 경로 (R*Tree 후보 -> 원본 좌표/업종/상태 조건 -> 실제 거리)
+두 방식의 결과 개수가 같은지 확인하고, R*Tree 트리거가 적재(행/초)에 더하는 비용도 측정한다.
+
+사용법:
+    python benchmarks/spatial.py --stores 1000000 --queries 200
+    python benchmarks/spatial.py --stores 200000 --radius 1000 --output benchmarks/results/spatial.json
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(BENCH_DIR))
+
+BUSINESS_TYPES = ["식음료업", "소매업", "서비스업", "숙박업", "여가/오락", "교육"]
+STATUSES = ["active"] * 8 + ["closed", "new"]
+# 대전광역시 일대
+LAT_RANGE = (36.20, 36.50)
+LNG_RANGE = (127.25, 127.55)
+
+def store_rows(count: int, seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    return [
+        {"id": index, "area_id": 1, "business_type": rng.choice(BUSINESS_TYPES), "business_name": f"가게{index}",
+         "address": "대전", "latitude": rng.uniform(*LAT_RANGE), "longitude": rng.uniform(*LNG_RANGE),
+         "status": rng.choice(STATUSES)}
+        for index in range(1, count + 1)
+    ]
+
+def create_database(path: str, spatial: bool):
+    """business_data 생성 (after_create 이벤트로 R*Tree/트리거가 함께 생성되며, spatial=False면 제거)"""
+    from sqlalchemy import create_engine, insert
+
+    from models import BusinessData, CommercialArea
+    from services import spatial_index
+
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.begin() as connection:
+        CommercialArea.metadata.create_all(connection, tables=[CommercialArea.__table__, BusinessData.__table__])
+        if not spatial:
+            spatial_index.uninstall(connection)
+        connection.execute(insert(CommercialArea.__table__), [
+            {"id": 1, "area_code": "BM00001", "area_name": "벤치마크", "address": "대전", "latitude": 36.35, "longitude": 127.38}
+        ])
+    return engine
+
+def load(engine, rows: List[Dict[str, Any]], chunk_size: int) -> Dict[str, Any]:
+    from sqlalchemy import insert
+
+    from models import BusinessData
+
+    started = time.perf_counter()
+    for start in range(0, len(rows), chunk_size):
+        with engine.begin() as connection:
+            connection.execute(insert(BusinessData.__table__), rows[start:start + chunk_size])
+    elapsed = time.perf_counter() - started
+    return {"rows": len(rows), "seconds": round(elapsed, 3), "rows_per_second": round(len(rows) / elapsed)}
+
+def count_within_radius(connection, dialect: str, lat: float, lng: float, radius_m: float, business_type: str) -> int:
+    """spatial_index.count_within_radius와 같은 조회 (앱 컨텍스트 없이 연결과 방언을 직접 지정)"""
+    import numpy as np
+
+    from models import BusinessData
+    from services import spatial_index
+
+    box = spatial_index.radius_bbox(lat, lng, radius_m)
+    rows = connection.execute(spatial_index.bbox_query(
+        box["min_lat"], box["min_lng"], box["max_lat"], box["max_lng"], business_type, "active",
+        columns=(BusinessData.latitude, BusinessData.longitude), dialect=dialect
+    )).all()
+    if not rows:
+        return 0
+    coordinates = np.array(rows, dtype=np.float64)
+    return int((spatial_index.haversine_m(lat, lng, coordinates[:, 0], coordinates[:, 1]) <= radius_m).sum())
+
+def run_queries(engine, dialect: str, centers: List[tuple], radius_m: float) -> Dict[str, Any]:
+    timings, counts = [], []
+    with engine.connect() as connection:
+        for lat, lng, business_type in centers:
+            started = time.perf_counter()
+            counts.append(count_within_radius(connection, dialect, lat, lng, radius_m, business_type))
+            timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return {
+        "queries": len(timings),
+        "p50_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 3),
+        "mean_ms": round(statistics.fmean(timings), 3),
+        "mean_matches": round(statistics.fmean(counts), 1),
+        "counts": counts
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="사업체 반경 조회 벤치마크 (전체 스캔 vs R*Tree)")
+    parser.add_argument('--stores', type=int, default=1_000_000, help="사업체 수")
+    parser.add_argument('--queries', type=int, default=200, help="반경 조회 횟수")
+    parser.add_argument('--radius', type=float, default=500.0, help="반경 (m)")
+    parser.add_argument('--scan-queries', type=int, default=20, help="전체 스캔 조회 횟수 (느리므로 앞부분만)")
+    parser.add_argument('--chunk-size', type=int, default=50000)
+    parser.add_argument('--seed', type=int, default=47)
+    parser.add_argument('--output', default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    rows = store_rows(args.stores, args.seed)
+    rng = random.Random(args.seed + 1)
+    centers = [(rng.uniform(*LAT_RANGE), rng.uniform(*LNG_RANGE), rng.choice(BUSINESS_TYPES))
+               for _ in range(args.queries)]
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='sodam-spatial-') as work_dir:
+        for name, spatial in (("load-plain", False), ("load-rtree", True)):
+            engine = create_database(os.path.join(work_dir, f"{name}.db"), spatial)
+            results[name] = load(engine, rows, args.chunk_size)
+            print(f"  {name:<12} {results[name]['rows']:>10,}행 {results[name]['seconds']:>8.2f}초 "
+                  f"{results[name]['rows_per_second']:>10,}행/초")
+            if not spatial:
+                engine.dispose()
+
+        # R*Tree가 있는 DB에서 방언만 바꿔 같은 조건으로 조회 (scan은 범위 조건만 사용)
+        results["scan"] = run_queries(engine, "generic", centers[:args.scan_queries], args.radius)
+        results["rtree"] = run_queries(engine, "sqlite", centers, args.radius)
+        engine.dispose()
+
+    if results["scan"]["counts"] != results["rtree"]["counts"][:args.scan_queries]:
+        raise SystemExit("scan/rtree 결과 개수가 다릅니다")
+    for name in ("scan", "rtree"):
+        results[name].pop("counts")
+        print(f"  {name:<12} {results[name]['queries']:>6}회 p50 {results[name]['p50_ms']:>9.3f}ms "
+              f"p95 {results[name]['p95_ms']:>9.3f}ms 평균 {results[name]['mean_matches']:>8.1f}건")
+    results["speedup_p50"] = round(results["scan"]["p50_ms"] / results["rtree"]["p50_ms"], 1)
+    results["load_overhead"] = round(results["load-plain"]["rows_per_second"] / results["load-rtree"]["rows_per_second"], 2)
+    print(f"  p50 {results['speedup_p50']}배 빠름, 적재 비용 {results['load_overhead']}배")
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({"options": vars(args), "results": results}, f, ensure_ascii=False, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+사업체 생존/폐업 통계 계산 벤치마크
+
+합성 사업체 N개(상권 M개 x 업종)의 개업/폐업 이력으로 그룹 수준별 Kaplan-Meier 생존 곡선을 계산한다.
+- vectorized: services.business_survival._level_stats (전체 그룹을 정렬 + 누적합 한 번으로, 4개 수준 모두)
+- per-group: 상권 x 업종 그룹마다 사업체를 골라 폐업 시점별로 곱해 나감 (기준선, --baseline-groups 개만)
+두 방식의 생존율이 같은지 확인한다. DB 조회 시간은 포함하지 않는다.
+
+사용법:
+    python benchmarks/survival.py --markets 2000 --stores 1000000
+    python benchmarks/survival.py --markets 500 --stores 200000 --output benchmarks/results/survival.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Dict
+
+import numpy as np
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(BENCH_DIR))
+
+from spatial import BUSINESS_TYPES  # noqa: E402
+
+def per_group(groups, durations, events, times, limit: int) -> np.ndarray:
+    """기준선: 그룹마다 사업체를 골라 폐업 시점 순으로 생존율을 곱함 (times 순서대로 반환)"""
+    order = np.argsort(times, kind="stable")
+    times = times[order]
+    survival = np.ones((limit, len(times)))
+    for group in range(limit):
+        mask = groups == group
+        group_durations, group_events = durations[mask], events[mask]
+        current = 1.0
+        column = 0
+        for t in np.unique(group_durations[group_events]):
+            while column < len(times) and times[column] < t:
+                survival[group, column] = current
+                column += 1
+            at_risk = (group_durations >= t).sum()
+            current *= 1 - (group_events & (group_durations == t)).sum() / at_risk
+        survival[group, column:] = current
+    result = np.empty_like(survival)
+    result[:, order] = survival
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="사업체 생존/폐업 통계 계산 벤치마크")
+    parser.add_argument('--markets', type=int, default=2000, help="상권 수")
+    parser.add_argument('--stores', type=int, default=1_000_000, help="사업체 수")
+    parser.add_argument('--baseline-groups', type=int, default=500, help="기준선으로 계산할 상권 x 업종 그룹 수 (0이면 생략)")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=49)
+    parser.add_argument('--output', default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    from services.business_survival import CURVE_MONTHS, DAYS_PER_MONTH, HORIZONS, LEVELS, _level_stats
+
+    rng = np.random.default_rng(args.seed)
+    as_of = 20000
+    area_codes = rng.integers(0, args.markets, args.stores)
+    type_codes = rng.integers(0, len(BUSINESS_TYPES), args.stores)
+    opened = as_of - rng.integers(0, 3650, args.stores)
+    lifetime = rng.exponential(1500, args.stores).astype(np.int64)
+    events = opened + lifetime <= as_of
+    durations = np.where(events, lifetime, as_of - opened)
+    closed = np.where(events, opened + durations, -1)
+    columns = {"area_code": area_codes.tolist(), "business_type": type_codes.tolist()}
+    level_keys = {level: list(zip(*(columns[name] for name in level))) if level else [()] * args.stores
+                  for level in LEVELS}
+
+    results: Dict[str, Any] = {}
+    timings = []
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        levels = {level: _level_stats(keys, opened, durations, events, closed, as_of) for level, keys in level_keys.items()}
+        timings.append(time.perf_counter() - started)
+    cells = levels[("area_code", "business_type")]
+    results["vectorized"] = {"groups": len(cells["index"]), "seconds": round(min(timings), 3)}
+    print(f"  vectorized   그룹 {len(cells['index']):>7,}개 {results['vectorized']['seconds']:>8.3f}초")
+
+    if args.baseline_groups:
+        # 그룹 번호를 _level_stats의 정렬된 키 순서에 맞춤
+        index = cells["index"]
+        groups = np.fromiter((index[key] for key in level_keys[("area_code", "business_type")]), dtype=np.int64, count=args.stores)
+        times = np.r_[list(HORIZONS.values()), np.round(np.arange(CURVE_MONTHS + 1) * DAYS_PER_MONTH)].astype(np.int64)
+        limit = min(args.baseline_groups, len(index))
+        started = time.perf_counter()
+        expected = per_group(groups, durations, events, times, limit)
+        elapsed = time.perf_counter() - started
+        if not np.allclose(expected, cells["survival"][:limit]):
+            raise SystemExit("vectorized/per-group 결과가 다릅니다")
+        results["per-group"] = {"groups": limit, "seconds": round(elapsed, 3),
+                                "estimated_seconds": round(elapsed / limit * len(index), 3)}
+        print(f"  per-group    그룹 {limit:>7,}개 {elapsed:>8.3f}초 (전체 추정 {results['per-group']['estimated_seconds']:.1f}초)")
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({"options": vars(args), "results": results}, f, ensure_ascii=False, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+규모 테스트용 합성 데이터 생성 스크립트
+
+원본 데이터(기본: benchmarks/fixtures)를 기준으로 상권, 지역, 기간을 배수로 확장한
+데이터 디렉터리를 생성한다. 같은 옵션과 시드로 실행하면 항상 같은 결과가 나온다.
+
+생성 파일 (DataLoader가 그대로 읽을 수 있는 원본 CSV 형식):
+- market_data.csv          상권 (지역별 실제 좌표 근처의 다각형 경계 포함)
+- tourism_consumption.csv  지역 x 중분류 x 월별 관광 소비액
+- industry_expenditure.csv 업종별 지출 비율 (중분류 확장)
+- regional_expenditure.csv 기초지자체별 지출 비율 (합계 100)
+- markets.json             상권 목록 API 응답 형식
+- manifest.json            생성 옵션과 행 수
+
+--database-url을 지정하면 CommercialArea / FootTrafficData / SalesData 행을
+Core executemany로 일괄 삽입한다.
+
+사용법:
+    python benchmarks/synthetic.py --scale 10 --out benchmarks/data/x10
+    python benchmarks/synthetic.py --scale 100 --out benchmarks/data/x100 \\
+        --database-url sqlite:///benchmarks/data/x100/app.db --days 30
+    python benchmarks/run.py --data-dir benchmarks/data/x10
+"""
+import argparse
+import csv
+import functools
+import json
+import math
+import os
+import sys
+import time
+import zlib
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterator, List
+
+import numpy as np
+import pandas as pd
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(BENCH_DIR))
+
+SOURCE_DIR = os.path.join(BENCH_DIR, 'fixtures')
+
+# 광역지자체: (이름, 시도코드, 상권 코드 접두어, 중심 경도, 중심 위도)
+REGIONS = [
+    ("대전광역시", "30", "DJ", 127.385, 36.351),
+    ("서울특별시", "11", "SE", 126.978, 37.567),
+    ("부산광역시", "26", "BS", 129.075, 35.180),
+    ("대구광역시", "27", "DG", 128.601, 35.871),
+    ("인천광역시", "28", "IC", 126.705, 37.456),
+    ("광주광역시", "29", "GJ", 126.851, 35.160),
+    ("울산광역시", "31", "US", 129.311, 35.539),
+    ("세종특별자치시", "36", "SJ", 127.289, 36.480),
+    ("경기도", "41", "GG", 127.009, 37.275),
+    ("강원특별자치도", "51", "GW", 127.730, 37.885),
+    ("충청북도", "43", "CB", 127.491, 36.635),
+    ("충청남도", "44", "CN", 126.672, 36.659),
+    ("전북특별자치도", "52", "JB", 127.108, 35.820),
+    ("전라남도", "46", "JN", 126.463, 34.816),
+    ("경상북도", "47", "GB", 128.505, 36.576),
+    ("경상남도", "48", "GN", 128.692, 35.238),
+    ("제주특별자치도", "50", "JJ", 126.498, 33.489),
+]
+
+DISTRICTS_PER_REGION = 5
+MARKET_TYPES = ["주요상권", "골목상권", "전통시장", "관광특구"]
+MARKET_NAME_SUFFIXES = ["역 상권", "전통시장", "먹자골목", "대학가", "중심상가", "아파트상가", "터미널 상권", "카페거리"]
+BUSINESS_TYPES = ["쇼핑업", "숙박업", "식음료업", "여가서비스업", "여행업", "운송업"]
+
+# 시간대별 유동인구 가중치 (0~23시)
+HOURLY_PROFILE = np.array([
+    0.15, 0.10, 0.08, 0.06, 0.06, 0.10, 0.25, 0.55, 0.85, 0.75, 0.70, 0.85,
+    1.00, 0.95, 0.80, 0.75, 0.80, 0.95, 1.00, 0.90, 0.75, 0.55, 0.40, 0.25
+])
+
+def seeded_rng(seed: int, *key: Any) -> np.random.Generator:
+    """(시드, 키) 조합별 독립 난수 생성기 - 생성 순서와 무관하게 같은 값 보장"""
+    return np.random.default_rng([seed, zlib.crc32(repr(key).encode('utf-8'))])
+
+def read_source_csv(source_dir: str, filename: str) -> pd.DataFrame:
+    return pd.read_csv(os.path.join(source_dir, filename), encoding='utf-8-sig')
+
+def write_csv(path: str, header: List[str], rows: Iterator[List[Any]]) -> int:
+    count = 0
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+@functools.lru_cache(maxsize=None)
+def region_districts(source_dir: str, region_index: int) -> List[str]:
+    """지역별 기초지자체 이름 (첫 지역은 원본 지역 데이터의 실제 구 이름 사용)"""
+    if region_index == 0:
+        return list(read_source_csv(source_dir, 'regional_expenditure.csv').iloc[:, 0])
+    short_name = REGIONS[region_index][0][:2]
+    return [f"{short_name}{number}구" for number in range(1, DISTRICTS_PER_REGION + 1)]
+
+def polygon(rng: np.random.Generator, center_lng: float, center_lat: float) -> List[float]:
+    """중심점 주변의 닫힌 다각형 경계 (경도, 위도 교차 배열)"""
+    vertex_count = int(rng.integers(6, 13))
+    angles = np.sort(rng.uniform(0, 2 * math.pi, vertex_count))
+    radii = rng.uniform(0.0015, 0.0045, vertex_count)
+    # 위도 방향 거리 보정 (경도 1도가 위도 1도보다 짧음)
+    lngs = center_lng + radii * np.cos(angles) / math.cos(math.radians(center_lat))
+    lats = center_lat + radii * np.sin(angles)
+    coords = []
+    for lng, lat in zip(np.append(lngs, lngs[0]), np.append(lats, lats[0])):
+        coords.extend([round(float(lng), 10), round(float(lat), 10)])
+    return coords
+
+def generate_markets(args, region_count: int) -> List[Dict[str, Any]]:
+    total = args.markets_per_scale * args.scale
+    markets = []
+    for index in range(total):
+        region_index = index % region_count
+        region_name, city_code, prefix, center_lng, center_lat = REGIONS[region_index]
+        number = index // region_count + 1
+        districts = region_districts(args.source, region_index)
+        district_index = (number - 1) % len(districts)
+
+        rng = seeded_rng(args.seed, 'market', region_index, number)
+        # 지역 중심에서 반경 약 15km 이내, 구별로 방향을 나누어 배치
+        bearing = 2 * math.pi * district_index / len(districts) + rng.uniform(-0.5, 0.5)
+        distance = rng.uniform(0.01, 0.12)
+        market_lng = center_lng + distance * math.cos(bearing)
+        market_lat = center_lat + distance * math.sin(bearing) * 0.8
+
+        markets.append({
+            "market_code": f"{prefix}{number:03d}",
+            "market_name": f"{districts[district_index]} {MARKET_NAME_SUFFIXES[number % len(MARKET_NAME_SUFFIXES)]} {number}",
+            "market_type": MARKET_TYPES[number % len(MARKET_TYPES)],
+            "city_code": city_code,
+            "city_name": region_name,
+            "district_code": f"{city_code}{(district_index + 1) * 10:03d}",
+            "district_name": districts[district_index],
+            "center": (market_lng, market_lat),
+            "coordinates": polygon(rng, market_lng, market_lat)
+        })
+    return markets
+
+def write_market_files(out_dir: str, markets: List[Dict[str, Any]]) -> int:
+    header = ["상권코드", "상권명", "상권유형", "시도코드", "시도명", "시군구코드", "시군구명", "좌표개수", "좌표", "기준일자"]
+    count = write_csv(os.path.join(out_dir, 'market_data.csv'), header, (
+        [market["market_code"], market["market_name"], market["market_type"], market["city_code"],
+         market["city_name"], market["district_code"], market["district_name"],
+         len(market["coordinates"]) // 2, "|".join(str(value) for value in market["coordinates"]), "2024-12-31"]
+        for market in markets
+    ))
+
+    # 상권 목록 API 응답 형식 (markets.json과 동일 구조)
+    payload = {
+        "data": {
+            "markets": [
+                {
+                    "city_name": market["city_name"],
+                    "coordinates": [
+                        {"lng": market["coordinates"][i], "lat": market["coordinates"][i + 1]}
+                        for i in range(0, len(market["coordinates"]), 2)
+                    ],
+                    "district_name": market["district_name"],
+                    "market_code": market["market_code"],
+                    "market_name": market["market_name"],
+                    "market_type": market["market_type"]
+                }
+                for market in markets
+            ],
+            "pagination": {"page": 1, "limit": len(markets), "total": len(markets), "total_pages": 1}
+        },
+        "message": "합성 상권 데이터",
+        "success": True,
+        "timestamp": "2024-12-31T00:00:00"
+    }
+    with open(os.path.join(out_dir, 'markets.json'), 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False)
+    return count
+
+def month_range(end_month: int, months: int) -> List[int]:
+    year, month = divmod(end_month, 100)
+    result = []
+    for _ in range(months):
+        result.append(year * 100 + month)
+        month -= 1
+        if month == 0:
+            year, month = year - 1, 12
+    return result[::-1]
+
+def write_tourism(args, out_dir: str, region_count: int) -> int:
+    source = read_source_csv(args.source, 'tourism_consumption.csv')
+    source.columns = ['year_month', 'region', 'category', 'consumption_amount']
+    category_means = source.groupby('category', sort=False)['consumption_amount'].mean()
+    months = month_range(int(source['year_month'].max()), args.months)
+    month_numbers = np.array([month % 100 for month in months])
+
+    def rows():
+        for region_index in range(region_count):
+            region_name = REGIONS[region_index][0]
+            region_factor = seeded_rng(args.seed, 'region', region_index).uniform(0.4, 2.5)
+            for category, mean in category_means.items():
+                rng = seeded_rng(args.seed, 'tourism', region_index, category)
+                # 계절성 + 완만한 추세 + 잡음
+                seasonal = 1 + 0.15 * np.sin(2 * math.pi * (month_numbers - 4) / 12)
+                trend = np.linspace(1 - 0.002 * args.months, 1, args.months)
+                noise = rng.normal(1, 0.05, args.months)
+                values = mean * region_factor * seasonal * trend * noise
+                for month, value in zip(months, values):
+                    yield [month, region_name, category, f"{max(float(value), 0.0):.6E}"]
+
+    return write_csv(os.path.join(out_dir, 'tourism_consumption.csv'),
+                     ["기준년월", "광역지자체", "중분류", "소비액(천원)"], rows())
+
+def write_industry(args, out_dir: str) -> int:
+    source = read_source_csv(args.source, 'industry_expenditure.csv')
+    source.columns = ['major_category', 'minor_category', 'major_ratio', 'minor_ratio']
+    variants = max(1, int(math.ceil(math.log10(args.scale))) + 1)
+
+    def rows():
+        for major, group in source.groupby('major_category', sort=False):
+            # 원본 중분류를 먼저 두어 대분류 첫 행 기준 조회 결과를 유지
+            entries = [(row.minor_category, row.minor_ratio) for row in group.itertuples()]
+            for variant in range(2, variants + 1):
+                rng = seeded_rng(args.seed, 'industry', major, variant)
+                entries += [(f"{minor} {variant}", float(rng.uniform(0, 10))) for minor, _ in entries[:len(group)]]
+            total = sum(ratio for _, ratio in entries) or 1.0
+            for minor, ratio in entries:
+                yield [major, minor, group['major_ratio'].iloc[0], round(ratio * 100 / total, 1)]
+
+    return write_csv(os.path.join(out_dir, 'industry_expenditure.csv'),
+                     ["대분류", "중분류", "대분류 지출액 비율", "중분류 지출액 비율"], rows())
+
+def write_regional(args, out_dir: str, region_count: int) -> int:
+    source = read_source_csv(args.source, 'regional_expenditure.csv')
+    entries = [(row[0], float(row[1])) for row in source.itertuples(index=False)]
+    for region_index in range(1, region_count):
+        rng = seeded_rng(args.seed, 'regional', region_index)
+        entries += [(district, float(rng.uniform(1, 40))) for district in region_districts(args.source, region_index)]
+    total = sum(ratio for _, ratio in entries)
+
+    return write_csv(os.path.join(out_dir, 'regional_expenditure.csv'),
+                     ["기초지자체 명", "기초지자체 지출액 비율(%)"],
+                     ([district, round(ratio * 100 / total, 2)] for district, ratio in entries))
+
+def chunked(rows: Iterator[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def foot_traffic_rows(args, area_id: int, market_index: int, dates: List[date]) -> Iterator[Dict[str, Any]]:
+    rng = seeded_rng(args.seed, 'foot_traffic', market_index)
+    base = rng.uniform(200, 3000)
+    weekday_factor = np.array([1.0, 0.95, 0.95, 1.0, 1.15, 1.35, 1.25])
+    for day in dates:
+        counts = rng.poisson(base * HOURLY_PROFILE * weekday_factor[day.weekday()])
+        ages = rng.dirichlet([2, 3, 3, 2, 1.5], len(counts))
+        male_share = rng.uniform(0.4, 0.6, len(counts))
+        dwell = rng.gamma(4, 8, len(counts))
+        for hour, count in enumerate(counts.tolist()):
+            age_counts = (ages[hour] * count).astype(int)
+            yield {
+                "area_id": area_id, "date": day, "day_of_week": day.weekday(), "hour": hour,
+                "foot_traffic_count": count,
+                "age_20s": int(age_counts[0]), "age_30s": int(age_counts[1]), "age_40s": int(age_counts[2]),
+                "age_50s": int(age_counts[3]), "age_60s": int(age_counts[4]),
+                "male_count": int(count * male_share[hour]), "female_count": count - int(count * male_share[hour]),
+                "dwell_time_avg": round(float(dwell[hour]), 1)
+            }
+
+def sales_rows(args, area_id: int, market_index: int, dates: List[date]) -> Iterator[Dict[str, Any]]:
+    rng = seeded_rng(args.seed, 'sales', market_index)
+    base = rng.uniform(2_000_000, 30_000_000, len(BUSINESS_TYPES))
+    for day in dates:
+        totals = (base * rng.lognormal(0, 0.25, len(BUSINESS_TYPES))).astype(np.int64)
+        transactions = np.maximum(1, (totals / rng.uniform(8000, 40000, len(BUSINESS_TYPES))).astype(int))
+        ages = rng.dirichlet([2, 3, 3, 2, 1.5], len(BUSINESS_TYPES))
+        male_share = rng.uniform(0.35, 0.65, len(BUSINESS_TYPES))
+        for index, business_type in enumerate(BUSINESS_TYPES):
+            total = int(totals[index])
+            age_sales = (ages[index] * total).astype(np.int64)
+            yield {
+                "area_id": area_id, "date": day, "business_type": business_type,
+                "total_sales": total, "transaction_count": int(transactions[index]),
+                "avg_transaction_amount": round(total / int(transactions[index]), 1),
+                "age_20s_sales": int(age_sales[0]), "age_30s_sales": int(age_sales[1]), "age_40s_sales": int(age_sales[2]),
+                "age_50s_sales": int(age_sales[3]), "age_60s_sales": int(age_sales[4]),
+                "male_sales": int(total * male_share[index]), "female_sales": total - int(total * male_share[index])
+            }
+
+def populate_database(args, markets: List[Dict[str, Any]]) -> Dict[str, int]:
+    """상권/유동인구/매출 행을 Core executemany로 일괄 삽입"""
+    from sqlalchemy import create_engine, delete, insert, select
+
+    from models import (CommercialArea, FootTrafficData, FootTrafficDailyRollup, FootTrafficMonthlyRollup,
+                        SalesData, SalesDailyRollup, SalesMonthlyRollup)
+    from services import rollups
+
+    tables = [CommercialArea.__table__, FootTrafficData.__table__, SalesData.__table__,
+              FootTrafficDailyRollup.__table__, FootTrafficMonthlyRollup.__table__,
+              SalesDailyRollup.__table__, SalesMonthlyRollup.__table__]
+    engine = create_engine(args.database_url)
+    CommercialArea.metadata.create_all(engine, tables=tables)
+
+    end_date = date(2024, 12, 31)
+    dates = [end_date - timedelta(days=offset) for offset in range(args.days - 1, -1, -1)]
+    codes = [market["market_code"] for market in markets]
+    counts = {"commercial_area": len(markets), "foot_traffic_data": 0, "sales_data": 0}
+
+    with engine.begin() as connection:
+        # 같은 코드의 기존 합성 데이터를 지우고 다시 생성 (재실행 시에도 결과 동일)
+        existing = select(CommercialArea.id).where(CommercialArea.area_code.in_(codes)).scalar_subquery()
+        connection.execute(delete(FootTrafficData.__table__).where(FootTrafficData.area_id.in_(existing)))
+        connection.execute(delete(SalesData.__table__).where(SalesData.area_id.in_(existing)))
+        for table in tables[3:]:
+            connection.execute(delete(table).where(table.c.area_id.in_(existing)))
+        connection.execute(delete(CommercialArea.__table__).where(CommercialArea.area_code.in_(codes)))
+
+        connection.execute(insert(CommercialArea.__table__), [
+            {
+                "area_code": market["market_code"], "area_name": market["market_name"],
+                "address": f"{market['city_name']} {market['district_name']}",
+                "latitude": market["center"][1], "longitude": market["center"][0], "radius": 500
+            }
+            for market in markets
+        ])
+        area_ids = dict(connection.execute(
+            select(CommercialArea.area_code, CommercialArea.id).where(CommercialArea.area_code.in_(codes))
+        ).all())
+
+    started = time.perf_counter()
+    for market_index, market in enumerate(markets):
+        area_id = area_ids[market["market_code"]]
+        with engine.begin() as connection:
+            for chunk in chunked(foot_traffic_rows(args, area_id, market_index, dates), args.batch_size):
+                connection.execute(insert(FootTrafficData.__table__), chunk)
+                rollups.apply_foot_traffic(connection, chunk)
+                counts["foot_traffic_data"] += len(chunk)
+            for chunk in chunked(sales_rows(args, area_id, market_index, dates), args.batch_size):
+                connection.execute(insert(SalesData.__table__), chunk)
+                rollups.apply_sales(connection, chunk)
+                counts["sales_data"] += len(chunk)
+
+        if (market_index + 1) % 50 == 0 or market_index + 1 == len(markets):
+            elapsed = time.perf_counter() - started
+            inserted = counts["foot_traffic_data"] + counts["sales_data"]
+            print(f"  DB {market_index + 1}/{len(markets)} 상권, {inserted:,}행 ({inserted / max(elapsed, 1e-9):,.0f}행/초)")
+
+    return counts
+
+def main():
+    parser = argparse.ArgumentParser(description="규모 테스트용 합성 데이터 생성")
+    parser.add_argument('--scale', type=int, default=10, help="상권 수 배수 (1배 = 상권 50개)")
+    parser.add_argument('--out', required=True, help="출력 데이터 디렉터리")
+    parser.add_argument('--source', default=SOURCE_DIR, help="기준 데이터 디렉터리 (기본: benchmarks/fixtures)")
+    parser.add_argument('--regions', type=int, default=None, help=f"광역지자체 수 (최대 {len(REGIONS)}, 기본: 배수에 비례)")
+    parser.add_argument('--months', type=int, default=None, help="관광 소비 기간 (개월, 기본: 12 x 배수, 최대 120)")
+    parser.add_argument('--markets-per-scale', type=int, default=50)
+    parser.add_argument('--database-url', default=None, help="지정 시 상권/유동인구/매출 데이터를 DB에 삽입")
+    parser.add_argument('--days', type=int, default=30, help="DB 유동인구/매출 데이터 일수")
+    parser.add_argument('--batch-size', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=31)
+    args = parser.parse_args()
+
+    region_count = min(len(REGIONS), args.regions or max(1, int(math.ceil(math.sqrt(args.scale)))))
+    args.months = args.months or min(120, 12 * args.scale)
+    os.makedirs(args.out, exist_ok=True)
+
+    markets = generate_markets(args, region_count)
+    rows = {
+        "market_data": write_market_files(args.out, markets),
+        "tourism_consumption": write_tourism(args, args.out, region_count),
+        "industry_expenditure": write_industry(args, args.out),
+        "regional_expenditure": write_regional(args, args.out, region_count)
+    }
+    print(f"CSV 생성 완료: {args.out} {rows}")
+
+    if args.database_url:
+        rows.update(populate_database(args, markets))
+        print(f"DB 삽입 완료: {args.database_url}")
+
+    manifest = {
+        "created_at": datetime.now().isoformat(timespec='seconds'),
+        "options": {
+            "scale": args.scale, "regions": region_count, "months": args.months,
+            "markets_per_scale": args.markets_per_scale, "days": args.days, "seed": args.seed,
+            "database_url": args.database_url
+        },
+        "rows": rows
+    }
+    with open(os.path.join(args.out, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+if __name__ == '__main__':
+    main()
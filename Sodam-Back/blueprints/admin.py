@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+운영 관리 API
+메트릭, 프로파일, 기동 리포트 등 운영 모니터링용 엔드포인트 (X-Admin-Token 헤더 필요, ADMIN_TOKEN 미설정 시 모두 거부)
+"""
+import hmac
+from flask import Blueprint, Response, current_app, request, jsonify, send_from_directory
+from services import startup
+from services.metrics import registry
+from services.profiling import list_profiles
+
+admin_bp = Blueprint('admin', __name__, url_prefix='/api/v1/admin')
+
+def is_admin_request() -> bool:
+    """관리자 토큰 확인 (토큰이 설정되지 않았으면 거부)"""
+    token = current_app.config.get("ADMIN_TOKEN")
+    if not token:
+        return False
+    return hmac.compare_digest(request.headers.get("X-Admin-Token", ""), token)
+
+@admin_bp.before_request
+def require_admin_token():
+    if not current_app.config.get("ADMIN_TOKEN"):
+        return jsonify({
+            "success": False,
+            "error": {
+                "code": "ADMIN_DISABLED",
+                "message": "ADMIN_TOKEN이 설정되지 않아 관리 API를 사용할 수 없습니다."
+            }
+        }), 403
+    if not is_admin_request():
+        return jsonify({
+            "success": False,
+            "error": {
+                "code": "UNAUTHORIZED",
+                "message": "관리자 토큰이 필요합니다."
+            }
+        }), 401
+
+@admin_bp.route('/metrics', methods=['GET'])
+def get_metrics():
+    """
+    Prometheus 메트릭 조회
+    
+    엔드포인트별 요청 수/에러 수/응답 시간 히스토그램, 데이터셋 로드 시간과 행 수,
+    캐시 적중/미스 수를 Prometheus 텍스트 포맷으로 반환합니다.
+    METRICS_DIR가 설정된 경우 모든 워커 프로세스의 값을 합산합니다.
+    """
+    return Response(registry.render(), mimetype='text/plain; version=0.0.4; charset=utf-8')
+
+@admin_bp.route('/profiles', methods=['GET'])
+def get_profiles():
+    """
+    저장된 요청 프로파일 목록 조회 (최신순)
+    
+    Query Parameters:
+    - limit: 조회 개수 (기본 20)
+    """
+    limit = request.args.get('limit', 20, type=int)
+    return jsonify({
+        "success": True,
+        "data": {
+            "enabled": bool(current_app.config.get("PROFILING_ENABLED")),
+            "profiles": list_profiles(current_app.config["PROFILE_DIR"], limit)
+        }
+    })
+
+@admin_bp.route('/profiles/<path:filename>', methods=['GET'])
+def download_profile(filename):
+    """프로파일 파일(.prof / .collapsed) 다운로드"""
+    return send_from_directory(current_app.config["PROFILE_DIR"], filename, as_attachment=True)
+
+@admin_bp.route('/startup', methods=['GET'])
+def get_startup_report():
+    """
+    기동 리포트 조회
+    
+    create_app 단계별 시간, 서비스 생성 시간, ready/첫 요청 시점을 반환합니다.
+    STARTUP_REPORT=true로 기동한 경우 모듈별 import 시간(누적 시간 상위 limit개)도 포함됩니다.
+    preload_app 운영 서버에서는 마스터에서 측정한 값에 워커의 지연 생성 서비스 기록이 더해집니다.
+    
+    Query Parameters:
+    - limit: import 시간 조회 개수 (기본 30)
+    """
+    limit = request.args.get('limit', 30, type=int)
+    return jsonify({
+        "success": True,
+        "data": startup.report(limit)
+    })
@@ -1,12 +1,24 @@
 from flask import request, jsonify
 from flask_restx import Namespace, Resource, fields
-from extensions import db, bcrypt
+from extensions import db
 from models import User
+from services import password_hashing
 from flask_jwt_extended import create_access_token
 from datetime import datetime
 
 auth_ns = Namespace('auth', description='사용자 인증 및 회원가입 API')
 
+def _busy_response(error: password_hashing.HashingBusyError):
+    """해싱 풀 대기열 초과 시 503 응답"""
+    return jsonify({
+        "success": False,
+        "error": {
+            "code": "SERVICE_BUSY",
+            "message": str(error),
+            "details": {}
+        }
+    }), 503, {"Retry-After": "1"}
+
 # 모델 정의
 login_model = auth_ns.model('LoginRequest', {
     'username': fields.String(
@@ -201,7 +213,10 @@ class Register(Resource):
                 }
             }), 400
 
-        pw_hash = bcrypt.generate_password_hash(password).decode()
+        try:
+            pw_hash = password_hashing.hash_password(password)
+        except password_hashing.HashingBusyError as e:
+            return _busy_response(e)
         user = User(
             username=username,
             email=email,
@@ -273,6 +288,7 @@ class Login(Resource):
         - **401**: 잘못된 아이디 또는 비밀번호
         - **403**: 비활성화된 계정
         - **500**: 서버 내부 오류
+        - **503**: 로그인 요청 폭주로 일시적으로 처리 불가 (Retry-After 헤더 참고)
         ''')
     def post(self):
         data = request.get_json() or {}
@@ -291,7 +307,11 @@ class Login(Resource):
 
         # 아이디로 사용자 찾기
         user = User.query.filter_by(username=username).first()
-        if not user or not bcrypt.check_password_hash(user.password_hash, password):
+        try:
+            valid = bool(user) and password_hashing.check_password(user.password_hash, password)
+        except password_hashing.HashingBusyError as e:
+            return _busy_response(e)
+        if not valid:
             return jsonify({
                 "success": False,
                 "error": {
@@ -312,6 +332,14 @@ class Login(Resource):
                 }
             }), 403
 
+        # 해시 비용 설정이 바뀌었으면 로그인 성공 시 새 비용으로 다시 저장 (실패해도 로그인은 진행)
+        if password_hashing.needs_rehash(user.password_hash):
+            try:
+                user.password_hash = password_hashing.hash_password(password)
+                db.session.commit()
+            except password_hashing.HashingBusyError:
+                db.session.rollback()
+
         # JWT 토큰 생성
         token = create_access_token(identity=user.id)
         
@@ -1,12 +1,12 @@
 from flask import request, jsonify
 from flask_restx import Namespace, Resource, fields
-from services.core_diagnosis_service import CoreDiagnosisService
+from services.lazy import lazy_service
 from datetime import datetime
 from typing import Dict, List, Any
 
 core_diagnosis_ns = Namespace('core-diagnosis', description='상권 진단 핵심 지표 API')
 
-core_diagnosis_service = CoreDiagnosisService()
+core_diagnosis_service = lazy_service("services.core_diagnosis_service", "CoreDiagnosisService")
 
 # 모델 정의
 foot_traffic_response = core_diagnosis_ns.model('FootTrafficResponse', {
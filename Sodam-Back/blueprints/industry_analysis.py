@@ -4,14 +4,35 @@
 생존율/폐업율, 리스크 분석 등
 """
 from flask import Blueprint, request, jsonify
-from services.data_loader import DataLoader
+from services.lazy import lazy_service
 from datetime import datetime
 import random
 
 industry_analysis_bp = Blueprint('industry_analysis', __name__, url_prefix='/api/v1/industry-analysis')
 
 # 데이터 로더 인스턴스
-data_loader = DataLoader()
+data_loader = lazy_service("services.data_loader", "DataLoader")
+
+def _business_survival_rates(industry, period, market_code=None):
+    """business_data 개업/폐업 이력 기반 업종별 n년 생존 통계 (사업체 데이터가 없으면 None)"""
+    from services import business_survival
+    if period not in business_survival.HORIZONS:
+        return None
+    current = business_survival.table()
+    if current is None:
+        return None
+
+    rates = []
+    for business_type in current.business_types():
+        if industry and industry not in business_type:
+            continue
+        stats = current.group(area_code=market_code, business_type=business_type)
+        # 관측 기간이 period보다 짧은 업종은 제외
+        if stats is None or stats["horizons"][period] is None:
+            continue
+        rates.append(dict(stats["horizons"][period], industry=business_type, period=period,
+                          sample_size=stats["sample_size"], closures=stats["closures"]))
+    return rates, current.as_of.isoformat()
 
 @industry_analysis_bp.route('/')
 def industry_analysis():
@@ -39,6 +60,10 @@ def get_survival_rates():
     ### 쿼리 파라미터
     - **industry**: 특정 업종 필터 (선택사항)
     - **period**: 분석 기간 (1year, 3year, 5year, 기본값: 1year)
+    - **market_code**: 특정 상권 필터 (선택사항, 사업체 데이터가 있을 때만 적용)
+    
+    사업체 데이터(business_data)가 있으면 개업일/폐업일로 계산한 Kaplan-Meier 생존율과
+    95% 신뢰구간을 반환하고(source: business_data), 없으면 업종별 기준값을 반환합니다.
     
     ### 지원 업종
     - 식음료업, 쇼핑업, 숙박업, 여가서비스업, 운송업
@@ -79,6 +104,31 @@ def get_survival_rates():
         # 쿼리 파라미터
         industry = request.args.get('industry')
         period = request.args.get('period', '1year')  # 1year, 3year, 5year
+        market_code = request.args.get('market_code')
+        
+        engine = _business_survival_rates(industry, period, market_code)
+        if engine is not None:
+            rates, as_of = engine
+            return jsonify({
+                "success": True,
+                "data": {
+                    "survival_rates": [{
+                        "industry": rate["industry"],
+                        "survival_rate": rate["survival_rate"],
+                        "period": period,
+                        "sample_size": rate["sample_size"],
+                        "at_risk": rate["at_risk"],
+                        "confidence_interval": rate["confidence_interval"],
+                        "confidence_level": 95
+                    } for rate in rates],
+                    "period": period,
+                    "market_code": market_code,
+                    "last_updated": as_of,
+                    "source": "business_data"
+                },
+                "message": "업종별 생존율을 성공적으로 조회했습니다.",
+                "timestamp": datetime.utcnow().isoformat()
+            })
         
         # 실제 데이터가 없으므로 샘플 데이터 생성
         industries = [
@@ -144,11 +194,37 @@ def get_survival_rates():
 
 @industry_analysis_bp.route('/closure-rates', methods=['GET'])
 def get_closure_rates():
-    """업종별 폐업율 조회"""
+    """업종별 폐업율 조회 (n년 폐업률 = 1 - n년 생존율, 파라미터와 데이터 출처는 생존율 조회와 같음)"""
     try:
         # 쿼리 파라미터
         industry = request.args.get('industry')
         period = request.args.get('period', '1year')
+        market_code = request.args.get('market_code')
+        
+        engine = _business_survival_rates(industry, period, market_code)
+        if engine is not None:
+            rates, as_of = engine
+            return jsonify({
+                "success": True,
+                "data": {
+                    "closure_rates": [{
+                        "industry": rate["industry"],
+                        "closure_rate": rate["closure_rate"],
+                        "period": period,
+                        "sample_size": rate["sample_size"],
+                        "closures": rate["closures"],
+                        "confidence_interval": [round(100 - rate["confidence_interval"][1], 1),
+                                                round(100 - rate["confidence_interval"][0], 1)],
+                        "risk_level": "HIGH" if rate["closure_rate"] > 40 else "MEDIUM" if rate["closure_rate"] > 20 else "LOW"
+                    } for rate in rates],
+                    "period": period,
+                    "market_code": market_code,
+                    "last_updated": as_of,
+                    "source": "business_data"
+                },
+                "message": "업종별 폐업율을 성공적으로 조회했습니다.",
+                "timestamp": datetime.utcnow().isoformat()
+            })
         
         industries = [
             "식음료업", "쇼핑업", "숙박업", "여가서비스업", "운송업",
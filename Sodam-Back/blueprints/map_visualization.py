@@ -1,11 +1,11 @@
 from flask import Blueprint, request, jsonify
-from services.map_visualization_service import MapVisualizationService
+from services.lazy import lazy_service
 from datetime import datetime
 from typing import Dict, List, Any
 
 map_visualization_bp = Blueprint('map_visualization', __name__, url_prefix='/api/v1/map-visualization')
 
-map_visualization_service = MapVisualizationService()
+map_visualization_service = lazy_service("services.map_visualization_service", "MapVisualizationService")
 
 @map_visualization_bp.route('/heatmap', methods=['GET'])
 def get_market_heatmap_data():
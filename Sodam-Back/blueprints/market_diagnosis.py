@@ -1,15 +1,16 @@
 #!/usr/bin/env python3
 """
-상권 진단 API (CSV 데이터 기반)
+상권 진단 API (CSV 데이터 기반, /areas는 DB 상권 정보)
 """
 from flask import Blueprint, request, jsonify
-from services.data_loader import DataLoader
+from services.lazy import lazy_service
+from services.query_counter import query_budget
 from datetime import datetime
 
 market_diagnosis_bp = Blueprint('market_diagnosis', __name__, url_prefix='/api/v1/market-diagnosis')
 
 # 데이터 로더 인스턴스
-data_loader = DataLoader()
+data_loader = lazy_service("services.data_loader", "DataLoader")
 
 @market_diagnosis_bp.route('/')
 def market_diagnosis():
@@ -105,14 +106,14 @@ def get_markets():
         
         # 결과 변환
         markets = []
-        for _, row in paginated_df.iterrows():
+        for position, row in paginated_df.iterrows():
             market = {
                 "market_code": row['market_code'],
                 "market_name": row['market_name'],
                 "city_name": row['city_name'],
                 "district_name": row['district_name'],
                 "market_type": row['market_type'],
-                "coordinates": row['coordinates']
+                "coordinates": data_loader.market_coordinates(position)
             }
             markets.append(market)
         
@@ -173,6 +174,138 @@ def get_market_detail(market_code):
             }
         }), 500
 
+@market_diagnosis_bp.route('/areas', methods=['GET'])
+@query_budget(2)
+def get_areas():
+    """
+    DB 상권 목록 조회 (상권 기본 정보만, 관계 데이터는 상세/분석 조회 사용)
+    
+    ### 쿼리 파라미터
+    - **limit**: 페이지당 결과 수 (기본값: 50, 최대: 100)
+    - **offset**: 페이지 오프셋 (기본값: 0)
+    """
+    try:
+        limit = min(max(int(request.args.get('limit', 50)), 1), 100)
+        offset = max(int(request.args.get('offset', 0)), 0)
+    except ValueError:
+        return jsonify({
+            "success": False,
+            "error": {
+                "code": "INVALID_PARAMETER",
+                "message": "limit, offset은 정수여야 합니다."
+            }
+        }), 400
+    
+    try:
+        from services import commercial_areas
+        result = commercial_areas.list_areas(limit, offset)
+        
+        return jsonify({
+            "success": True,
+            "data": {
+                "areas": result["areas"],
+                "pagination": {
+                    "total": result["total"],
+                    "limit": limit,
+                    "offset": offset,
+                    "has_more": offset + limit < result["total"]
+                }
+            },
+            "message": "상권 목록을 성공적으로 조회했습니다.",
+            "timestamp": datetime.utcnow().isoformat()
+        })
+        
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": {
+                "code": "INTERNAL_ERROR",
+                "message": f"상권 목록 조회 중 오류가 발생했습니다: {str(e)}"
+            }
+        }), 500
+
+@market_diagnosis_bp.route('/areas/<area_code>', methods=['GET'])
+@query_budget(3)
+def get_area_detail(area_code):
+    """DB 상권 상세 조회 (업종별 사업체 수, 업종별 리스크 분류 요약 포함)"""
+    try:
+        from services import commercial_areas
+        detail = commercial_areas.area_detail(area_code)
+        
+        if detail is None:
+            return jsonify({
+                "success": False,
+                "error": {
+                    "code": "NOT_FOUND",
+                    "message": "해당 상권을 찾을 수 없습니다."
+                }
+            }), 404
+        
+        return jsonify({
+            "success": True,
+            "data": detail,
+            "message": "상권 상세 정보를 성공적으로 조회했습니다.",
+            "timestamp": datetime.utcnow().isoformat()
+        })
+        
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": {
+                "code": "INTERNAL_ERROR",
+                "message": f"상권 상세 정보 조회 중 오류가 발생했습니다: {str(e)}"
+            }
+        }), 500
+
+@market_diagnosis_bp.route('/areas/<area_code>/analytics', methods=['GET'])
+@query_budget(3)
+def get_area_analytics(area_code):
+    """
+    DB 상권 월별 유동인구/매출 추이 (집계 테이블 기반)
+    
+    ### 쿼리 파라미터
+    - **months**: 최근 개월 수 (기본값: 12, 최대: 60)
+    """
+    try:
+        months = min(max(int(request.args.get('months', 12)), 1), 60)
+    except ValueError:
+        return jsonify({
+            "success": False,
+            "error": {
+                "code": "INVALID_PARAMETER",
+                "message": "months는 정수여야 합니다."
+            }
+        }), 400
+    
+    try:
+        from services import commercial_areas
+        analytics = commercial_areas.area_analytics(area_code, months)
+        
+        if analytics is None:
+            return jsonify({
+                "success": False,
+                "error": {
+                    "code": "NOT_FOUND",
+                    "message": "해당 상권을 찾을 수 없습니다."
+                }
+            }), 404
+        
+        return jsonify({
+            "success": True,
+            "data": analytics,
+            "message": "상권 월별 추이를 성공적으로 조회했습니다.",
+            "timestamp": datetime.utcnow().isoformat()
+        })
+        
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": {
+                "code": "INTERNAL_ERROR",
+                "message": f"상권 월별 추이 조회 중 오류가 발생했습니다: {str(e)}"
+            }
+        }), 500
+
 @market_diagnosis_bp.route('/districts', methods=['GET'])
 def get_districts():
     """지역구 목록 조회"""
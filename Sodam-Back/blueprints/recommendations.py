@@ -4,14 +4,14 @@
 개인화된 추천 서비스
 """
 from flask import Blueprint, request, jsonify
-from services.recommendation_service import RecommendationService
+from services.lazy import lazy_service
 from datetime import datetime
 from typing import Dict, List, Any
 
 recommendations_bp = Blueprint('recommendations', __name__, url_prefix='/api/v1/recommendations')
 
 # 추천 서비스 인스턴스
-recommendation_service = RecommendationService()
+recommendation_service = lazy_service("services.recommendation_service", "RecommendationService")
 
 @recommendations_bp.route('/')
 def recommendations():
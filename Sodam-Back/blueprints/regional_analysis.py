@@ -4,14 +4,14 @@
 인구수, 임대료, 상권 밀도 등
 """
 from flask import Blueprint, request, jsonify
-from services.data_loader import DataLoader
+from services.lazy import lazy_service
 from datetime import datetime
 import random
 
 regional_analysis_bp = Blueprint('regional_analysis', __name__, url_prefix='/api/v1/regional-analysis')
 
 # 데이터 로더 인스턴스
-data_loader = DataLoader()
+data_loader = lazy_service("services.data_loader", "DataLoader")
 
 @regional_analysis_bp.route('/')
 def regional_analysis():
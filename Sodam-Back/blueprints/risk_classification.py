@@ -1,11 +1,11 @@
 from flask import Blueprint, request, jsonify
-from services.risk_analysis_service import RiskAnalysisService
+from services.lazy import lazy_service
 from datetime import datetime
 from typing import Dict, List, Any
 
 risk_classification_bp = Blueprint('risk_classification', __name__, url_prefix='/api/v1/risk-classification')
 
-risk_analysis_service = RiskAnalysisService()
+risk_analysis_service = lazy_service("services.risk_analysis_service", "RiskAnalysisService")
 
 @risk_classification_bp.route('/classify/<string:market_code>', methods=['POST'])
 def classify_risk_type(market_code: str):
@@ -79,6 +79,42 @@ def classify_risk_type(market_code: str):
             }
         }), 500
 
+@risk_classification_bp.route('/districts/<string:district>/risk-types', methods=['GET'])
+def get_district_risk_types(district: str):
+    """
+    지역구 내 상권별 리스크 유형 일괄 조회
+    
+    저장된 분류 결과를 (지역구, 업종) 인덱스로 한 번에 조회합니다. 상권별로 분류를 다시 계산하지 않으며,
+    아직 분류되지 않은 상권은 포함되지 않습니다 (`flask risk refresh --all --district <지역구>`로 미리 분류).
+    
+    ### 경로 파라미터
+    - **district**: 지역구 (예: 유성구)
+    
+    ### 쿼리 파라미터
+    - **industry**: 업종 (생략 시 업종 미지정 분류)
+    
+    ### 응답
+    - **markets**: 상권별 market_code, market_name, risk_type, risk_score, risk_level, health_score, stale, classified_at
+      (리스크 점수 내림차순, stale=true는 이전 데이터 버전으로 분류되어 재분류 대기 중인 결과)
+    - **count**, **stale_count**, **data_version**
+    """
+    try:
+        from services import risk_store
+        industry = request.args.get('industry')
+        
+        return jsonify({
+            "success": True,
+            "data": risk_store.district_risk_types(district, industry)
+        })
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": {
+                "code": "INTERNAL_ERROR",
+                "message": str(e)
+            }
+        }), 500
+
 @risk_classification_bp.route('/detailed-analysis/<string:market_code>', methods=['POST'])
 def get_detailed_risk_analysis(market_code: str):
     """특정 리스크 유형의 상세 분석"""
@@ -4,13 +4,13 @@
 상권, 업종, 지역 데이터를 종합하여 점수 계산
 """
 from flask import Blueprint, request, jsonify
-from services.scoring_service import ScoringService
+from services.lazy import lazy_service
 from datetime import datetime
 
 scoring_bp = Blueprint('scoring', __name__, url_prefix='/api/v1/scoring')
 
 # 점수 계산 서비스 인스턴스
-scoring_service = ScoringService()
+scoring_service = lazy_service("services.scoring_service", "ScoringService")
 
 @scoring_bp.route('/')
 def scoring():
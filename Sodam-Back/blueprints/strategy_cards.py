@@ -1,11 +1,11 @@
 from flask import Blueprint, request, jsonify
-from services.strategy_card_service import StrategyCardService
+from services.lazy import lazy_service
 from datetime import datetime
 from typing import Dict, List, Any
 
 strategy_cards_bp = Blueprint('strategy_cards', __name__, url_prefix='/api/v1/strategy-cards')
 
-strategy_card_service = StrategyCardService()
+strategy_card_service = lazy_service("services.strategy_card_service", "StrategyCardService")
 
 @strategy_cards_bp.route('/generate', methods=['POST'])
 def generate_strategy_cards():
@@ -1,11 +1,11 @@
 from flask import Blueprint, request, jsonify
-from services.support_tools_service import SupportToolsService
+from services.lazy import lazy_service
 from datetime import datetime
 from typing import Dict, List, Any
 
 support_tools_bp = Blueprint('support_tools', __name__, url_prefix='/api/v1/support-tools')
 
-support_tools_service = SupportToolsService()
+support_tools_service = lazy_service("services.support_tools_service", "SupportToolsService")
 
 @support_tools_bp.route('/support-centers', methods=['GET'])
 def get_support_centers():
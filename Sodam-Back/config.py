@@ -3,5 +3,107 @@ import os
 class Config:
     SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL", "sqlite:///app.db")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # DB 엔진 프로파일: auto(URI로 판단) / sqlite(연결 시 PRAGMA) / server(커넥션 풀 설정) / none
+    DB_ENGINE_PROFILE = os.getenv("DB_ENGINE_PROFILE", "auto")
+    SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    SQLITE_MMAP_SIZE_MB = int(os.getenv("SQLITE_MMAP_SIZE_MB", "256"))
+    SQLITE_CACHE_SIZE_MB = int(os.getenv("SQLITE_CACHE_SIZE_MB", "64"))
+    # 워커 프로세스별 풀 (기본 pool_size = 워커 스레드 수)
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", os.getenv("THREADS", "4")))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "4"))
+    DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    # 읽기 전용 복제본 (분석 조회를 주 DB의 인증/예약 쓰기와 분리, 미설정 시 모든 조회가 주 DB)
+    DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+
     SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret-key")
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "dev-jwt-secret")
+
+    # 운영 서버(gunicorn pre-fork) 설정
+    PORT = int(os.getenv("PORT", "5000"))
+    WORKERS = int(os.getenv("WEB_CONCURRENCY", str((os.cpu_count() or 1) * 2 + 1)))
+    THREADS = int(os.getenv("THREADS", "4"))
+    WORKER_TIMEOUT = int(os.getenv("WORKER_TIMEOUT", "60"))
+    # 워커 역할: full(전체 API) / auth(로그인·회원가입 전용, 분석 서비스와 pandas를 불러오지 않음)
+    APP_ROLE = os.getenv("APP_ROLE", "full")
+    # create_app 시점에 CSV 데이터셋과 조회 인덱스를 미리 로드할지 여부
+    PRELOAD_DATASETS = os.getenv("PRELOAD_DATASETS", "false").lower() == "true"
+
+    # 요청별 단계 시간(data_load, filter, indicators, text, json)을 Server-Timing 헤더로 노출
+    SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "false").lower() == "true"
+
+    # 요청별 DB 쿼리 수: X-Query-Count 헤더, query_budget이 없는 엔드포인트의 상한, 상한 초과 시 예외(테스트용)
+    QUERY_COUNT_HEADER = os.getenv("QUERY_COUNT_HEADER", "false").lower() == "true"
+    QUERY_BUDGET_DEFAULT = int(os.getenv("QUERY_BUDGET_DEFAULT", "0")) or None
+    QUERY_BUDGET_STRICT = os.getenv("QUERY_BUDGET_STRICT", "false").lower() == "true"
+
+    # 메트릭 수집 (METRICS_DIR 지정 시 워커 프로세스 간 mmap 파일로 합산)
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    METRICS_DIR = os.getenv("METRICS_DIR")
+
+    # 서비스 결과 캐시 (동일 인자 동시 계산 병합 + TTL 만료 전 확률적 조기 갱신)
+    RESULT_CACHE_ENABLED = os.getenv("RESULT_CACHE_ENABLED", "true").lower() == "true"
+    RESULT_CACHE_TTL = float(os.getenv("RESULT_CACHE_TTL", "300"))
+    RESULT_CACHE_BETA = float(os.getenv("RESULT_CACHE_BETA", "1.0"))
+    RESULT_CACHE_MAX_ENTRIES = int(os.getenv("RESULT_CACHE_MAX_ENTRIES", "1024"))
+    # 캐시 키에 넣는 DB 데이터 버전(집계 테이블, business_data) 확인 주기(초)
+    RESULT_CACHE_VERSION_CHECK = float(os.getenv("RESULT_CACHE_VERSION_CHECK", "5"))
+
+    # 워커 공유 결과 캐시 (로컬 SQLite 파일, 미설정 시 비활성화)
+    SHARED_CACHE_PATH = os.getenv("SHARED_CACHE_PATH")
+    SHARED_CACHE_MAX_MB = float(os.getenv("SHARED_CACHE_MAX_MB", "64"))
+    SHARED_CACHE_TTL = float(os.getenv("SHARED_CACHE_TTL", "3600"))
+
+    # 데이터셋 숫자 배열을 워커 간 공유하는 memmap 파일 디렉터리 (미설정 시 프로세스 메모리 사용)
+    SHARED_ARRAYS_DIR = os.getenv("SHARED_ARRAYS_DIR")
+
+    # 리스크 분류 저장소 (RiskAnalysis 테이블, 데이터 버전이 같으면 재계산 없이 응답)
+    RISK_STORE_ENABLED = os.getenv("RISK_STORE_ENABLED", "true").lower() == "true"
+    # 데이터 버전이 바뀐 분류 결과를 워커별 백그라운드 스레드가 재분류하는 주기(초, 0이면 끔)와 1회 처리 건수
+    RISK_REFRESH_INTERVAL = float(os.getenv("RISK_REFRESH_INTERVAL", "0"))
+    RISK_REFRESH_BATCH = int(os.getenv("RISK_REFRESH_BATCH", "50"))
+
+    # 경쟁 사업체 밀도 표 (business_data 기반, 데이터 버전별 캐시) 버전 확인 주기(초)
+    COMPETITION_VERSION_CHECK = float(os.getenv("COMPETITION_VERSION_CHECK", "30"))
+    # 사업체 생존/폐업 표 (Kaplan-Meier, 데이터 버전별 캐시) 버전 확인 주기(초)
+    SURVIVAL_VERSION_CHECK = float(os.getenv("SURVIVAL_VERSION_CHECK", "30"))
+
+    # 관리 API(/api/v1/admin) 접근 토큰 (X-Admin-Token 헤더, 설정하지 않으면 관리 API 비활성화)
+    ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+
+    # 비밀번호 해싱 (bcrypt 비용과 전용 해싱 풀, 대기열 초과 시 503 응답)
+    BCRYPT_LOG_ROUNDS = int(os.getenv("BCRYPT_LOG_ROUNDS", "12"))
+    BCRYPT_POOL_MODE = os.getenv("BCRYPT_POOL_MODE", "process")
+    BCRYPT_POOL_SIZE = int(os.getenv("BCRYPT_POOL_SIZE", "2"))
+    BCRYPT_QUEUE_LIMIT = int(os.getenv("BCRYPT_QUEUE_LIMIT", "16"))
+    BCRYPT_ADMISSION_TIMEOUT = float(os.getenv("BCRYPT_ADMISSION_TIMEOUT", "0.5"))
+    BCRYPT_TIMEOUT = float(os.getenv("BCRYPT_TIMEOUT", "10"))
+
+    # Swagger 스펙 제공 방식: live(요청 시 생성) / static(기동·빌드 시 한 번 생성한 바이트를 ETag, gzip과 함께 응답) / off
+    SWAGGER_MODE = os.getenv("SWAGGER_MODE", "live")
+    # 빌드 시 `flask openapi dump`로 저장한 스펙 파일 (static 모드에서 있으면 기동 시 생성 생략)
+    SWAGGER_SPEC_PATH = os.getenv("SWAGGER_SPEC_PATH")
+
+    # 기동 리포트의 모듈별 import 시간 측정 (설정 클래스보다 먼저 필요하므로 services/startup.py가 환경 변수를 직접 읽음)
+    STARTUP_REPORT = os.getenv("STARTUP_REPORT", "false").lower() == "true"
+
+    # 온디맨드 요청 프로파일링 (X-Profile 헤더로 트리거, 결과는 PROFILE_DIR에 저장)
+    PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+    PROFILE_DIR = os.getenv("PROFILE_DIR", "/tmp/sodam-profiles")
+    PROFILE_SAMPLE_INTERVAL = float(os.getenv("PROFILE_SAMPLE_INTERVAL", "0.005"))
+    # X-Profile 서명의 최대 유효 기간(초, 만료 시각이 이보다 먼 미래면 거부)
+    PROFILE_SIGNATURE_MAX_AGE = int(os.getenv("PROFILE_SIGNATURE_MAX_AGE", "60"))
+
+class ProductionConfig(Config):
+    # 마스터 프로세스에서 데이터셋을 로드한 뒤 워커를 fork 하여 copy-on-write로 공유
+    PRELOAD_DATASETS = True
+    METRICS_DIR = os.getenv("METRICS_DIR", "/tmp/sodam-metrics")
+    # 재시작 후에도 유지되도록 메트릭 디렉터리와 별도 경로 사용
+    SHARED_CACHE_PATH = os.getenv("SHARED_CACHE_PATH", "/tmp/sodam-cache/results.db")
+    SHARED_ARRAYS_DIR = os.getenv("SHARED_ARRAYS_DIR", "/tmp/sodam-arrays")
+    # 스펙은 기동 시(또는 이미지 빌드 시) 한 번만 생성
+    SWAGGER_MODE = os.getenv("SWAGGER_MODE", "static")
@@ -1,10 +1,66 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session
 from flask_migrate import Migrate
 from flask_bcrypt import Bcrypt
 from flask_jwt_extended import JWTManager
 from flask_cors import CORS
+from sqlalchemy import event
+
+# 읽기 전용 복제본 bind 이름 (DATABASE_REPLICA_URL 설정 시 SQLALCHEMY_BINDS에 추가됨)
+REPLICA_BIND = "replica"
+# 세션(요청)에서 쓰기가 있었거나 read_your_writes()를 호출하면 이후 읽기를 주 DB로 보냄
+_PRIMARY_READS = "sodam_primary_reads"
+
+_replica_scope: ContextVar[bool] = ContextVar("sodam_replica_scope", default=False)
+
+class RoutingSession(Session):
+    """
+    읽기/쓰기 라우팅 세션
+    replica_reads() 범위에서 실행되는 SELECT는 복제본으로, 그 외(쓰기, FOR UPDATE, 범위 밖 조회)는 주 DB로 보낸다.
+    같은 세션에서 쓰기가 있었으면 복제 지연과 무관하게 자신이 쓴 값을 읽도록 이후 조회도 주 DB를 사용한다.
+    세션은 앱 컨텍스트(요청) 단위이므로 이 상태도 요청이 끝나면 초기화된다.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and self._routes_to_replica(clause):
+            return self._db.engines[REPLICA_BIND]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _routes_to_replica(self, clause) -> bool:
+        if not _replica_scope.get() or self.info.get(_PRIMARY_READS) or self._flushing:
+            return False
+        if not getattr(clause, "is_select", False) or getattr(clause, "_for_update_arg", None) is not None:
+            return False
+        if self._new or self._deleted or self.identity_map._modified:
+            return False
+        return REPLICA_BIND in self._db.engines
+
+@event.listens_for(RoutingSession, "after_flush")
+def _after_flush(session, flush_context):
+    session.info[_PRIMARY_READS] = True
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _on_execute(orm_execute_state):
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[_PRIMARY_READS] = True
+
+@contextmanager
+def replica_reads():
+    """범위 안의 조회를 복제본으로 보냄 (with 문 또는 서비스 메서드 데코레이터로 사용, 복제본 미설정 시 주 DB)"""
+    token = _replica_scope.set(True)
+    try:
+        yield
+    finally:
+        _replica_scope.reset(token)
+
+def read_your_writes():
+    """현재 요청의 남은 조회를 모두 주 DB로 보냄 (직전 요청에서 쓴 값을 바로 읽어야 하는 경우)"""
+    db.session.info[_PRIMARY_READS] = True
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 migrate = Migrate()
 bcrypt = Bcrypt()
 jwt = JWTManager()
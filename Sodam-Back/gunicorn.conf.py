@@ -0,0 +1,36 @@
+"""
+gunicorn 운영 서버 설정
+실행: gunicorn -c gunicorn.conf.py wsgi:app
+"""
+import gc
+# 기동 리포트 기준 시점 (STARTUP_REPORT=true이면 이후 import 시간 측정)
+from services import startup
+from config import Config, ProductionConfig
+from services import metrics
+
+bind = f"0.0.0.0:{Config.PORT}"
+workers = Config.WORKERS
+threads = Config.THREADS
+worker_class = "gthread"
+timeout = Config.WORKER_TIMEOUT
+
+# 마스터에서 앱과 데이터셋을 로드한 뒤 fork (워커마다 CSV를 다시 파싱하지 않음)
+preload_app = True
+
+accesslog = "-"
+errorlog = "-"
+
+# 이전 실행에서 남은 프로세스별 메트릭 파일 정리
+# (preload_app은 on_starting 훅보다 먼저 앱을 로드하므로 설정 로드 시점에 정리)
+metrics.clear_directory(ProductionConfig.METRICS_DIR)
+
+def when_ready(server):
+    # 워커 fork 직전: 로드된 객체를 GC 추적 대상에서 제외하여
+    # 워커의 GC가 공유 페이지를 건드려 복사가 일어나는 것을 줄인다.
+    gc.freeze()
+    server.log.info("데이터셋 로드 완료, 워커 %d개 x 스레드 %d개로 fork 합니다.", workers, threads)
+    server.log.info("%s", startup.summary())
+
+def child_exit(server, worker):
+    # 종료된 워커의 게이지 값은 합산에서 제외 (카운터는 유지)
+    metrics.mark_process_dead(worker.pid, ProductionConfig.METRICS_DIR)
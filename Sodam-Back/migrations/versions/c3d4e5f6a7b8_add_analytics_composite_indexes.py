@@ -0,0 +1,103 @@
+"""Add composite indexes for foot traffic and sales queries
+
+Revision ID: c3d4e5f6a7b8
+Revises: b2c3d4e5f6a7
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3d4e5f6a7b8'
+down_revision = 'b2c3d4e5f6a7'
+branch_labels = None
+depends_on = None
+
+
+def _create_analytics_tables(existing):
+    # 분석 테이블은 이전까지 db.create_all()로만 생성되었으므로 없을 때만 생성
+    if 'commercial_area' not in existing:
+        op.create_table('commercial_area',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('area_code', sa.String(length=20), nullable=False),
+        sa.Column('area_name', sa.String(length=100), nullable=False),
+        sa.Column('address', sa.String(length=200), nullable=False),
+        sa.Column('latitude', sa.Float(), nullable=False),
+        sa.Column('longitude', sa.Float(), nullable=False),
+        sa.Column('radius', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('commercial_area', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_commercial_area_area_code'), ['area_code'], unique=True)
+
+    if 'foot_traffic_data' not in existing:
+        op.create_table('foot_traffic_data',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('area_id', sa.Integer(), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('day_of_week', sa.Integer(), nullable=False),
+        sa.Column('hour', sa.Integer(), nullable=False),
+        sa.Column('foot_traffic_count', sa.Integer(), nullable=False),
+        sa.Column('age_20s', sa.Integer(), nullable=True),
+        sa.Column('age_30s', sa.Integer(), nullable=True),
+        sa.Column('age_40s', sa.Integer(), nullable=True),
+        sa.Column('age_50s', sa.Integer(), nullable=True),
+        sa.Column('age_60s', sa.Integer(), nullable=True),
+        sa.Column('male_count', sa.Integer(), nullable=True),
+        sa.Column('female_count', sa.Integer(), nullable=True),
+        sa.Column('dwell_time_avg', sa.Float(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['area_id'], ['commercial_area.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'sales_data' not in existing:
+        op.create_table('sales_data',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('area_id', sa.Integer(), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('business_type', sa.String(length=50), nullable=False),
+        sa.Column('total_sales', sa.BigInteger(), nullable=False),
+        sa.Column('transaction_count', sa.Integer(), nullable=False),
+        sa.Column('avg_transaction_amount', sa.Float(), nullable=False),
+        sa.Column('age_20s_sales', sa.BigInteger(), nullable=True),
+        sa.Column('age_30s_sales', sa.BigInteger(), nullable=True),
+        sa.Column('age_40s_sales', sa.BigInteger(), nullable=True),
+        sa.Column('age_50s_sales', sa.BigInteger(), nullable=True),
+        sa.Column('age_60s_sales', sa.BigInteger(), nullable=True),
+        sa.Column('male_sales', sa.BigInteger(), nullable=True),
+        sa.Column('female_sales', sa.BigInteger(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['area_id'], ['commercial_area.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    _create_analytics_tables(set(inspector.get_table_names()))
+
+    inspector = sa.inspect(op.get_bind())
+    foot_traffic_indexes = {index['name'] for index in inspector.get_indexes('foot_traffic_data')}
+    sales_indexes = {index['name'] for index in inspector.get_indexes('sales_data')}
+
+    with op.batch_alter_table('foot_traffic_data', schema=None) as batch_op:
+        if 'ix_foot_traffic_area_date_hour' not in foot_traffic_indexes:
+            batch_op.create_index('ix_foot_traffic_area_date_hour', ['area_id', 'date', 'hour'], unique=False)
+
+    with op.batch_alter_table('sales_data', schema=None) as batch_op:
+        if 'ix_sales_area_business_date' not in sales_indexes:
+            batch_op.create_index('ix_sales_area_business_date', ['area_id', 'business_type', 'date'], unique=False)
+
+
+def downgrade():
+    # 테이블은 이 리비전 이전부터 create_all로 존재했을 수 있으므로 인덱스만 제거
+    with op.batch_alter_table('sales_data', schema=None) as batch_op:
+        batch_op.drop_index('ix_sales_area_business_date')
+
+    with op.batch_alter_table('foot_traffic_data', schema=None) as batch_op:
+        batch_op.drop_index('ix_foot_traffic_area_date_hour')
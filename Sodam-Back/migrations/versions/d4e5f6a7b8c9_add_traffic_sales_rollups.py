@@ -0,0 +1,94 @@
+"""Add daily and monthly rollup tables for foot traffic and sales
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4e5f6a7b8c9'
+down_revision = 'c3d4e5f6a7b8'
+branch_labels = None
+depends_on = None
+
+
+def _foot_traffic_columns():
+    return [
+        sa.Column('total_count', sa.BigInteger(), nullable=False),
+        sa.Column('age_20s', sa.BigInteger(), nullable=False),
+        sa.Column('age_30s', sa.BigInteger(), nullable=False),
+        sa.Column('age_40s', sa.BigInteger(), nullable=False),
+        sa.Column('age_50s', sa.BigInteger(), nullable=False),
+        sa.Column('age_60s', sa.BigInteger(), nullable=False),
+        sa.Column('male_count', sa.BigInteger(), nullable=False),
+        sa.Column('female_count', sa.BigInteger(), nullable=False),
+        sa.Column('dwell_time_sum', sa.Float(), nullable=False),
+        sa.Column('row_count', sa.Integer(), nullable=False),
+    ]
+
+
+def _sales_columns():
+    return [
+        sa.Column('total_sales', sa.BigInteger(), nullable=False),
+        sa.Column('transaction_count', sa.BigInteger(), nullable=False),
+        sa.Column('age_20s_sales', sa.BigInteger(), nullable=False),
+        sa.Column('age_30s_sales', sa.BigInteger(), nullable=False),
+        sa.Column('age_40s_sales', sa.BigInteger(), nullable=False),
+        sa.Column('age_50s_sales', sa.BigInteger(), nullable=False),
+        sa.Column('age_60s_sales', sa.BigInteger(), nullable=False),
+        sa.Column('male_sales', sa.BigInteger(), nullable=False),
+        sa.Column('female_sales', sa.BigInteger(), nullable=False),
+        sa.Column('row_count', sa.Integer(), nullable=False),
+    ]
+
+
+def upgrade():
+    op.create_table('foot_traffic_daily_rollup',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('area_id', sa.Integer(), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    *_foot_traffic_columns(),
+    sa.ForeignKeyConstraint(['area_id'], ['commercial_area.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('area_id', 'date', name='uq_foot_traffic_daily_area_date')
+    )
+    op.create_table('foot_traffic_monthly_rollup',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('area_id', sa.Integer(), nullable=False),
+    sa.Column('month', sa.Date(), nullable=False),
+    *_foot_traffic_columns(),
+    sa.ForeignKeyConstraint(['area_id'], ['commercial_area.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('area_id', 'month', name='uq_foot_traffic_monthly_area_month')
+    )
+    op.create_table('sales_daily_rollup',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('area_id', sa.Integer(), nullable=False),
+    sa.Column('business_type', sa.String(length=50), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    *_sales_columns(),
+    sa.ForeignKeyConstraint(['area_id'], ['commercial_area.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('area_id', 'business_type', 'date', name='uq_sales_daily_area_business_date')
+    )
+    op.create_table('sales_monthly_rollup',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('area_id', sa.Integer(), nullable=False),
+    sa.Column('business_type', sa.String(length=50), nullable=False),
+    sa.Column('month', sa.Date(), nullable=False),
+    *_sales_columns(),
+    sa.ForeignKeyConstraint(['area_id'], ['commercial_area.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('area_id', 'business_type', 'month', name='uq_sales_monthly_area_business_month')
+    )
+
+
+def downgrade():
+    op.drop_table('sales_monthly_rollup')
+    op.drop_table('sales_daily_rollup')
+    op.drop_table('foot_traffic_monthly_rollup')
+    op.drop_table('foot_traffic_daily_rollup')
@@ -0,0 +1,57 @@
+"""Store latest risk classification per area and business type
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5f6a7b8c9d0'
+down_revision = 'd4e5f6a7b8c9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    # risk_analysis는 이전까지 db.create_all()로만 생성되었으므로 없으면 새로 생성
+    if 'risk_analysis' not in inspector.get_table_names():
+        op.create_table('risk_analysis',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('area_id', sa.Integer(), nullable=False),
+        sa.Column('business_type', sa.String(length=50), nullable=False),
+        sa.Column('district', sa.String(length=50), nullable=True),
+        sa.Column('risk_type', sa.String(length=50), nullable=False),
+        sa.Column('risk_score', sa.Float(), nullable=False),
+        sa.Column('health_score', sa.Float(), nullable=False),
+        sa.Column('analysis_data', sa.JSON(), nullable=False),
+        sa.Column('data_version', sa.String(length=64), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['area_id'], ['commercial_area.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('area_id', 'business_type', name='uq_risk_analysis_area_business')
+        )
+    else:
+        # 기존 행은 아무 곳에서도 쓰지 않았으므로 (상권, 업종) 중복이 없다고 가정
+        with op.batch_alter_table('risk_analysis', schema=None) as batch_op:
+            batch_op.add_column(sa.Column('district', sa.String(length=50), nullable=True))
+            batch_op.add_column(sa.Column('data_version', sa.String(length=64), nullable=True))
+            batch_op.add_column(sa.Column('updated_at', sa.DateTime(), nullable=True))
+            batch_op.create_unique_constraint('uq_risk_analysis_area_business', ['area_id', 'business_type'])
+
+    with op.batch_alter_table('risk_analysis', schema=None) as batch_op:
+        batch_op.create_index('ix_risk_analysis_district_business', ['district', 'business_type'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('risk_analysis', schema=None) as batch_op:
+        batch_op.drop_index('ix_risk_analysis_district_business')
+        batch_op.drop_constraint('uq_risk_analysis_area_business', type_='unique')
+        batch_op.drop_column('updated_at')
+        batch_op.drop_column('data_version')
+        batch_op.drop_column('district')
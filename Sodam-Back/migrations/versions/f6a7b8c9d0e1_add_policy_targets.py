@@ -0,0 +1,137 @@
+"""Normalize policy support targets and index strategy card filters
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f6a7b8c9d0e1'
+down_revision = 'e5f6a7b8c9d0'
+branch_labels = None
+depends_on = None
+
+
+def _area_keys(region):
+    words = (region or "").split()
+    return [" ".join(words[start:stop]) for start in range(len(words)) for stop in range(start + 1, len(words) + 1)]
+
+
+def _json_list(value):
+    if isinstance(value, str):
+        value = json.loads(value)
+    return list(value or [])
+
+
+def upgrade():
+    bind = op.get_bind()
+    existing = set(sa.inspect(bind).get_table_names())
+
+    # policy_support/strategy_card는 이전까지 db.create_all()로만 생성되었으므로 없으면 새로 생성
+    legacy_targets = []
+    if 'policy_support' not in existing:
+        op.create_table('policy_support',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('code', sa.String(length=50), nullable=True),
+        sa.Column('title', sa.String(length=200), nullable=False),
+        sa.Column('description', sa.Text(), nullable=False),
+        sa.Column('region', sa.String(length=100), nullable=True),
+        sa.Column('organization', sa.String(length=100), nullable=True),
+        sa.Column('support_type', sa.String(length=50), nullable=True),
+        sa.Column('support_amount', sa.String(length=100), nullable=True),
+        sa.Column('application_period', sa.String(length=100), nullable=True),
+        sa.Column('requirements', sa.JSON(), nullable=True),
+        sa.Column('priority', sa.Integer(), nullable=True),
+        sa.Column('contact_info', sa.String(length=200), nullable=True),
+        sa.Column('website_url', sa.String(length=500), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('code', name='uq_policy_support_code')
+        )
+    else:
+        # JSON 대상 목록은 policy_target 행으로 옮긴 뒤 컬럼 삭제
+        legacy_targets = bind.execute(
+            sa.text('SELECT id, target_business_types, target_areas FROM policy_support')
+        ).fetchall()
+        with op.batch_alter_table('policy_support', schema=None) as batch_op:
+            batch_op.add_column(sa.Column('code', sa.String(length=50), nullable=True))
+            batch_op.add_column(sa.Column('region', sa.String(length=100), nullable=True))
+            batch_op.add_column(sa.Column('organization', sa.String(length=100), nullable=True))
+            batch_op.add_column(sa.Column('support_type', sa.String(length=50), nullable=True))
+            batch_op.add_column(sa.Column('requirements', sa.JSON(), nullable=True))
+            batch_op.add_column(sa.Column('priority', sa.Integer(), nullable=True))
+            batch_op.create_unique_constraint('uq_policy_support_code', ['code'])
+            batch_op.drop_column('target_business_types')
+            batch_op.drop_column('target_areas')
+
+    policy_target = op.create_table('policy_target',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('policy_id', sa.Integer(), nullable=False),
+    sa.Column('dimension', sa.String(length=20), nullable=False),
+    sa.Column('value', sa.String(length=100), nullable=False),
+    sa.ForeignKeyConstraint(['policy_id'], ['policy_support.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('policy_target', schema=None) as batch_op:
+        batch_op.create_index('ix_policy_target_lookup', ['dimension', 'value', 'policy_id'], unique=True)
+        batch_op.create_index(batch_op.f('ix_policy_target_policy_id'), ['policy_id'], unique=False)
+
+    rows = []
+    for policy_id, business_types, areas in legacy_targets:
+        areas = _json_list(areas)
+        if areas:
+            bind.execute(sa.text('UPDATE policy_support SET region = :region WHERE id = :id'),
+                         {'region': areas[0], 'id': policy_id})
+        pairs = [('business_type', value) for value in _json_list(business_types)]
+        pairs += [('area', key) for area in areas for key in _area_keys(area)]
+        rows += [{'policy_id': policy_id, 'dimension': dimension, 'value': value}
+                 for dimension, value in dict.fromkeys(pairs)]
+    if rows:
+        op.bulk_insert(policy_target, rows)
+
+    if 'strategy_card' not in existing:
+        op.create_table('strategy_card',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('risk_type', sa.String(length=50), nullable=False),
+        sa.Column('business_type', sa.String(length=50), nullable=False),
+        sa.Column('strategy_category', sa.String(length=50), nullable=False),
+        sa.Column('title', sa.String(length=100), nullable=False),
+        sa.Column('description', sa.Text(), nullable=False),
+        sa.Column('checklist', sa.JSON(), nullable=True),
+        sa.Column('tips', sa.JSON(), nullable=True),
+        sa.Column('case_studies', sa.JSON(), nullable=True),
+        sa.Column('priority', sa.Integer(), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+    with op.batch_alter_table('strategy_card', schema=None) as batch_op:
+        batch_op.create_index('ix_strategy_card_risk_business', ['risk_type', 'business_type', 'is_active'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('strategy_card', schema=None) as batch_op:
+        batch_op.drop_index('ix_strategy_card_risk_business')
+
+    with op.batch_alter_table('policy_target', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_policy_target_policy_id'))
+        batch_op.drop_index('ix_policy_target_lookup')
+    op.drop_table('policy_target')
+
+    with op.batch_alter_table('policy_support', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('target_business_types', sa.JSON(), nullable=True))
+        batch_op.add_column(sa.Column('target_areas', sa.JSON(), nullable=True))
+        batch_op.drop_constraint('uq_policy_support_code', type_='unique')
+        batch_op.drop_column('priority')
+        batch_op.drop_column('requirements')
+        batch_op.drop_column('support_type')
+        batch_op.drop_column('organization')
+        batch_op.drop_column('region')
+        batch_op.drop_column('code')
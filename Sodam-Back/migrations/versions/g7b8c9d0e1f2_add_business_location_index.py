@@ -0,0 +1,78 @@
+"""Add spatial index over business store locations
+
+Revision ID: g7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'g7b8c9d0e1f2'
+down_revision = 'f6a7b8c9d0e1'
+branch_labels = None
+depends_on = None
+
+
+# services/spatial_index.py의 DDL과 같은 내용
+SQLITE_UPGRADE = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS business_data_rtree USING rtree(id, min_lat, max_lat, min_lng, max_lng)",
+    """CREATE TRIGGER IF NOT EXISTS business_data_rtree_insert AFTER INSERT ON business_data BEGIN
+        INSERT INTO business_data_rtree VALUES (new.id, new.latitude, new.latitude, new.longitude, new.longitude);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS business_data_rtree_update AFTER UPDATE OF id, latitude, longitude ON business_data BEGIN
+        DELETE FROM business_data_rtree WHERE id = old.id;
+        INSERT INTO business_data_rtree VALUES (new.id, new.latitude, new.latitude, new.longitude, new.longitude);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS business_data_rtree_delete AFTER DELETE ON business_data BEGIN
+        DELETE FROM business_data_rtree WHERE id = old.id;
+    END""",
+    "INSERT OR REPLACE INTO business_data_rtree SELECT id, latitude, latitude, longitude, longitude FROM business_data",
+)
+SQLITE_DOWNGRADE = (
+    "DROP TRIGGER IF EXISTS business_data_rtree_insert",
+    "DROP TRIGGER IF EXISTS business_data_rtree_update",
+    "DROP TRIGGER IF EXISTS business_data_rtree_delete",
+    "DROP TABLE IF EXISTS business_data_rtree",
+)
+
+
+def upgrade():
+    bind = op.get_bind()
+    # business_data는 이전까지 db.create_all()로만 생성되었으므로 없으면 새로 생성
+    if 'business_data' not in sa.inspect(bind).get_table_names():
+        op.create_table('business_data',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('area_id', sa.Integer(), nullable=False),
+        sa.Column('business_type', sa.String(length=50), nullable=False),
+        sa.Column('business_name', sa.String(length=100), nullable=False),
+        sa.Column('address', sa.String(length=200), nullable=False),
+        sa.Column('latitude', sa.Float(), nullable=False),
+        sa.Column('longitude', sa.Float(), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('opened_date', sa.Date(), nullable=True),
+        sa.Column('closed_date', sa.Date(), nullable=True),
+        sa.Column('rent_cost', sa.Integer(), nullable=True),
+        sa.Column('floor_area', sa.Float(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['area_id'], ['commercial_area.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+    if bind.dialect.name == 'sqlite':
+        for statement in SQLITE_UPGRADE:
+            op.execute(statement)
+    elif bind.dialect.name == 'postgresql':
+        op.execute("CREATE INDEX IF NOT EXISTS ix_business_data_location_gist "
+                   "ON business_data USING gist (point(longitude, latitude))")
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'sqlite':
+        for statement in SQLITE_DOWNGRADE:
+            op.execute(statement)
+    elif bind.dialect.name == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_business_data_location_gist")
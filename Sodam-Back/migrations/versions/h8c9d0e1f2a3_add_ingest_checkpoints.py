@@ -0,0 +1,34 @@
+"""Store bulk ingest checkpoints in the database
+
+Revision ID: h8c9d0e1f2a3
+Revises: g7b8c9d0e1f2
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'h8c9d0e1f2a3'
+down_revision = 'g7b8c9d0e1f2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('ingest_checkpoint',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=500), nullable=False),
+    sa.Column('kind', sa.String(length=20), nullable=False),
+    sa.Column('rows', sa.BigInteger(), nullable=False),
+    sa.Column('last_row', sa.JSON(), nullable=True),
+    sa.Column('area_ids', sa.JSON(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+
+
+def downgrade():
+    op.drop_table('ingest_checkpoint')
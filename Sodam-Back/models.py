@@ -51,7 +51,7 @@ class CommercialArea(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    # 관계
+    # 관계 (기본 lazy 로딩, 화면별 로딩 방식은 services/commercial_areas.py의 LIST/DETAIL 옵션 사용)
     foot_traffic_data = db.relationship('FootTrafficData', backref='commercial_area', lazy=True, cascade='all, delete-orphan')
     sales_data = db.relationship('SalesData', backref='commercial_area', lazy=True, cascade='all, delete-orphan')
     business_data = db.relationship('BusinessData', backref='commercial_area', lazy=True, cascade='all, delete-orphan')
@@ -72,6 +72,10 @@ class CommercialArea(db.Model):
 
 class FootTrafficData(db.Model):
     """유동인구 데이터"""
+    # 상권별 기간/시간대 조회용 (area_id = ? AND date BETWEEN ? AND ?, GROUP BY hour)
+    __table_args__ = (
+        db.Index('ix_foot_traffic_area_date_hour', 'area_id', 'date', 'hour'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     area_id = db.Column(db.Integer, db.ForeignKey('commercial_area.id'), nullable=False)
     date = db.Column(db.Date, nullable=False)
@@ -109,6 +113,10 @@ class FootTrafficData(db.Model):
 
 class SalesData(db.Model):
     """카드 매출 데이터"""
+    # 상권·업종별 기간 조회용 (area_id = ? AND business_type = ? AND date BETWEEN ? AND ?)
+    __table_args__ = (
+        db.Index('ix_sales_area_business_date', 'area_id', 'business_type', 'date'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     area_id = db.Column(db.Integer, db.ForeignKey('commercial_area.id'), nullable=False)
     date = db.Column(db.Date, nullable=False)
@@ -144,6 +152,95 @@ class SalesData(db.Model):
             "created_at": self.created_at.isoformat()
         }
 
+# 집계(롤업) 테이블: 원본 행이 추가될 때 services/rollups.py가 증분 갱신 (flask rollups backfill로 재생성)
+class FootTrafficDailyRollup(db.Model):
+    """유동인구 일별 집계 (상권별)"""
+    __table_args__ = (
+        db.UniqueConstraint('area_id', 'date', name='uq_foot_traffic_daily_area_date'),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    area_id = db.Column(db.Integer, db.ForeignKey('commercial_area.id'), nullable=False)
+    date = db.Column(db.Date, nullable=False)
+    total_count = db.Column(db.BigInteger, nullable=False, default=0)
+    age_20s = db.Column(db.BigInteger, nullable=False, default=0)
+    age_30s = db.Column(db.BigInteger, nullable=False, default=0)
+    age_40s = db.Column(db.BigInteger, nullable=False, default=0)
+    age_50s = db.Column(db.BigInteger, nullable=False, default=0)
+    age_60s = db.Column(db.BigInteger, nullable=False, default=0)
+    male_count = db.Column(db.BigInteger, nullable=False, default=0)
+    female_count = db.Column(db.BigInteger, nullable=False, default=0)
+    dwell_time_sum = db.Column(db.Float, nullable=False, default=0.0)  # 시간대별 평균 체류시간의 합
+    row_count = db.Column(db.Integer, nullable=False, default=0)  # 원본(시간대) 행 수
+
+class FootTrafficMonthlyRollup(db.Model):
+    """유동인구 월별 집계 (상권별, month는 해당 월 1일)"""
+    __table_args__ = (
+        db.UniqueConstraint('area_id', 'month', name='uq_foot_traffic_monthly_area_month'),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    area_id = db.Column(db.Integer, db.ForeignKey('commercial_area.id'), nullable=False)
+    month = db.Column(db.Date, nullable=False)
+    total_count = db.Column(db.BigInteger, nullable=False, default=0)
+    age_20s = db.Column(db.BigInteger, nullable=False, default=0)
+    age_30s = db.Column(db.BigInteger, nullable=False, default=0)
+    age_40s = db.Column(db.BigInteger, nullable=False, default=0)
+    age_50s = db.Column(db.BigInteger, nullable=False, default=0)
+    age_60s = db.Column(db.BigInteger, nullable=False, default=0)
+    male_count = db.Column(db.BigInteger, nullable=False, default=0)
+    female_count = db.Column(db.BigInteger, nullable=False, default=0)
+    dwell_time_sum = db.Column(db.Float, nullable=False, default=0.0)
+    row_count = db.Column(db.Integer, nullable=False, default=0)
+
+class SalesDailyRollup(db.Model):
+    """카드 매출 일별 집계 (상권 x 업종)"""
+    __table_args__ = (
+        db.UniqueConstraint('area_id', 'business_type', 'date', name='uq_sales_daily_area_business_date'),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    area_id = db.Column(db.Integer, db.ForeignKey('commercial_area.id'), nullable=False)
+    business_type = db.Column(db.String(50), nullable=False)
+    date = db.Column(db.Date, nullable=False)
+    total_sales = db.Column(db.BigInteger, nullable=False, default=0)
+    transaction_count = db.Column(db.BigInteger, nullable=False, default=0)
+    age_20s_sales = db.Column(db.BigInteger, nullable=False, default=0)
+    age_30s_sales = db.Column(db.BigInteger, nullable=False, default=0)
+    age_40s_sales = db.Column(db.BigInteger, nullable=False, default=0)
+    age_50s_sales = db.Column(db.BigInteger, nullable=False, default=0)
+    age_60s_sales = db.Column(db.BigInteger, nullable=False, default=0)
+    male_sales = db.Column(db.BigInteger, nullable=False, default=0)
+    female_sales = db.Column(db.BigInteger, nullable=False, default=0)
+    row_count = db.Column(db.Integer, nullable=False, default=0)
+
+class SalesMonthlyRollup(db.Model):
+    """카드 매출 월별 집계 (상권 x 업종, month는 해당 월 1일)"""
+    __table_args__ = (
+        db.UniqueConstraint('area_id', 'business_type', 'month', name='uq_sales_monthly_area_business_month'),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    area_id = db.Column(db.Integer, db.ForeignKey('commercial_area.id'), nullable=False)
+    business_type = db.Column(db.String(50), nullable=False)
+    month = db.Column(db.Date, nullable=False)
+    total_sales = db.Column(db.BigInteger, nullable=False, default=0)
+    transaction_count = db.Column(db.BigInteger, nullable=False, default=0)
+    age_20s_sales = db.Column(db.BigInteger, nullable=False, default=0)
+    age_30s_sales = db.Column(db.BigInteger, nullable=False, default=0)
+    age_40s_sales = db.Column(db.BigInteger, nullable=False, default=0)
+    age_50s_sales = db.Column(db.BigInteger, nullable=False, default=0)
+    age_60s_sales = db.Column(db.BigInteger, nullable=False, default=0)
+    male_sales = db.Column(db.BigInteger, nullable=False, default=0)
+    female_sales = db.Column(db.BigInteger, nullable=False, default=0)
+    row_count = db.Column(db.Integer, nullable=False, default=0)
+
+class IngestCheckpoint(db.Model):
+    """CSV 일괄 적재 진행 상황 (services/bulk_ingest.py가 청크 삽입과 같은 트랜잭션으로 갱신)"""
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(500), nullable=False, unique=True)  # 체크포인트 이름 (기본: CSV 절대 경로)
+    kind = db.Column(db.String(20), nullable=False)  # 'foot-traffic', 'sales'
+    rows = db.Column(db.BigInteger, nullable=False, default=0)  # 커밋된 CSV 행 수
+    last_row = db.Column(db.JSON, nullable=True)  # 마지막으로 커밋한 CSV 행 (파일 변경 확인용)
+    area_ids = db.Column(db.JSON, nullable=False)  # 적재한 상권 ID 목록 (집계 재생성 대상)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
 class BusinessData(db.Model):
     """사업체 데이터 (창업/폐업 정보)"""
     id = db.Column(db.Integer, primary_key=True)
@@ -178,15 +275,22 @@ class BusinessData(db.Model):
         }
 
 class RiskAnalysis(db.Model):
-    """리스크 분석 결과"""
+    """리스크 분석 결과 (상권 x 업종별 최신 분류, services/risk_store.py가 저장/갱신)"""
+    __table_args__ = (
+        db.UniqueConstraint('area_id', 'business_type', name='uq_risk_analysis_area_business'),
+        db.Index('ix_risk_analysis_district_business', 'district', 'business_type'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     area_id = db.Column(db.Integer, db.ForeignKey('commercial_area.id'), nullable=False)
-    business_type = db.Column(db.String(50), nullable=False)
+    business_type = db.Column(db.String(50), nullable=False)  # 업종 미지정 분류는 '전체'
+    district = db.Column(db.String(50))  # 지역구 (지역구별 일괄 조회용)
     risk_type = db.Column(db.String(50), nullable=False)  # '유입저조형', '과포화경쟁형', '소비력약형', '성장잠재형'
     risk_score = db.Column(db.Float, nullable=False)  # 0-100 점수
     health_score = db.Column(db.Float, nullable=False)  # 상권 건강 점수
     analysis_data = db.Column(db.JSON, nullable=False)  # 분석 상세 데이터
+    data_version = db.Column(db.String(64))  # 분류 시점의 입력 데이터 버전 (현재 버전과 다르면 재분류 대상)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     def to_dict(self):
         return {
@@ -197,11 +301,16 @@ class RiskAnalysis(db.Model):
             "risk_score": self.risk_score,
             "health_score": self.health_score,
             "analysis_data": self.analysis_data,
-            "created_at": self.created_at.isoformat()
+            "data_version": self.data_version,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None
         }
 
 class StrategyCard(db.Model):
     """전략 카드"""
+    __table_args__ = (
+        db.Index('ix_strategy_card_risk_business', 'risk_type', 'business_type', 'is_active'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     risk_type = db.Column(db.String(50), nullable=False)
     business_type = db.Column(db.String(50), nullable=False)
@@ -232,26 +341,36 @@ class StrategyCard(db.Model):
         }
 
 class PolicySupport(db.Model):
-    """정책 지원 정보"""
+    """정책 지원 정보 (지원 대상은 PolicyTarget 행으로 정규화)"""
     id = db.Column(db.Integer, primary_key=True)
+    code = db.Column(db.String(50), unique=True, nullable=True)  # 정책 식별자 (예: policy_001)
     title = db.Column(db.String(200), nullable=False)
     description = db.Column(db.Text, nullable=False)
-    target_business_types = db.Column(db.JSON, nullable=True)  # 대상 업종들
-    target_areas = db.Column(db.JSON, nullable=True)  # 대상 지역들
+    region = db.Column(db.String(100), nullable=True)  # 시행 지역 (예: 대전광역시 유성구)
+    organization = db.Column(db.String(100), nullable=True)  # 시행 기관
+    support_type = db.Column(db.String(50), nullable=True)  # '자금지원', '마케팅지원' 등
     support_amount = db.Column(db.String(100), nullable=True)  # 지원 금액
     application_period = db.Column(db.String(100), nullable=True)  # 신청 기간
+    requirements = db.Column(db.JSON, nullable=True)  # 제출 서류
+    priority = db.Column(db.Integer, default=0)  # 추천 우선순위 (높을수록 먼저)
     contact_info = db.Column(db.String(200), nullable=True)  # 연락처
     website_url = db.Column(db.String(500), nullable=True)  # 관련 웹사이트
     is_active = db.Column(db.Boolean, default=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    targets = db.relationship('PolicyTarget', backref='policy', lazy=True, cascade='all, delete-orphan',
+                              order_by='PolicyTarget.id')
+
+    def target_values(self, dimension):
+        return [target.value for target in self.targets if target.dimension == dimension]
+
     def to_dict(self):
         return {
             "id": self.id,
             "title": self.title,
             "description": self.description,
-            "target_business_types": self.target_business_types,
-            "target_areas": self.target_areas,
+            "target_business_types": self.target_values('business_type'),
+            "target_areas": [self.region] if self.region else [],
             "support_amount": self.support_amount,
             "application_period": self.application_period,
             "contact_info": self.contact_info,
@@ -260,6 +379,19 @@ class PolicySupport(db.Model):
             "created_at": self.created_at.isoformat()
         }
 
+class PolicyTarget(db.Model):
+    """정책 지원 대상 (정책 x 차원 x 값)
+    dimension: 'area'(시행 지역의 연속 단어 조합), 'business_type', 'user_type', 'stage'
+    (dimension, value, policy_id) 유니크 인덱스로 조건별 정책 ID를 인덱스만 읽어 찾는다.
+    """
+    __table_args__ = (
+        db.Index('ix_policy_target_lookup', 'dimension', 'value', 'policy_id', unique=True),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    policy_id = db.Column(db.Integer, db.ForeignKey('policy_support.id'), nullable=False, index=True)
+    dimension = db.Column(db.String(20), nullable=False)
+    value = db.Column(db.String(100), nullable=False)
+
 class ExpertConsultation(db.Model):
     """전문가 상담 예약"""
     id = db.Column(db.Integer, primary_key=True)
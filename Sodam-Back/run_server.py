@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """
 개발 서버 실행 스크립트
+운영 환경에서는 gunicorn -c gunicorn.conf.py wsgi:app 을 사용
 """
 
 import os
@@ -13,7 +14,7 @@ if __name__ == "__main__":
     
     # 환경 변수에서 포트 설정 (기본값: 5000)
     port = int(os.environ.get("PORT", 5000))
-    debug = os.environ.get("FLASK_DEBUG", "True").lower() == "true"
+    debug = os.environ.get("FLASK_DEBUG", "False").lower() == "true"
     
     print(f"서버 시작: http://localhost:{port}")
     print("API 문서:")
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+유동인구/카드매출 DB 조회 서비스
+FootTrafficData, SalesData를 상권(area_id)·업종·기간 단위로 집계한다.
+행을 파이썬으로 가져와 합산하지 않고 SQL GROUP BY로 집계하며, 조건은
+복합 인덱스 순서에 맞춘다. 월별 추이는 집계 테이블(services/rollups.py)에서 읽는다.
+모든 조회는 읽기 전용이므로 복제본이 설정되어 있으면 복제본에서 실행한다 (replica_reads).
+
+- ix_foot_traffic_area_date_hour: (area_id, date, hour)
+- ix_sales_area_business_date: (area_id, business_type, date)
+"""
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func, select
+
+from extensions import db, replica_reads
+from models import CommercialArea, FootTrafficData, FootTrafficMonthlyRollup, SalesData, SalesMonthlyRollup
+
+FOOT_TRAFFIC_SPLITS = ('age_20s', 'age_30s', 'age_40s', 'age_50s', 'age_60s', 'male_count', 'female_count')
+SALES_SPLITS = ('age_20s_sales', 'age_30s_sales', 'age_40s_sales', 'age_50s_sales', 'age_60s_sales',
+                'male_sales', 'female_sales')
+
+class AnalyticsQueryService:
+    """상권별 유동인구/매출 기간·시간대 집계"""
+
+    @replica_reads()
+    def get_area_id(self, area_code: str) -> Optional[int]:
+        """상권 코드로 area_id 조회"""
+        return db.session.execute(
+            select(CommercialArea.id).where(CommercialArea.area_code == area_code)
+        ).scalar()
+
+    # 유동인구
+    def _foot_traffic_range(self, area_id: int, start_date: date, end_date: date):
+        return (FootTrafficData.area_id == area_id, FootTrafficData.date.between(start_date, end_date))
+
+    @replica_reads()
+    def foot_traffic_by_hour(self, area_id: int, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+        """시간대(0-23)별 합계/일평균 유동인구와 평균 체류시간"""
+        stmt = (
+            select(
+                FootTrafficData.hour,
+                func.sum(FootTrafficData.foot_traffic_count).label('total_count'),
+                func.avg(FootTrafficData.foot_traffic_count).label('avg_count'),
+                func.avg(FootTrafficData.dwell_time_avg).label('avg_dwell_time'),
+                func.count().label('days')
+            )
+            .where(*self._foot_traffic_range(area_id, start_date, end_date))
+            .group_by(FootTrafficData.hour)
+            .order_by(FootTrafficData.hour)
+        )
+        return [
+            {
+                "hour": row.hour,
+                "total_count": int(row.total_count or 0),
+                "avg_count": round(float(row.avg_count or 0), 1),
+                "avg_dwell_time": round(float(row.avg_dwell_time or 0), 1),
+                "days": row.days
+            }
+            for row in db.session.execute(stmt)
+        ]
+
+    @replica_reads()
+    def foot_traffic_daily(self, area_id: int, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+        """일별 유동인구 합계"""
+        stmt = (
+            select(
+                FootTrafficData.date,
+                func.sum(FootTrafficData.foot_traffic_count).label('total_count'),
+                func.max(FootTrafficData.foot_traffic_count).label('peak_count')
+            )
+            .where(*self._foot_traffic_range(area_id, start_date, end_date))
+            .group_by(FootTrafficData.date)
+            .order_by(FootTrafficData.date)
+        )
+        return [
+            {"date": row.date.isoformat(), "total_count": int(row.total_count or 0), "peak_count": int(row.peak_count or 0)}
+            for row in db.session.execute(stmt)
+        ]
+
+    @replica_reads()
+    def foot_traffic_summary(self, area_id: int, start_date: date, end_date: date) -> Dict[str, Any]:
+        """기간 합계 (연령대/성별 포함)"""
+        columns = [func.sum(getattr(FootTrafficData, name)).label(name) for name in FOOT_TRAFFIC_SPLITS]
+        row = db.session.execute(
+            select(
+                func.sum(FootTrafficData.foot_traffic_count).label('total_count'),
+                func.count(func.distinct(FootTrafficData.date)).label('days'),
+                *columns
+            ).where(*self._foot_traffic_range(area_id, start_date, end_date))
+        ).one()
+        summary = {"total_count": int(row.total_count or 0), "days": row.days}
+        summary.update({name: int(getattr(row, name) or 0) for name in FOOT_TRAFFIC_SPLITS})
+        return summary
+
+    # 카드 매출
+    @replica_reads()
+    def sales_by_business_type(self, area_id: int, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+        """업종별 기간 매출 합계 (매출 순)"""
+        stmt = (
+            select(
+                SalesData.business_type,
+                func.sum(SalesData.total_sales).label('total_sales'),
+                func.sum(SalesData.transaction_count).label('transaction_count'),
+                func.count().label('days')
+            )
+            .where(SalesData.area_id == area_id, SalesData.date.between(start_date, end_date))
+            .group_by(SalesData.business_type)
+        )
+        rows = [
+            {
+                "business_type": row.business_type,
+                "total_sales": int(row.total_sales or 0),
+                "transaction_count": int(row.transaction_count or 0),
+                "days": row.days
+            }
+            for row in db.session.execute(stmt)
+        ]
+        return sorted(rows, key=lambda item: item["total_sales"], reverse=True)
+
+    @replica_reads()
+    def sales_daily(self, area_id: int, business_type: str, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+        """업종 일별 매출"""
+        stmt = (
+            select(
+                SalesData.date,
+                func.sum(SalesData.total_sales).label('total_sales'),
+                func.sum(SalesData.transaction_count).label('transaction_count')
+            )
+            .where(
+                SalesData.area_id == area_id,
+                SalesData.business_type == business_type,
+                SalesData.date.between(start_date, end_date)
+            )
+            .group_by(SalesData.date)
+            .order_by(SalesData.date)
+        )
+        return [
+            {"date": row.date.isoformat(), "total_sales": int(row.total_sales or 0),
+             "transaction_count": int(row.transaction_count or 0)}
+            for row in db.session.execute(stmt)
+        ]
+
+    @replica_reads()
+    def sales_summary(self, area_id: int, business_type: str, start_date: date, end_date: date) -> Dict[str, Any]:
+        """업종 기간 매출 합계 (연령대/성별 포함, 객단가는 합계 기준으로 계산)"""
+        columns = [func.sum(getattr(SalesData, name)).label(name) for name in SALES_SPLITS]
+        row = db.session.execute(
+            select(
+                func.sum(SalesData.total_sales).label('total_sales'),
+                func.sum(SalesData.transaction_count).label('transaction_count'),
+                func.count().label('days'),
+                *columns
+            ).where(
+                SalesData.area_id == area_id,
+                SalesData.business_type == business_type,
+                SalesData.date.between(start_date, end_date)
+            )
+        ).one()
+        total_sales = int(row.total_sales or 0)
+        transaction_count = int(row.transaction_count or 0)
+        summary = {
+            "total_sales": total_sales,
+            "transaction_count": transaction_count,
+            "avg_transaction_amount": round(total_sales / transaction_count, 1) if transaction_count else 0.0,
+            "days": row.days
+        }
+        summary.update({name: int(getattr(row, name) or 0) for name in SALES_SPLITS})
+        return summary
+
+    # 월별 집계 (롤업 테이블, 최근 months개월)
+    @replica_reads()
+    def monthly_foot_traffic(self, area_id: int, months: int = 12) -> List[Dict[str, Any]]:
+        """월별 유동인구 합계와 평균 체류시간 (오래된 월부터)"""
+        rollup = FootTrafficMonthlyRollup
+        stmt = (
+            select(rollup)
+            .where(rollup.area_id == area_id)
+            .order_by(rollup.month.desc())
+            .limit(months)
+        )
+        rows = []
+        for row in reversed(db.session.execute(stmt).scalars().all()):
+            item = {"month": row.month.strftime('%Y-%m'), "total_count": int(row.total_count),
+                    "avg_dwell_time": round(row.dwell_time_sum / row.row_count, 1) if row.row_count else 0.0,
+                    "dwell_time_sum": float(row.dwell_time_sum), "row_count": row.row_count}
+            item.update({name: int(getattr(row, name)) for name in FOOT_TRAFFIC_SPLITS})
+            rows.append(item)
+        return rows
+
+    @replica_reads()
+    def monthly_sales(self, area_id: int, business_type: Optional[str] = None, months: int = 12) -> List[Dict[str, Any]]:
+        """월별 매출 합계 (business_type 생략 시 전체 업종 합계, 오래된 월부터)"""
+        rollup = SalesMonthlyRollup
+        measures = ('total_sales', 'transaction_count') + SALES_SPLITS
+        stmt = (
+            select(rollup.month, *(func.sum(getattr(rollup, name)).label(name) for name in measures))
+            .where(rollup.area_id == area_id)
+            .group_by(rollup.month)
+            .order_by(rollup.month.desc())
+            .limit(months)
+        )
+        if business_type:
+            stmt = stmt.where(rollup.business_type == business_type)
+        return [
+            dict({"month": row.month.strftime('%Y-%m')}, **{name: int(getattr(row, name) or 0) for name in measures})
+            for row in reversed(db.session.execute(stmt).all())
+        ]
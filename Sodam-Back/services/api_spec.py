@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Swagger(OpenAPI) 스펙 사전 생성 및 캐시 응답
+Flask-RESTX는 첫 요청 시 모든 네임스페이스 모델로 스펙을 만들고, 이후에도 요청마다
+큰 스펙 딕셔너리를 다시 JSON으로 직렬화한다.
+
+SWAGGER_MODE:
+- live: Flask-RESTX 기본 동작 (요청 시 생성/직렬화)
+- static: 기동 시(또는 빌드 시 덤프한 SWAGGER_SPEC_PATH 파일에서) 한 번만 만들어
+  직렬화된 바이트와 gzip 압축 바이트를 메모리에 두고 ETag와 함께 응답 (If-None-Match 시 304)
+- off: /docs/ 와 swagger.json 을 제공하지 않음 (404)
+
+빌드 시 덤프:
+    flask openapi dump instance/swagger.json
+"""
+import gzip
+import hashlib
+import json
+import os
+from typing import Optional
+
+import click
+from flask import Flask, Response, abort, current_app, request
+from flask_restx import Api
+
+SWAGGER_MODES = ("live", "static", "off")
+
+class PrecomputedSpec:
+    """직렬화/압축이 끝난 스펙"""
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.gzipped = gzip.compress(body, compresslevel=9, mtime=0)
+        self.etag = hashlib.sha1(body).hexdigest()[:16]
+
+    def response(self) -> Response:
+        if request.if_none_match.contains(self.etag):
+            response = Response(status=304)
+        elif request.accept_encodings['gzip']:
+            response = Response(self.gzipped, mimetype='application/json')
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            response = Response(self.body, mimetype='application/json')
+        response.set_etag(self.etag)
+        response.headers['Vary'] = 'Accept-Encoding'
+        response.headers['Cache-Control'] = 'public, max-age=300'
+        return response
+
+def serialize_spec(app: Flask, api: Api) -> bytes:
+    """현재 등록된 네임스페이스로 스펙 생성 후 JSON 바이트로 직렬화"""
+    with app.test_request_context():
+        schema = api.__schema__
+    if "error" in schema:
+        raise RuntimeError("Swagger 스펙 생성 실패 (로그 참고)")
+    return json.dumps(schema, ensure_ascii=False, separators=(',', ':'), sort_keys=True).encode('utf-8')
+
+def _load_spec(app: Flask, api: Api) -> PrecomputedSpec:
+    """SWAGGER_SPEC_PATH 파일이 있으면 사용하고, 없으면 기동 시 생성"""
+    path: Optional[str] = app.config.get("SWAGGER_SPEC_PATH")
+    if path and os.path.exists(path):
+        with open(path, 'rb') as f:
+            return PrecomputedSpec(f.read())
+    return PrecomputedSpec(serialize_spec(app, api))
+
+def init_app(app: Flask, api: Api):
+    """SWAGGER_MODE=static이면 스펙 응답을 사전 생성 바이트로 교체 (모든 네임스페이스 등록 후 호출)"""
+    app.extensions["sodam_api"] = api
+    app.cli.add_command(openapi_cli)
+
+    mode = app.config.get("SWAGGER_MODE", "live")
+    if mode not in SWAGGER_MODES:
+        raise ValueError(f"알 수 없는 SWAGGER_MODE: {mode} (가능한 값: {', '.join(SWAGGER_MODES)})")
+    if mode == "off":
+        # Api(app, add_specs=False)는 init_app에 전달되지 않으므로 스펙 뷰를 404로 교체
+        app.view_functions[api.endpoint('specs')] = lambda: abort(404)
+        return
+    if mode != "static":
+        return
+
+    spec = _load_spec(app, api)
+    app.extensions["sodam_api_spec"] = spec
+    app.view_functions[api.endpoint('specs')] = spec.response
+
+@click.group('openapi', help='Swagger(OpenAPI) 스펙 관리')
+def openapi_cli():
+    pass
+
+@openapi_cli.command('dump')
+@click.argument('path', required=False)
+def dump_spec(path: Optional[str]):
+    """스펙을 JSON 파일로 저장 (경로 생략 시 SWAGGER_SPEC_PATH)"""
+    app = current_app._get_current_object()
+    api = app.extensions["sodam_api"]
+    path = path or app.config.get("SWAGGER_SPEC_PATH")
+    if not path:
+        raise click.UsageError("저장할 경로를 지정하거나 SWAGGER_SPEC_PATH를 설정하세요.")
+
+    body = serialize_spec(app, api)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(body)
+    click.echo(f"스펙 저장 완료: {path} ({len(body):,} bytes, ETag {PrecomputedSpec(body).etag})")
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+유동인구/카드매출 CSV 일괄 적재
+ORM 객체를 한 건씩 만들지 않고 CSV를 청크 단위로 읽어 Core executemany로 삽입한다.
+(세션 identity map, 객체별 flush/기본값 처리 비용이 없음)
+
+- 청크마다 별도 트랜잭션으로 커밋하고, 같은 트랜잭션에서 ingest_checkpoint 테이블에 처리한 행 수와
+  마지막 행을 기록 -> 중단 후 같은 명령을 다시 실행하면 커밋된 행 다음부터 이어서 적재
+  (청크와 체크포인트가 함께 커밋/롤백되므로 어느 시점에 중단되어도 같은 행을 두 번 넣지 않음)
+- 보조 인덱스는 적재 전에 삭제하고 끝난 뒤 한 번에 다시 생성 (SQLite/PostgreSQL/MySQL)
+  적재 중 오류가 나도 인덱스는 다시 생성하며, 프로세스가 강제 종료된 경우 재실행 시 생성된다.
+- 집계(롤업) 테이블: incremental(청크마다 같은 트랜잭션에서 반영, 기본) / rebuild(끝난 뒤 적재한
+  상권만 재집계) / skip
+- 적재가 끝나거나 중단되면 결과 캐시(result_cache.clear_all)를 비움
+
+CSV 형식: 헤더가 모델 컬럼 이름과 같아야 하며 상권은 area_code 또는 area_id 컬럼으로 지정한다.
+- foot-traffic: date, hour, foot_traffic_count (필수), day_of_week(생략 시 날짜로 계산),
+  age_20s~age_60s, male_count, female_count, dwell_time_avg
+- sales: date, business_type, total_sales, transaction_count (필수),
+  avg_transaction_amount(생략 시 계산), age_20s_sales~age_60s_sales, male_sales, female_sales
+
+사용법:
+    flask ingest foot-traffic data/foot_traffic_2024.csv --chunk-size 20000
+    flask ingest sales data/sales_2024.csv --rollups rebuild
+"""
+import csv
+import os
+import time
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import click
+from flask import Flask
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.engine import Connection, Engine
+
+from extensions import db
+from models import CommercialArea, FootTrafficData, IngestCheckpoint, SalesData
+from services import result_cache, rollups
+
+INDEX_DEFER_DIALECTS = ("sqlite", "postgresql", "mysql", "mariadb")
+ROLLUP_MODES = ("incremental", "rebuild", "skip")
+
+def _parse_date(value: str) -> date:
+    value = value.strip()
+    if len(value) == 8 and value.isdigit():
+        return date(int(value[:4]), int(value[4:6]), int(value[6:]))
+    return date.fromisoformat(value[:10])
+
+def _parse_int(value: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        return int(float(value))
+
+# 종류별 대상 테이블, 필수/선택 컬럼 변환기, 집계 반영 함수
+KINDS: Dict[str, Dict[str, Any]] = {
+    "foot-traffic": {
+        "table": FootTrafficData.__table__,
+        "rollup": "foot_traffic",
+        "apply_rollup": rollups.apply_foot_traffic,
+        "required": {"date": _parse_date, "hour": _parse_int, "foot_traffic_count": _parse_int},
+        "optional": dict(
+            {"day_of_week": _parse_int, "dwell_time_avg": float},
+            **{name: _parse_int for name in ("age_20s", "age_30s", "age_40s", "age_50s", "age_60s",
+                                             "male_count", "female_count")}
+        )
+    },
+    "sales": {
+        "table": SalesData.__table__,
+        "rollup": "sales",
+        "apply_rollup": rollups.apply_sales,
+        "required": {"date": _parse_date, "business_type": str.strip, "total_sales": _parse_int,
+                     "transaction_count": _parse_int},
+        "optional": dict(
+            {"avg_transaction_amount": float},
+            **{name: _parse_int for name in ("age_20s_sales", "age_30s_sales", "age_40s_sales", "age_50s_sales",
+                                             "age_60s_sales", "male_sales", "female_sales")}
+        )
+    }
+}
+
+class IngestError(Exception):
+    """입력 파일/체크포인트 오류 (line: CSV 줄 번호)"""
+
+    def __init__(self, message: str, line: Optional[int] = None):
+        super().__init__(f"{line}번째 줄: {message}" if line else message)
+        self.line = line
+
+def _read_checkpoint(engine: Engine, name: str, kind: str) -> Optional[Dict[str, Any]]:
+    table = IngestCheckpoint.__table__
+    with engine.connect() as connection:
+        row = connection.execute(
+            select(table.c.id, table.c.kind, table.c.rows, table.c.last_row, table.c.area_ids).where(table.c.name == name)
+        ).mappings().first()
+    if row is None:
+        return None
+    if row["kind"] != kind:
+        raise IngestError(f"체크포인트가 다른 종류({row['kind']})의 것입니다: {name} (--restart 로 처음부터 적재)")
+    return dict(row)
+
+def _delete_checkpoint(engine: Engine, name: str):
+    with engine.begin() as connection:
+        connection.execute(delete(IngestCheckpoint.__table__).where(IngestCheckpoint.__table__.c.name == name))
+
+def _skip_committed(reader, checkpoint: Dict[str, Any]):
+    """커밋된 행을 건너뛰고, 마지막 커밋 행이 체크포인트와 같은지 확인 (파일이 바뀐 경우 중단)"""
+    values = None
+    for _ in range(checkpoint["rows"]):
+        values = next(reader, None)
+        if values is None:
+            break
+    if values != checkpoint["last_row"]:
+        raise IngestError("체크포인트 이후 파일의 앞부분(이미 적재한 행)이 바뀌었습니다 (--restart 로 처음부터 적재)")
+
+def _write_checkpoint(connection: Connection, name: str, checkpoint: Dict[str, Any]):
+    """청크 삽입과 같은 트랜잭션에서 체크포인트 행 생성/갱신"""
+    table = IngestCheckpoint.__table__
+    values = {key: checkpoint[key] for key in ("kind", "rows", "last_row", "area_ids")}
+    values["updated_at"] = datetime.utcnow()
+    if checkpoint.get("id") is None:
+        checkpoint["id"] = connection.execute(insert(table).values(name=name, **values)).inserted_primary_key[0]
+    else:
+        connection.execute(update(table).where(table.c.id == checkpoint["id"]).values(**values))
+
+def _area_ids(engine: Engine) -> Dict[str, int]:
+    with engine.connect() as connection:
+        return dict(connection.execute(select(CommercialArea.area_code, CommercialArea.id)).all())
+
+def _row_converter(kind: str, header: List[str], area_ids: Dict[str, int]) -> Callable[[List[str]], Dict[str, Any]]:
+    """CSV 한 줄(list) -> 삽입용 dict 변환 함수 (헤더 검증 포함)"""
+    spec = KINDS[kind]
+    positions = {name: index for index, name in enumerate(header)}
+    missing = [name for name in spec["required"] if name not in positions]
+    if "area_code" not in positions and "area_id" not in positions:
+        missing.insert(0, "area_code|area_id")
+    if missing:
+        raise IngestError(f"필수 컬럼이 없습니다: {', '.join(missing)}")
+
+    converters = [(name, positions[name], parse) for name, parse in spec["required"].items()]
+    optional = [(name, positions[name], parse) for name, parse in spec["optional"].items() if name in positions]
+    defaults = {name: 0 for name in spec["optional"] if name not in positions}
+    area_position = positions.get("area_code")
+    id_position = positions.get("area_id")
+    created_at = datetime.utcnow()
+
+    def convert(values: List[str]) -> Dict[str, Any]:
+        if area_position is not None:
+            area_code = values[area_position].strip()
+            if area_code not in area_ids:
+                raise ValueError(f"등록되지 않은 상권 코드 {area_code}")
+            row = {"area_id": area_ids[area_code]}
+        else:
+            row = {"area_id": int(values[id_position])}
+        for name, position, parse in converters:
+            row[name] = parse(values[position])
+        for name, position, parse in optional:
+            value = values[position]
+            row[name] = parse(value) if value else 0
+        row.update(defaults)
+        if "day_of_week" in defaults:
+            row["day_of_week"] = row["date"].weekday()
+        if "avg_transaction_amount" in defaults:
+            count = row["transaction_count"]
+            row["avg_transaction_amount"] = round(row["total_sales"] / count, 1) if count else 0.0
+        row["created_at"] = created_at
+        return row
+
+    return convert
+
+def _drop_indexes(engine: Engine, table) -> List[str]:
+    if engine.dialect.name not in INDEX_DEFER_DIALECTS:
+        return []
+    with engine.begin() as connection:
+        for index in table.indexes:
+            index.drop(connection, checkfirst=True)
+    return sorted(index.name for index in table.indexes)
+
+def _create_indexes(engine: Engine, table):
+    with engine.begin() as connection:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+def ingest_csv(engine: Engine, kind: str, path: str, chunk_size: int = 10000,
+               checkpoint_name: Optional[str] = None, defer_indexes: bool = True,
+               rollup_mode: str = "incremental", restart: bool = False,
+               progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """
+    CSV를 청크 단위로 적재하고 결과 통계 반환 (progress는 청크 커밋마다 호출)
+    checkpoint_name: ingest_checkpoint 행 이름 (기본: CSV 절대 경로)
+    """
+    if kind not in KINDS:
+        raise IngestError(f"알 수 없는 종류: {kind} (가능한 값: {', '.join(KINDS)})")
+    if rollup_mode not in ROLLUP_MODES:
+        raise IngestError(f"알 수 없는 집계 모드: {rollup_mode} (가능한 값: {', '.join(ROLLUP_MODES)})")
+    spec = KINDS[kind]
+    table = spec["table"]
+    checkpoint_name = checkpoint_name or os.path.abspath(path)
+
+    # 마이그레이션 전 DB에서도 동작하도록 체크포인트 테이블이 없으면 생성
+    IngestCheckpoint.__table__.create(engine, checkfirst=True)
+    if restart:
+        _delete_checkpoint(engine, checkpoint_name)
+    checkpoint = _read_checkpoint(engine, checkpoint_name, kind) or {
+        "id": None, "kind": kind, "rows": 0, "last_row": None, "area_ids": []
+    }
+    resumed_from = checkpoint["rows"]
+    touched_areas = set(checkpoint["area_ids"])
+
+    deferred = _drop_indexes(engine, table) if defer_indexes else []
+    stats = {"kind": kind, "path": path, "resumed_from": resumed_from, "rows": 0,
+             "deferred_indexes": deferred, "rollups": rollup_mode}
+    started = time.perf_counter()
+    try:
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            total_bytes = os.fstat(f.fileno()).st_size
+            csv_reader = csv.reader(f)
+            convert = _row_converter(kind, next(csv_reader, []), _area_ids(engine))
+            reader = (values for values in csv_reader if values)  # 빈 줄 제외
+            if resumed_from:
+                _skip_committed(reader, checkpoint)
+
+            chunk: List[Dict[str, Any]] = []
+            for values in reader:
+                try:
+                    chunk.append(convert(values))
+                except (ValueError, IndexError, TypeError) as e:
+                    raise IngestError(str(e) or type(e).__name__, csv_reader.line_num) from e
+                if len(chunk) >= chunk_size:
+                    _commit_chunk(engine, spec, chunk, values, rollup_mode, checkpoint, touched_areas, checkpoint_name)
+                    stats["rows"] += len(chunk)
+                    chunk = []
+                    if progress:
+                        progress(_progress(stats, f, total_bytes, started))
+            if chunk:
+                _commit_chunk(engine, spec, chunk, values, rollup_mode, checkpoint, touched_areas, checkpoint_name)
+                stats["rows"] += len(chunk)
+    finally:
+        # 오류/중단 시에도 조회 성능이 떨어진 채로 두지 않음
+        if deferred:
+            index_started = time.perf_counter()
+            _create_indexes(engine, table)
+            stats["index_seconds"] = round(time.perf_counter() - index_started, 3)
+        # 커밋된 청크가 있으면 이전 데이터로 계산한 결과를 버림
+        if stats["rows"]:
+            result_cache.clear_all()
+
+    stats["load_seconds"] = round(time.perf_counter() - started - stats.get("index_seconds", 0), 3)
+    if rollup_mode == "rebuild" and touched_areas:
+        rollup_started = time.perf_counter()
+        with engine.begin() as connection:
+            rollups.backfill(connection, sorted(touched_areas), kinds=(spec["rollup"],))
+        stats["rollup_seconds"] = round(time.perf_counter() - rollup_started, 3)
+
+    elapsed = time.perf_counter() - started
+    stats["seconds"] = round(elapsed, 3)
+    stats["rows_per_second"] = round(stats["rows"] / elapsed) if elapsed > 0 else 0
+    _delete_checkpoint(engine, checkpoint_name)
+    if rollup_mode == "rebuild" and touched_areas:
+        result_cache.clear_all()
+    return stats
+
+def _commit_chunk(engine: Engine, spec: Dict[str, Any], chunk: List[Dict[str, Any]], last_row: List[str],
+                  rollup_mode: str, checkpoint: Dict[str, Any], touched_areas: set, checkpoint_name: str):
+    """청크 삽입(+집계 반영)과 체크포인트 갱신을 한 트랜잭션으로 커밋"""
+    areas = touched_areas | {row["area_id"] for row in chunk}
+    updated = dict(checkpoint, rows=checkpoint["rows"] + len(chunk), last_row=last_row, area_ids=sorted(areas))
+    with engine.begin() as connection:
+        connection.execute(insert(spec["table"]), chunk)
+        if rollup_mode == "incremental":
+            spec["apply_rollup"](connection, chunk)
+        _write_checkpoint(connection, checkpoint_name, updated)
+    # 커밋이 끝난 뒤에만 메모리의 진행 상황을 갱신
+    checkpoint.update(updated)
+    touched_areas.update(areas)
+
+def _progress(stats: Dict[str, Any], f, total_bytes: int, started: float) -> Dict[str, Any]:
+    elapsed = time.perf_counter() - started
+    return {
+        "rows": stats["resumed_from"] + stats["rows"],
+        "rows_per_second": stats["rows"] / elapsed if elapsed > 0 else 0.0,
+        "percent": min(100.0, f.buffer.tell() * 100 / total_bytes) if total_bytes else 100.0
+    }
+
+@click.group('ingest', help='유동인구/카드매출 CSV 일괄 적재')
+def ingest_cli():
+    pass
+
+def _register_command(kind: str):
+    @ingest_cli.command(kind, help=f'{kind} CSV를 청크 단위로 적재 (중단 시 같은 명령으로 이어서 실행)')
+    @click.argument('path', type=click.Path(exists=True, dir_okay=False))
+    @click.option('--chunk-size', default=10000, show_default=True, help='트랜잭션(executemany) 당 행 수')
+    @click.option('--checkpoint', 'checkpoint_name', default=None, help='체크포인트 이름 (기본: CSV 절대 경로)')
+    @click.option('--defer-indexes/--keep-indexes', default=True, show_default=True,
+                  help='적재 중 보조 인덱스를 삭제했다가 마지막에 다시 생성')
+    @click.option('--rollups', 'rollup_mode', type=click.Choice(ROLLUP_MODES), default='incremental',
+                  show_default=True, help='집계 테이블 반영 방식')
+    @click.option('--restart', is_flag=True, help='체크포인트를 무시하고 처음부터 적재')
+    def command(path, **options):
+        _run_ingest(kind, path, **options)
+
+for _kind in KINDS:
+    _register_command(_kind)
+
+def _run_ingest(kind: str, path: str, **options):
+    last_report = [0.0]
+
+    def report(progress):
+        now = time.perf_counter()
+        if now - last_report[0] >= 2.0:
+            last_report[0] = now
+            click.echo(f"  {progress['rows']:,}행 ({progress['percent']:.1f}%, {progress['rows_per_second']:,.0f}행/초)")
+
+    try:
+        stats = ingest_csv(db.engine, kind, path, progress=report, **options)
+    except IngestError as e:
+        raise click.ClickException(f"{e} (커밋된 행까지 체크포인트에 기록됨, 수정 후 다시 실행하면 이어서 적재)")
+
+    resumed = f", {stats['resumed_from']:,}행 이후부터 재개" if stats["resumed_from"] else ""
+    click.echo(f"적재 완료: {stats['rows']:,}행, {stats['seconds']}초 ({stats['rows_per_second']:,}행/초{resumed})")
+    if stats["deferred_indexes"]:
+        click.echo(f"인덱스 재생성: {', '.join(stats['deferred_indexes'])} ({stats['index_seconds']}초)")
+    if "rollup_seconds" in stats:
+        click.echo(f"집계 재생성: {stats['rollup_seconds']}초")
+
+def init_app(app: Flask):
+    """CLI 등록"""
+    app.cli.add_command(ingest_cli)
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+사업체 생존/폐업 분석 (BusinessData 개업일/폐업일/상태 기반)
+상권 x 업종, 상권, 업종, 전체 그룹별로 Kaplan-Meier 생존 곡선과 1/3/5년 폐업률,
+최근 1년 창업률/폐업률을 그룹별 반복 없이 정렬 + 누적합 배열 연산 한 번으로 계산한다.
+
+- 생존 기간: 개업일부터 폐업일(폐업) 또는 관측 종료일(영업 중, 중도 절단)까지의 일수
+  관측 종료일은 데이터에 나타난 가장 늦은 개업일/폐업일 (개업일이 없는 사업체는 제외)
+- 폐업: status가 closed이거나 폐업일이 있는 사업체
+- n년 폐업률 = 1 - S(n년), 95% 신뢰구간은 Greenwood 분산, 관측 기간이 n년보다 짧은 그룹은 None
+- 결과 표는 데이터 버전(competitor_density.business_data_version)별로 프로세스에 캐시하고,
+  버전 확인 쿼리는 SURVIVAL_VERSION_CHECK초(기본 30)에 한 번만 실행
+"""
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from flask import Flask, has_app_context
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+
+from extensions import db, replica_reads
+from models import BusinessData, CommercialArea
+
+HORIZONS = {"1year": 365, "3year": 1095, "5year": 1826}
+CURVE_MONTHS = 60
+DAYS_PER_MONTH = 30.4375
+# 그룹 수준: 상권 x 업종, 상권, 업종, 전체
+LEVELS = (("area_code", "business_type"), ("area_code",), ("business_type",), ())
+
+_settings = {
+    "version_check": 30.0,
+}
+
+_tables: Dict[str, Tuple[str, float, Optional["SurvivalTable"]]] = {}
+_tables_lock = threading.Lock()
+
+def kaplan_meier(groups: np.ndarray, durations: np.ndarray, events: np.ndarray, group_count: int,
+                 times: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    그룹별 Kaplan-Meier 생존 함수를 times(일)에서 평가 (사업체가 한 곳 이상, 각 배열은 그룹 수 x 시점 수)
+    survival, variance(Greenwood), at_risk(해당 시점까지 관측 중인 사업체 수)
+    """
+    times = np.asarray(times, dtype=np.int64)
+    span = int(durations.max()) + int(times.max()) + 1
+    order = np.lexsort((durations, groups))
+    groups, durations, events = groups[order], durations[order], events[order]
+    row_keys = groups * span + durations
+    group_ends = np.cumsum(np.bincount(groups, minlength=group_count))
+
+    # (그룹, 기간) 블록별 폐업 수와 위험 집합 크기
+    starts = np.flatnonzero(np.r_[True, row_keys[1:] != row_keys[:-1]])
+    block_groups, block_keys = groups[starts], row_keys[starts]
+    deaths = np.add.reduceat(events.astype(np.int64), starts)
+    at_risk = group_ends[block_groups] - starts
+    wiped = deaths >= at_risk
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_terms = np.where(wiped, 0.0, np.log1p(-deaths / at_risk))
+        greenwood = np.where(wiped, 0.0, deaths / (at_risk * (at_risk - deaths)))
+
+    # 그룹 안 누적합 = 전체 누적합 - 그룹 첫 블록 직전까지의 누적합
+    new_group = np.r_[True, block_groups[1:] != block_groups[:-1]]
+    base = np.flatnonzero(new_group)[np.cumsum(new_group) - 1]
+    def within(values):
+        total = np.r_[0, np.cumsum(values)]
+        return total[1:] - total[base]
+    log_survival, wiped_count, greenwood_sum = within(log_terms), within(wiped), within(greenwood)
+
+    # 각 (그룹, 시점)에서 시점 이하 마지막 블록 (없으면 S = 1)
+    query_groups = np.repeat(np.arange(group_count), len(times))
+    query_keys = query_groups * span + np.tile(times, group_count)
+    block = np.searchsorted(block_keys, query_keys, side="right") - 1
+    valid = block >= 0
+    valid[valid] &= block_groups[block[valid]] == query_groups[valid]
+    block = np.where(valid, block, 0)
+
+    survival = np.where(valid, np.where(wiped_count[block] > 0, 0.0, np.exp(log_survival[block])), 1.0)
+    variance = np.where(valid, survival ** 2 * greenwood_sum[block], 0.0)
+    observed = group_ends[query_groups] - np.searchsorted(row_keys, query_keys, side="left")
+    shape = (group_count, len(times))
+    return {"survival": survival.reshape(shape), "variance": variance.reshape(shape), "at_risk": observed.reshape(shape)}
+
+@dataclass
+class SurvivalTable:
+    """그룹 수준별 생존/폐업 통계"""
+    version: str
+    as_of: date
+    levels: Dict[Tuple[str, ...], Dict[str, Any]]
+    excluded: int = 0  # 개업일이 없어 제외한 사업체 수
+    seconds: float = 0.0
+    rows: Dict[str, int] = field(default_factory=dict)
+
+    def group(self, area_code: Optional[str] = None, business_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """그룹 하나의 생존/폐업 통계 (사업체가 없는 그룹이면 None)"""
+        level = tuple(name for name, value in (("area_code", area_code), ("business_type", business_type)) if value)
+        stats = self.levels[level]
+        row = stats["index"].get(tuple(str(value) for value in (area_code, business_type) if value))
+        if row is None:
+            return None
+
+        survival = stats["survival"][row]
+        half_width = 1.96 * np.sqrt(stats["variance"][row])
+        followed = stats["max_duration"][row]
+        horizons = {}
+        for column, (period, days) in enumerate(HORIZONS.items()):
+            if followed < days:
+                horizons[period] = None
+                continue
+            horizons[period] = {
+                "survival_rate": round(float(survival[column]) * 100, 1),
+                "closure_rate": round((1 - float(survival[column])) * 100, 1),
+                "confidence_interval": [round(max(float(survival[column] - half_width[column]), 0.0) * 100, 1),
+                                        round(min(float(survival[column] + half_width[column]), 1.0) * 100, 1)],
+                "at_risk": int(stats["at_risk"][row, column]),
+            }
+
+        operating = int(stats["operating_at_start"][row])
+        curve_start = len(HORIZONS)
+        return {
+            "area_code": area_code,
+            "business_type": business_type,
+            "sample_size": int(stats["sample_size"][row]),
+            "closures": int(stats["closures"][row]),
+            "horizons": horizons,
+            "survival_curve": [
+                {"month": month, "survival_rate": round(float(value) * 100, 1)}
+                for month, value in enumerate(survival[curve_start:])
+                if month * DAYS_PER_MONTH <= followed
+            ],
+            "last_year": {
+                "operating_at_start": operating,
+                "openings": int(stats["recent_openings"][row]),
+                "closures": int(stats["recent_closures"][row]),
+                "startup_rate": round(stats["recent_openings"][row] / operating * 100, 2) if operating else None,
+                "closure_rate": round(stats["recent_closures"][row] / operating * 100, 2) if operating else None,
+            },
+            "as_of": self.as_of.isoformat(),
+            "data_version": self.version,
+        }
+
+    def business_types(self) -> List[str]:
+        return [key[0] for key in self.levels[("business_type",)]["index"]]
+
+def _level_stats(keys: List[tuple], opened: np.ndarray, durations: np.ndarray, events: np.ndarray,
+                 closed: np.ndarray, as_of: int) -> Dict[str, Any]:
+    """그룹 키 목록(사업체별) -> 그룹별 통계 배열"""
+    names = sorted(set(keys))
+    index = {key: row for row, key in enumerate(names)}
+    groups = np.fromiter((index[key] for key in keys), dtype=np.int64, count=len(keys))
+    group_count = len(names)
+    times = np.r_[list(HORIZONS.values()), np.round(np.arange(CURVE_MONTHS + 1) * DAYS_PER_MONTH)].astype(np.int64)
+    estimate = kaplan_meier(groups, durations, events, group_count, times)
+
+    # 최근 1년 창업/폐업 (기간 시작 시점에 영업 중이던 사업체 대비)
+    window_start = as_of - 365
+    operating = (opened <= window_start) & ~(events & (closed <= window_start))
+    recent_openings = opened > window_start
+    recent_closures = events & (closed > window_start)
+
+    def per_group(values=None):
+        return np.bincount(groups, weights=values, minlength=group_count).astype(np.int64)
+
+    max_duration = np.full(group_count, -1, dtype=np.int64)
+    np.maximum.at(max_duration, groups, durations)
+    return {
+        "index": index,
+        "sample_size": per_group(),
+        "closures": per_group(events.astype(np.float64)),
+        "max_duration": max_duration,
+        "operating_at_start": per_group(operating.astype(np.float64)),
+        "recent_openings": per_group(recent_openings.astype(np.float64)),
+        "recent_closures": per_group(recent_closures.astype(np.float64)),
+        **estimate,
+    }
+
+@replica_reads()
+def build(version: Optional[str] = None) -> Optional[SurvivalTable]:
+    """전체 그룹 수준 통계 계산 (개업일이 있는 사업체가 없으면 None)"""
+    from services.competitor_density import business_data_version
+
+    started = time.perf_counter()
+    version = version or business_data_version()
+    rows = db.session.execute(
+        select(CommercialArea.area_code, BusinessData.business_type, BusinessData.opened_date,
+               BusinessData.closed_date, BusinessData.status)
+        .join(CommercialArea, CommercialArea.id == BusinessData.area_id)
+    ).all()
+    dated = [row for row in rows if row.opened_date is not None]
+    if not dated:
+        return None
+
+    area_codes, business_types, opened_dates, closed_dates, statuses = zip(*dated)
+    epoch = date(1970, 1, 1)
+    opened = np.array([(value - epoch).days for value in opened_dates], dtype=np.int64)
+    closed = np.array([(value - epoch).days if value is not None else -1 for value in closed_dates], dtype=np.int64)
+    events = (closed >= 0) | (np.array(statuses) == "closed")
+    as_of = int(max(opened.max(), closed.max()))
+    # 폐업 상태인데 폐업일이 없으면 관측 종료일에 폐업한 것으로 간주
+    end = np.where(closed >= 0, closed, as_of)
+    durations = np.maximum(end - opened, 0)
+    closed = np.where(events, end, -1)
+
+    levels = {}
+    for level in LEVELS:
+        columns = [dict(area_code=area_codes, business_type=business_types)[name] for name in level]
+        keys = list(zip(*columns)) if columns else [()] * len(dated)
+        levels[level] = _level_stats(keys, opened, durations, events, closed, as_of)
+
+    return SurvivalTable(
+        version=version, as_of=epoch + timedelta(days=as_of), levels=levels, excluded=len(rows) - len(dated),
+        seconds=round(time.perf_counter() - started, 3), rows={"businesses": len(dated)},
+    )
+
+@replica_reads()
+def table() -> Optional[SurvivalTable]:
+    """현재 데이터 버전의 생존/폐업 표 (앱 컨텍스트 밖이거나 business_data를 읽을 수 없으면 None)"""
+    if not has_app_context():
+        return None
+    key = str(db.engine.url)
+    now = time.monotonic()
+    cached = _tables.get(key)
+    if cached is not None and now < cached[1]:
+        return cached[2]
+
+    with _tables_lock:
+        cached = _tables.get(key)
+        if cached is not None and now < cached[1]:
+            return cached[2]
+        try:
+            from services.competitor_density import business_data_version
+            version = business_data_version()
+            current = cached[2] if cached is not None and cached[0] == version else build(version)
+        except SQLAlchemyError:
+            db.session.rollback()
+            return None
+        _tables[key] = (version, now + _settings["version_check"], current)
+        return current
+
+def group(area_code: Optional[str] = None, business_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """그룹 생존/폐업 통계 (데이터가 없으면 None)"""
+    current = table()
+    return current.group(area_code, business_type) if current is not None else None
+
+def clear():
+    with _tables_lock:
+        _tables.clear()
+
+def init_app(app: Flask):
+    """설정 반영"""
+    _settings["version_check"] = float(app.config.get("SURVIVAL_VERSION_CHECK", 30))
+    clear()
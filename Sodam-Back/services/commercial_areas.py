@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+상권(CommercialArea) DB 조회와 관계 로딩 프로파일
+CommercialArea의 관계(유동인구, 매출, 사업체, 리스크 분석)는 기본 lazy 로딩이라 상권 여러 개를
+직렬화하면서 관계에 접근하면 상권마다 쿼리가 한 번씩 더 나간다 (N+1). 화면 종류별로 로딩 방식을 고정한다.
+
+- LIST: 목록은 관계를 읽지 않음 (raiseload, 실수로 접근하면 쿼리 대신 예외)
+- DETAIL: 상세는 요약에 필요한 사업체/리스크 분석 컬럼만 selectinload (관계당 IN 쿼리 한 번),
+  행 수가 많은 유동인구/매출은 raiseload
+- 분석(월별 유동인구/매출)은 관계를 거치지 않고 집계 테이블(services/rollups.py)에서 읽음
+
+요청당 쿼리 수: 목록 2 (건수 + 목록), 상세 3 (상권 + 관계 2), 분석 3 (area_id + 집계 2)
+"""
+from collections import Counter
+from typing import Any, Dict, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import raiseload, selectinload
+
+from extensions import db, replica_reads
+from models import BusinessData, CommercialArea, RiskAnalysis
+from services.competitor_density import ACTIVE_STATUSES
+
+LIST = (raiseload("*"),)
+DETAIL = (
+    selectinload(CommercialArea.business_data).load_only(
+        BusinessData.business_type, BusinessData.status, raiseload=True),
+    selectinload(CommercialArea.risk_analyses).load_only(
+        RiskAnalysis.business_type, RiskAnalysis.risk_type, RiskAnalysis.risk_score,
+        RiskAnalysis.health_score, RiskAnalysis.updated_at, raiseload=True),
+    raiseload("*"),
+)
+
+@replica_reads()
+def list_areas(limit: int = 50, offset: int = 0) -> Dict[str, Any]:
+    """상권 목록 (관계 로딩 없음)"""
+    total = db.session.execute(select(func.count()).select_from(CommercialArea)).scalar()
+    areas = db.session.execute(
+        select(CommercialArea).options(*LIST).order_by(CommercialArea.area_code).limit(limit).offset(offset)
+    ).scalars().all()
+    return {"areas": [area.to_dict() for area in areas], "total": total}
+
+@replica_reads()
+def area_detail(area_code: str) -> Optional[Dict[str, Any]]:
+    """상권 상세 + 업종별 사업체 수, 업종별 리스크 분류 요약 (없는 상권이면 None)"""
+    area = db.session.execute(
+        select(CommercialArea).options(*DETAIL).where(CommercialArea.area_code == area_code)
+    ).scalar()
+    if area is None:
+        return None
+
+    active = Counter(business.business_type for business in area.business_data if business.status in ACTIVE_STATUSES)
+    closed = Counter(business.business_type for business in area.business_data if business.status not in ACTIVE_STATUSES)
+    return {
+        "area": area.to_dict(),
+        "business_summary": {
+            "total": len(area.business_data),
+            "active": sum(active.values()),
+            "closed": sum(closed.values()),
+            "by_type": {
+                business_type: {"active": active[business_type], "closed": closed[business_type]}
+                for business_type in sorted(set(active) | set(closed))
+            }
+        },
+        "risk_summary": [
+            {
+                "business_type": risk.business_type,
+                "risk_type": risk.risk_type,
+                "risk_score": risk.risk_score,
+                "health_score": risk.health_score,
+                "updated_at": risk.updated_at.isoformat() if risk.updated_at else None
+            }
+            for risk in sorted(area.risk_analyses, key=lambda risk: risk.business_type)
+        ]
+    }
+
+def area_analytics(area_code: str, months: int = 12) -> Optional[Dict[str, Any]]:
+    """상권 월별 유동인구/매출 추이 (집계 테이블, 없는 상권이면 None)"""
+    from services.analytics_query_service import AnalyticsQueryService
+
+    query = AnalyticsQueryService()
+    area_id = query.get_area_id(area_code)
+    if area_id is None:
+        return None
+    return {
+        "area_code": area_code,
+        "months": months,
+        "foot_traffic": query.monthly_foot_traffic(area_id, months),
+        "sales": query.monthly_sales(area_id, months=months)
+    }
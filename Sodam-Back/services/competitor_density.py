@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+경쟁 사업체 밀도 (BusinessData 기반)
+상권 경계(다각형) 또는 반경 안의 영업 중인 사업체 수를 전체 상권 x 업종에 대해 한 번에 세고,
+면적(km²)당 밀도, 지역구 인구 1만 명당 사업체 수, 같은 지역구 상권들의 밀도 분포 대비 위치를 제공한다.
+
+- 상권 경계: 상권 CSV 좌표(3점 이상)는 다각형, 그 외에는 CommercialArea 중심/반경(기본 500m) 원
+- 계산: 사업체를 (위도 칸, 경도) 순으로 정렬해 상권마다 경계 상자 후보 구간을 찾고(searchsorted),
+  (후보, 변) 쌍 전체에 대한 반직선 교차 판정과 거리 계산을 numpy 배열 연산으로 처리 (상권별 반복 없음)
+- 영업 중: status가 active/new인 사업체
+- 결과 표는 데이터 버전(CSV 데이터셋 버전 + business_data 행 수/최대 id/상태 집계)별로 프로세스에 캐시하고,
+  버전 확인 쿼리는 COMPETITION_VERSION_CHECK초(기본 30)에 한 번만 실행
+"""
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from flask import Flask, has_app_context
+from sqlalchemy import case, func, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from extensions import db, replica_reads
+from models import BusinessData, CommercialArea
+
+ACTIVE_STATUSES = ("active", "new")
+DEFAULT_RADIUS_M = 500
+KM_PER_DEGREE_LAT = 111.32
+# 한 번에 만드는 (후보, 변) 쌍 수 상한 (메모리 사용량 제한)
+PAIR_BATCH = 2_000_000
+
+_settings = {
+    "version_check": 30.0,
+}
+
+_tables: Dict[str, Tuple[str, float, Optional["DensityTable"]]] = {}
+_tables_lock = threading.Lock()
+
+@dataclass
+class Geometry:
+    """상권 경계 (다각형 상권 먼저, 이어서 원 상권)"""
+    codes: List[str]
+    districts: List[Optional[str]]
+    offsets: np.ndarray  # 다각형 꼭짓점 구간 (다각형 수 + 1)
+    points: np.ndarray  # (꼭짓점 수, 2) 경도, 위도
+    centers: np.ndarray  # (원 수, 2) 위도, 경도
+    radii: np.ndarray  # 원 반경 (m)
+
+    @property
+    def polygon_count(self) -> int:
+        return len(self.offsets) - 1
+
+@dataclass
+class DensityTable:
+    """상권 x 업종 영업 사업체 수와 지역구 집계"""
+    version: str
+    codes: List[str]
+    districts: List[Optional[str]]
+    business_types: List[str]
+    counts: np.ndarray  # (상권 수, 업종 수)
+    area_km2: np.ndarray
+    district_counts: Dict[str, np.ndarray]  # 지역구 -> 업종별 사업체 수 (사업체 소속 상권 기준)
+    district_population: Dict[str, int]
+    seconds: float = 0.0
+    rows: Dict[str, int] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self._rows = {code: row for row, code in enumerate(self.codes)}
+        self._columns = {business_type: column for column, business_type in enumerate(self.business_types)}
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.density = np.where(self.area_km2[:, None] > 0, self.counts / self.area_km2[:, None], 0.0)
+
+    def market(self, market_code: str, business_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """상권 하나의 경쟁 밀도 (업종 미지정 시 업종별 사업체 수만)"""
+        row = self._rows.get(str(market_code))
+        if row is None:
+            return None
+        district = self.districts[row]
+        total = int(self.counts[row].sum())
+        result = {
+            "market_code": self.codes[row],
+            "district": district,
+            "area_km2": round(float(self.area_km2[row]), 4),
+            "total_businesses": total,
+            "data_version": self.version,
+        }
+        if business_type is None:
+            result["industry_breakdown"] = {
+                name: int(count) for name, count in zip(self.business_types, self.counts[row]) if count
+            }
+            return result
+
+        column = self._columns.get(business_type)
+        count = int(self.counts[row, column]) if column is not None else 0
+        density = float(self.density[row, column]) if column is not None else 0.0
+        peers = [index for index, name in enumerate(self.districts) if name == district] if district else []
+        peer_density = self.density[peers, column] if column is not None and peers else np.zeros(0)
+        city_density = self.density[:, column] if column is not None else np.zeros(len(self.codes))
+
+        result.update({
+            "business_type": business_type,
+            "business_count": count,
+            "industry_ratio": round(count / total * 100, 2) if total else 0.0,
+            "density_per_km2": round(density, 2),
+            "density_percentile": _percentile(peer_density, density) if len(peer_density) else None,
+            "city_percentile": _percentile(city_density, density),
+            "district_stats": self._district_stats(district, column, peer_density),
+        })
+        return result
+
+    def _district_stats(self, district: Optional[str], column: Optional[int], peer_density: np.ndarray) -> Optional[Dict[str, Any]]:
+        if not district:
+            return None
+        business_count = int(self.district_counts[district][column]) if district in self.district_counts and column is not None else 0
+        population = self.district_population.get(district)
+        return {
+            "district": district,
+            "market_count": len(peer_density),
+            "median_density_per_km2": round(float(np.median(peer_density)), 2) if len(peer_density) else 0.0,
+            "business_count": business_count,
+            "population": population,
+            "per_10k_residents": round(business_count / population * 10000, 2) if population else None,
+        }
+
+def _percentile(values: np.ndarray, value: float) -> float:
+    """값의 백분위 (같은 값은 절반으로 계산)"""
+    if not len(values):
+        return 0.0
+    return round(float(((values < value).sum() + 0.5 * (values == value).sum()) / len(values) * 100), 1)
+
+def _batches(weights: np.ndarray, limit: int) -> Iterator[Tuple[int, int]]:
+    """weights 합이 limit을 넘지 않는 연속 구간 (하나가 limit보다 크면 단독 구간)"""
+    ends = np.cumsum(weights)
+    start = 0
+    while start < len(weights):
+        base = ends[start - 1] if start else 0
+        stop = max(int(np.searchsorted(ends, base + limit, side="right")), start + 1)
+        yield start, stop
+        start = stop
+
+def _expand(starts: np.ndarray, counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """구간 [start, start + count)들을 이어 붙인 (구간 번호, 인덱스)"""
+    owner = np.repeat(np.arange(len(counts)), counts)
+    offsets = np.cumsum(counts) - counts
+    return owner, np.arange(int(counts.sum())) - np.repeat(offsets - starts, counts)
+
+def polygon_area_km2(offsets: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """다각형 면적 (꼭짓점 평균 위도 기준 등장방형 투영, 신발끈 공식)"""
+    if len(offsets) < 2:
+        return np.zeros(0)
+    starts, sizes = offsets[:-1], np.diff(offsets)
+    owner = np.repeat(np.arange(len(sizes)), sizes)
+    mean_lat = np.add.reduceat(points[:, 1], starts) / sizes
+    x = points[:, 0] * KM_PER_DEGREE_LAT * np.cos(np.radians(mean_lat[owner]))
+    y = points[:, 1] * KM_PER_DEGREE_LAT
+    following = np.arange(len(points)) + 1
+    following[offsets[1:] - 1] = starts
+    return np.abs(np.add.reduceat(x * y[following] - x[following] * y, starts)) / 2
+
+def count_by_market(lats: np.ndarray, lngs: np.ndarray, type_codes: np.ndarray, type_count: int,
+                    geometry: Geometry) -> np.ndarray:
+    """상권 x 업종 사업체 수 (경계 위 점은 다각형에서는 어느 한쪽, 원에서는 안쪽으로 계산)"""
+    from services.spatial_index import haversine_m, radius_bbox
+
+    market_count = geometry.polygon_count + len(geometry.radii)
+    counts = np.zeros(market_count * type_count, dtype=np.int64)
+    if not len(lats) or not market_count:
+        return counts.reshape(market_count, type_count)
+
+    # 경계 상자 목록 (다각형 다음 원)
+    box = [np.zeros(0)] * 4
+    if geometry.polygon_count:
+        offsets, points = geometry.offsets, geometry.points
+        starts, sizes = offsets[:-1], np.diff(offsets)
+        box = [reduce(points[:, axis], starts) for axis in (1, 0) for reduce in (np.minimum.reduceat, np.maximum.reduceat)]
+    if len(geometry.radii):
+        center_lat, center_lng = geometry.centers[:, 0], geometry.centers[:, 1]
+        circle_box = radius_bbox(center_lat, center_lng, geometry.radii)
+        box = [np.concatenate([part, circle_box[key]]) for part, key in zip(box, ("min_lat", "max_lat", "min_lng", "max_lng"))]
+    min_lat, max_lat, min_lng, max_lng = box
+
+    # 사업체를 (위도 칸, 경도) 순으로 정렬: 칸 높이는 상권 경계 상자 높이의 중앙값
+    cell = max(float(np.median(max_lat - min_lat)), 1e-5)
+    lat0, lng0 = float(lats.min()), float(lngs.min())
+    lng_scale = 0.5 / (float(lngs.max()) - lng0 + 1e-9)
+    keys = np.floor((lats - lat0) / cell) + (lngs - lng0) * lng_scale
+    order = np.argsort(keys, kind="stable")
+    keys, lats, lngs, type_codes = keys[order], lats[order], lngs[order], type_codes[order]
+
+    def candidates(markets):
+        """상권별 경계 상자 안의 (상권 번호, 사업체 인덱스) 쌍을 PAIR_BATCH 단위로"""
+        first = np.floor((min_lat[markets] - lat0) / cell)
+        cells = (np.floor((max_lat[markets] - lat0) / cell) - first + 1).astype(np.int64)
+        query, offset = _expand(np.zeros(len(markets), dtype=np.int64), cells)
+        row = first[query] + offset
+        low = np.searchsorted(keys, row + np.clip((min_lng[markets][query] - lng0) * lng_scale, 0, 0.5), side="left")
+        sizes = np.searchsorted(keys, row + np.clip((max_lng[markets][query] - lng0) * lng_scale, 0, 0.5), side="right") - low
+        for start, stop in _batches(sizes, PAIR_BATCH):
+            owner, index = _expand(low[start:stop], sizes[start:stop])
+            owner = markets[query[start:stop][owner]]
+            inside = ((lats[index] >= min_lat[owner]) & (lats[index] <= max_lat[owner])
+                      & (lngs[index] >= min_lng[owner]) & (lngs[index] <= max_lng[owner]))
+            yield owner[inside], index[inside]
+
+    def add(markets, index):
+        counts[:] += np.bincount(markets * type_count + type_codes[index], minlength=len(counts))
+
+    # 다각형: 후보마다 해당 상권의 모든 변과 반직선 교차 판정, 교차 수가 홀수면 안쪽
+    if geometry.polygon_count:
+        following = np.arange(len(points)) + 1
+        following[offsets[1:] - 1] = starts
+        for owner, index in candidates(np.arange(geometry.polygon_count)):
+            for start, stop in _batches(sizes[owner], PAIR_BATCH):
+                pair, vertex = _expand(starts[owner[start:stop]], sizes[owner[start:stop]])
+                x, y = lngs[index[start:stop]][pair], lats[index[start:stop]][pair]
+                x1, y1 = points[vertex, 0], points[vertex, 1]
+                x2, y2 = points[following[vertex], 0], points[following[vertex], 1]
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    crossing = ((y1 > y) != (y2 > y)) & (x < (x2 - x1) * (y - y1) / (y2 - y1) + x1)
+                inside = np.bincount(pair, weights=crossing, minlength=stop - start) % 2 == 1
+                add(owner[start:stop][inside], index[start:stop][inside])
+
+    # 원: 경계 상자 후보 중 중심까지 거리가 반경 이하
+    if len(geometry.radii):
+        for owner, index in candidates(np.arange(geometry.polygon_count, market_count)):
+            circle = owner - geometry.polygon_count
+            near = haversine_m(center_lat[circle], center_lng[circle], lats[index], lngs[index]) <= geometry.radii[circle]
+            add(owner[near], index[near])
+
+    return counts.reshape(market_count, type_count)
+
+def _geometry() -> Geometry:
+    """상권 CSV 경계 다각형 + (다각형이 없는) CommercialArea 중심/반경"""
+    from services.data_loader import DataLoader
+
+    index = DataLoader()._get_market_index()
+    markets = index.get("markets", {}) if index else {}
+
+    codes, districts, parts = [], [], []
+    point_free = {}
+    for code, (info, row) in markets.items():
+        start, stop = int(index["offsets"][row]), int(index["offsets"][row + 1])
+        if stop - start >= 3:
+            codes.append(code)
+            districts.append(info.get("district_name"))
+            parts.append(index["points"][start:stop])
+        else:
+            point_free[code] = info.get("district_name")
+
+    offsets = np.zeros(len(parts) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(part) for part in parts])
+    points = np.concatenate(parts).astype(np.float64) if parts else np.zeros((0, 2))
+
+    polygon_codes = set(codes)
+    circles = [
+        (area_code, latitude, longitude, radius)
+        for area_code, latitude, longitude, radius in db.session.execute(
+            select(CommercialArea.area_code, CommercialArea.latitude, CommercialArea.longitude, CommercialArea.radius)
+        )
+        if area_code not in polygon_codes
+    ]
+    codes += [area_code for area_code, *_ in circles]
+    districts += [point_free.get(area_code) for area_code, *_ in circles]
+    return Geometry(
+        codes=codes, districts=districts, offsets=offsets, points=points,
+        centers=np.array([(latitude, longitude) for _, latitude, longitude, _ in circles], dtype=np.float64).reshape(-1, 2),
+        radii=np.array([radius or DEFAULT_RADIUS_M for *_, radius in circles], dtype=np.float64),
+    )
+
+def business_data_version() -> str:
+    """CSV 데이터셋 버전 + business_data 행 수/최대 id/폐업일 수/영업 중 수 (추가/삭제/상태 변경 시 달라짐)"""
+    from services.data_loader import DataLoader
+
+    row = db.session.execute(select(
+        func.count(), func.max(BusinessData.id), func.count(BusinessData.closed_date),
+        func.sum(case((BusinessData.status.in_(ACTIVE_STATUSES), 1), else_=0))
+    ).select_from(BusinessData)).one()
+    return f"{DataLoader().dataset_version()}.{row[0]}.{row[1] or 0}.{row[2]}.{row[3] or 0}"
+
+@replica_reads()
+def build(version: Optional[str] = None) -> Optional[DensityTable]:
+    """전체 상권 x 업종 밀도 표 계산 (영업 중인 사업체가 없으면 None)"""
+    from services.data_loader import DataLoader
+
+    started = time.perf_counter()
+    version = version or business_data_version()
+    rows = db.session.execute(
+        select(BusinessData.latitude, BusinessData.longitude, BusinessData.business_type, CommercialArea.area_code)
+        .join(CommercialArea, CommercialArea.id == BusinessData.area_id)
+        .where(BusinessData.status.in_(ACTIVE_STATUSES))
+    ).all()
+    if not rows:
+        return None
+
+    lats, lngs, business_types, area_codes = (np.array(column) for column in zip(*rows))
+    names, type_codes = np.unique(business_types, return_inverse=True)
+    geometry = _geometry()
+    counts = count_by_market(lats.astype(np.float64), lngs.astype(np.float64), type_codes, len(names), geometry)
+
+    area_km2 = np.concatenate([
+        polygon_area_km2(geometry.offsets, geometry.points),
+        np.pi * (geometry.radii / 1000) ** 2
+    ])
+
+    # 지역구 집계는 사업체가 속한 상권(area_id)의 지역구 기준
+    district_of = dict(zip(geometry.codes, geometry.districts))
+    area_names, area_index = np.unique(area_codes, return_inverse=True)
+    per_area = np.zeros((len(area_names), len(names)), dtype=np.int64)
+    np.add.at(per_area, (area_index, type_codes), 1)
+    district_counts: Dict[str, np.ndarray] = {}
+    for area_code, area_counts in zip(area_names.tolist(), per_area):
+        district = district_of.get(area_code)
+        if district:
+            district_counts[district] = district_counts.get(district, 0) + area_counts
+
+    return DensityTable(
+        version=version, codes=geometry.codes, districts=geometry.districts,
+        business_types=names.tolist(), counts=counts, area_km2=area_km2,
+        district_counts=district_counts, district_population=DataLoader().get_district_population(),
+        seconds=round(time.perf_counter() - started, 3),
+        rows={"businesses": len(rows), "markets": len(geometry.codes)},
+    )
+
+@replica_reads()
+def table() -> Optional[DensityTable]:
+    """현재 데이터 버전의 밀도 표 (앱 컨텍스트 밖이거나 business_data를 읽을 수 없으면 None)"""
+    if not has_app_context():
+        return None
+    key = str(db.engine.url)
+    now = time.monotonic()
+    cached = _tables.get(key)
+    if cached is not None and now < cached[1]:
+        return cached[2]
+
+    with _tables_lock:
+        cached = _tables.get(key)
+        if cached is not None and now < cached[1]:
+            return cached[2]
+        try:
+            version = business_data_version()
+            current = cached[2] if cached is not None and cached[0] == version else build(version)
+        except SQLAlchemyError:
+            db.session.rollback()
+            return None
+        _tables[key] = (version, now + _settings["version_check"], current)
+        return current
+
+def market_competition(market_code: str, business_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """상권 경쟁 밀도 (밀도 표에 없는 상권이면 None)"""
+    current = table()
+    return current.market(market_code, business_type) if current is not None else None
+
+def clear():
+    with _tables_lock:
+        _tables.clear()
+
+def cache_version() -> str:
+    """결과 캐시 키/리스크 분류 저장소용 business_data 버전 (테이블이 없으면 none)"""
+    try:
+        return business_data_version()
+    except SQLAlchemyError:
+        db.session.rollback()
+        return "none"
+
+def init_app(app: Flask):
+    """설정 반영, 결과 캐시에 business_data 버전 소스 등록"""
+    _settings["version_check"] = float(app.config.get("COMPETITION_VERSION_CHECK", 30))
+    clear()
+
+    from services import result_cache
+    result_cache.register_version("business_data", cache_version)
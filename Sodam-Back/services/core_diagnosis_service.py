@@ -4,6 +4,8 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 import numpy as np
 from .data_loader import DataLoader
+from .result_cache import single_flight
+from .timing import timed
 
 class CoreDiagnosisService:
     """상권 진단 핵심 지표 분석 서비스"""
@@ -72,44 +74,81 @@ class CoreDiagnosisService:
         # 기본값
         return {"weight": 1.0, "traffic_factor": 1.0, "competition_factor": 1.0}
     
+    def _get_tourism_series(self, market_code: str, industry: str = None, period_months: int = 12):
+        """관광 소비 데이터 기반 월별 지표 (지역 지출 비율, 업종 가중치 적용) - (월 목록, 값 목록) 또는 오류"""
+        # 상권 정보에서 지역 추출
+        market_info = self.data_loader.get_market_by_code(market_code)
+        if not market_info:
+            return {"error": "상권 정보를 가져올 수 없습니다."}
+        
+        region = market_info.get('city_name', '대전광역시')
+        
+        # 업종별 관광 데이터 사용
+        if industry and industry != "전체":
+            tourism_data = self.data_loader.get_tourism_trend_by_industry(region, industry)
+        else:
+            tourism_data = self.data_loader.get_tourism_trend(region)
+        
+        if not tourism_data:
+            return {"error": "관광 소비 데이터를 가져올 수 없습니다."}
+        
+        # 최근 N개월 데이터 추출
+        recent_data = tourism_data[-period_months:] if len(tourism_data) >= period_months else tourism_data
+        
+        base_values = [float(data['consumption_amount']) for data in recent_data]
+        months = [data['year_month'] for data in recent_data]
+        
+        # 지역별 지출 비율 적용
+        regional_ratio = self.data_loader.get_regional_ratio_by_region(region)
+        regional_adjustment = regional_ratio / 100.0 if regional_ratio > 0 else 1.0
+        
+        # 업종별 가중치 적용
+        industry_weight = 1.0
+        if industry and industry != "전체":
+            industry_ratio = self.data_loader.get_industry_ratio_by_category(industry)
+            industry_weight = industry_ratio.get('major_ratio', 1.0) / 100.0 if industry_ratio.get('major_ratio', 0) > 0 else 1.0
+        
+        # 최종 조정된 값
+        return months, [v * regional_adjustment * industry_weight for v in base_values]
+    
+    def _get_monthly_rollups(self, market_code: str, kind: str, industry: str = None, period_months: int = 12) -> List[Dict[str, Any]]:
+        """DB 월별 집계 조회 (kind: foot_traffic / sales) - 앱 컨텍스트 밖이거나 데이터가 없으면 빈 목록"""
+        from flask import has_app_context
+        if not has_app_context():
+            return []
+        
+        from sqlalchemy.exc import SQLAlchemyError
+        from extensions import db
+        from services.analytics_query_service import AnalyticsQueryService
+        try:
+            query = AnalyticsQueryService()
+            area_id = query.get_area_id(market_code)
+            if area_id is None:
+                return []
+            if kind == "sales":
+                return query.monthly_sales(area_id, industry if industry and industry != "전체" else None, period_months)
+            return query.monthly_foot_traffic(area_id, period_months)
+        except SQLAlchemyError:
+            # 집계 테이블이 없는 DB(마이그레이션 전)는 CSV 기반 추정으로 대체
+            db.session.rollback()
+            return []
+    
+    @single_flight("core_diagnosis.get_foot_traffic_analysis", shared=True, versions=("dataset", "rollups"))
+    @timed("indicators")
     def get_foot_traffic_analysis(self, market_code: str, industry: str = None, period_months: int = 12) -> Dict[str, Any]:
-        """유동인구 변화량 분석 - 위치별, 업종별 실제 데이터 사용"""
+        """유동인구 변화량 분석 - DB 월별 집계가 있으면 실제 유동인구, 없으면 관광 소비 데이터로 추정"""
         try:
-            # 상권 정보에서 지역 추출
-            market_info = self.data_loader.get_market_by_code(market_code)
-            if not market_info:
-                return {"error": "상권 정보를 가져올 수 없습니다."}
-            
-            region = market_info.get('city_name', '대전광역시')
-            
-            # 업종별 관광 데이터 사용
-            if industry and industry != "전체":
-                tourism_data = self.data_loader.get_tourism_trend_by_industry(region, industry)
+            rollup_rows = self._get_monthly_rollups(market_code, "foot_traffic", period_months=period_months)
+            if rollup_rows:
+                months = [row['month'] for row in rollup_rows]
+                values = [float(row['total_count']) for row in rollup_rows]
+                unit = 1  # 유동인구 수
             else:
-                tourism_data = self.data_loader.get_tourism_trend(region)
-            
-            if not tourism_data:
-                return {"error": "관광 소비 데이터를 가져올 수 없습니다."}
-            
-            # 최근 N개월 데이터 추출
-            recent_data = tourism_data[-period_months:] if len(tourism_data) >= period_months else tourism_data
-            
-            # 소비액을 유동인구 지표로 변환 (소비액이 높을수록 유동인구가 많다고 가정)
-            base_values = [float(data['consumption_amount']) for data in recent_data]
-            months = [data['year_month'] for data in recent_data]
-            
-            # 지역별 지출 비율 적용
-            regional_ratio = self.data_loader.get_regional_ratio_by_region(region)
-            regional_adjustment = regional_ratio / 100.0 if regional_ratio > 0 else 1.0
-            
-            # 업종별 가중치 적용
-            industry_weight = 1.0
-            if industry and industry != "전체":
-                industry_ratio = self.data_loader.get_industry_ratio_by_category(industry)
-                industry_weight = industry_ratio.get('major_ratio', 1.0) / 100.0 if industry_ratio.get('major_ratio', 0) > 0 else 1.0
-            
-            # 최종 조정된 값
-            values = [v * regional_adjustment * industry_weight for v in base_values]
+                series = self._get_tourism_series(market_code, industry, period_months)
+                if isinstance(series, dict):
+                    return series
+                months, values = series
+                unit = 1000  # 소비액 -> 천원 단위
             
             # 변화량 계산
             if len(values) >= 2:
@@ -138,13 +177,13 @@ class CoreDiagnosisService:
             
             return {
                 "market_code": market_code,
-                "current_monthly_traffic": int(values[-1] / 1000),  # 천원 단위로 변환
+                "current_monthly_traffic": int(values[-1] / unit),
                 "average_monthly_change": round(avg_monthly_change, 2),
                 "total_change_period": round(total_change, 2),
                 "trend": trend,
                 "grade": grade,
                 "monthly_data": [
-                    {"month": month, "traffic": int(value / 1000)} 
+                    {"month": month, "traffic": int(value / unit)} 
                     for month, value in zip(months, values)
                 ],
                 "analysis": self._get_foot_traffic_analysis_text(avg_monthly_change, grade)
@@ -152,44 +191,20 @@ class CoreDiagnosisService:
         except Exception as e:
             return {"error": f"유동인구 분석 중 오류가 발생했습니다: {str(e)}"}
     
+    @single_flight("core_diagnosis.get_card_sales_analysis", shared=True, versions=("dataset", "rollups"))
+    @timed("indicators")
     def get_card_sales_analysis(self, market_code: str, industry: str = None, period_months: int = 12) -> Dict[str, Any]:
-        """카드매출 추이 분석 - 위치별, 업종별 실제 데이터 사용"""
+        """카드매출 추이 분석 - DB 월별 집계가 있으면 실제 카드매출, 없으면 관광 소비 데이터 사용"""
         try:
-            # 상권 정보에서 지역 추출
-            market_info = self.data_loader.get_market_by_code(market_code)
-            if not market_info:
-                return {"error": "상권 정보를 가져올 수 없습니다."}
-            
-            region = market_info.get('city_name', '대전광역시')
-            
-            # 업종별 관광 데이터 사용
-            if industry and industry != "전체":
-                tourism_data = self.data_loader.get_tourism_trend_by_industry(region, industry)
+            rollup_rows = self._get_monthly_rollups(market_code, "sales", industry, period_months)
+            if rollup_rows:
+                months = [row['month'] for row in rollup_rows]
+                values = [float(row['total_sales']) for row in rollup_rows]
             else:
-                tourism_data = self.data_loader.get_tourism_trend(region)
-            
-            if not tourism_data:
-                return {"error": "관광 소비 데이터를 가져올 수 없습니다."}
-            
-            # 최근 N개월 데이터 추출
-            recent_data = tourism_data[-period_months:] if len(tourism_data) >= period_months else tourism_data
-            
-            # 소비액을 카드매출로 사용
-            base_values = [float(data['consumption_amount']) for data in recent_data]
-            months = [data['year_month'] for data in recent_data]
-            
-            # 지역별 지출 비율 적용
-            regional_ratio = self.data_loader.get_regional_ratio_by_region(region)
-            regional_adjustment = regional_ratio / 100.0 if regional_ratio > 0 else 1.0
-            
-            # 업종별 가중치 적용
-            industry_weight = 1.0
-            if industry and industry != "전체":
-                industry_ratio = self.data_loader.get_industry_ratio_by_category(industry)
-                industry_weight = industry_ratio.get('major_ratio', 1.0) / 100.0 if industry_ratio.get('major_ratio', 0) > 0 else 1.0
-            
-            # 최종 조정된 값
-            values = [v * regional_adjustment * industry_weight for v in base_values]
+                series = self._get_tourism_series(market_code, industry, period_months)
+                if isinstance(series, dict):
+                    return series
+                months, values = series
             
             # 변화량 계산
             if len(values) >= 2:
@@ -232,10 +247,16 @@ class CoreDiagnosisService:
         except Exception as e:
             return {"error": f"카드매출 분석 중 오류가 발생했습니다: {str(e)}"}
     
+    @single_flight("core_diagnosis.get_same_industry_analysis", shared=True, versions=("dataset", "business_data"))
+    @timed("indicators")
     def get_same_industry_analysis(self, market_code: str, industry: str = None) -> Dict[str, Any]:
-        """동일업종 수 분석"""
+        """동일업종 수 분석 - 사업체 데이터가 있으면 상권 안 실제 사업체 밀도, 없으면 업종별 지출액 비율로 추정"""
         try:
-            # 실제 업종별 지출액 데이터 사용
+            density = self._get_competitor_density(market_code, industry)
+            if density:
+                return density
+            
+            # 업종별 지출액 데이터 사용
             industry_data = self.data_loader.get_industry_ratios()
             
             if not industry_data:
@@ -289,21 +310,83 @@ class CoreDiagnosisService:
         except Exception as e:
             return {"error": f"동일업종 분석 중 오류가 발생했습니다: {str(e)}"}
     
+    def _get_business_type(self, industry: str = None) -> Optional[str]:
+        """업종(대분류 또는 중분류) -> 사업체 데이터의 business_type (대분류)"""
+        if not industry or industry == "전체":
+            return None
+        for category, sub_categories in self.categories.items():
+            if industry in sub_categories:
+                return category
+        return industry
+    
+    def _get_competitor_density(self, market_code: str, industry: str = None) -> Optional[Dict[str, Any]]:
+        """business_data 기반 상권 경쟁 밀도 - 앱 컨텍스트 밖이거나 밀도 표에 없는 상권이면 None"""
+        from services import competitor_density
+        business_type = self._get_business_type(industry)
+        result = competitor_density.market_competition(market_code, business_type)
+        if result is None:
+            return None
+        
+        if business_type is None:
+            return {
+                **result,
+                "analysis": "상권 안 영업 중인 업종별 사업체 수 현황입니다.",
+                "source": "business_data"
+            }
+        
+        # 같은 지역구 상권 대비 밀도 백분위 (지역구를 모르면 전체 상권 대비)
+        percentile = result["density_percentile"] if result["density_percentile"] is not None else result["city_percentile"]
+        if result["business_count"] == 0 or percentile <= 30:
+            competition_level, grade = "낮음", "A"
+        elif percentile <= 60:
+            competition_level, grade = "보통", "B"
+        elif percentile <= 80:
+            competition_level, grade = "높음", "C"
+        else:
+            competition_level, grade = "매우 높음", "D"
+        
+        return {
+            **result,
+            "industry": industry,
+            "competition_level": competition_level,
+            "grade": grade,
+            "analysis": self._get_density_analysis_text(result["density_per_km2"], percentile, competition_level),
+            "source": "business_data"
+        }
+    
+    def _get_business_survival(self, market_code: str) -> Optional[Dict[str, Any]]:
+        """business_data 기반 상권 생존/폐업 통계 - 앱 컨텍스트 밖이거나 1년 전 영업 중이던 사업체가 없으면 None"""
+        from services import business_survival
+        survival = business_survival.group(area_code=market_code)
+        if survival is None or survival["last_year"]["startup_rate"] is None:
+            return None
+        return survival
+    
+    @single_flight("core_diagnosis.get_business_rates_analysis", shared=True, versions=("dataset", "business_data"))
+    @timed("indicators")
     def get_business_rates_analysis(self, market_code: str) -> Dict[str, Any]:
-        """창업·폐업 비율 분석"""
+        """창업·폐업 비율 분석 - 사업체 데이터가 있으면 실제 개업/폐업 이력, 없으면 관광 소비 변동성으로 추정"""
         try:
+            survival = self._get_business_survival(market_code)
+            
             # 관광 소비 데이터의 변동성을 기반으로 창업·폐업 비율 추정
-            tourism_data = self.data_loader.get_tourism_trend()
+            tourism_data = [] if survival else self.data_loader.get_tourism_trend()
             
-            if not tourism_data:
+            if not survival and not tourism_data:
                 return {"error": "관광 소비 데이터를 가져올 수 없습니다."}
             
             # 최근 12개월 데이터의 변동성 계산
             recent_data = tourism_data[-12:] if len(tourism_data) >= 12 else tourism_data
             values = [float(data['consumption_amount']) for data in recent_data]
             
+            if survival:
+                # 최근 1년 창업률/폐업률, 1년 생존율 (Kaplan-Meier, 관측 기간이 1년 미만이면 폐업률로 대체)
+                startup_rate = survival["last_year"]["startup_rate"]
+                closure_rate = survival["last_year"]["closure_rate"]
+                one_year = survival["horizons"]["1year"]
+                survival_rate = one_year["survival_rate"] if one_year else 100 - closure_rate
             # 변동성 기반으로 창업·폐업 비율 추정
-            if len(values) >= 2:
+            elif len(values) >= 2:
                 # 변동성 계산 (표준편차)
                 std_dev = np.std(values)
                 mean_value = np.mean(values)
@@ -343,7 +426,7 @@ class CoreDiagnosisService:
                 grade = "D"
                 health_status = "우려"
             
-            return {
+            result = {
                 "market_code": market_code,
                 "startup_rate": round(startup_rate, 2),
                 "closure_rate": round(closure_rate, 2),
@@ -353,24 +436,44 @@ class CoreDiagnosisService:
                 "health_status": health_status,
                 "analysis": self._get_business_rates_analysis_text(total_score, health_status)
             }
+            if survival:
+                result.update({
+                    "closure_rates": {
+                        period: horizon["closure_rate"] if horizon else None
+                        for period, horizon in survival["horizons"].items()
+                    },
+                    "sample_size": survival["sample_size"],
+                    "survival_curve": survival["survival_curve"],
+                    "as_of": survival["as_of"],
+                    "source": "business_data"
+                })
+            return result
         except Exception as e:
             return {"error": f"창업·폐업 비율 분석 중 오류가 발생했습니다: {str(e)}"}
     
+    @single_flight("core_diagnosis.get_dwell_time_analysis", shared=True, versions=("dataset", "rollups"))
+    @timed("indicators")
     def get_dwell_time_analysis(self, market_code: str) -> Dict[str, Any]:
-        """체류시간 분석"""
+        """체류시간 분석 - DB 월별 집계가 있으면 실측 평균 체류시간 사용"""
         try:
+            rollup_rows = self._get_monthly_rollups(market_code, "foot_traffic")
+            row_count = sum(row['row_count'] for row in rollup_rows)
+            
             # 관광 소비 데이터의 패턴을 기반으로 체류시간 추정
-            tourism_data = self.data_loader.get_tourism_trend()
+            tourism_data = [] if row_count else self.data_loader.get_tourism_trend()
             
-            if not tourism_data:
+            if not row_count and not tourism_data:
                 return {"error": "관광 소비 데이터를 가져올 수 없습니다."}
             
             # 최근 12개월 데이터 분석
             recent_data = tourism_data[-12:] if len(tourism_data) >= 12 else tourism_data
             values = [float(data['consumption_amount']) for data in recent_data]
             
+            if row_count:
+                # 최근 12개월 시간대별 평균 체류시간의 평균
+                avg_time = sum(row['dwell_time_sum'] for row in rollup_rows) / row_count
             # 소비액 패턴을 기반으로 체류시간 추정
-            if len(values) >= 2:
+            elif len(values) >= 2:
                 # 소비액의 안정성을 체류시간 지표로 사용
                 mean_value = np.mean(values)
                 std_dev = np.std(values)
@@ -413,6 +516,8 @@ class CoreDiagnosisService:
         except Exception as e:
             return {"error": f"체류시간 분석 중 오류가 발생했습니다: {str(e)}"}
     
+    @single_flight("core_diagnosis.calculate_health_score", shared=True, versions=("dataset", "rollups", "business_data"))
+    @timed("indicators")
     def calculate_health_score(self, market_code: str, industry: str = None, category: str = None, sub_category: str = None) -> Dict[str, Any]:
         """상권 건강 점수 종합 산정 - 카테고리 정보 활용"""
         # 카테고리 정보 조회
@@ -466,8 +571,8 @@ class CoreDiagnosisService:
             dwell_time_score * weights["dwell_time"]
         )
         
-        # 경쟁도 점수 추가 (업종이 지정된 경우)
-        if same_industry:
+        # 경쟁도 점수 추가 (업종이 지정된 경우, "전체"의 업종별 현황은 등급이 없어 제외)
+        if same_industry and same_industry.get("grade"):
             competition_score = grade_scores.get(same_industry["grade"], 60)
             competition_score *= category_info["competition_factor"]  # 카테고리별 경쟁도 가중치 적용
             total_score += competition_score * weights["competition"]
@@ -529,6 +634,7 @@ class CoreDiagnosisService:
             "recommendations": self._get_health_score_recommendations(total_score, final_grade)
         }
     
+    @timed("text")
     def _get_foot_traffic_analysis_text(self, change_rate: float, grade: str) -> str:
         """유동인구 분석 텍스트 생성"""
         if grade == "A":
@@ -540,6 +646,7 @@ class CoreDiagnosisService:
         else:
             return f"유동인구가 월평균 {change_rate:.1f}% 감소하여 주의가 필요합니다."
     
+    @timed("text")
     def _get_card_sales_analysis_text(self, change_rate: float, grade: str) -> str:
         """카드매출 분석 텍스트 생성"""
         if grade == "A":
@@ -551,6 +658,7 @@ class CoreDiagnosisService:
         else:
             return f"카드매출이 월평균 {change_rate:.1f}% 감소하여 소비력 저하가 우려됩니다."
     
+    @timed("text")
     def _get_competition_analysis_text(self, ratio: float, level: str) -> str:
         """경쟁도 분석 텍스트 생성"""
         if level == "매우 높음":
@@ -562,6 +670,20 @@ class CoreDiagnosisService:
         else:
             return f"동일업종 비율이 {ratio:.1f}%로 경쟁이 낮아 진입 기회가 좋습니다."
     
+    @timed("text")
+    def _get_density_analysis_text(self, density: float, percentile: float, level: str) -> str:
+        """경쟁 밀도 분석 텍스트 생성"""
+        position = f"면적 1km²당 동일업종 {density:.1f}개로 비교 상권 중 밀도 백분위 {percentile:.0f}입니다."
+        if level == "매우 높음":
+            return f"{position} 경쟁이 매우 치열하여 차별화 전략이 필수입니다."
+        elif level == "높음":
+            return f"{position} 경쟁이 치열한 편으로 차별화가 필요합니다."
+        elif level == "보통":
+            return f"{position} 적당한 경쟁 수준입니다."
+        else:
+            return f"{position} 경쟁이 낮아 진입 기회가 좋습니다."
+    
+    @timed("text")
     def _get_business_rates_analysis_text(self, score: float, status: str) -> str:
         """창업·폐업 비율 분석 텍스트 생성"""
         if status == "매우 양호":
@@ -573,6 +695,7 @@ class CoreDiagnosisService:
         else:
             return f"창업·폐업 비율에 우려가 있어 상권 활력 제고가 필요합니다."
     
+    @timed("text")
     def _get_dwell_time_analysis_text(self, avg_time: float, quality: str) -> str:
         """체류시간 분석 텍스트 생성"""
         if quality == "매우 우수":
@@ -584,6 +707,7 @@ class CoreDiagnosisService:
         else:
             return f"평균 체류시간이 {avg_time}분으로 부족하여 고객 유치 전략이 필요합니다."
     
+    @timed("text")
     def _get_health_score_recommendations(self, score: float, grade: str) -> List[str]:
         """건강 점수 기반 추천사항 생성"""
         recommendations = []
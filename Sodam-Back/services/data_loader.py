@@ -3,21 +3,85 @@
 데이터 로더 서비스
 CSV 파일들을 로드하고 전처리하는 서비스
 """
+import numpy as np
 import pandas as pd
+import hashlib
 import os
 import json
+import time
 from typing import Dict, List, Any, Optional
+from services import shared_arrays
+from services.metrics import CACHE_REQUESTS, DATASET_LOAD_SECONDS, DATASET_ROWS
+from services.timing import timed
+
+DEFAULT_DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'csv')
+
+# 프로세스 전역 데이터셋 캐시 (데이터 디렉터리별)
+# 모든 DataLoader 인스턴스가 공유하므로 pre-fork 서버의 마스터에서 한 번 로드하면
+# fork 된 워커들이 같은 데이터프레임을 copy-on-write로 공유한다.
+# 인덱스(공유 배열)로 옮긴 데이터는 데이터프레임에서 해제하여 워커마다 복사되는 pandas 객체를 줄인다.
+# - 관광 소비: 인덱스가 모든 조회를 처리하므로 데이터프레임을 캐시에서 제거
+# - 상권: 경계 좌표(행마다 dict 리스트) 열을 제거하고 market_coordinates()로 공유 배열에서 조회
+_shared_cache: Dict[str, Dict[str, Any]] = {}
 
 class DataLoader:
-    def __init__(self):
-        self.data_dir = os.path.join(os.path.dirname(__file__), '..', 'csv')
-        self._cache = {}
+    def __init__(self, data_dir: str = None):
+        # 데이터 디렉터리: 인자 > SODAM_DATA_DIR 환경 변수 > 기본 csv 디렉터리
+        self.data_dir = data_dir or os.getenv('SODAM_DATA_DIR') or DEFAULT_DATA_DIR
+        self._cache = _shared_cache.setdefault(os.path.abspath(self.data_dir), {})
+    
+    def preload(self) -> Dict[str, int]:
+        """모든 데이터셋과 조회 인덱스를 미리 로드 (워커 fork 전 마스터 프로세스에서 호출)"""
+        row_counts = {
+            'market_data': len(self.load_market_data()),
+            'tourism_consumption': len(self.load_tourism_consumption()),
+            'industry_expenditure': len(self.load_industry_expenditure()),
+            'regional_expenditure': len(self.load_regional_expenditure())
+        }
+        self._get_market_index()
+        self._get_tourism_index()
+        self._get_industry_index()
+        self._get_regional_index()
+        if shared_arrays.store is not None:
+            shared_arrays.store.prune(self.dataset_version())
+        return row_counts
     
+    def dataset_version(self) -> str:
+        """데이터 디렉터리의 CSV/xlsx 파일 이름/크기/수정 시각 기반 버전 (파일이 바뀌면 달라짐)"""
+        cached = self._cache.get('dataset_version')
+        if cached is not None:
+            return cached
+        
+        digest = hashlib.sha1()
+        for filename in sorted(os.listdir(self.data_dir)):
+            if filename.endswith(('.csv', '.xlsx')):
+                stat = os.stat(os.path.join(self.data_dir, filename))
+                digest.update(f"{filename}:{stat.st_size}:{stat.st_mtime_ns};".encode('utf-8'))
+        
+        version = digest.hexdigest()[:12]
+        self._cache['dataset_version'] = version
+        return version
+    
+    def _cache_lookup(self, key: str, cache: str = 'dataset') -> Any:
+        """캐시 조회 (적중/미스 메트릭 기록)"""
+        value = self._cache.get(key)
+        CACHE_REQUESTS.inc(cache=cache, result='miss' if value is None else 'hit')
+        return value
+    
+    def _cache_dataset(self, key: str, df: pd.DataFrame, started: float):
+        """로드한 데이터셋을 캐시에 저장하고 로드 시간/행 수 기록"""
+        DATASET_LOAD_SECONDS.observe(time.perf_counter() - started, dataset=key)
+        DATASET_ROWS.set(len(df), dataset=key)
+        self._cache[key] = df
+    
+    @timed("data_load")
     def load_market_data(self) -> pd.DataFrame:
-        """상권 데이터 로드"""
-        if 'market_data' in self._cache:
-            return self._cache['market_data']
+        """상권 데이터 로드 (상권 인덱스를 만든 뒤에는 coordinates 열 없음, market_coordinates 사용)"""
+        cached = self._cache_lookup('market_data')
+        if cached is not None:
+            return cached
         
+        started = time.perf_counter()
         file_path = os.path.join(self.data_dir, 'market_data.csv')
         try:
             # CSV 파일 로드 (인코딩 문제 해결)
@@ -41,17 +105,20 @@ class DataLoader:
             # 좌표 데이터 파싱
             df['coordinates'] = df['coordinates'].apply(self._parse_coordinates)
             
-            self._cache['market_data'] = df
+            self._cache_dataset('market_data', df, started)
             return df
         except Exception as e:
             print(f"상권 데이터 로드 실패: {e}")
             return pd.DataFrame()
     
+    @timed("data_load")
     def load_tourism_consumption(self) -> pd.DataFrame:
-        """관광 소비 데이터 로드"""
-        if 'tourism_consumption' in self._cache:
-            return self._cache['tourism_consumption']
+        """관광 소비 데이터 로드 (관광 인덱스를 만든 뒤에는 캐시하지 않으므로 다시 읽음)"""
+        cached = self._cache_lookup('tourism_consumption')
+        if cached is not None:
+            return cached
         
+        started = time.perf_counter()
         file_path = os.path.join(self.data_dir, 'tourism_consumption.csv')
         try:
             df = pd.read_csv(file_path, encoding='utf-8')
@@ -62,17 +129,20 @@ class DataLoader:
             # 소비액을 숫자로 변환
             df['consumption_amount'] = pd.to_numeric(df['consumption_amount'], errors='coerce')
             
-            self._cache['tourism_consumption'] = df
+            self._cache_dataset('tourism_consumption', df, started)
             return df
         except Exception as e:
             print(f"관광 소비 데이터 로드 실패: {e}")
             return pd.DataFrame()
     
+    @timed("data_load")
     def load_industry_expenditure(self) -> pd.DataFrame:
         """업종별 지출액 데이터 로드"""
-        if 'industry_expenditure' in self._cache:
-            return self._cache['industry_expenditure']
+        cached = self._cache_lookup('industry_expenditure')
+        if cached is not None:
+            return cached
         
+        started = time.perf_counter()
         file_path = os.path.join(self.data_dir, 'industry_expenditure.csv')
         try:
             df = pd.read_csv(file_path, encoding='utf-8')
@@ -84,17 +154,20 @@ class DataLoader:
             df['major_ratio'] = pd.to_numeric(df['major_ratio'], errors='coerce')
             df['minor_ratio'] = pd.to_numeric(df['minor_ratio'], errors='coerce')
             
-            self._cache['industry_expenditure'] = df
+            self._cache_dataset('industry_expenditure', df, started)
             return df
         except Exception as e:
             print(f"업종별 지출액 데이터 로드 실패: {e}")
             return pd.DataFrame()
     
+    @timed("data_load")
     def load_regional_expenditure(self) -> pd.DataFrame:
         """지역별 지출액 데이터 로드"""
-        if 'regional_expenditure' in self._cache:
-            return self._cache['regional_expenditure']
+        cached = self._cache_lookup('regional_expenditure')
+        if cached is not None:
+            return cached
         
+        started = time.perf_counter()
         file_path = os.path.join(self.data_dir, 'regional_expenditure.csv')
         try:
             df = pd.read_csv(file_path, encoding='utf-8')
@@ -105,12 +178,36 @@ class DataLoader:
             # 비율을 숫자로 변환
             df['expenditure_ratio'] = pd.to_numeric(df['expenditure_ratio'], errors='coerce')
             
-            self._cache['regional_expenditure'] = df
+            self._cache_dataset('regional_expenditure', df, started)
             return df
         except Exception as e:
             print(f"지역별 지출액 데이터 로드 실패: {e}")
             return pd.DataFrame()
     
+    @timed("data_load")
+    def load_regional_population(self) -> pd.DataFrame:
+        """지역별(읍면동, 성별) 인구수 데이터 로드 (xlsx, openpyxl 필요)"""
+        cached = self._cache_lookup('regional_population')
+        if cached is not None:
+            return cached
+        
+        started = time.perf_counter()
+        file_path = os.path.join(self.data_dir, 'regional_population.xlsx')
+        try:
+            df = pd.read_excel(file_path, usecols=[0, 1, 2, 3, 4])
+            
+            # 컬럼명 정리 (기준년월, 시도, 시군구, 읍면동, 총인구수)
+            df.columns = ['year_month', 'city_name', 'district_name', 'dong_name', 'population']
+            
+            # "6,792" 형식 인구수를 숫자로 변환
+            df['population'] = pd.to_numeric(df['population'].astype(str).str.replace(',', ''), errors='coerce')
+            
+            self._cache_dataset('regional_population', df, started)
+            return df
+        except Exception as e:
+            print(f"지역별 인구수 데이터 로드 실패: {e}")
+            return pd.DataFrame()
+    
     def _parse_coordinates(self, coord_string: str) -> List[Dict[str, float]]:
         """좌표 문자열을 파싱하여 좌표 리스트로 변환"""
         try:
@@ -136,26 +233,159 @@ class DataLoader:
             print(f"좌표 파싱 실패: {e}")
             return []
     
-    def get_market_by_code(self, market_code: str) -> Optional[Dict[str, Any]]:
-        """상권 코드로 상권 정보 조회"""
+    def _shared_array(self, name: str, build) -> np.ndarray:
+        """숫자 배열 (SHARED_ARRAYS_DIR 설정 시 워커 공유 memmap)"""
+        return shared_arrays.as_shared(self.dataset_version(), name, build)
+    
+    @timed("data_load")
+    def _get_market_index(self) -> Dict[str, Any]:
+        """상권 코드 -> 상권 정보 인덱스 (경계 좌표는 공유 배열에 보관)"""
+        cached = self._cache_lookup('market_index', cache='dataset_index')
+        if cached is not None:
+            return cached
+        
         df = self.load_market_data()
         if df.empty:
-            return None
+            return {}
         
-        market = df[df['market_code'].astype(str) == str(market_code)]
-        if market.empty:
-            return None
+        coordinates = df['coordinates'].tolist()
+        offsets = np.zeros(len(coordinates) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(coords) for coords in coordinates])
         
-        market_info = market.iloc[0].to_dict()
-        return {
-            'market_code': market_info['market_code'],
-            'market_name': market_info['market_name'],
-            'city_name': market_info['city_name'],
-            'district_name': market_info['district_name'],
-            'market_type': market_info['market_type'],
-            'coordinates': market_info['coordinates']
+        def build_points():
+            points = np.empty((int(offsets[-1]), 2), dtype=np.float64)
+            for row, coords in enumerate(coordinates):
+                if coords:
+                    points[offsets[row]:offsets[row + 1]] = [(coord['lng'], coord['lat']) for coord in coords]
+            return points
+        
+        markets = {}
+        for row, market_info in enumerate(df[['market_code', 'market_name', 'city_name', 'district_name', 'market_type']].to_dict('records')):
+            # 코드가 중복되면 첫 번째 행을 사용 (기존 iloc[0] 동작과 동일)
+            markets.setdefault(str(market_info['market_code']), (market_info, row))
+        
+        index = {
+            'markets': markets,
+            'offsets': self._shared_array('market_offsets', lambda: offsets),
+            'points': self._shared_array('market_points', build_points)
+        }
+        self._cache['market_index'] = index
+        # 경계 좌표는 공유 배열로 옮겼으므로 데이터프레임에서 제거
+        self._cache['market_data'] = df.drop(columns=['coordinates'])
+        return index
+    
+    @timed("data_load")
+    def _get_tourism_index(self) -> Dict[str, Any]:
+        """(지역, 중분류) -> 관광 소비 배열 구간 인덱스 (원본 순서 유지)"""
+        cached = self._cache_lookup('tourism_index', cache='dataset_index')
+        if cached is not None:
+            return cached
+        
+        df = self.load_tourism_consumption()
+        if df.empty:
+            return {}
+        
+        groups = df.groupby(['region', 'category'], sort=False).indices
+        order = np.concatenate(list(groups.values()))
+        slices = {}
+        start = 0
+        for key, positions in groups.items():
+            slices[key] = (start, start + len(positions))
+            start += len(positions)
+        
+        index = {
+            'slices': slices,
+            'year_month': self._shared_array('tourism_year_month', lambda: df['year_month'].to_numpy()[order]),
+            'consumption_amount': self._shared_array('tourism_consumption_amount', lambda: df['consumption_amount'].to_numpy(dtype=np.float64)[order])
+        }
+        self._cache['tourism_index'] = index
+        # 모든 관광 소비 조회는 인덱스를 사용하므로 데이터프레임은 해제
+        self._cache.pop('tourism_consumption', None)
+        return index
+    
+    @timed("data_load")
+    def _get_industry_index(self) -> Dict[str, Any]:
+        """업종(대분류/중분류) -> 지출 비율 배열 위치 인덱스 (첫 행 기준)"""
+        cached = self._cache_lookup('industry_index', cache='dataset_index')
+        if cached is not None:
+            return cached
+        
+        df = self.load_industry_expenditure()
+        if df.empty:
+            return {}
+        
+        major_rows, minor_rows = {}, {}
+        for row, (major, minor) in enumerate(zip(df['major_category'].tolist(), df['minor_category'].tolist())):
+            major_rows.setdefault(major, row)
+            minor_rows.setdefault((major, minor), row)
+        
+        index = {
+            'major_rows': major_rows,
+            'minor_rows': minor_rows,
+            'major_ratio': self._shared_array('industry_major_ratio', lambda: df['major_ratio'].to_numpy(dtype=np.float64)),
+            'minor_ratio': self._shared_array('industry_minor_ratio', lambda: df['minor_ratio'].to_numpy(dtype=np.float64))
         }
+        self._cache['industry_index'] = index
+        return index
     
+    @timed("data_load")
+    def _get_regional_index(self) -> Dict[str, Any]:
+        """지역 -> 지출 비율 배열 위치 인덱스 (첫 행 기준)"""
+        cached = self._cache_lookup('regional_index', cache='dataset_index')
+        if cached is not None:
+            return cached
+        
+        df = self.load_regional_expenditure()
+        if df.empty:
+            return {}
+        
+        rows = {}
+        for row, region in enumerate(df['region'].tolist()):
+            rows.setdefault(region, row)
+        
+        index = {
+            'rows': rows,
+            'expenditure_ratio': self._shared_array('regional_expenditure_ratio', lambda: df['expenditure_ratio'].to_numpy(dtype=np.float64))
+        }
+        self._cache['regional_index'] = index
+        return index
+    
+    def _tourism_records(self, region: str, category: str, limit: int = 12) -> List[Dict[str, Any]]:
+        """(지역, 중분류)의 최근 limit개 관광 소비 레코드"""
+        index = self._get_tourism_index()
+        if not index:
+            return []
+        
+        start, stop = index['slices'].get((region, category), (0, 0))
+        start = max(start, stop - limit)
+        year_months = index['year_month'][start:stop].tolist()
+        amounts = index['consumption_amount'][start:stop].tolist()
+        return [
+            {'year_month': year_month, 'region': region, 'category': category, 'consumption_amount': amount}
+            for year_month, amount in zip(year_months, amounts)
+        ]
+    
+    def market_coordinates(self, row: int) -> List[Dict[str, float]]:
+        """상권 데이터 행 번호(load_market_data 인덱스) -> 경계 좌표 리스트"""
+        index = self._get_market_index()
+        if not index:
+            return []
+        
+        start, stop = index['offsets'][row], index['offsets'][row + 1]
+        return [{'lng': lng, 'lat': lat} for lng, lat in index['points'][start:stop].tolist()]
+    
+    @timed("filter")
+    def get_market_by_code(self, market_code: str) -> Optional[Dict[str, Any]]:
+        """상권 코드로 상권 정보 조회"""
+        index = self._get_market_index()
+        entry = index['markets'].get(str(market_code)) if index else None
+        if entry is None:
+            return None
+        
+        market_info, row = entry
+        return {**market_info, 'coordinates': self.market_coordinates(row)}
+    
+    @timed("filter")
     def get_markets_by_district(self, district: str) -> List[Dict[str, Any]]:
         """지역구별 상권 목록 조회"""
         df = self.load_market_data()
@@ -163,28 +393,30 @@ class DataLoader:
             return []
         
         markets = df[df['district_name'] == district]
-        return markets.to_dict('records')
+        return [
+            {**market, 'coordinates': self.market_coordinates(row)}
+            for row, market in zip(markets.index.tolist(), markets.to_dict('records'))
+        ]
     
-    def get_tourism_trend(self, region: str = "대전광역시") -> List[Dict[str, Any]]:
-        """관광 소비 트렌드 조회 - 위치별 실제 데이터"""
-        df = self.load_tourism_consumption()
+    @timed("filter")
+    def get_district_population(self) -> Dict[str, int]:
+        """지역구별 총인구수 (가장 최근 기준년월, 읍면동/성별 합계)"""
+        df = self.load_regional_population()
         if df.empty:
-            return []
-        
-        # 해당 지역의 관광총소비 데이터만 필터링
-        tourism_data = df[(df['region'] == region) & (df['category'] == '관광총소비')]
+            return {}
         
-        # 최신 12개월 데이터
-        trend_data = tourism_data.tail(12).to_dict('records')
-        
-        return trend_data
+        latest = df[df['year_month'] == df['year_month'].max()]
+        return {district: int(total) for district, total in latest.groupby('district_name')['population'].sum().items()}
+    
+    @timed("filter")
+    def get_tourism_trend(self, region: str = "대전광역시") -> List[Dict[str, Any]]:
+        """관광 소비 트렌드 조회 - 위치별 실제 데이터"""
+        # 해당 지역의 관광총소비 데이터 중 최신 12개월
+        return self._tourism_records(region, '관광총소비', 12)
     
+    @timed("filter")
     def get_tourism_trend_by_industry(self, region: str, industry: str) -> List[Dict[str, Any]]:
         """업종별 관광 소비 트렌드 조회 - 위치별, 업종별 실제 데이터"""
-        df = self.load_tourism_consumption()
-        if df.empty:
-            return []
-        
         # 업종 매핑 (실제 데이터의 카테고리명 사용)
         industry_mapping = {
             "쇼핑업": "대형쇼핑몰",  # 쇼핑업의 대표 카테고리
@@ -197,14 +429,10 @@ class DataLoader:
         
         category = industry_mapping.get(industry, "관광총소비")
         
-        # 해당 지역과 업종의 데이터 필터링
-        tourism_data = df[(df['region'] == region) & (df['category'] == category)]
-        
-        # 최신 12개월 데이터
-        trend_data = tourism_data.tail(12).to_dict('records')
-        
-        return trend_data
+        # 해당 지역과 업종의 데이터 중 최신 12개월
+        return self._tourism_records(region, category, 12)
     
+    @timed("filter")
     def get_industry_ratios(self) -> List[Dict[str, Any]]:
         """업종별 지출액 비율 조회"""
         df = self.load_industry_expenditure()
@@ -213,31 +441,31 @@ class DataLoader:
         
         return df.to_dict('records')
     
+    @timed("filter")
     def get_industry_ratio_by_category(self, major_category: str, minor_category: str = None) -> Dict[str, float]:
         """특정 업종의 지출액 비율 조회"""
-        df = self.load_industry_expenditure()
-        if df.empty:
-            return {"major_ratio": 0.0, "minor_ratio": 0.0}
+        index = self._get_industry_index()
         
-        # 대분류 필터링
-        major_data = df[df['major_category'] == major_category]
-        if major_data.empty:
+        # 대분류 조회
+        major_row = index['major_rows'].get(major_category) if index else None
+        if major_row is None:
             return {"major_ratio": 0.0, "minor_ratio": 0.0}
         
-        major_ratio = major_data.iloc[0]['major_ratio'] if not major_data.empty else 0.0
+        major_ratio = float(index['major_ratio'][major_row])
         
-        # 중분류 필터링 (있는 경우)
+        # 중분류 조회 (있는 경우)
         minor_ratio = 0.0
         if minor_category:
-            minor_data = major_data[major_data['minor_category'] == minor_category]
-            if not minor_data.empty:
-                minor_ratio = minor_data.iloc[0]['minor_ratio']
+            minor_row = index['minor_rows'].get((major_category, minor_category))
+            if minor_row is not None:
+                minor_ratio = float(index['minor_ratio'][minor_row])
         
         return {
             "major_ratio": major_ratio,
             "minor_ratio": minor_ratio
         }
     
+    @timed("filter")
     def get_regional_ratios(self) -> List[Dict[str, Any]]:
         """지역별 지출액 비율 조회"""
         df = self.load_regional_expenditure()
@@ -246,17 +474,15 @@ class DataLoader:
         
         return df.to_dict('records')
     
+    @timed("filter")
     def get_regional_ratio_by_region(self, region: str) -> float:
         """특정 지역의 지출액 비율 조회"""
-        df = self.load_regional_expenditure()
-        if df.empty:
-            return 0.0
-        
-        region_data = df[df['region'] == region]
-        if region_data.empty:
+        index = self._get_regional_index()
+        row = index['rows'].get(region) if index else None
+        if row is None:
             return 0.0
         
-        return region_data.iloc[0]['expenditure_ratio']
+        return float(index['expenditure_ratio'][row])
     
     def clear_cache(self):
         """캐시 초기화"""
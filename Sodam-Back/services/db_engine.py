@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+DB 엔진 프로파일
+DB_ENGINE_PROFILE로 SQLAlchemy 엔진 설정 묶음을 선택한다.
+
+- sqlite: 연결마다 PRAGMA 적용
+  journal_mode=WAL (읽기와 쓰기가 서로 막지 않음), synchronous=NORMAL (WAL에서 안전한 수준으로 fsync 감소),
+  mmap_size, cache_size, busy_timeout (잠금 시 즉시 'database is locked' 대신 대기), temp_store=MEMORY
+- server: PostgreSQL/MySQL 등 커넥션 풀 설정
+  pool_size, max_overflow, pool_timeout, pool_recycle, pool_pre_ping
+  (워커 프로세스마다 풀이 따로 있으므로 워커 수 x (pool_size + max_overflow)가 DB 최대 연결 수 이내여야 함)
+- auto(기본): SQLALCHEMY_DATABASE_URI가 sqlite면 sqlite, 아니면 server
+- none: Flask-SQLAlchemy 기본값
+
+SQLALCHEMY_ENGINE_OPTIONS에 직접 지정한 값이 프로파일 값보다 우선한다.
+
+DATABASE_REPLICA_URL을 설정하면 읽기 전용 복제본을 SQLALCHEMY_BINDS['replica']로 등록하며
+(같은 프로파일 적용), replica_reads() 범위의 조회가 복제본으로 간다 (extensions.RoutingSession).
+"""
+from typing import Any, Dict
+
+from flask import Flask
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+
+from extensions import REPLICA_BIND, db
+
+ENGINE_PROFILES = ("auto", "sqlite", "server", "none")
+
+def resolve_profile(app: Flask) -> str:
+    profile = app.config.get("DB_ENGINE_PROFILE", "auto")
+    if profile not in ENGINE_PROFILES:
+        raise ValueError(f"알 수 없는 DB_ENGINE_PROFILE: {profile} (가능한 값: {', '.join(ENGINE_PROFILES)})")
+    if profile == "auto":
+        backend = make_url(app.config["SQLALCHEMY_DATABASE_URI"]).get_backend_name()
+        profile = "sqlite" if backend == "sqlite" else "server"
+    return profile
+
+def server_engine_options(config) -> Dict[str, Any]:
+    return {
+        "pool_size": config.get("DB_POOL_SIZE", 4),
+        "max_overflow": config.get("DB_MAX_OVERFLOW", 4),
+        "pool_timeout": config.get("DB_POOL_TIMEOUT", 10),
+        "pool_recycle": config.get("DB_POOL_RECYCLE", 1800),
+        "pool_pre_ping": config.get("DB_POOL_PRE_PING", True),
+    }
+
+def sqlite_pragmas(config) -> Dict[str, Any]:
+    """적용 순서대로 PRAGMA 이름 -> 값"""
+    return {
+        "journal_mode": config.get("SQLITE_JOURNAL_MODE", "WAL"),
+        "synchronous": config.get("SQLITE_SYNCHRONOUS", "NORMAL"),
+        "busy_timeout": config.get("SQLITE_BUSY_TIMEOUT_MS", 5000),
+        "mmap_size": int(config.get("SQLITE_MMAP_SIZE_MB", 256) * 1024 * 1024),
+        "cache_size": -int(config.get("SQLITE_CACHE_SIZE_MB", 64) * 1024),  # 음수 = KiB 단위
+        "temp_store": "MEMORY",
+    }
+
+def _is_memory_database(engine: Engine) -> bool:
+    return engine.url.database in (None, "", ":memory:") or "mode=memory" in str(engine.url)
+
+def attach_sqlite_pragmas(engine: Engine, pragmas: Dict[str, Any]):
+    """엔진의 새 DBAPI 연결마다 PRAGMA 실행 (메모리 DB는 WAL/mmap 제외)"""
+    if _is_memory_database(engine):
+        pragmas = {name: value for name, value in pragmas.items() if name not in ("journal_mode", "mmap_size")}
+
+    def on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    event.listen(engine, "connect", on_connect)
+
+def configure(app: Flask):
+    """프로파일의 엔진 옵션과 복제본 bind를 설정 (db.init_app 전에 호출)"""
+    profile = resolve_profile(app)
+    app.config["DB_ENGINE_PROFILE_RESOLVED"] = profile
+    options = {}
+    if profile == "server":
+        options = server_engine_options(app.config)
+        options.update(app.config.get("SQLALCHEMY_ENGINE_OPTIONS") or {})
+        app.config["SQLALCHEMY_ENGINE_OPTIONS"] = options
+
+    # bind에는 SQLALCHEMY_ENGINE_OPTIONS가 적용되지 않으므로 같은 옵션을 bind 설정에 포함
+    replica_url = app.config.get("DATABASE_REPLICA_URL")
+    if replica_url:
+        binds = dict(app.config.get("SQLALCHEMY_BINDS") or {})
+        binds.setdefault(REPLICA_BIND, dict(options, url=replica_url))
+        app.config["SQLALCHEMY_BINDS"] = binds
+
+def init_app(app: Flask):
+    """SQLite 엔진(기본 + SQLALCHEMY_BINDS)에 PRAGMA 등록 (db.init_app 후, 첫 연결 전에 호출)"""
+    if app.config.get("DB_ENGINE_PROFILE_RESOLVED") != "sqlite":
+        return
+    pragmas = sqlite_pragmas(app.config)
+    with app.app_context():
+        for engine in db.engines.values():
+            if engine.dialect.name == "sqlite":
+                attach_sqlite_pragmas(engine, pragmas)
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+지연 생성 서비스 프록시
+블루프린트 모듈이 import 될 때 서비스 모듈(pandas/numpy, 대용량 샘플 데이터)을 바로 불러오지 않고
+첫 속성 접근 시점에 import 및 인스턴스 생성을 한다.
+
+사용법:
+    scoring_service = lazy_service("services.scoring_service", "ScoringService")
+    scoring_service.calculate_market_score(...)  # 이 시점에 ScoringService() 생성
+
+PRELOAD_DATASETS로 미리 로드하는 경우 create_app에서 instantiate_all()을 호출해
+fork 전에 모든 서비스를 생성한다.
+"""
+import importlib
+import threading
+import time
+from typing import Any, List
+
+from services import startup
+
+class LazyService:
+    """첫 사용 시 서비스 모듈을 import 하고 인스턴스를 만드는 프록시"""
+
+    def __init__(self, module: str, class_name: str):
+        self._module = module
+        self._class_name = class_name
+        self._instance = None
+        self._lock = threading.Lock()
+
+    def _get(self) -> Any:
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    started = time.perf_counter()
+                    service_class = getattr(importlib.import_module(self._module), self._class_name)
+                    self._instance = service_class()
+                    startup.record_service(self._class_name, time.perf_counter() - started)
+        return self._instance
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get(), name)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._instance is not None else "not loaded"
+        return f"<LazyService {self._module}.{self._class_name} ({state})>"
+
+_services: List[LazyService] = []
+
+def lazy_service(module: str, class_name: str) -> LazyService:
+    """지연 생성 서비스 등록"""
+    service = LazyService(module, class_name)
+    _services.append(service)
+    return service
+
+def instantiate_all():
+    """등록된 모든 서비스를 즉시 생성 (pre-fork 전 미리 로드)"""
+    for service in _services:
+        service._get()
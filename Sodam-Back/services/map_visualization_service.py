@@ -4,6 +4,7 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 import numpy as np
 import math
+from services.result_cache import single_flight
 
 class MapVisualizationService:
     """지도 기반 시각화 서비스"""
@@ -13,6 +14,7 @@ class MapVisualizationService:
         self.sample_market_data = self._init_sample_market_data()
         self.analysis_cache = {}
     
+    @single_flight("map_visualization.get_market_heatmap_data", shared=True)
     def get_market_heatmap_data(self, region: str = None, analysis_type: str = "health_score") -> Dict[str, Any]:
         """상권 히트맵 데이터 생성"""
         
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+프로세스 내 메트릭 레지스트리 (Prometheus 텍스트 포맷)
+엔드포인트별 요청 수/에러 수/지연 시간 히스토그램, 데이터셋 로드 시간과 행 수,
+캐시 적중/미스를 기록한다.
+
+METRICS_DIR가 설정되면 값을 프로세스별 mmap 파일(counters_<pid>.db, gauges_<pid>.db)에
+기록하고, 메트릭 조회 시 디렉터리의 모든 파일을 합산하므로 pre-fork 워커 어느 쪽이
+요청을 받아도 전체 워커의 합계가 반환된다. 설정되지 않으면 메모리에만 기록한다.
+"""
+import glob
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from flask import Flask, g, request
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class _MmapStore:
+    """mmap 파일 기반 key -> float 저장소 (한 프로세스만 기록)
+
+    파일 구조: [사용 바이트 수(int32) + 패딩 4바이트] 이후
+    [키 길이(int32)][키(utf-8, 8바이트 정렬 패딩)][값(double)] 항목의 연속
+    """
+    _INITIAL_SIZE = 1 << 16
+
+    def __init__(self, path: str):
+        self._file = open(path, 'a+b')
+        size = os.fstat(self._file.fileno()).st_size
+        if size == 0:
+            self._file.truncate(self._INITIAL_SIZE)
+            size = self._INITIAL_SIZE
+        self._capacity = size
+        self._mmap = mmap.mmap(self._file.fileno(), self._capacity)
+        self._used = struct.unpack_from('<i', self._mmap, 0)[0]
+        if self._used == 0:
+            self._used = 8
+            struct.pack_into('<i', self._mmap, 0, self._used)
+        self._positions = {key: pos for key, _, pos in _read_entries(self._mmap, self._used)}
+
+    def read(self, key: str) -> float:
+        pos = self._positions.get(key)
+        if pos is None:
+            return 0.0
+        return struct.unpack_from('<d', self._mmap, pos)[0]
+
+    def write(self, key: str, value: float):
+        pos = self._positions.get(key)
+        if pos is None:
+            pos = self._init_key(key)
+        struct.pack_into('<d', self._mmap, pos, value)
+
+    def items(self) -> Iterator[Tuple[str, float]]:
+        for key, value, _ in _read_entries(self._mmap, self._used):
+            yield key, value
+
+    def _init_key(self, key: str) -> int:
+        encoded = key.encode('utf-8')
+        padding = (8 - (4 + len(encoded)) % 8) % 8
+        entry = struct.pack(f'<i{len(encoded) + padding}sd', len(encoded), encoded + b' ' * padding, 0.0)
+        while self._used + len(entry) > self._capacity:
+            self._grow()
+        self._mmap[self._used:self._used + len(entry)] = entry
+        self._used += len(entry)
+        struct.pack_into('<i', self._mmap, 0, self._used)
+        pos = self._used - 8
+        self._positions[key] = pos
+        return pos
+
+    def _grow(self):
+        self._capacity *= 2
+        self._mmap.close()
+        self._file.truncate(self._capacity)
+        self._mmap = mmap.mmap(self._file.fileno(), self._capacity)
+
+def _read_entries(data, used: int) -> Iterator[Tuple[str, float, int]]:
+    pos = 8
+    while pos < used:
+        key_length = struct.unpack_from('<i', data, pos)[0]
+        pos += 4
+        key = bytes(data[pos:pos + key_length]).decode('utf-8')
+        pos += key_length + (8 - (4 + key_length) % 8) % 8
+        value = struct.unpack_from('<d', data, pos)[0]
+        yield key, value, pos
+        pos += 8
+
+def _read_file(path: str) -> Iterator[Tuple[str, float]]:
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < 8:
+        return iter(())
+    return ((key, value) for key, value, _ in _read_entries(data, struct.unpack_from('<i', data, 0)[0]))
+
+class _DictStore:
+    """메모리 저장소 (단일 프로세스)"""
+
+    def __init__(self):
+        self._values: Dict[str, float] = {}
+
+    def read(self, key: str) -> float:
+        return self._values.get(key, 0.0)
+
+    def write(self, key: str, value: float):
+        self._values[key] = value
+
+    def items(self) -> Iterator[Tuple[str, float]]:
+        return iter(list(self._values.items()))
+
+class _Metric:
+    metric_type = ''
+
+    def __init__(self, registry: 'MetricsRegistry', name: str, documentation: str, labelnames: Sequence[str]):
+        self._registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, sample_name: str, labels: Dict[str, str], extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+        pairs = [[name, str(labels.get(name, ''))] for name in self.labelnames]
+        pairs.extend([name, value] for name, value in extra)
+        return json.dumps([sample_name, pairs], ensure_ascii=False)
+
+class Counter(_Metric):
+    metric_type = 'counter'
+
+    def inc(self, amount: float = 1.0, **labels):
+        self._registry._add('counter', self._key(self.name, labels), amount)
+
+class Gauge(_Metric):
+    """게이지: 워커 간 집계 방식 mode='max'(공유 데이터 통계 등) 또는 'sum'(큐 깊이 등)"""
+    metric_type = 'gauge'
+
+    def __init__(self, registry, name, documentation, labelnames, mode: str = 'max'):
+        super().__init__(registry, name, documentation, labelnames)
+        self.mode = mode
+
+    def set(self, value: float, **labels):
+        self._registry._set('gauge', self._key(self.name, labels), value)
+
+    def inc(self, amount: float = 1.0, **labels):
+        self._registry._add('gauge', self._key(self.name, labels), amount)
+
+    def dec(self, amount: float = 1.0, **labels):
+        self._registry._add('gauge', self._key(self.name, labels), -amount)
+
+class Histogram(_Metric):
+    metric_type = 'histogram'
+
+    def __init__(self, registry, name, documentation, labelnames, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        super().__init__(registry, name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+
+    def observe(self, value: float, **labels):
+        # 버킷별 비누적 개수로 저장하고 출력 시 누적한다 (관측당 기록 3회)
+        for bound in self.buckets:
+            if value <= bound:
+                break
+        self._registry._add('counter', self._key(self.name + '_bucket', labels, (('le', _format_value(bound)),)), 1.0)
+        self._registry._add('counter', self._key(self.name + '_sum', labels), value)
+        self._registry._add('counter', self._key(self.name + '_count', labels), 1.0)
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._lock = threading.Lock()
+        self._directory: Optional[str] = None
+        self._pid = os.getpid()
+        self._stores = {'counter': _DictStore(), 'gauge': _DictStore()}
+        self.enabled = True
+
+    def configure(self, directory: Optional[str] = None, enabled: bool = True):
+        """저장소 설정 (directory 지정 시 워커 간 공유 mmap 파일 사용)"""
+        with self._lock:
+            self.enabled = enabled
+            if directory == self._directory:
+                return
+            self._directory = directory
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._pid = None
+            self._stores = {'counter': _DictStore(), 'gauge': _DictStore()}
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(self, name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = (), mode: str = 'max') -> Gauge:
+        return self._register(Gauge(self, name, documentation, labelnames, mode))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(self, name, documentation, labelnames, buckets))
+
+    def _register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def _current_stores(self):
+        # fork 이후 첫 기록 시 워커 자신의 파일을 연다 (마스터 파일에 기록하지 않도록)
+        pid = os.getpid()
+        if self._directory and pid != self._pid:
+            self._stores = {
+                kind: _MmapStore(os.path.join(self._directory, f'{kind}s_{pid}.db'))
+                for kind in ('counter', 'gauge')
+            }
+            self._pid = pid
+        return self._stores
+
+    def _add(self, kind: str, key: str, amount: float):
+        if not self.enabled:
+            return
+        with self._lock:
+            store = self._current_stores()[kind]
+            store.write(key, store.read(key) + amount)
+
+    def _set(self, kind: str, key: str, value: float):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._current_stores()[kind].write(key, value)
+
+    def _collect(self) -> Tuple[Dict[str, float], Dict[str, List[float]]]:
+        counters: Dict[str, float] = {}
+        gauges: Dict[str, List[float]] = {}
+        if self._directory:
+            with self._lock:
+                self._current_stores()
+            counter_items = (item for path in glob.glob(os.path.join(self._directory, 'counters_*.db'))
+                             for item in _read_file(path))
+            gauge_items = (item for path in glob.glob(os.path.join(self._directory, 'gauges_*.db'))
+                           for item in _read_file(path))
+        else:
+            counter_items = self._stores['counter'].items()
+            gauge_items = self._stores['gauge'].items()
+        for key, value in counter_items:
+            counters[key] = counters.get(key, 0.0) + value
+        for key, value in gauge_items:
+            gauges.setdefault(key, []).append(value)
+        return counters, gauges
+
+    def render(self) -> str:
+        """Prometheus 텍스트 포맷 출력"""
+        counters, gauges = self._collect()
+        samples: Dict[str, List[Tuple[str, List[List[str]], float]]] = {}
+        for key, value in counters.items():
+            sample_name, pairs = json.loads(key)
+            samples.setdefault(sample_name, []).append((sample_name, pairs, value))
+
+        lines = []
+        for metric in self._metrics:
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.metric_type}')
+            if isinstance(metric, Gauge):
+                aggregate = sum if metric.mode == 'sum' else max
+                for key, values in sorted(gauges.items()):
+                    sample_name, pairs = json.loads(key)
+                    if sample_name == metric.name:
+                        lines.append(_format_sample(sample_name, pairs, aggregate(values)))
+            elif isinstance(metric, Histogram):
+                lines.extend(_render_histogram(metric, samples))
+            else:
+                for sample_name, pairs, value in sorted(samples.get(metric.name, [])):
+                    lines.append(_format_sample(sample_name, pairs, value))
+        return '\n'.join(lines) + '\n'
+
+def _render_histogram(metric: Histogram, samples) -> List[str]:
+    # 라벨 조합별로 버킷을 누적
+    series: Dict[str, Dict[str, float]] = {}
+    for _, pairs, value in samples.get(metric.name + '_bucket', []):
+        labels = json.dumps(pairs[:-1], ensure_ascii=False)
+        series.setdefault(labels, {})[pairs[-1][1]] = value
+    lines = []
+    for labels, bucket_counts in sorted(series.items()):
+        pairs = json.loads(labels)
+        cumulative = 0.0
+        for bound in metric.buckets:
+            cumulative += bucket_counts.get(_format_value(bound), 0.0)
+            lines.append(_format_sample(metric.name + '_bucket', pairs + [['le', _format_value(bound)]], cumulative))
+    for suffix in ('_sum', '_count'):
+        for sample_name, pairs, value in sorted(samples.get(metric.name + suffix, [])):
+            lines.append(_format_sample(sample_name, pairs, value))
+    return lines
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value))
+
+def _format_sample(name: str, pairs: List[List[str]], value: float) -> str:
+    if not pairs:
+        return f'{name} {_format_value(value)}'
+    labels = ','.join(
+        '{}="{}"'.format(label, str(label_value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"'))
+        for label, label_value in pairs
+    )
+    return f'{name}{{{labels}}} {_format_value(value)}'
+
+def mark_process_dead(pid: int, directory: Optional[str]):
+    """종료된 워커의 게이지 파일 삭제 (카운터는 합계 유지를 위해 남겨 둔다)"""
+    if not directory:
+        return
+    path = os.path.join(directory, f'gauges_{pid}.db')
+    if os.path.exists(path):
+        os.remove(path)
+
+def clear_directory(directory: Optional[str]):
+    """서버 시작 시 이전 실행의 메트릭 파일 정리"""
+    if not directory or not os.path.isdir(directory):
+        return
+    for path in glob.glob(os.path.join(directory, '*.db')):
+        os.remove(path)
+
+registry = MetricsRegistry()
+
+# HTTP 요청
+HTTP_REQUESTS = registry.counter(
+    'sodam_http_requests_total', '엔드포인트별 요청 수', ('endpoint', 'method', 'status'))
+HTTP_ERRORS = registry.counter(
+    'sodam_http_request_errors_total',
+    '엔드포인트별 에러 수 (kind: status=4xx/5xx 응답, error_payload=정상 상태 코드 응답의 error 본문)',
+    ('endpoint', 'kind'))
+HTTP_LATENCY = registry.histogram(
+    'sodam_http_request_duration_seconds', '엔드포인트별 응답 시간 (초)', ('endpoint', 'method'))
+
+# 데이터셋
+DATASET_LOAD_SECONDS = registry.histogram(
+    'sodam_dataset_load_duration_seconds', '데이터셋 로드 시간 (초)', ('dataset',))
+DATASET_ROWS = registry.gauge(
+    'sodam_dataset_rows', '로드된 데이터셋 행 수', ('dataset',), mode='max')
+
+# 캐시
+CACHE_REQUESTS = registry.counter(
+    'sodam_cache_requests_total', '캐시 조회 수 (result: hit/miss)', ('cache', 'result'))
+
+def _start_request():
+    g._metrics_started = time.perf_counter()
+
+def _contains_error(payload: Any, depth: int = 2) -> bool:
+    """서비스가 반환한 {"error": ...} 또는 {"success": false} 본문 여부 (data 하위 2단계까지)"""
+    if not isinstance(payload, dict):
+        return False
+    if 'error' in payload or payload.get('success') is False:
+        return True
+    if depth > 0:
+        return any(_contains_error(value, depth - 1) for value in payload.values() if isinstance(value, dict))
+    return False
+
+def _has_error_payload(response) -> bool:
+    if response.status_code >= 400 or response.direct_passthrough or not response.is_json:
+        return False
+    body = response.get_data()
+    # 대부분의 정상 응답은 문자열 검사에서 걸러지므로 JSON 파싱은 에러 의심 시에만 수행
+    if b'"error"' not in body and b'"success": false' not in body and b'"success":false' not in body:
+        return False
+    return _contains_error(response.get_json(silent=True))
+
+def _record_request(response):
+    started = g.pop('_metrics_started', None)
+    if started is None:
+        return response
+
+    endpoint = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+    HTTP_REQUESTS.inc(endpoint=endpoint, method=request.method, status=str(response.status_code))
+    HTTP_LATENCY.observe(time.perf_counter() - started, endpoint=endpoint, method=request.method)
+    if response.status_code >= 400:
+        HTTP_ERRORS.inc(endpoint=endpoint, kind='status')
+    elif _has_error_payload(response):
+        HTTP_ERRORS.inc(endpoint=endpoint, kind='error_payload')
+    return response
+
+def init_app(app: Flask):
+    """메트릭 저장소 설정 및 요청 훅 등록 (RESTX 네임스페이스와 블루프린트 공통)"""
+    registry.configure(app.config.get("METRICS_DIR"), bool(app.config.get("METRICS_ENABLED", True)))
+    if not registry.enabled:
+        return
+
+    app.before_request(_start_request)
+    app.after_request(_record_request)
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+비밀번호 해싱 서비스
+bcrypt 해싱/검증을 요청 스레드가 아닌 전용 프로세스 풀에서 실행하여
+로그인이 몰려도 같은 워커의 다른 API 요청이 CPU를 빼앗기지 않도록 한다.
+
+- 풀 크기(BCRYPT_POOL_SIZE)와 대기열 한도(BCRYPT_QUEUE_LIMIT)를 넘는 요청은
+  BCRYPT_ADMISSION_TIMEOUT 동안만 기다린 뒤 HashingBusyError로 거절 (503)
+- BCRYPT_TIMEOUT 안에 끝나지 않거나 풀 프로세스가 죽은 경우(BrokenProcessPool)도 HashingBusyError
+  (대기 중인 작업은 취소하고, 이미 실행 중인 작업은 끝날 때까지 대기열 자리를 차지함)
+- 해시 비용은 BCRYPT_LOG_ROUNDS로 조정하며, 기존 해시의 비용이 다르면
+  로그인 성공 시 needs_rehash()로 확인해 새 비용으로 다시 저장
+- BCRYPT_POOL_MODE: process(기본) / thread / inline(요청 스레드에서 직접 실행)
+
+Flask-Bcrypt와 같은 bcrypt 해시 형식을 사용하므로 기존 해시와 호환된다.
+"""
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import BrokenExecutor, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Optional
+
+import bcrypt
+from flask import Flask
+
+from services.metrics import registry
+
+PASSWORD_HASH_QUEUE_DEPTH = registry.gauge(
+    'sodam_password_hash_queue_depth', '해싱 풀에서 실행 중이거나 대기 중인 작업 수',
+    mode='sum'
+)
+PASSWORD_HASH_REQUESTS = registry.counter(
+    'sodam_password_hash_requests_total', '비밀번호 해싱/검증 요청 수', ('operation', 'result')
+)
+PASSWORD_HASH_LATENCY = registry.histogram(
+    'sodam_password_hash_seconds', '비밀번호 해싱/검증 소요 시간 (대기 포함)', ('operation',)
+)
+
+class HashingBusyError(Exception):
+    """해싱 풀 대기열이 가득 차 요청을 받을 수 없음"""
+
+_settings = {
+    "rounds": 12,
+    "mode": "process",
+    "pool_size": 2,
+    "queue_limit": 16,
+    "admission_timeout": 0.5,
+    "timeout": 10.0
+}
+
+_pool: Optional[Executor] = None
+_pool_pid: Optional[int] = None
+_pool_lock = threading.Lock()
+_admission = threading.BoundedSemaphore(_settings["pool_size"] + _settings["queue_limit"])
+
+def _hash(password: bytes, rounds: int) -> bytes:
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds))
+
+def _check(pw_hash: bytes, password: bytes) -> bool:
+    return bcrypt.checkpw(password, pw_hash)
+
+def _executor() -> Executor:
+    """프로세스별 풀 (gunicorn fork 이후 워커에서 처음 사용할 때 생성)"""
+    global _pool, _pool_pid
+    pid = os.getpid()
+    if _pool is not None and _pool_pid == pid:
+        return _pool
+
+    with _pool_lock:
+        if _pool is None or _pool_pid != pid:
+            if _settings["mode"] == "thread":
+                _pool = ThreadPoolExecutor(max_workers=_settings["pool_size"], thread_name_prefix='bcrypt')
+            else:
+                # 멀티스레드 워커에서 fork 하지 않도록 forkserver 사용 (지원하지 않으면 spawn)
+                method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+                _pool = ProcessPoolExecutor(max_workers=_settings["pool_size"],
+                                            mp_context=multiprocessing.get_context(method))
+            _pool_pid = pid
+    return _pool
+
+def _reset_executor(broken: Executor):
+    """죽은 풀을 버림 (다음 요청에서 새로 생성)"""
+    global _pool
+    with _pool_lock:
+        if _pool is broken:
+            _pool = None
+    broken.shutdown(wait=False)
+
+def _release(future: Optional[Future] = None):
+    PASSWORD_HASH_QUEUE_DEPTH.dec()
+    _admission.release()
+
+def _run(operation: str, func, *args):
+    if _settings["mode"] == "inline":
+        started = time.perf_counter()
+        result = func(*args)
+        PASSWORD_HASH_LATENCY.observe(time.perf_counter() - started, operation=operation)
+        PASSWORD_HASH_REQUESTS.inc(operation=operation, result='ok')
+        return result
+
+    if not _admission.acquire(timeout=_settings["admission_timeout"]):
+        PASSWORD_HASH_REQUESTS.inc(operation=operation, result='rejected')
+        raise HashingBusyError("로그인 요청이 많아 잠시 후 다시 시도해주세요.")
+
+    PASSWORD_HASH_QUEUE_DEPTH.inc()
+    started = time.perf_counter()
+    executor = _executor()
+    try:
+        future = executor.submit(func, *args)
+    except RuntimeError:  # BrokenExecutor, 종료된 풀
+        _release()
+        _reset_executor(executor)
+        PASSWORD_HASH_REQUESTS.inc(operation=operation, result='error')
+        raise HashingBusyError("로그인 요청이 많아 잠시 후 다시 시도해주세요.")
+    # 대기열 자리는 작업이 실제로 끝나거나 취소될 때 반환 (시간 초과로 포기한 작업도 한도에 포함)
+    future.add_done_callback(_release)
+
+    try:
+        result = future.result(timeout=_settings["timeout"])
+        PASSWORD_HASH_REQUESTS.inc(operation=operation, result='ok')
+        return result
+    except FutureTimeoutError:
+        future.cancel()
+        PASSWORD_HASH_REQUESTS.inc(operation=operation, result='timeout')
+        raise HashingBusyError("로그인 요청이 많아 잠시 후 다시 시도해주세요.")
+    except BrokenExecutor:
+        _reset_executor(executor)
+        PASSWORD_HASH_REQUESTS.inc(operation=operation, result='error')
+        raise HashingBusyError("로그인 요청이 많아 잠시 후 다시 시도해주세요.")
+    finally:
+        PASSWORD_HASH_LATENCY.observe(time.perf_counter() - started, operation=operation)
+
+def hash_password(password: str) -> str:
+    """설정된 비용으로 비밀번호 해시 생성"""
+    return _run('hash', _hash, password.encode('utf-8'), _settings["rounds"]).decode('utf-8')
+
+def check_password(pw_hash: str, password: str) -> bool:
+    """비밀번호 검증 (해시 형식이 잘못되면 False)"""
+    try:
+        return _run('check', _check, pw_hash.encode('utf-8'), password.encode('utf-8'))
+    except ValueError:
+        return False
+
+def needs_rehash(pw_hash: str) -> bool:
+    """해시 비용이 현재 설정(BCRYPT_LOG_ROUNDS)과 다른지 확인 ($2b$<cost>$...)"""
+    try:
+        return int(pw_hash.split('$')[2]) != _settings["rounds"]
+    except (IndexError, ValueError):
+        return True
+
+def init_app(app: Flask):
+    """BCRYPT_* 설정 적용"""
+    global _admission
+    _settings.update({
+        "rounds": int(app.config.get("BCRYPT_LOG_ROUNDS", 12)),
+        "mode": app.config.get("BCRYPT_POOL_MODE", "process"),
+        "pool_size": int(app.config.get("BCRYPT_POOL_SIZE", 2)),
+        "queue_limit": int(app.config.get("BCRYPT_QUEUE_LIMIT", 16)),
+        "admission_timeout": float(app.config.get("BCRYPT_ADMISSION_TIMEOUT", 0.5)),
+        "timeout": float(app.config.get("BCRYPT_TIMEOUT", 10.0))
+    })
+    _admission = threading.BoundedSemaphore(_settings["pool_size"] + _settings["queue_limit"])
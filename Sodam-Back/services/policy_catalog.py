@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+지원 정책 카탈로그 (PolicySupport + PolicyTarget)
+정책의 지원 대상(지역, 업종, 사용자 유형, 사업 단계)을 PolicyTarget 행으로 정규화해 두고,
+"(지역, 업종, 사용자 유형, 단계)에 해당하는 정책" 조회를 차원별 인덱스 조인 한 번으로 처리한다.
+정책이 수천 건이 되어도 조건에 맞는 정책 행만 읽는다.
+
+- 지역: 기존 부분 문자열 비교(region in policy['region'])를 단어 단위 동등 비교로 옮기기 위해
+  시행 지역의 연속 단어 조합을 모두 저장 ('대전광역시 유성구' -> 대전광역시, 유성구, 대전광역시 유성구)
+- 카탈로그가 비어 있으면 SupportToolsService의 기본 정책 목록으로 채움 (DB별 프로세스당 한 번 확인)
+
+CLI:
+    flask policies load [catalog.json] [--replace]
+"""
+import json
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional
+
+import click
+from flask import Flask
+from sqlalchemy import and_, func, select, update
+from sqlalchemy.orm import aliased, selectinload
+
+from extensions import db, replica_reads
+from models import PolicySupport, PolicyTarget
+
+TARGET_AREA = "area"
+TARGET_BUSINESS_TYPE = "business_type"
+TARGET_USER_TYPE = "user_type"
+TARGET_STAGE = "stage"
+
+# 카탈로그 항목의 대상 목록 키 -> 차원
+TARGET_KEYS = {
+    "target_business": TARGET_BUSINESS_TYPE,
+    "target_user": TARGET_USER_TYPE,
+    "target_stage": TARGET_STAGE,
+}
+
+_checked = set()
+_checked_lock = threading.Lock()
+
+def normalize_region(region: Optional[str]) -> str:
+    return " ".join((region or "").split())
+
+def area_keys(region: Optional[str]) -> List[str]:
+    """시행 지역의 연속 단어 조합"""
+    words = normalize_region(region).split()
+    return [" ".join(words[start:stop]) for start in range(len(words)) for stop in range(start + 1, len(words) + 1)]
+
+def _target_pairs(item: Dict[str, Any]) -> List[tuple]:
+    """(차원, 값) 목록 (목록 순서 유지, 중복 제거)"""
+    pairs = [(TARGET_AREA, key) for key in area_keys(item.get("region"))]
+    for key, dimension in TARGET_KEYS.items():
+        pairs.extend((dimension, value) for value in item.get(key) or [])
+    return list(dict.fromkeys(pairs))
+
+def sync(policies: Iterable[Dict[str, Any]], replace: bool = False) -> int:
+    """
+    카탈로그 항목(SupportToolsService._init_policies 형식)을 id(code) 기준으로 추가/갱신
+    대상 행은 바뀐 것만 추가/삭제하며, replace=True면 목록에 없는 정책을 비활성화한다.
+    """
+    existing = {
+        policy.code: policy
+        for policy in db.session.execute(
+            select(PolicySupport).where(PolicySupport.code.isnot(None)).options(selectinload(PolicySupport.targets))
+        ).scalars()
+    }
+    codes = []
+    for item in policies:
+        policy = existing.get(item["id"])
+        if policy is None:
+            policy = PolicySupport(code=item["id"])
+            db.session.add(policy)
+        policy.title = item["name"]
+        policy.description = item.get("description") or ""
+        policy.region = normalize_region(item.get("region")) or None
+        policy.organization = item.get("organization")
+        policy.support_type = item.get("support_type")
+        policy.support_amount = item.get("support_amount")
+        policy.application_period = item.get("application_period")
+        policy.requirements = item.get("requirements")
+        policy.priority = item.get("priority", 0)
+        policy.contact_info = item.get("contact")
+        policy.is_active = item.get("is_active", True)
+
+        # 같은 (차원, 값)을 지웠다가 다시 넣으면 flush 순서에 따라 유니크 인덱스에 걸리므로 차이만 반영
+        wanted = _target_pairs(item)
+        for target in list(policy.targets):
+            if (target.dimension, target.value) not in wanted:
+                policy.targets.remove(target)
+        current = {(target.dimension, target.value) for target in policy.targets}
+        policy.targets.extend(PolicyTarget(dimension=dimension, value=value)
+                              for dimension, value in wanted if (dimension, value) not in current)
+        codes.append(item["id"])
+
+    if replace:
+        db.session.execute(
+            update(PolicySupport).where(PolicySupport.code.isnot(None), PolicySupport.code.notin_(codes))
+            .values(is_active=False)
+        )
+    db.session.commit()
+    return len(codes)
+
+def ensure_catalog(default_policies: List[Dict[str, Any]]):
+    """카탈로그가 비어 있으면 기본 정책 목록으로 채움"""
+    key = str(db.engine.url)
+    if key in _checked:
+        return
+    with _checked_lock:
+        if key in _checked:
+            return
+        if not db.session.execute(select(func.count()).select_from(PolicySupport)).scalar():
+            sync(default_policies)
+        _checked.add(key)
+
+# 추천 응답 항목에 필요한 정책 컬럼 (ORM 객체를 만들지 않고 행으로 읽음)
+ITEM_COLUMNS = (
+    PolicySupport.id, PolicySupport.code, PolicySupport.title, PolicySupport.region, PolicySupport.organization,
+    PolicySupport.support_amount, PolicySupport.support_type, PolicySupport.application_period,
+    PolicySupport.priority, PolicySupport.description, PolicySupport.requirements, PolicySupport.contact_info,
+)
+
+def _matching_ids(region: str, business_type: str, user_type: str, stage: str):
+    """조건을 모두 만족하는 활성 정책 ID (차원마다 대상 인덱스 조인)"""
+    criteria = (
+        (TARGET_AREA, normalize_region(region)),
+        (TARGET_BUSINESS_TYPE, business_type),
+        (TARGET_USER_TYPE, user_type),
+        (TARGET_STAGE, stage),
+    )
+    stmt = select(PolicySupport.id).where(PolicySupport.is_active.is_(True))
+    for dimension, value in criteria:
+        target = aliased(PolicyTarget)
+        stmt = stmt.join(target, and_(target.policy_id == PolicySupport.id,
+                                      target.dimension == dimension, target.value == value))
+    return stmt
+
+@replica_reads()
+def find(region: str, business_type: str, user_type: str, stage: str) -> List[Dict[str, Any]]:
+    """
+    조건을 모두 만족하는 활성 정책 요약 (우선순위 내림차순)
+    요약은 policy_id, id, name, application_period, priority만 담고, 응답에 실을 정책만 details()로 채운다.
+    """
+    rows = db.session.execute(
+        select(PolicySupport.id, PolicySupport.code, PolicySupport.title, PolicySupport.application_period,
+               PolicySupport.priority)
+        .where(PolicySupport.id.in_(_matching_ids(region, business_type, user_type, stage)))
+        .order_by(PolicySupport.priority.desc(), PolicySupport.id)
+    ).all()
+    return [
+        {"policy_id": row.id, "id": row.code or str(row.id), "name": row.title,
+         "application_period": row.application_period, "priority": row.priority}
+        for row in rows
+    ]
+
+@replica_reads()
+def details(summaries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """find() 요약 -> 정책 추천 응답 항목 (요약 순서 유지)"""
+    ids = [summary["policy_id"] for summary in summaries]
+    if not ids:
+        return []
+    rows = {row.id: row for row in db.session.execute(select(*ITEM_COLUMNS).where(PolicySupport.id.in_(ids)))}
+    targets = defaultdict(lambda: defaultdict(list))
+    for policy_id, dimension, value in db.session.execute(
+        select(PolicyTarget.policy_id, PolicyTarget.dimension, PolicyTarget.value)
+        .where(PolicyTarget.policy_id.in_(ids), PolicyTarget.dimension != TARGET_AREA)
+        .order_by(PolicyTarget.id)
+    ):
+        targets[policy_id][dimension].append(value)
+    return [_catalog_item(rows[policy_id], targets[policy_id]) for policy_id in ids if policy_id in rows]
+
+def _catalog_item(row, targets: Dict[str, List[str]]) -> Dict[str, Any]:
+    """정책 행 -> 정책 추천 응답 항목 (SupportToolsService 기본 목록과 같은 형식)"""
+    return {
+        "id": row.code or str(row.id),
+        "name": row.title,
+        "region": row.region,
+        "organization": row.organization,
+        "support_amount": row.support_amount,
+        "support_type": row.support_type,
+        "target_business": targets.get(TARGET_BUSINESS_TYPE, []),
+        "target_stage": targets.get(TARGET_STAGE, []),
+        "target_user": targets.get(TARGET_USER_TYPE, []),
+        "application_period": row.application_period,
+        "priority": row.priority,
+        "description": row.description,
+        "requirements": row.requirements or [],
+        "contact": row.contact_info
+    }
+
+@click.group('policies', help='지원 정책 카탈로그 관리')
+def policies_cli():
+    pass
+
+@policies_cli.command('load')
+@click.argument('path', required=False, type=click.Path(exists=True, dir_okay=False))
+@click.option('--replace', is_flag=True, help='파일에 없는 기존 정책을 비활성화')
+def load_command(path, replace):
+    """정책 목록 JSON(생략 시 기본 정책 목록)을 카탈로그에 반영"""
+    if path:
+        with open(path, encoding='utf-8') as f:
+            policies = json.load(f)
+    else:
+        from services.support_tools_service import SupportToolsService
+        policies = SupportToolsService().policies
+    count = sync(policies, replace=replace)
+    click.echo(f"정책 {count:,}건 반영")
+
+def init_app(app: Flask):
+    """CLI 등록"""
+    app.cli.add_command(policies_cli)
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+요청 단위 온디맨드 프로파일링 서비스
+PROFILING_ENABLED 설정과 인증된 X-Profile 헤더가 있는 요청만 프로파일링하여
+PROFILE_DIR에 결과를 저장한다.
+
+- <이름>.prof: cProfile 결과 (pstats 형식, snakeviz/pstats로 확인)
+- <이름>.collapsed: 스택 샘플링 결과 (flamegraph.pl / speedscope 입력용 collapsed stack)
+
+트리거 방법 (둘 중 하나):
+    X-Profile: <만료 시각(unix 초)>.<HMAC-SHA256(SECRET_KEY, "만료 시각:메서드 경로") hex>
+    X-Profile: 1  +  X-Admin-Token: <ADMIN_TOKEN>
+
+서명은 만료 시각이 지났거나 PROFILE_SIGNATURE_MAX_AGE초보다 먼 미래면 거부하고,
+한 번 쓴 서명은 만료 전까지 다시 받지 않는다 (워커 프로세스별 기록이라 워커 수만큼은 재사용될 수 있음).
+SECRET_KEY가 기본값(dev-secret-key)이면 서명 방식은 쓰지 않는다.
+"""
+import cProfile
+import hashlib
+import hmac
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from flask import Flask, current_app, g, request
+
+_FILENAME_UNSAFE = re.compile(r'[^0-9A-Za-z가-힣._-]+')
+DEFAULT_SECRET_KEY = "dev-secret-key"
+
+# 사용한 서명 -> 만료 시각 (재사용 거부)
+_used_signatures: Dict[str, int] = {}
+_used_lock = threading.Lock()
+
+def profile_signature(secret_key: str, path: str, method: str = "GET", expires: Optional[int] = None,
+                      max_age: int = 60) -> str:
+    """X-Profile 헤더 값 생성 (<만료 시각>.<서명>, 만료 시각 기본값은 지금부터 max_age초 후)"""
+    if expires is None:
+        expires = int(time.time()) + max_age
+    message = f"{expires}:{method.upper()} {path}"
+    signature = hmac.new(secret_key.encode('utf-8'), message.encode('utf-8'), hashlib.sha256).hexdigest()
+    return f"{expires}.{signature}"
+
+def _claim_signature(header: str, expires: int, now: int) -> bool:
+    """처음 쓰는 서명이면 기록하고 True (만료된 기록은 정리)"""
+    with _used_lock:
+        for used, used_expires in list(_used_signatures.items()):
+            if used_expires < now:
+                del _used_signatures[used]
+        if header in _used_signatures:
+            return False
+        _used_signatures[header] = expires
+        return True
+
+class StackSampler(threading.Thread):
+    """대상 스레드의 호출 스택을 주기적으로 샘플링하여 collapsed stack으로 집계"""
+
+    def __init__(self, thread_id: int, interval: float):
+        super().__init__(name='profile-sampler', daemon=True)
+        self._thread_id = thread_id
+        self._interval = interval
+        self._stop_event = threading.Event()
+        self.stacks: Counter = Counter()
+
+    def run(self):
+        while not self._stop_event.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+    def write_collapsed(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+def _is_authorized() -> bool:
+    header = request.headers.get("X-Profile")
+    if not header:
+        return False
+
+    admin_token = current_app.config.get("ADMIN_TOKEN")
+    if admin_token and hmac.compare_digest(request.headers.get("X-Admin-Token", ""), admin_token):
+        return True
+
+    secret_key = current_app.config.get("SECRET_KEY")
+    if not secret_key or secret_key == DEFAULT_SECRET_KEY:
+        return False
+
+    expires_part, _, _ = header.partition('.')
+    if not expires_part.isdigit():
+        return False
+    expires = int(expires_part)
+    now = int(time.time())
+    if expires < now or expires > now + current_app.config.get("PROFILE_SIGNATURE_MAX_AGE", 60):
+        return False
+
+    expected = profile_signature(secret_key, request.path, request.method, expires)
+    return hmac.compare_digest(header, expected) and _claim_signature(header, expires, now)
+
+def _profile_name() -> str:
+    """시각_메서드_경로_파라미터 형식의 파일 이름"""
+    params = dict(request.view_args or {})
+    params.update(request.args.to_dict())
+    if request.is_json:
+        body = request.get_json(silent=True)
+        if isinstance(body, dict):
+            params.update({key: value for key, value in body.items() if isinstance(value, (str, int, float))})
+
+    route = _FILENAME_UNSAFE.sub('_', request.path.strip('/')) or 'root'
+    param_part = _FILENAME_UNSAFE.sub('_', '_'.join(f"{key}-{value}" for key, value in sorted(params.items())))
+    stamp = datetime.now().strftime('%Y%m%dT%H%M%S') + f"{int(time.time() * 1000) % 1000:03d}"
+    name = '_'.join(part for part in (stamp, request.method, route, param_part) if part)
+    return name[:180]
+
+def _start_profile():
+    if not _is_authorized():
+        return
+
+    profiler = cProfile.Profile()
+    sampler = StackSampler(threading.get_ident(), current_app.config.get("PROFILE_SAMPLE_INTERVAL", 0.005))
+    g._profile = (profiler, sampler, _profile_name())
+    sampler.start()
+    profiler.enable()
+
+def _finish_profile(response):
+    profile = g.pop('_profile', None)
+    if profile is None:
+        return response
+
+    profiler, sampler, name = profile
+    profiler.disable()
+    sampler.stop()
+
+    profile_dir = current_app.config["PROFILE_DIR"]
+    os.makedirs(profile_dir, exist_ok=True)
+    pstats.Stats(profiler).dump_stats(os.path.join(profile_dir, f"{name}.prof"))
+    sampler.write_collapsed(os.path.join(profile_dir, f"{name}.collapsed"))
+
+    response.headers['X-Profile-Id'] = name
+    return response
+
+def list_profiles(profile_dir: str, limit: int = 20) -> List[Dict[str, Any]]:
+    """최근 프로파일 목록 (최신순)"""
+    if not os.path.isdir(profile_dir):
+        return []
+
+    profiles = []
+    for filename in os.listdir(profile_dir):
+        if not filename.endswith('.prof'):
+            continue
+        name = filename[:-len('.prof')]
+        path = os.path.join(profile_dir, filename)
+        stat = os.stat(path)
+        collapsed = f"{name}.collapsed"
+        profiles.append({
+            "id": name,
+            "created_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            "size_bytes": stat.st_size,
+            "files": [filename] + ([collapsed] if os.path.exists(os.path.join(profile_dir, collapsed)) else [])
+        })
+
+    profiles.sort(key=lambda profile: profile["created_at"], reverse=True)
+    return profiles[:limit]
+
+def init_app(app: Flask):
+    """PROFILING_ENABLED 설정 시 프로파일링 훅 등록"""
+    if not app.config.get("PROFILING_ENABLED"):
+        return
+
+    app.before_request(_start_profile)
+    app.after_request(_finish_profile)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+요청 단위 DB 쿼리 수 측정
+모든 SQLAlchemy 엔진(기본 + 복제본 bind)의 before_cursor_execute 이벤트로 요청마다 실행한 SQL 문 수를 센다.
+관계를 행마다 지연 로딩하는 N+1 패턴은 결과 크기에 비례해 쿼리 수가 늘어나므로,
+엔드포인트마다 상한을 두고 넘으면 경고 로그를 남긴다 (QUERY_BUDGET_STRICT면 QueryBudgetExceeded 발생).
+
+사용법:
+    @bp.route('/areas')
+    @query_budget(2)
+    def list_areas():
+        ...
+
+- QUERY_COUNT_HEADER: X-Query-Count 응답 헤더로 쿼리 수 노출
+- QUERY_BUDGET_DEFAULT: query_budget이 없는 엔드포인트의 상한 (기본 없음)
+- QUERY_BUDGET_STRICT: 상한 초과 시 예외 (테스트용, TESTING이면 예외가 테스트 클라이언트까지 전파되어 테스트가 실패함)
+"""
+from typing import Callable, Optional
+
+from flask import Flask, current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_settings = {
+    "header": False,
+    "default_budget": None,
+    "strict": False,
+}
+
+class QueryBudgetExceeded(AssertionError):
+    """엔드포인트 쿼리 수 상한 초과 (QUERY_BUDGET_STRICT)"""
+
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context() and '_query_count' in g:
+        g._query_count += 1
+
+def current_count() -> int:
+    """현재 요청에서 지금까지 실행한 SQL 문 수 (요청 밖이면 0)"""
+    if not has_request_context():
+        return 0
+    return g.get('_query_count', 0)
+
+def query_budget(limit: int) -> Callable:
+    """뷰 함수의 요청당 쿼리 수 상한 (route 데코레이터 바로 아래에 둠)"""
+    def decorator(func: Callable) -> Callable:
+        func._query_budget = limit
+        return func
+    return decorator
+
+def _budget() -> Optional[int]:
+    view = current_app.view_functions.get(request.endpoint) if request.endpoint else None
+    return getattr(view, '_query_budget', _settings["default_budget"])
+
+def _start_request():
+    g._query_count = 0
+
+def _check_budget(response):
+    count = g.pop('_query_count', None)
+    if count is None:
+        return response
+
+    if _settings["header"]:
+        response.headers['X-Query-Count'] = str(count)
+    budget = _budget()
+    if budget is not None and count > budget:
+        message = f"query budget exceeded {request.method} {request.path}: {count} > {budget}"
+        if _settings["strict"]:
+            raise QueryBudgetExceeded(message)
+        current_app.logger.warning(message)
+    return response
+
+def init_app(app: Flask):
+    """쿼리 이벤트(프로세스 전역, 한 번만)와 요청 훅 등록"""
+    default_budget = app.config.get("QUERY_BUDGET_DEFAULT")
+    _settings.update(
+        header=bool(app.config.get("QUERY_COUNT_HEADER")),
+        default_budget=int(default_budget) if default_budget else None,
+        strict=bool(app.config.get("QUERY_BUDGET_STRICT")),
+    )
+    if not event.contains(Engine, "before_cursor_execute", _count_statement):
+        event.listen(Engine, "before_cursor_execute", _count_statement)
+
+    app.before_request(_start_request)
+    app.after_request(_check_budget)
@@ -6,6 +6,8 @@
 from typing import Dict, List, Any, Optional
 from services.data_loader import DataLoader
 from services.scoring_service import ScoringService
+from services.result_cache import single_flight
+from services.timing import timed
 import random
 import math
 
@@ -137,6 +139,8 @@ class RecommendationService:
             }
         }
     
+    @single_flight("recommendation.get_personalized_recommendations")
+    @timed("indicators")
     def get_personalized_recommendations(self, user_profile: Dict[str, Any]) -> Dict[str, Any]:
         """개인화된 추천 생성"""
         try:
@@ -442,6 +446,7 @@ class RecommendationService:
         
         return recommendations[:5]  # 상위 5개 반환
     
+    @timed("text")
     def _generate_comprehensive_recommendations(self, industry_recommendations: List[Dict[str, Any]], 
                                               region_recommendations: List[Dict[str, Any]], 
                                               market_recommendations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -492,6 +497,7 @@ class RecommendationService:
         
         return comprehensive[:3]  # 상위 3개 반환
     
+    @timed("text")
     def _generate_next_steps(self, user_preferences: Dict[str, Any]) -> List[str]:
         """다음 단계 제안"""
         business_stage = user_preferences["business_stage"]
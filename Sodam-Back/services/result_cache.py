@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+서비스 결과 캐시 (single-flight + 확률적 조기 갱신)
+같은 인자로 동시에 들어온 비싼 계산을 프로세스 안에서 한 번만 수행하고,
+나머지 호출은 첫 계산의 결과를 기다렸다가 함께 사용한다.
+
+TTL 만료 직전에는 XFetch 방식으로 일부 요청이 미리 재계산을 시작하고
+(계산이 오래 걸릴수록 더 일찍), 그동안 다른 요청은 기존 값을 그대로 받아
+만료 시점에 요청이 한꺼번에 몰리는 캐시 스탬피드를 막는다.
+
+사용법:
+    @single_flight("scoring.calculate_market_score")
+    def calculate_market_score(self, market_code, industry, region):
+        ...
+
+shared=True로 지정한 메서드는 프로세스 캐시 미스 시 워커 공유 캐시(shared_cache)를
+먼저 확인하고, 새로 계산한 결과를 공유 캐시에도 저장한다.
+
+캐시 키에는 결과가 의존하는 데이터 버전(versions, 기본 CSV 데이터셋)을 포함하므로 데이터가 바뀌면
+다른 워커/프로세스가 적재했더라도 새 키로 다시 계산한다. DB 버전 소스(rollups, business_data)는
+각 서비스의 init_app이 register_version으로 등록하고, 버전 조회 쿼리는
+RESULT_CACHE_VERSION_CHECK초(기본 5)에 한 번만 실행한다.
+
+데이터를 갱신하는 명령(flask rollups backfill, flask ingest)은 끝난 뒤 clear_all()을 호출하며,
+CSV 교체처럼 명령을 거치지 않은 갱신 후에는 flask cache clear로 직접 비운다.
+
+RESULT_CACHE_ENABLED가 꺼져 있거나 init_app 전에는 원래 함수를 그대로 호출한다.
+"error" 키가 있는 결과는 캐시하지 않으며, 호출자가 결과를 수정해도 캐시가
+바뀌지 않도록 항상 복사본을 반환한다.
+"""
+import copy
+import functools
+import inspect
+import json
+import math
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+import click
+from flask import Flask, has_app_context
+
+from services import shared_cache
+from services.metrics import CACHE_REQUESTS
+
+_settings = {
+    "enabled": False,
+    "ttl": 300.0,
+    "beta": 1.0,
+    "max_entries": 1024,
+    "version_check": 5.0
+}
+
+def _dataset_version() -> str:
+    from services.data_loader import DataLoader
+    return DataLoader().dataset_version()
+
+# 데이터 버전 소스 이름 -> 버전 함수 (DB 소스는 앱 컨텍스트 안에서만 조회)
+_version_sources: Dict[str, Callable[[], str]] = {"dataset": _dataset_version}
+_versions: Dict[str, Tuple[str, float]] = {}  # 소스 -> (버전, 다음 확인 시각)
+_versions_lock = threading.Lock()
+
+class _Entry:
+    __slots__ = ('value', 'delta', 'expires_at')
+
+    def __init__(self, value: Any, delta: float, expires_at: float):
+        self.value = value
+        self.delta = delta  # 계산에 걸린 시간 (조기 갱신 확률에 사용)
+        self.expires_at = expires_at
+
+class _Call:
+    """진행 중인 계산 (대기 중인 호출들이 결과를 공유)"""
+    __slots__ = ('event', 'value', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+class SingleFlightCache:
+    """이름 하나(서비스 메서드 하나)에 대한 결과 캐시"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._entries: 'OrderedDict[str, _Entry]' = OrderedDict()
+        self._inflight: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def _should_refresh(self, entry: _Entry, now: float) -> bool:
+        """XFetch: now - delta * beta * ln(rand) >= expiry 이면 조기 갱신"""
+        return now - entry.delta * _settings["beta"] * math.log(1.0 - random.random()) >= entry.expires_at
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not self._should_refresh(entry, now):
+                self._entries.move_to_end(key)
+                CACHE_REQUESTS.inc(cache=self.name, result='hit')
+                return entry.value
+
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self._inflight[key] = _Call()
+
+        if not leader:
+            if entry is not None and now < entry.expires_at:
+                # 다른 요청이 갱신 중이면 아직 유효한 기존 값을 바로 반환
+                CACHE_REQUESTS.inc(cache=self.name, result='stale')
+                return entry.value
+            CACHE_REQUESTS.inc(cache=self.name, result='coalesced')
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        CACHE_REQUESTS.inc(cache=self.name, result='miss' if entry is None or now >= entry.expires_at else 'early_refresh')
+        started = time.monotonic()
+        try:
+            call.value = compute()
+            if not (isinstance(call.value, dict) and "error" in call.value):
+                finished = time.monotonic()
+                self._store(key, _Entry(call.value, finished - started, finished + _settings["ttl"]))
+            return call.value
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            call.event.set()
+
+    def _store(self, key: str, entry: _Entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > _settings["max_entries"]:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+_caches: Dict[str, SingleFlightCache] = {}
+
+def make_key(signature: inspect.Signature, args: tuple, kwargs: dict) -> str:
+    """캐시 키: 위치/키워드 인자를 이름으로 묶고 기본값을 채운 뒤(self 제외) 딕셔너리 키 순서와 무관하게 직렬화"""
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    arguments = {name: value for name, value in bound.arguments.items() if name != 'self'}
+    return json.dumps(arguments, sort_keys=True, ensure_ascii=False, default=str)
+
+def register_version(source: str, func: Callable[[], str]):
+    """데이터 버전 소스 등록 (single_flight의 versions에 이름으로 지정)"""
+    _version_sources[source] = func
+    invalidate_version(source)
+
+def invalidate_version(source: str):
+    """저장해 둔 버전을 버려 다음 호출에서 다시 조회 (이 프로세스에서 데이터를 바꾼 직후)"""
+    with _versions_lock:
+        _versions.pop(source, None)
+
+def data_version(sources: Sequence[str]) -> str:
+    """소스별 데이터 버전을 이어 붙인 문자열 (등록되지 않았거나 앱 컨텍스트 밖인 DB 소스는 빈 값)"""
+    now = time.monotonic()
+    parts = []
+    for source in sources:
+        func = _version_sources.get(source)
+        if func is None or (source != "dataset" and not has_app_context()):
+            parts.append("")
+            continue
+        with _versions_lock:
+            cached = _versions.get(source)
+        if cached is None or now >= cached[1]:
+            cached = (str(func()), now + _settings["version_check"])
+            with _versions_lock:
+                _versions[source] = cached
+        parts.append(cached[0])
+    return "/".join(parts)
+
+def _compute_shared(name: str, key: str, compute: Callable[[], Any]) -> Any:
+    """워커 공유 캐시 조회 후 미스이면 계산하여 저장 (key에 데이터 버전 포함)"""
+    store = shared_cache.store
+    if store is None:
+        return compute()
+
+    shared_key = f"{name}:{key}"
+    value = store.get(shared_key)
+    if value is not shared_cache.MISSING:
+        CACHE_REQUESTS.inc(cache=f"{name}:shared", result='hit')
+        return value
+
+    CACHE_REQUESTS.inc(cache=f"{name}:shared", result='miss')
+    value = compute()
+    if not (isinstance(value, dict) and "error" in value):
+        store.set(shared_key, name, value)
+    return value
+
+def single_flight(name: str, shared: bool = False, versions: Sequence[str] = ("dataset",)) -> Callable:
+    """
+    서비스 진입 메서드에 single-flight 결과 캐시 적용 (shared=True면 워커 공유 캐시도 사용)
+    versions: 결과가 의존하는 데이터 버전 소스 (dataset, rollups, business_data)
+    """
+    def decorator(func: Callable) -> Callable:
+        cache = _caches.setdefault(name, SingleFlightCache(name))
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _settings["enabled"]:
+                return func(*args, **kwargs)
+            key = f"{data_version(versions)}:{make_key(signature, args, kwargs)}"
+            compute = lambda: func(*args, **kwargs)
+            if shared:
+                compute = functools.partial(_compute_shared, name, key, compute)
+            return copy.deepcopy(cache.get_or_compute(key, compute))
+        wrapper.cache = cache
+        return wrapper
+    return decorator
+
+def clear_all():
+    """
+    모든 결과 캐시 비우기 (데이터 갱신 후 호출)
+    이 프로세스의 캐시와 저장해 둔 데이터 버전, 워커 공유 캐시를 비운다.
+    다른 워커의 프로세스 캐시는 키의 데이터 버전이 바뀌어 RESULT_CACHE_VERSION_CHECK초 안에 새로 계산된다.
+    """
+    for cache in _caches.values():
+        cache.clear()
+    with _versions_lock:
+        _versions.clear()
+    if shared_cache.store is not None:
+        shared_cache.store.clear()
+
+@click.group('cache', help='서비스 결과 캐시 관리')
+def cache_cli():
+    pass
+
+@cache_cli.command('clear')
+def clear_command():
+    """이 프로세스와 워커 공유 캐시의 결과를 모두 비움"""
+    clear_all()
+    click.echo("결과 캐시를 비웠습니다.")
+
+def init_app(app: Flask):
+    """RESULT_CACHE_* 설정 적용과 CLI 등록"""
+    _settings.update({
+        "enabled": bool(app.config.get("RESULT_CACHE_ENABLED")),
+        "ttl": float(app.config.get("RESULT_CACHE_TTL", 300)),
+        "beta": float(app.config.get("RESULT_CACHE_BETA", 1.0)),
+        "max_entries": int(app.config.get("RESULT_CACHE_MAX_ENTRIES", 1024)),
+        "version_check": float(app.config.get("RESULT_CACHE_VERSION_CHECK", 5))
+    })
+    with _versions_lock:
+        _versions.clear()
+    app.cli.add_command(cache_cli)
@@ -3,6 +3,8 @@ import pandas as pd
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 import numpy as np
+from services.result_cache import single_flight
+from services.timing import timed
 
 class RiskAnalysisService:
     """4가지 리스크 유형 자동 분류 및 분석 서비스"""
@@ -10,8 +12,23 @@ class RiskAnalysisService:
     def __init__(self):
         self.core_diagnosis = None  # CoreDiagnosisService 인스턴스
         
+    @single_flight("risk_analysis.classify_risk_type", versions=("dataset", "rollups", "business_data"))
+    @timed("indicators")
     def classify_risk_type(self, market_code: str, industry: str = None) -> Dict[str, Any]:
-        """4가지 리스크 유형 자동 분류"""
+        """4가지 리스크 유형 자동 분류 (저장된 결과가 현재 데이터 버전이면 재계산하지 않음)"""
+        from services import risk_store
+        
+        version = risk_store.data_version()
+        stored = risk_store.load(market_code, industry)
+        if stored is not None and stored.data_version == version:
+            return risk_store.to_classification(stored, version)
+        
+        classification = self._classify(market_code, industry)
+        stored = risk_store.save(market_code, industry, classification, version)
+        return risk_store.to_classification(stored, version) if stored is not None else classification
+    
+    def _classify(self, market_code: str, industry: str = None) -> Dict[str, Any]:
+        """리스크 유형 분류 계산 (결과를 바꾸는 수정 시 risk_store.CLASSIFIER_VERSION 증가)"""
         
         # 임시 샘플 데이터 (실제로는 CoreDiagnosisService에서 가져와야 함)
         sample_data = self._get_sample_market_data(market_code)
@@ -55,6 +72,8 @@ class RiskAnalysisService:
             "recommendations": self._get_risk_recommendations(primary_risk[0], primary_risk[1])
         }
     
+    @single_flight("risk_analysis.get_detailed_risk_analysis")
+    @timed("indicators")
     def get_detailed_risk_analysis(self, market_code: str, risk_type: str, industry: str = None) -> Dict[str, Any]:
         """특정 리스크 유형의 상세 분석"""
         
@@ -179,6 +198,7 @@ class RiskAnalysisService:
         else:
             return "낮음"
     
+    @timed("text")
     def _get_risk_analysis(self, risk_type: str, risk_score: float) -> str:
         """리스크 분석 텍스트 생성"""
         risk_descriptions = {
@@ -189,6 +209,7 @@ class RiskAnalysisService:
         }
         return risk_descriptions.get(risk_type, "리스크 분석을 수행할 수 없습니다.")
     
+    @timed("text")
     def _get_risk_recommendations(self, risk_type: str, risk_score: float) -> List[str]:
         """리스크별 추천사항 생성"""
         recommendations_map = {
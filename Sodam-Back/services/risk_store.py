@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+리스크 분류 결과 저장소 (RiskAnalysis 테이블)
+상권 x 업종별 최신 분류 결과를 분류 시점의 입력 데이터 버전과 함께 저장해 두고,
+버전이 현재와 같으면(fresh) 재계산 없이 테이블에서 바로 응답한다.
+
+- 데이터 버전: CLASSIFIER_VERSION(분류 로직) + 입력 데이터 버전 해시
+  (CSV 데이터셋, 유동인구/매출 집계 테이블, business_data)
+  CSV 교체, 적재/집계 재생성, 사업체 변경, 분류 로직 변경(CLASSIFIER_VERSION 증가) 시 기존 행은 모두 stale
+- 업종 미지정 분류는 business_type='전체'로 저장
+- stale 행은 조회 시 재계산해 덮어쓰고, 백그라운드 갱신 스레드가
+  RISK_REFRESH_INTERVAL초마다 RISK_REFRESH_BATCH개씩 미리 재분류 (0이면 끔)
+- 지역구별 일괄 조회는 (district, business_type) 인덱스 한 번으로 처리
+- CommercialArea에 없는 상권은 상권 CSV 정보로 행을 만든 뒤 저장 (CSV에도 없으면 저장하지 않음)
+
+CLI:
+    flask risk refresh [--district 유성구] [--industry 식음료업] [--all]
+"""
+import hashlib
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import click
+from flask import Flask, has_app_context
+from sqlalchemy import and_, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+
+from extensions import db, replica_reads
+from models import CommercialArea, RiskAnalysis
+
+# 분류 로직(RiskAnalysisService._classify)을 바꾸면 올려서 저장된 결과를 모두 재분류
+CLASSIFIER_VERSION = "1"
+ALL_INDUSTRIES = "전체"
+
+_settings = {
+    "enabled": True,
+    "refresh_interval": 0.0,
+    "refresh_batch": 50,
+}
+
+_refresher: Optional["StaleRefresher"] = None
+_refresher_pid: Optional[int] = None
+_refresher_lock = threading.Lock()
+
+def data_version() -> str:
+    """분류 입력 데이터 버전 (data_version 컬럼 길이에 맞춰 해시)"""
+    from services import competitor_density, rollups
+    from services.data_loader import DataLoader
+    inputs = f"{DataLoader().dataset_version()}|{rollups.data_version()}|{competitor_density.cache_version()}"
+    return f"{CLASSIFIER_VERSION}.{hashlib.sha1(inputs.encode('utf-8')).hexdigest()[:16]}"
+
+def business_type_key(industry: Optional[str]) -> str:
+    return industry or ALL_INDUSTRIES
+
+def _market_info(market_code: str) -> Optional[Dict[str, Any]]:
+    from services.data_loader import DataLoader
+    return DataLoader().get_market_by_code(market_code)
+
+def _health_score(market_code: str, industry: Optional[str]) -> Optional[float]:
+    from services.core_diagnosis_service import CoreDiagnosisService
+    result = CoreDiagnosisService().calculate_health_score(market_code, industry)
+    return result.get("total_score")
+
+def _ensure_area(market_code: str, market_info: Optional[Dict[str, Any]]) -> Optional[int]:
+    """상권 코드 -> CommercialArea.id (없으면 상권 CSV 정보로 생성)"""
+    area_id = db.session.execute(
+        select(CommercialArea.id).where(CommercialArea.area_code == market_code)
+    ).scalar()
+    if area_id is not None or market_info is None:
+        return area_id
+
+    coordinates = market_info.get("coordinates") or []
+    latitude = sum(coord["lat"] for coord in coordinates) / len(coordinates) if coordinates else 0.0
+    longitude = sum(coord["lng"] for coord in coordinates) / len(coordinates) if coordinates else 0.0
+    area = CommercialArea(
+        area_code=market_code,
+        area_name=market_info.get("market_name") or market_code,
+        address=" ".join(filter(None, [market_info.get("city_name"), market_info.get("district_name")])),
+        latitude=latitude,
+        longitude=longitude
+    )
+    db.session.add(area)
+    db.session.flush()
+    return area.id
+
+def to_classification(row: RiskAnalysis, version: Optional[str] = None) -> Dict[str, Any]:
+    """저장된 행 -> classify_risk_type 응답 형식"""
+    result = dict(row.analysis_data)
+    result.update({
+        "health_score": row.health_score,
+        "data_version": row.data_version,
+        "stale": row.data_version != (version or data_version()),
+        "classified_at": row.updated_at.isoformat() if row.updated_at else None
+    })
+    return result
+
+def load(market_code: str, industry: Optional[str]) -> Optional[RiskAnalysis]:
+    """저장된 분류 결과 (앱 컨텍스트 밖, 저장소를 끈 경우, DB 오류 시 None)"""
+    if not _settings["enabled"] or not has_app_context():
+        return None
+    try:
+        return db.session.execute(
+            select(RiskAnalysis)
+            .join(CommercialArea, CommercialArea.id == RiskAnalysis.area_id)
+            .where(CommercialArea.area_code == market_code,
+                   RiskAnalysis.business_type == business_type_key(industry))
+        ).scalar()
+    except SQLAlchemyError:
+        db.session.rollback()
+        return None
+
+def save(market_code: str, industry: Optional[str], classification: Dict[str, Any],
+         version: Optional[str] = None) -> Optional[RiskAnalysis]:
+    """분류 결과를 (상권, 업종) 행에 저장 (상권 정보나 건강 점수를 구할 수 없으면 저장하지 않고 None)"""
+    if not _settings["enabled"] or not has_app_context() or "error" in classification:
+        return None
+    try:
+        return _save(market_code, industry, classification, version)
+    except SQLAlchemyError:
+        # 저장 실패(동시 생성 충돌, 마이그레이션 전 등)는 계산 결과 응답에 영향을 주지 않음
+        db.session.rollback()
+        return None
+
+def _save(market_code: str, industry: Optional[str], classification: Dict[str, Any],
+          version: Optional[str]) -> Optional[RiskAnalysis]:
+    market_info = _market_info(market_code)
+    health_score = _health_score(market_code, industry)
+    if health_score is None:
+        return None
+    area_id = _ensure_area(market_code, market_info)
+    if area_id is None:
+        return None
+
+    now = datetime.utcnow()
+    values = {
+        "district": (market_info or {}).get("district_name"),
+        "risk_type": classification["primary_risk_type"],
+        "risk_score": classification["primary_risk_score"],
+        "health_score": health_score,
+        "analysis_data": classification,
+        "data_version": version or data_version(),
+        "updated_at": now,
+    }
+    key = {"area_id": area_id, "business_type": business_type_key(industry)}
+    table = RiskAnalysis.__table__
+    connection = db.session.connection()
+    dialect = connection.dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        dialect_insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        stmt = dialect_insert(table).values(**key, **values, created_at=now)
+        connection.execute(stmt.on_conflict_do_update(index_elements=list(key), set_=values))
+    else:
+        condition = and_(*(table.c[column] == value for column, value in key.items()))
+        if connection.execute(update(table).where(condition).values(values)).rowcount == 0:
+            connection.execute(insert(table).values(**key, **values, created_at=now))
+    db.session.commit()
+    return load(market_code, industry)
+
+def _classify_and_save(market_code: str, industry: Optional[str], version: str) -> bool:
+    from services.risk_analysis_service import RiskAnalysisService
+    classification = RiskAnalysisService()._classify(market_code, industry)
+    return save(market_code, industry, classification, version) is not None
+
+def refresh_stale(limit: Optional[int] = None, district: Optional[str] = None,
+                  industry: Optional[str] = None) -> int:
+    """데이터 버전이 현재와 다른 행을 오래된 순으로 재분류, 갱신한 행 수 반환"""
+    version = data_version()
+    query = (
+        select(RiskAnalysis.id, CommercialArea.area_code, RiskAnalysis.business_type)
+        .join(CommercialArea, CommercialArea.id == RiskAnalysis.area_id)
+        .where((RiskAnalysis.data_version != version) | RiskAnalysis.data_version.is_(None))
+        .order_by(RiskAnalysis.updated_at)
+    )
+    if district:
+        query = query.where(RiskAnalysis.district == district)
+    if industry:
+        query = query.where(RiskAnalysis.business_type == business_type_key(industry))
+    if limit:
+        query = query.limit(limit)
+
+    refreshed = 0
+    for row_id, market_code, business_type in db.session.execute(query).all():
+        if _classify_and_save(market_code, None if business_type == ALL_INDUSTRIES else business_type, version):
+            refreshed += 1
+        else:
+            # 재분류할 수 없는 행(상권 CSV에서 빠진 상권 등)이 매번 배치 앞자리를 차지하지 않도록 뒤로 보냄
+            db.session.execute(update(RiskAnalysis).where(RiskAnalysis.id == row_id)
+                               .values(updated_at=datetime.utcnow()))
+            db.session.commit()
+    return refreshed
+
+def classify_all(district: Optional[str] = None, industry: Optional[str] = None) -> int:
+    """상권 CSV의 (지역구) 전체 상권을 분류해 저장 (이미 최신인 행은 건너뜀)"""
+    from services.data_loader import DataLoader
+    loader = DataLoader()
+    markets = loader.get_markets_by_district(district) if district else loader.load_market_data().to_dict('records')
+    version = data_version()
+    saved = 0
+    for market in markets:
+        market_code = str(market["market_code"])
+        row = load(market_code, industry)
+        if row is not None and row.data_version == version:
+            continue
+        saved += _classify_and_save(market_code, industry, version)
+    return saved
+
+@replica_reads()
+def district_risk_types(district: str, industry: Optional[str] = None) -> Dict[str, Any]:
+    """지역구 내 모든 상권의 저장된 분류 결과 (인덱스 조회 한 번)"""
+    version = data_version()
+    rows = db.session.execute(
+        select(CommercialArea.area_code, CommercialArea.area_name, RiskAnalysis.risk_type,
+               RiskAnalysis.risk_score, RiskAnalysis.health_score, RiskAnalysis.analysis_data,
+               RiskAnalysis.data_version, RiskAnalysis.updated_at)
+        .join(CommercialArea, CommercialArea.id == RiskAnalysis.area_id)
+        .where(RiskAnalysis.district == district, RiskAnalysis.business_type == business_type_key(industry))
+        .order_by(RiskAnalysis.risk_score.desc())
+    ).all()
+
+    markets = [
+        {
+            "market_code": row.area_code,
+            "market_name": row.area_name,
+            "risk_type": row.risk_type,
+            "risk_score": row.risk_score,
+            "risk_level": (row.analysis_data or {}).get("risk_level"),
+            "health_score": row.health_score,
+            "stale": row.data_version != version,
+            "classified_at": row.updated_at.isoformat() if row.updated_at else None
+        }
+        for row in rows
+    ]
+    return {
+        "district": district,
+        "industry": industry,
+        "data_version": version,
+        "count": len(markets),
+        "stale_count": sum(market["stale"] for market in markets),
+        "markets": markets
+    }
+
+class StaleRefresher(threading.Thread):
+    """주기적으로 stale 행을 재분류하는 워커별 백그라운드 스레드"""
+
+    def __init__(self, app: Flask, interval: float, batch: int):
+        super().__init__(name='risk-refresher', daemon=True)
+        self.app = app
+        self.interval = interval
+        self.batch = batch
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            try:
+                with self.app.app_context():
+                    refresh_stale(self.batch)
+            except Exception as e:
+                self.app.logger.warning("리스크 분류 백그라운드 갱신 실패: %s", e)
+
+def _ensure_refresher(app: Flask):
+    """프로세스별 갱신 스레드 (gunicorn fork 이후 워커에서 첫 요청 시 시작)"""
+    global _refresher, _refresher_pid
+    pid = os.getpid()
+    if _refresher is not None and _refresher_pid == pid:
+        return
+    with _refresher_lock:
+        if _refresher is None or _refresher_pid != pid:
+            _refresher = StaleRefresher(app, _settings["refresh_interval"], _settings["refresh_batch"])
+            _refresher.start()
+            _refresher_pid = pid
+
+@click.group('risk', help='리스크 분류 저장소 관리')
+def risk_cli():
+    pass
+
+@risk_cli.command('refresh')
+@click.option('--district', default=None, help='지역구 (예: 유성구, 생략 시 전체)')
+@click.option('--industry', default=None, help='업종 (생략 시 업종 미지정 분류)')
+@click.option('--all', 'classify_everything', is_flag=True,
+              help='stale 행만이 아니라 상권 CSV의 모든 상권을 분류해 저장')
+def refresh_command(district, industry, classify_everything):
+    """데이터 버전이 바뀐 분류 결과를 재계산"""
+    started = time.perf_counter()
+    if classify_everything:
+        count = classify_all(district, industry)
+    else:
+        count = refresh_stale(district=district, industry=industry)
+    click.echo(f"{count:,}건 저장 ({time.perf_counter() - started:.1f}초, 데이터 버전 {data_version()})")
+
+def init_app(app: Flask):
+    """RISK_* 설정 적용, 백그라운드 갱신과 CLI 등록"""
+    _settings.update({
+        "enabled": bool(app.config.get("RISK_STORE_ENABLED", True)),
+        "refresh_interval": float(app.config.get("RISK_REFRESH_INTERVAL", 0)),
+        "refresh_batch": int(app.config.get("RISK_REFRESH_BATCH", 50)),
+    })
+    app.cli.add_command(risk_cli)
+
+    if _settings["enabled"] and _settings["refresh_interval"] > 0:
+        @app.before_request
+        def start_risk_refresher():
+            _ensure_refresher(app)
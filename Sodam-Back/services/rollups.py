@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+유동인구/카드매출 집계(롤업) 테이블 관리
+원본(FootTrafficData 시간대 행, SalesData 일별 행)이 추가될 때 일별/월별 집계 행에
+합계를 더해 두어, 진단 지표는 기간 전체를 스캔하지 않고 월 수만큼의 행만 읽는다.
+
+- 유동인구: 상권별 (원본에 업종 구분이 없음)
+- 카드매출: 상권 x 업종별
+- 합계 컬럼: 전체/연령대별/성별 합계와 원본 행 수 (평균 체류시간은 합/행 수로 계산)
+
+갱신 경로:
+- ORM으로 추가한 행: 세션 after_flush 이벤트에서 같은 트랜잭션으로 반영
+- Core 일괄 삽입: 호출 측에서 apply_foot_traffic / apply_sales 호출 (flask ingest 는 청크마다 반영)
+- 원본 수정/삭제 또는 기존 데이터: flask rollups backfill 로 재생성
+
+집계 테이블 버전(data_version)은 결과 캐시 키(result_cache versions="rollups")와
+리스크 분류 저장소 버전에 포함되어, 집계가 바뀌면 캐시된 지표와 저장된 분류가 다시 계산된다.
+"""
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import click
+from flask import Flask
+from sqlalchemy import Date, Table, and_, cast, delete, event, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import SQLAlchemyError
+
+from extensions import db
+from models import (CommercialArea, FootTrafficData, FootTrafficDailyRollup, FootTrafficMonthlyRollup,
+                    SalesData, SalesDailyRollup, SalesMonthlyRollup)
+
+# 집계 컬럼 -> 원본 컬럼
+FOOT_TRAFFIC_MEASURES = {
+    "total_count": "foot_traffic_count",
+    "age_20s": "age_20s", "age_30s": "age_30s", "age_40s": "age_40s", "age_50s": "age_50s", "age_60s": "age_60s",
+    "male_count": "male_count", "female_count": "female_count",
+    "dwell_time_sum": "dwell_time_avg"
+}
+SALES_MEASURES = {
+    "total_sales": "total_sales", "transaction_count": "transaction_count",
+    "age_20s_sales": "age_20s_sales", "age_30s_sales": "age_30s_sales", "age_40s_sales": "age_40s_sales",
+    "age_50s_sales": "age_50s_sales", "age_60s_sales": "age_60s_sales",
+    "male_sales": "male_sales", "female_sales": "female_sales"
+}
+
+def _to_date(value: Any) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+def _accumulate(rows: Iterable[Dict[str, Any]], key_columns: Sequence[str], measures: Dict[str, str],
+                monthly: bool) -> Tuple[Dict[tuple, Dict[str, float]], Dict[tuple, Dict[str, float]]]:
+    """원본 행을 (키 + 날짜) 단위와 (키 + 월) 단위로 합산"""
+    daily: Dict[tuple, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    for row in rows:
+        key = tuple(row[column] for column in key_columns) + (_to_date(row["date"]),)
+        totals = daily[key]
+        for target, source in measures.items():
+            totals[target] += row.get(source) or 0
+        totals["row_count"] += 1
+
+    by_month: Dict[tuple, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    if monthly:
+        for key, totals in daily.items():
+            month_totals = by_month[key[:-1] + (key[-1].replace(day=1),)]
+            for column, value in totals.items():
+                month_totals[column] += value
+    return daily, by_month
+
+def _upsert(connection: Connection, table: Table, key_columns: Sequence[str], measures: Sequence[str],
+            totals: Dict[tuple, Dict[str, float]]):
+    """키가 있으면 합계에 더하고 없으면 새로 삽입"""
+    if not totals:
+        return
+    columns = list(measures) + ["row_count"]
+    rows = [
+        dict(zip(key_columns, key), **{column: values.get(column, 0) for column in columns})
+        for key, values in totals.items()
+    ]
+
+    dialect = connection.dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        dialect_insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        stmt = dialect_insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(key_columns),
+            set_={column: table.c[column] + stmt.excluded[column] for column in columns}
+        )
+        connection.execute(stmt, rows)
+        return
+
+    # 그 외 DB: 갱신 후 대상 행이 없으면 삽입
+    for row in rows:
+        condition = and_(*(table.c[column] == row[column] for column in key_columns))
+        result = connection.execute(
+            update(table).where(condition).values({column: table.c[column] + row[column] for column in columns})
+        )
+        if result.rowcount == 0:
+            connection.execute(insert(table), [row])
+
+def apply_foot_traffic(connection: Connection, rows: Iterable[Dict[str, Any]]):
+    """추가된 유동인구 원본 행을 일별/월별 집계에 반영"""
+    daily, monthly = _accumulate(rows, ("area_id",), FOOT_TRAFFIC_MEASURES, monthly=True)
+    _upsert(connection, FootTrafficDailyRollup.__table__, ("area_id", "date"), list(FOOT_TRAFFIC_MEASURES), daily)
+    _upsert(connection, FootTrafficMonthlyRollup.__table__, ("area_id", "month"), list(FOOT_TRAFFIC_MEASURES), monthly)
+
+def apply_sales(connection: Connection, rows: Iterable[Dict[str, Any]]):
+    """추가된 카드매출 원본 행을 일별/월별 집계에 반영"""
+    daily, monthly = _accumulate(rows, ("area_id", "business_type"), SALES_MEASURES, monthly=True)
+    _upsert(connection, SalesDailyRollup.__table__, ("area_id", "business_type", "date"), list(SALES_MEASURES), daily)
+    _upsert(connection, SalesMonthlyRollup.__table__, ("area_id", "business_type", "month"), list(SALES_MEASURES), monthly)
+
+def _month_start(column, dialect: str):
+    """날짜 컬럼 -> 해당 월 1일 (DB별 함수)"""
+    if dialect == "sqlite":
+        return func.date(column, "start of month")
+    if dialect == "postgresql":
+        return cast(func.date_trunc("month", column), Date)
+    if dialect in ("mysql", "mariadb"):
+        return cast(func.date_format(column, "%Y-%m-01"), Date)
+    raise NotImplementedError(f"월 집계를 지원하지 않는 DB입니다: {dialect}")
+
+def _rebuild(connection: Connection, source: Table, daily: Table, monthly: Table, key_columns: Sequence[str],
+             measures: Dict[str, str], area_ids: Optional[List[int]]) -> Dict[str, int]:
+    """원본 -> 일별 -> 월별 순서로 SQL GROUP BY 재집계"""
+    dialect = connection.dialect.name
+    for table in (daily, monthly):
+        stmt = delete(table)
+        if area_ids is not None:
+            stmt = stmt.where(table.c.area_id.in_(area_ids))
+        connection.execute(stmt)
+
+    source_keys = [source.c[column] for column in key_columns]
+    daily_select = select(
+        *source_keys, source.c.date,
+        *(func.coalesce(func.sum(source.c[column]), 0) for column in measures.values()),
+        func.count()
+    ).group_by(*source_keys, source.c.date)
+    if area_ids is not None:
+        daily_select = daily_select.where(source.c.area_id.in_(area_ids))
+    connection.execute(insert(daily).from_select(
+        list(key_columns) + ["date"] + list(measures) + ["row_count"], daily_select
+    ))
+
+    daily_keys = [daily.c[column] for column in key_columns]
+    month = _month_start(daily.c.date, dialect)
+    monthly_select = select(
+        *daily_keys, month,
+        *(func.sum(daily.c[column]) for column in measures),
+        func.sum(daily.c.row_count)
+    ).group_by(*daily_keys, month)
+    if area_ids is not None:
+        monthly_select = monthly_select.where(daily.c.area_id.in_(area_ids))
+    connection.execute(insert(monthly).from_select(
+        list(key_columns) + ["month"] + list(measures) + ["row_count"], monthly_select
+    ))
+
+    count = lambda table: connection.execute(select(func.count()).select_from(table)).scalar()
+    return {daily.name: count(daily), monthly.name: count(monthly)}
+
+def backfill(connection: Connection, area_ids: Optional[List[int]] = None,
+             kinds: Sequence[str] = ("foot_traffic", "sales")) -> Dict[str, int]:
+    """집계 테이블 재생성 (area_ids 지정 시 해당 상권만, kinds로 유동인구/매출 선택)"""
+    counts = {}
+    if "foot_traffic" in kinds:
+        counts.update(_rebuild(connection, FootTrafficData.__table__, FootTrafficDailyRollup.__table__,
+                               FootTrafficMonthlyRollup.__table__, ("area_id",), FOOT_TRAFFIC_MEASURES, area_ids))
+    if "sales" in kinds:
+        counts.update(_rebuild(connection, SalesData.__table__, SalesDailyRollup.__table__,
+                               SalesMonthlyRollup.__table__, ("area_id", "business_type"), SALES_MEASURES, area_ids))
+    return counts
+
+def data_version() -> str:
+    """월별 집계 행 수/최대 id/원본 행 수 합/합계 (증분 갱신, 재생성 시 달라짐, 집계 테이블이 없으면 none)"""
+    parts = []
+    try:
+        for table, measure in ((FootTrafficMonthlyRollup, FootTrafficMonthlyRollup.total_count),
+                               (SalesMonthlyRollup, SalesMonthlyRollup.total_sales)):
+            row = db.session.execute(
+                select(func.count(), func.max(table.id), func.sum(table.row_count), func.sum(measure))
+            ).one()
+            parts.append(f"{row[0]}.{row[1] or 0}.{row[2] or 0}.{row[3] or 0}")
+    except SQLAlchemyError:
+        db.session.rollback()
+        return "none"
+    return "-".join(parts)
+
+def _row(instance, columns: Iterable[str]) -> Dict[str, Any]:
+    return {column: getattr(instance, column) for column in columns}
+
+def _after_flush(session, flush_context):
+    """ORM으로 추가된 원본 행을 같은 트랜잭션에서 집계에 반영"""
+    foot_traffic, sales = [], []
+    for instance in session.new:
+        if isinstance(instance, FootTrafficData):
+            foot_traffic.append(_row(instance, ("area_id", "date", *FOOT_TRAFFIC_MEASURES.values())))
+        elif isinstance(instance, SalesData):
+            sales.append(_row(instance, ("area_id", "business_type", "date", *SALES_MEASURES.values())))
+    if foot_traffic or sales:
+        connection = session.connection()
+        apply_foot_traffic(connection, foot_traffic)
+        apply_sales(connection, sales)
+        session.info["rollups_changed"] = True
+
+def _after_commit(session):
+    """이 프로세스에서 집계가 바뀐 트랜잭션이 커밋되면 저장해 둔 집계 버전을 바로 버림"""
+    if session.info.pop("rollups_changed", False):
+        from services import result_cache
+        result_cache.invalidate_version("rollups")
+
+def _after_rollback(session):
+    session.info.pop("rollups_changed", None)
+
+@click.group('rollups', help='유동인구/카드매출 집계 테이블 관리')
+def rollups_cli():
+    pass
+
+@rollups_cli.command('backfill')
+@click.option('--area-code', 'area_codes', multiple=True, help='재집계할 상권 코드 (여러 번 지정 가능, 생략 시 전체)')
+def backfill_command(area_codes):
+    """원본 데이터로 일별/월별 집계를 다시 생성"""
+    area_ids = None
+    if area_codes:
+        area_ids = list(db.session.execute(
+            select(CommercialArea.id).where(CommercialArea.area_code.in_(area_codes))
+        ).scalars())
+        if not area_ids:
+            raise click.UsageError(f"상권을 찾을 수 없습니다: {', '.join(area_codes)}")
+
+    counts = backfill(db.session.connection(), area_ids)
+    db.session.commit()
+    # 공유 캐시 정리 (다른 워커의 프로세스 캐시는 키의 집계 버전이 바뀌어 다시 계산됨)
+    from services import result_cache
+    result_cache.clear_all()
+    for table, count in counts.items():
+        click.echo(f"{table}: {count:,}행")
+
+def init_app(app: Flask):
+    """ORM 증분 갱신 이벤트와 CLI 등록"""
+    for name, listener in (("after_flush", _after_flush), ("after_commit", _after_commit),
+                           ("after_rollback", _after_rollback)):
+        if not event.contains(db.session, name, listener):
+            event.listen(db.session, name, listener)
+    app.cli.add_command(rollups_cli)
+
+    from services import result_cache
+    result_cache.register_version("rollups", data_version)
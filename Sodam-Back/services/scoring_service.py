@@ -5,6 +5,8 @@
 """
 from typing import Dict, List, Any, Optional
 from services.data_loader import DataLoader
+from services.result_cache import single_flight
+from services.timing import timed
 import math
 
 class ScoringService:
@@ -33,6 +35,8 @@ class ScoringService:
             }
         }
     
+    @single_flight("scoring.calculate_market_score", shared=True)
+    @timed("indicators")
     def calculate_market_score(self, market_code: str, industry: str, region: str) -> Dict[str, Any]:
         """상권 종합 점수 계산"""
         try:
@@ -340,6 +344,7 @@ class ScoringService:
         else:
             return "D"
     
+    @timed("text")
     def _generate_recommendations(self, market_score: Dict[str, Any], 
                                 industry_score: Dict[str, Any], 
                                 regional_score: Dict[str, Any]) -> List[str]:
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+워커 공유 숫자 배열 저장소
+데이터셋의 숫자 열(관광 소비, 업종/지역 지출 비율, 상권 경계 좌표)을 .npy 파일로 한 번 기록하고
+각 워커는 읽기 전용 memmap NumPy 배열로 연결한다.
+
+pre-fork 후에도 pandas 객체는 참조 카운트 갱신으로 페이지가 점점 복사되지만,
+memmap 배열은 OS 페이지 캐시를 공유하므로 워커가 N개여도 데이터는 약 한 벌만 차지한다.
+
+파일은 SHARED_ARRAYS_DIR/<데이터셋 버전>/<이름>.npy 에 저장되며, 데이터가 바뀌면
+새 버전 디렉터리에 다시 기록한다. SHARED_ARRAYS_DIR가 설정되지 않으면 일반 메모리 배열을 사용한다.
+"""
+import os
+import shutil
+from typing import Callable, Dict, Optional
+
+import numpy as np
+from flask import Flask
+
+class SharedArrayStore:
+    """버전별 디렉터리에 .npy 파일을 기록하고 읽기 전용 memmap으로 연결"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._attached: Dict[str, np.ndarray] = {}
+
+    def _path(self, version: str, name: str) -> str:
+        return os.path.join(self.directory, version, f"{name}.npy")
+
+    def get_or_publish(self, version: str, name: str, build: Callable[[], np.ndarray]) -> np.ndarray:
+        """이미 기록된 배열이면 연결하고, 없으면 build()로 만들어 기록한 뒤 연결"""
+        path = self._path(version, name)
+        attached = self._attached.get(path)
+        if attached is not None:
+            return attached
+
+        if not os.path.exists(path):
+            array = np.ascontiguousarray(build())
+            if array.dtype == object:
+                raise TypeError(f"공유 배열은 숫자 타입이어야 합니다: {name}")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # 다른 워커가 동시에 기록해도 완성된 파일만 보이도록 임시 파일에 쓴 뒤 교체
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, 'wb') as f:
+                np.save(f, array)
+            os.replace(temp_path, path)
+
+        attached = np.load(path, mmap_mode='r')
+        self._attached[path] = attached
+        return attached
+
+    def prune(self, keep_version: str):
+        """현재 버전 외의 디렉터리 삭제 (연결된 memmap은 삭제 후에도 유효)"""
+        if not os.path.isdir(self.directory):
+            return
+        for entry in os.listdir(self.directory):
+            if entry != keep_version:
+                shutil.rmtree(os.path.join(self.directory, entry), ignore_errors=True)
+
+store: Optional[SharedArrayStore] = None
+
+def as_shared(version: str, name: str, build: Callable[[], np.ndarray]) -> np.ndarray:
+    """공유 모드면 memmap 배열, 아니면 읽기 전용 일반 배열"""
+    if store is not None:
+        return store.get_or_publish(version, name, build)
+    array = np.ascontiguousarray(build())
+    array.setflags(write=False)
+    return array
+
+def init_app(app: Flask):
+    """SHARED_ARRAYS_DIR 설정 시 공유 배열 저장소 생성"""
+    global store
+    directory = app.config.get("SHARED_ARRAYS_DIR")
+    if not directory:
+        store = None
+        return
+    if store is None or store.directory != directory:
+        store = SharedArrayStore(directory)
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+워커 공유 결과 캐시 (2차 캐시)
+같은 호스트의 모든 gunicorn 워커가 하나의 로컬 SQLite 파일을 키/값 저장소로 공유한다.
+파일이 배포/재시작 후에도 남아 있으므로 새로 뜬 워커도 자주 쓰이는 결과를 바로 응답할 수 있다.
+
+- 키: 서비스 메서드 이름 + 데이터 버전(CSV 데이터셋, DB 집계/사업체) + 호출 인자 (데이터가 바뀌면 자동으로 다른 키)
+- 값: pickle 직렬화 결과
+- 용량 제한: SHARED_CACHE_MAX_MB 초과 시 가장 오래 조회되지 않은 항목부터 삭제 (LRU)
+
+SHARED_CACHE_PATH가 설정되지 않으면 비활성화된다.
+캐시 오류(잠금 대기 초과 등)는 요청을 실패시키지 않고 미스로 처리한다.
+"""
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+from flask import Flask
+
+MISSING = object()
+
+# 조회 시각 갱신 최소 간격 (초) - 조회마다 쓰기가 발생하지 않도록 LRU 정밀도를 낮춤
+_TOUCH_INTERVAL = 30.0
+# 용량 확인 주기 (쓰기 횟수)
+_EVICT_CHECK_EVERY = 16
+
+class SharedResultCache:
+    """SQLite 기반 프로세스 간 공유 키/값 캐시"""
+
+    def __init__(self, path: str, max_bytes: int, ttl: float):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._local = threading.local()
+        self._writes = 0
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._init_schema()
+
+    def _connection(self) -> sqlite3.Connection:
+        """스레드별 연결 (fork 후에는 부모의 연결을 쓰지 않고 새로 연결)"""
+        pid = os.getpid()
+        if getattr(self._local, 'pid', None) != pid:
+            connection = sqlite3.connect(self.path, timeout=5.0, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = pid
+        return self._local.connection
+
+    def _init_schema(self):
+        connection = self._connection()
+        connection.execute("""
+            CREATE TABLE IF NOT EXISTS result_cache (
+                key TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        connection.execute("CREATE INDEX IF NOT EXISTS ix_result_cache_accessed_at ON result_cache (accessed_at)")
+
+    def get(self, key: str) -> Any:
+        now = time.time()
+        try:
+            connection = self._connection()
+            row = connection.execute(
+                "SELECT value, expires_at, accessed_at FROM result_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return MISSING
+            value, expires_at, accessed_at = row
+            if expires_at <= now:
+                connection.execute("DELETE FROM result_cache WHERE key = ?", (key,))
+                return MISSING
+            if now - accessed_at > _TOUCH_INTERVAL:
+                connection.execute("UPDATE result_cache SET accessed_at = ? WHERE key = ?", (now, key))
+        except sqlite3.Error:
+            return MISSING
+        try:
+            return pickle.loads(value)
+        except Exception:
+            # 깨진 값이나 이전 코드가 저장한 값 (이름이 바뀐 클래스, numpy.core 이동 등) - 삭제하고 미스로 처리
+            try:
+                connection.execute("DELETE FROM result_cache WHERE key = ?", (key,))
+            except sqlite3.Error:
+                pass
+            return MISSING
+
+    def set(self, key: str, name: str, value: Any):
+        now = time.time()
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            connection = self._connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO result_cache (key, name, value, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, name, payload, len(payload), now + self.ttl, now)
+            )
+            self._writes += 1
+            if self._writes % _EVICT_CHECK_EVERY == 0:
+                self.evict()
+        except (sqlite3.Error, pickle.PicklingError, TypeError, AttributeError):
+            # AttributeError: 지역 함수/클래스 등 pickle할 수 없는 객체
+            pass
+
+    def evict(self):
+        """만료 항목 삭제 후 용량 초과분을 LRU 순서로 삭제 (최대 용량의 90%까지)"""
+        connection = self._connection()
+        connection.execute("DELETE FROM result_cache WHERE expires_at <= ?", (time.time(),))
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM result_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        target = total - int(self.max_bytes * 0.9)
+        freed = 0
+        keys = []
+        for key, size in connection.execute("SELECT key, size FROM result_cache ORDER BY accessed_at"):
+            keys.append((key,))
+            freed += size
+            if freed >= target:
+                break
+        connection.executemany("DELETE FROM result_cache WHERE key = ?", keys)
+
+    def stats(self) -> dict:
+        row = self._connection().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM result_cache").fetchone()
+        return {"path": self.path, "entries": row[0], "bytes": row[1], "max_bytes": self.max_bytes}
+
+    def clear(self):
+        self._connection().execute("DELETE FROM result_cache")
+
+store: Optional[SharedResultCache] = None
+
+def init_app(app: Flask):
+    """SHARED_CACHE_PATH 설정 시 공유 캐시 생성"""
+    global store
+    path = app.config.get("SHARED_CACHE_PATH")
+    if not path:
+        store = None
+        return
+    if store is None or store.path != path:
+        store = SharedResultCache(
+            path,
+            max_bytes=int(float(app.config.get("SHARED_CACHE_MAX_MB", 64)) * 1024 * 1024),
+            ttl=float(app.config.get("SHARED_CACHE_TTL", 3600))
+        )
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+사업체(BusinessData) 위치 공간 인덱스
+"반경 500m 안의 영업 중인 식음료업 사업체" 같은 조회가 테이블 전체를 스캔하지 않도록
+위도/경도에 공간 인덱스를 두고, 경계 상자(bbox)로 후보를 좁힌 뒤 실제 거리로 거른다.
+
+- SQLite: R*Tree 가상 테이블 business_data_rtree(id, min_lat, max_lat, min_lng, max_lng)
+  business_data의 INSERT / UPDATE OF latitude, longitude / DELETE 트리거로 같은 트랜잭션에서 동기화
+  (R*Tree 좌표는 32비트 실수로 저장되며 상자를 바깥쪽으로 반올림하므로, 원본 좌표로 한 번 더 거른다)
+- PostgreSQL: point(longitude, latitude) 식에 GiST 인덱스 (일반 인덱스이므로 별도 동기화 불필요)
+- 그 외 DB: 위도/경도 범위 조건만 사용 (공간 인덱스 없음)
+
+db.create_all()로 business_data를 만들면 after_create 이벤트로 함께 생성되고,
+기존 DB에는 마이그레이션(g7b8c9d0e1f2)이 생성하고 기존 행을 채운다.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+from sqlalchemy import Column, Float, Integer, MetaData, Table, event, func, select
+from sqlalchemy.engine import Connection
+
+from extensions import db, replica_reads
+from models import BusinessData
+
+RTREE_TABLE = "business_data_rtree"
+GIST_INDEX = "ix_business_data_location_gist"
+EARTH_RADIUS_M = 6371000.0
+
+# R*Tree 가상 테이블 (db.metadata에 넣으면 create_all이 일반 테이블로 만들려 하므로 별도 MetaData)
+rtree = Table(
+    RTREE_TABLE, MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("min_lat", Float), Column("max_lat", Float),
+    Column("min_lng", Float), Column("max_lng", Float),
+)
+
+SQLITE_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {RTREE_TABLE} USING rtree(id, min_lat, max_lat, min_lng, max_lng)",
+    f"""CREATE TRIGGER IF NOT EXISTS business_data_rtree_insert AFTER INSERT ON business_data BEGIN
+        INSERT INTO {RTREE_TABLE} VALUES (new.id, new.latitude, new.latitude, new.longitude, new.longitude);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS business_data_rtree_update AFTER UPDATE OF id, latitude, longitude ON business_data BEGIN
+        DELETE FROM {RTREE_TABLE} WHERE id = old.id;
+        INSERT INTO {RTREE_TABLE} VALUES (new.id, new.latitude, new.latitude, new.longitude, new.longitude);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS business_data_rtree_delete AFTER DELETE ON business_data BEGIN
+        DELETE FROM {RTREE_TABLE} WHERE id = old.id;
+    END""",
+)
+POSTGRESQL_DDL = (
+    f"CREATE INDEX IF NOT EXISTS {GIST_INDEX} ON business_data USING gist (point(longitude, latitude))",
+)
+
+def install(connection: Connection, backfill: bool = True):
+    """공간 인덱스 생성 (이미 있으면 그대로), SQLite는 기존 행으로 R*Tree를 채움"""
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        for statement in SQLITE_DDL:
+            connection.exec_driver_sql(statement)
+        if backfill:
+            connection.exec_driver_sql(
+                f"INSERT OR REPLACE INTO {RTREE_TABLE} SELECT id, latitude, latitude, longitude, longitude FROM business_data"
+            )
+    elif dialect == "postgresql":
+        for statement in POSTGRESQL_DDL:
+            connection.exec_driver_sql(statement)
+
+def uninstall(connection: Connection):
+    if connection.dialect.name == "sqlite":
+        for trigger in ("insert", "update", "delete"):
+            connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS business_data_rtree_{trigger}")
+        connection.exec_driver_sql(f"DROP TABLE IF EXISTS {RTREE_TABLE}")
+    elif connection.dialect.name == "postgresql":
+        connection.exec_driver_sql(f"DROP INDEX IF EXISTS {GIST_INDEX}")
+
+@event.listens_for(BusinessData.__table__, "after_create")
+def _after_create(target, connection, **kw):
+    install(connection, backfill=False)
+
+@event.listens_for(BusinessData.__table__, "before_drop")
+def _before_drop(target, connection, **kw):
+    uninstall(connection)
+
+def radius_bbox(lat, lng, radius_m) -> Dict[str, Any]:
+    """중심과 반경(m)을 감싸는 경계 상자 (haversine_m 거리 기준, 인자는 배열도 가능)"""
+    angle = np.asarray(radius_m, dtype=np.float64) / EARTH_RADIUS_M
+    dlat = np.degrees(angle)
+    ratio = np.sin(np.minimum(angle, np.pi / 2)) / np.maximum(np.cos(np.radians(lat)), 1e-9)
+    dlng = np.where(ratio < 1, np.degrees(np.arcsin(np.minimum(ratio, 1.0))), 180.0)
+    if np.ndim(dlat) == 0 and np.ndim(dlng) == 0:
+        dlat, dlng = float(dlat), float(dlng)
+    return {"min_lat": lat - dlat, "max_lat": lat + dlat, "min_lng": lng - dlng, "max_lng": lng + dlng}
+
+def haversine_m(lat, lng, lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+    """중심에서 각 좌표까지 거리 (m, 중심도 좌표와 같은 길이의 배열 가능)"""
+    lat1, lng1 = np.radians(lat), np.radians(lng)
+    lat2, lng2 = np.radians(lats), np.radians(lngs)
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+def _as_list(value: Union[str, Sequence[str], None]) -> Optional[List[str]]:
+    if value is None:
+        return None
+    return [value] if isinstance(value, str) else list(value)
+
+def bbox_query(min_lat: float, min_lng: float, max_lat: float, max_lng: float,
+               business_type: Union[str, Sequence[str], None] = None,
+               status: Union[str, Sequence[str], None] = None,
+               columns: Optional[Iterable[Any]] = None, dialect: Optional[str] = None):
+    """경계 상자 안의 사업체 SELECT (공간 인덱스로 후보를 찾고 업종/상태로 거름)"""
+    stmt = select(*(columns or (BusinessData,)))
+    dialect = dialect or db.session.get_bind().dialect.name
+    if dialect == "sqlite":
+        stmt = stmt.join(rtree, rtree.c.id == BusinessData.id).where(
+            rtree.c.min_lat <= max_lat, rtree.c.max_lat >= min_lat,
+            rtree.c.min_lng <= max_lng, rtree.c.max_lng >= min_lng
+        )
+    elif dialect == "postgresql":
+        stmt = stmt.where(
+            func.point(BusinessData.longitude, BusinessData.latitude)
+            .op("<@")(func.box(func.point(min_lng, min_lat), func.point(max_lng, max_lat)))
+        )
+    stmt = stmt.where(BusinessData.latitude.between(min_lat, max_lat),
+                      BusinessData.longitude.between(min_lng, max_lng))
+
+    business_types, statuses = _as_list(business_type), _as_list(status)
+    if business_types:
+        stmt = stmt.where(BusinessData.business_type.in_(business_types))
+    if statuses:
+        stmt = stmt.where(BusinessData.status.in_(statuses))
+    return stmt
+
+@replica_reads()
+def within_bbox(min_lat: float, min_lng: float, max_lat: float, max_lng: float,
+                business_type: Union[str, Sequence[str], None] = None,
+                status: Union[str, Sequence[str], None] = "active") -> List[Dict[str, Any]]:
+    """경계 상자 안의 사업체"""
+    stmt = bbox_query(min_lat, min_lng, max_lat, max_lng, business_type, status)
+    return [business.to_dict() for business in db.session.execute(stmt).scalars()]
+
+@replica_reads()
+def within_radius(lat: float, lng: float, radius_m: float,
+                  business_type: Union[str, Sequence[str], None] = None,
+                  status: Union[str, Sequence[str], None] = "active") -> List[Dict[str, Any]]:
+    """반경(m) 안의 사업체 (가까운 순, distance_m 포함)"""
+    box = radius_bbox(lat, lng, radius_m)
+    businesses = list(db.session.execute(
+        bbox_query(box["min_lat"], box["min_lng"], box["max_lat"], box["max_lng"], business_type, status)
+    ).scalars())
+    if not businesses:
+        return []
+
+    distances = haversine_m(lat, lng, np.array([b.latitude for b in businesses]), np.array([b.longitude for b in businesses]))
+    result = []
+    for index in np.argsort(distances, kind="stable"):
+        if distances[index] <= radius_m:
+            result.append(dict(businesses[index].to_dict(), distance_m=round(float(distances[index]), 1)))
+    return result
+
+@replica_reads()
+def count_within_radius(lat: float, lng: float, radius_m: float,
+                        business_type: Union[str, Sequence[str], None] = None,
+                        status: Union[str, Sequence[str], None] = "active") -> int:
+    """반경(m) 안의 사업체 수 (ORM 객체를 만들지 않고 좌표만 읽음)"""
+    box = radius_bbox(lat, lng, radius_m)
+    rows = db.session.execute(bbox_query(
+        box["min_lat"], box["min_lng"], box["max_lat"], box["max_lng"], business_type, status,
+        columns=(BusinessData.latitude, BusinessData.longitude)
+    )).all()
+    if not rows:
+        return 0
+    coordinates = np.array(rows, dtype=np.float64)
+    return int((haversine_m(lat, lng, coordinates[:, 0], coordinates[:, 1]) <= radius_m).sum())
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+기동 시간 리포트
+create_app까지의 콜드 스타트 시간을 구간별로 기록한다.
+
+- 모듈 import 시간: STARTUP_REPORT=true 환경 변수로 실행하면 이 모듈이 import 되는 시점에
+  sys.meta_path에 타이머를 설치하여 이후 import 되는 모듈별 누적/자체 시간을 기록
+  (환경 변수는 설정 클래스보다 먼저 읽어야 하므로 os.environ에서 직접 확인)
+- create_app 단계 시간: 확장 초기화, API/요청 훅 구성, 라우트 정의, 블루프린트 등록, 데이터셋 사전 로드
+- 서비스 생성 시간: 지연 생성 서비스(LazyService)의 인스턴스 생성 시간
+- ready: create_app 완료 시점, first_request: 첫 요청 처리 시작 시점
+
+시간은 모두 이 모듈이 처음 import 된 시점(app.py, gunicorn.conf.py의 첫 import) 기준이다.
+표준 라이브러리만 사용하므로 다른 모듈보다 먼저 import 해도 기동 시간에 영향이 없다.
+"""
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+_origin = time.perf_counter()
+_lock = threading.Lock()
+
+_imports: Dict[str, Dict[str, float]] = {}
+_phases: List[Dict[str, Any]] = []
+_services: List[Dict[str, Any]] = []
+_marks: Dict[str, float] = {}
+_last_checkpoint: Optional[float] = None
+
+def _elapsed() -> float:
+    return time.perf_counter() - _origin
+
+class _TimedLoader:
+    """exec_module 시간을 측정하는 로더 래퍼 (import가 끝나면 원래 로더로 되돌림)"""
+
+    def __init__(self, finder: '_ImportTimer', loader):
+        self._finder = finder
+        self._loader = loader
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._finder.enter()
+        started = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._finder.exit(module.__name__, time.perf_counter() - started)
+            module.__loader__ = self._loader
+            if module.__spec__ is not None:
+                module.__spec__.loader = self._loader
+
+    def __getattr__(self, name: str):
+        return getattr(self._loader, name)
+
+class _ImportTimer:
+    """모듈별 import 누적 시간(하위 import 포함)과 자체 시간 기록"""
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def _stack(self) -> List[float]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def find_spec(self, fullname, path=None, target=None):
+        if getattr(self._local, 'finding', False):
+            return None
+        self._local.finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, 'find_spec'):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.finding = False
+
+        if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = _TimedLoader(self, spec.loader)
+        return spec
+
+    def enter(self):
+        self._stack().append(0.0)
+
+    def exit(self, name: str, seconds: float):
+        stack = self._stack()
+        children = stack.pop()
+        if stack:
+            stack[-1] += seconds
+        with _lock:
+            _imports[name] = {
+                "cumulative_ms": round(seconds * 1000, 2),
+                "self_ms": round((seconds - children) * 1000, 2),
+                "at_ms": round(_elapsed() * 1000, 1)
+            }
+
+_timer: Optional[_ImportTimer] = None
+
+def enabled() -> bool:
+    return _timer is not None
+
+def install():
+    """모듈 import 타이머 설치 (이후 import 되는 모듈만 측정)"""
+    global _timer
+    if _timer is None:
+        _timer = _ImportTimer()
+        sys.meta_path.insert(0, _timer)
+
+def uninstall():
+    global _timer
+    if _timer is not None:
+        sys.meta_path.remove(_timer)
+        _timer = None
+
+def begin():
+    """create_app 단계 측정 시작 (create_app을 다시 호출하면 단계 기록을 새로 시작)"""
+    global _last_checkpoint
+    with _lock:
+        _phases.clear()
+    _last_checkpoint = time.perf_counter()
+
+def checkpoint(name: str):
+    """직전 checkpoint(또는 begin) 이후 걸린 시간을 단계 이름으로 기록"""
+    global _last_checkpoint
+    now = time.perf_counter()
+    with _lock:
+        _phases.append({
+            "name": name,
+            "ms": round((now - (_last_checkpoint or now)) * 1000, 2),
+            "at_ms": round(_elapsed() * 1000, 1)
+        })
+    _last_checkpoint = now
+
+def record_service(name: str, seconds: float):
+    """서비스 인스턴스 생성 시간 기록"""
+    with _lock:
+        _services.append({
+            "name": name,
+            "ms": round(seconds * 1000, 2),
+            "at_ms": round(_elapsed() * 1000, 1),
+            "pid": os.getpid()
+        })
+
+def mark(name: str):
+    """기동 이정표 기록 (처음 한 번만)"""
+    if name in _marks:
+        return
+    with _lock:
+        _marks.setdefault(name, round(_elapsed() * 1000, 1))
+
+def report(top: int = 30) -> Dict[str, Any]:
+    """기동 리포트 (import 시간은 누적 시간 상위 top개)"""
+    with _lock:
+        imports = sorted(_imports.items(), key=lambda item: item[1]["cumulative_ms"], reverse=True)
+        return {
+            "pid": os.getpid(),
+            "import_timing_enabled": enabled(),
+            "ready_ms": _marks.get("ready"),
+            "first_request_ms": _marks.get("first_request"),
+            "marks": dict(_marks),
+            "phases": list(_phases),
+            "services": list(_services),
+            "modules_imported": len(_imports),
+            "imports": [dict(module=name, **timing) for name, timing in imports[:top]]
+        }
+
+def summary(top: int = 10) -> str:
+    """부팅 로그용 한 줄 요약"""
+    data = report(top)
+    phases = ", ".join(f"{item['name']}={item['ms']:.0f}ms" for item in data["phases"])
+    text = f"기동 완료 {data['ready_ms']:.0f}ms ({phases})"
+    if data["imports"]:
+        slowest = ", ".join(f"{item['module']}={item['cumulative_ms']:.0f}ms" for item in data["imports"])
+        text += f" / 느린 import: {slowest}"
+    return text
+
+if os.getenv("STARTUP_REPORT", "false").lower() == "true":
+    install()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+요청 단위 단계별 시간 측정 서비스
+DataLoader와 각 서비스 내부 구간(데이터 로드, 필터링, 지표 계산, 텍스트 생성, JSON 인코딩)의
+소요 시간을 요청마다 집계하여 Server-Timing 헤더와 디버그 로그로 내보낸다.
+
+사용법:
+    with stage("filter"):
+        ...
+
+    @timed("text")
+    def _get_analysis_text(...):
+        ...
+
+단계는 중첩될 수 있으며 각 단계에는 자기 자신의 시간(하위 단계 제외)만 집계된다.
+SERVER_TIMING_ENABLED가 꺼져 있으면 stage()는 공유 no-op 컨텍스트를 반환하고
+timed()는 플래그 확인 한 번 후 원래 함수를 호출한다.
+"""
+import functools
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from flask import Flask, current_app, g, has_request_context, request
+from flask.json.provider import DefaultJSONProvider
+
+_enabled = False
+
+class _NullStage:
+    """측정 비활성화 시 사용하는 no-op 컨텍스트"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+_NULL_STAGE = _NullStage()
+
+class RequestTimings:
+    """한 요청 동안의 단계별 누적 시간 (초)"""
+    __slots__ = ('started', 'totals', '_stack')
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.totals: Dict[str, float] = {}
+        self._stack: List[List[Any]] = []
+
+    def enter(self, name: str):
+        now = time.perf_counter()
+        if self._stack:
+            # 상위 단계의 시간을 여기까지 정산하고 일시 정지
+            parent = self._stack[-1]
+            self._add(parent[0], now - parent[1])
+        self._stack.append([name, now])
+
+    def exit(self):
+        now = time.perf_counter()
+        name, since = self._stack.pop()
+        self._add(name, now - since)
+        if self._stack:
+            # 상위 단계 재개
+            self._stack[-1][1] = now
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def header_value(self) -> str:
+        """Server-Timing 헤더 값 (밀리초)"""
+        parts = [f"{name};dur={seconds * 1000:.2f}" for name, seconds in self.totals.items()]
+        parts.append(f"total;dur={self.elapsed() * 1000:.2f}")
+        return ", ".join(parts)
+
+    def _add(self, name: str, seconds: float):
+        self.totals[name] = self.totals.get(name, 0.0) + seconds
+
+class _Stage:
+    __slots__ = ('_timings', '_name')
+
+    def __init__(self, timings: RequestTimings, name: str):
+        self._timings = timings
+        self._name = name
+
+    def __enter__(self):
+        self._timings.enter(self._name)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._timings.exit()
+        return False
+
+def current_timings() -> Optional[RequestTimings]:
+    """현재 요청의 측정 객체 (비활성화 또는 요청 밖이면 None)"""
+    if not _enabled or not has_request_context():
+        return None
+    return g.get('_request_timings')
+
+def stage(name: str):
+    """단계 측정 컨텍스트"""
+    if not _enabled:
+        return _NULL_STAGE
+    timings = current_timings()
+    if timings is None:
+        return _NULL_STAGE
+    return _Stage(timings, name)
+
+def timed(name: str) -> Callable:
+    """함수 전체를 하나의 단계로 측정하는 데코레이터"""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+class TimedJSONProvider(DefaultJSONProvider):
+    """jsonify 직렬화 시간을 json 단계로 측정 (일반 블루프린트용)"""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        with stage("json"):
+            return super().dumps(obj, **kwargs)
+
+def _timed_representation(representation: Callable) -> Callable:
+    """Flask-RESTX 응답 직렬화를 json 단계로 측정 (네임스페이스용)"""
+    @functools.wraps(representation)
+    def wrapper(data, code, headers=None):
+        with stage("json"):
+            return representation(data, code, headers)
+    return wrapper
+
+def _start_request():
+    g._request_timings = RequestTimings()
+
+def _emit_server_timing(response):
+    timings = g.pop('_request_timings', None)
+    if timings is None:
+        return response
+
+    header_value = timings.header_value()
+    response.headers['Server-Timing'] = header_value
+    current_app.logger.debug(f"stage timings {request.method} {request.path} {response.status_code}: {header_value}")
+    return response
+
+def init_app(app: Flask, api=None):
+    """SERVER_TIMING_ENABLED 설정 시 요청 훅과 JSON 직렬화 측정을 등록"""
+    global _enabled
+    _enabled = bool(app.config.get("SERVER_TIMING_ENABLED"))
+    if not _enabled:
+        return
+
+    # before/after_request는 앱 전역 훅이므로 RESTX 네임스페이스와 블루프린트 모두에 적용됨
+    app.before_request(_start_request)
+    app.after_request(_emit_server_timing)
+
+    app.json = TimedJSONProvider(app)
+    if api is not None:
+        for mediatype, representation in list(api.representations.items()):
+            api.representations[mediatype] = _timed_representation(representation)
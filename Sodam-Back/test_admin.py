@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+운영 관리 API 접근 제어 테스트
+ADMIN_TOKEN이 없으면 관리 API 전체를 거부하고, 설정된 경우 X-Admin-Token이 일치해야 하는지 확인
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import create_app
+from config import Config
+
+def _client(tmp_path, token):
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'admin.db'}"
+        RESULT_CACHE_ENABLED = False
+        ADMIN_TOKEN = token
+
+    return create_app(TestConfig, components=["admin"]).test_client()
+
+def test_admin_api_disabled_without_token(tmp_path):
+    client = _client(tmp_path, None)
+    response = client.get("/api/v1/admin/metrics")
+    assert response.status_code == 403
+    assert response.get_json()["error"]["code"] == "ADMIN_DISABLED"
+    # 아무 토큰이나 보내도 통과하지 않음
+    assert client.get("/api/v1/admin/metrics", headers={"X-Admin-Token": ""}).status_code == 403
+
+def test_admin_api_requires_matching_token(tmp_path):
+    client = _client(tmp_path, "s3cret")
+    assert client.get("/api/v1/admin/metrics").status_code == 401
+    assert client.get("/api/v1/admin/metrics", headers={"X-Admin-Token": "wrong"}).status_code == 401
+    assert client.get("/api/v1/admin/metrics", headers={"X-Admin-Token": "s3cret"}).status_code == 200
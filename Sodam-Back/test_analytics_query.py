@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+AnalyticsQueryService 테스트
+SQL 집계 결과와, 실행된 쿼리가 복합 인덱스를 사용하는지(EXPLAIN QUERY PLAN) 확인
+집계(롤업) 테이블의 재생성/증분 갱신 결과가 원본 집계와 같은지 확인
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import event, insert
+
+from app import create_app
+from config import Config
+from extensions import db
+from models import CommercialArea, FootTrafficData, SalesData
+from services import rollups
+from services.analytics_query_service import AnalyticsQueryService
+
+START = date(2024, 1, 1)
+DAYS = 10
+
+@pytest.fixture
+def app(tmp_path):
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'analytics.db'}"
+        RESULT_CACHE_ENABLED = False
+
+    # 분석 컴포넌트를 포함해야 집계 테이블 증분 갱신 이벤트가 등록됨
+    app = create_app(TestConfig, components=["core_diagnosis"])
+    with app.app_context():
+        db.create_all()
+        _seed()
+        yield app
+
+def _seed():
+    for area_id, code in ((1, "DJ001"), (2, "DJ002")):
+        db.session.add(CommercialArea(id=area_id, area_code=code, area_name=code, address="대전",
+                                      latitude=36.35, longitude=127.38))
+    db.session.commit()
+
+    foot_traffic, sales = [], []
+    for area_id in (1, 2):
+        for offset in range(DAYS):
+            day = START + timedelta(days=offset)
+            for hour in range(24):
+                foot_traffic.append({
+                    "area_id": area_id, "date": day, "day_of_week": day.weekday(), "hour": hour,
+                    "foot_traffic_count": 100 * area_id + hour, "male_count": 50, "female_count": 50,
+                    "dwell_time_avg": 30.0
+                })
+            for business_type, amount in (("식음료업", 1_000_000), ("소매업", 500_000)):
+                sales.append({
+                    "area_id": area_id, "date": day, "business_type": business_type,
+                    "total_sales": amount * area_id, "transaction_count": 100, "avg_transaction_amount": amount / 100,
+                    "age_20s_sales": amount // 2, "male_sales": amount // 2, "female_sales": amount // 2
+                })
+    db.session.execute(insert(FootTrafficData.__table__), foot_traffic)
+    db.session.execute(insert(SalesData.__table__), sales)
+    db.session.commit()
+
+def _query_plans(run):
+    """run() 동안 실행된 SELECT 문마다 EXPLAIN QUERY PLAN 결과를 수집"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    engine = db.engine
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        run()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    plans = []
+    connection = db.session.connection().connection.driver_connection
+    for statement, parameters in statements:
+        rows = connection.execute(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+        plans.append(" | ".join(row[-1] for row in rows))
+    return plans
+
+def test_foot_traffic_aggregates(app):
+    service = AnalyticsQueryService()
+    end = START + timedelta(days=4)
+
+    by_hour = service.foot_traffic_by_hour(1, START, end)
+    assert [row["hour"] for row in by_hour] == list(range(24))
+    assert by_hour[9]["total_count"] == 5 * 109
+    assert by_hour[9]["days"] == 5
+
+    daily = service.foot_traffic_daily(2, START, end)
+    assert len(daily) == 5
+    assert daily[0]["total_count"] == sum(200 + hour for hour in range(24))
+
+    summary = service.foot_traffic_summary(1, START, end)
+    assert summary["days"] == 5
+    assert summary["male_count"] == 50 * 24 * 5
+
+def test_sales_aggregates(app):
+    service = AnalyticsQueryService()
+    end = START + timedelta(days=DAYS - 1)
+
+    by_type = service.sales_by_business_type(2, START, end)
+    assert [row["business_type"] for row in by_type] == ["식음료업", "소매업"]
+    assert by_type[0]["total_sales"] == 2_000_000 * DAYS
+
+    daily = service.sales_daily(1, "소매업", START, START + timedelta(days=2))
+    assert [row["total_sales"] for row in daily] == [500_000] * 3
+
+    summary = service.sales_summary(1, "식음료업", START, end)
+    assert summary["avg_transaction_amount"] == 10_000.0
+    assert summary["age_20s_sales"] == 500_000 * DAYS
+
+def test_queries_use_composite_indexes(app):
+    service = AnalyticsQueryService()
+    end = START + timedelta(days=4)
+
+    foot_traffic_plans = _query_plans(lambda: (
+        service.foot_traffic_by_hour(1, START, end),
+        service.foot_traffic_daily(1, START, end),
+        service.foot_traffic_summary(1, START, end)
+    ))
+    assert len(foot_traffic_plans) == 3
+    for plan in foot_traffic_plans:
+        assert "USING INDEX ix_foot_traffic_area_date_hour (area_id=? AND date>? AND date<?)" in plan, plan
+
+    sales_plans = _query_plans(lambda: (
+        service.sales_daily(1, "식음료업", START, end),
+        service.sales_summary(1, "식음료업", START, end),
+        service.sales_by_business_type(1, START, end)
+    ))
+    assert len(sales_plans) == 3
+    for plan in sales_plans[:2]:
+        assert "USING INDEX ix_sales_area_business_date (area_id=? AND business_type=? AND date>? AND date<?)" in plan, plan
+    # 업종별 집계는 area_id 접두사로 범위를 좁히고 인덱스 순서로 그룹화 (임시 정렬 없음)
+    assert "USING INDEX ix_sales_area_business_date (area_id=?)" in sales_plans[2], sales_plans[2]
+    assert "TEMP B-TREE" not in sales_plans[2], sales_plans[2]
+
+def test_rollups_backfill_and_incremental_insert(app):
+    service = AnalyticsQueryService()
+    end = START + timedelta(days=DAYS - 1)
+    rollups.backfill(db.session.connection())
+    db.session.commit()
+
+    monthly = service.monthly_sales(1, "식음료업")
+    assert monthly == [dict(month="2024-01", **{
+        key: value for key, value in service.sales_summary(1, "식음료업", START, end).items()
+        if key not in ("avg_transaction_amount", "days")
+    })]
+    assert service.monthly_sales(1)[0]["total_sales"] == 1_500_000 * DAYS
+    traffic = service.monthly_foot_traffic(2)
+    assert traffic[0]["total_count"] == service.foot_traffic_summary(2, START, end)["total_count"]
+    assert traffic[0]["avg_dwell_time"] == 30.0
+
+    # ORM으로 추가한 행은 같은 커밋에서 일별/월별 집계에 더해짐
+    db.session.add(SalesData(area_id=1, date=date(2024, 2, 1), business_type="식음료업", total_sales=300,
+                             transaction_count=3, avg_transaction_amount=100.0))
+    db.session.add(SalesData(area_id=1, date=START, business_type="식음료업", total_sales=700,
+                             transaction_count=7, avg_transaction_amount=100.0))
+    db.session.commit()
+
+    monthly = service.monthly_sales(1, "식음료업")
+    assert [row["month"] for row in monthly] == ["2024-01", "2024-02"]
+    assert monthly[0]["total_sales"] == 1_000_000 * DAYS + 700
+    assert monthly[1]["transaction_count"] == 3
+    assert service.monthly_sales(1, "식음료업", months=1) == monthly[1:]
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Swagger 스펙 사전 생성 테스트
+SWAGGER_MODE=static에서 live와 같은 스펙을 gzip/ETag와 함께 응답하고 If-None-Match면 304,
+덤프한 파일을 그대로 사용하며 off면 404인지 확인
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import gzip
+import json
+
+from app import create_app
+from config import Config
+
+SPEC_URL = "/api/v1/swagger.json"
+
+def _app(tmp_path, mode, spec_path=None):
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'spec.db'}"
+        RESULT_CACHE_ENABLED = False
+        SWAGGER_MODE = mode
+        SWAGGER_SPEC_PATH = spec_path
+
+    return create_app(TestConfig, components=["auth"])
+
+def test_static_spec_matches_live_with_etag_and_gzip(tmp_path):
+    live = _app(tmp_path, "live").test_client().get(SPEC_URL).get_json()
+
+    client = _app(tmp_path, "static").test_client()
+    response = client.get(SPEC_URL)
+    assert response.status_code == 200
+    assert response.get_json() == live
+    etag = response.headers["ETag"]
+
+    response = client.get(SPEC_URL, headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(response.data)) == live
+    assert response.headers["ETag"] == etag
+
+    response = client.get(SPEC_URL, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.data == b""
+
+def test_static_spec_uses_dumped_file(tmp_path):
+    spec_path = tmp_path / "swagger.json"
+    app = _app(tmp_path, "live", str(spec_path))
+    # flask CLI는 앱 컨텍스트 안에서 명령을 실행함
+    with app.app_context():
+        result = app.test_cli_runner().invoke(args=["openapi", "dump"])
+    assert result.exit_code == 0, result.output
+    assert json.loads(spec_path.read_bytes()) == app.test_client().get(SPEC_URL).get_json()
+
+    # 덤프 파일을 바꾸면 static 모드는 스펙을 다시 만들지 않고 파일 내용을 응답
+    spec_path.write_text(json.dumps({"swagger": "2.0", "paths": {}}), encoding="utf-8")
+    response = _app(tmp_path, "static", str(spec_path)).test_client().get(SPEC_URL)
+    assert response.get_json() == {"swagger": "2.0", "paths": {}}
+
+def test_off_mode_hides_spec(tmp_path):
+    assert _app(tmp_path, "off").test_client().get(SPEC_URL).status_code == 404
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+APP_ROLE 컴포넌트 구성 테스트
+auth 티어는 인증/관리 API만 등록하고 pandas와 분석 서비스를 불러오지 않으며,
+분석 블루프린트의 서비스는 첫 사용 시점에 생성되는지 확인
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import subprocess
+
+import pytest
+
+from app import COMPONENTS, create_app
+from config import Config
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def _config(tmp_path, role):
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'role.db'}"
+        RESULT_CACHE_ENABLED = False
+        APP_ROLE = role
+    return TestConfig
+
+def test_auth_role_registers_only_auth_components(tmp_path):
+    app = create_app(_config(tmp_path, "auth"))
+    assert app.config["REGISTERED_COMPONENTS"] == ["auth", "admin"]
+    rules = {rule.rule for rule in app.url_map.iter_rules()}
+    assert any(rule.startswith("/api/v1/sodam/auth/") for rule in rules)
+    assert not any(rule.startswith("/api/v1/market-diagnosis") for rule in rules)
+    assert app.test_client().get("/api/v1/market-diagnosis/markets").status_code == 404
+    # sodam 네임스페이스의 상권/진단 경로도 등록하지 않음
+    assert not any(rule.startswith(("/api/v1/sodam/core-diagnosis", "/api/v1/sodam/market-diagnosis")) for rule in rules)
+    client = app.test_client()
+    assert client.post("/api/v1/sodam/core-diagnosis/health-score/DJ001", json={"industry": "식음료업"}).status_code == 404
+    assert client.get("/api/v1/sodam/core-diagnosis/foot-traffic/DJ001").status_code == 404
+    assert client.get("/api/v1/sodam/markets").status_code == 404
+    assert "/api/v1/sodam/core-diagnosis/health-score/<string:market_code>" in {
+        rule.rule for rule in create_app(_config(tmp_path, "full")).url_map.iter_rules()}
+
+def test_full_role_and_unknown_role(tmp_path):
+    assert create_app(_config(tmp_path, "full")).config["REGISTERED_COMPONENTS"] == list(COMPONENTS)
+    with pytest.raises(ValueError):
+        create_app(_config(tmp_path, "analytics-only"))
+
+def _run(code: str) -> str:
+    # 이미 import 된 모듈이 없는 새 인터프리터에서 확인
+    env = dict(os.environ, APP_ROLE="auth", PRELOAD_DATASETS="false")
+    return subprocess.run([sys.executable, "-c", code], cwd=BASE_DIR, env=env, check=True,
+                          capture_output=True, text=True).stdout.strip()
+
+def test_auth_role_does_not_import_analytics_stack():
+    output = _run(
+        "import sys\n"
+        "from app import create_app\n"
+        "create_app()\n"
+        "print(sorted(name for name in ('pandas', 'numpy', 'services.data_loader') if name in sys.modules))"
+    )
+    assert output.splitlines()[-1] == "[]"
+
+def test_blueprint_services_are_created_on_first_use():
+    output = _run(
+        "import sys\n"
+        "from blueprints import scoring\n"
+        "print('services.scoring_service' in sys.modules)\n"
+        "repr(scoring.scoring_service)\n"
+        "scoring.scoring_service.calculate_market_score\n"
+        "print('services.scoring_service' in sys.modules)"
+    )
+    assert output.splitlines()[-2:] == ["False", "True"]
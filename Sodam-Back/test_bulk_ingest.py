@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+CSV 일괄 적재 재개 테스트
+청크 삽입과 체크포인트가 한 트랜잭션이라 어느 시점에 중단되어도 재실행 시 행이 중복되지 않고,
+적재 후 결과 캐시를 비우는지 확인
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from sqlalchemy import func, select
+
+from app import create_app
+from config import Config
+from extensions import db
+from models import CommercialArea, FootTrafficData, FootTrafficMonthlyRollup, IngestCheckpoint
+from services import bulk_ingest, result_cache
+
+ROWS = 25
+
+@pytest.fixture
+def app(tmp_path):
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'ingest.db'}"
+        RESULT_CACHE_ENABLED = False
+
+    app = create_app(TestConfig, components=["admin"])
+    with app.app_context():
+        db.create_all(bind_key=None)
+        db.session.add(CommercialArea(id=1, area_code="DJ001", area_name="동구 전통시장", address="대전 동구",
+                                      latitude=36.306, longitude=127.456))
+        db.session.commit()
+        yield app
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "foot_traffic.csv"
+    lines = ["area_code,date,hour,foot_traffic_count"]
+    lines += [f"DJ001,2024-01-{day:02d},12,100" for day in range(1, ROWS + 1)]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+def _counts():
+    return (db.session.execute(select(func.count()).select_from(FootTrafficData)).scalar(),
+            db.session.execute(select(func.sum(FootTrafficMonthlyRollup.total_count))).scalar())
+
+def test_resume_after_crash_does_not_duplicate_rows(app, csv_path, monkeypatch):
+    write_checkpoint = bulk_ingest._write_checkpoint
+    writes = []
+
+    def crash_on_third_chunk(connection, name, checkpoint):
+        writes.append(checkpoint["rows"])
+        write_checkpoint(connection, name, checkpoint)
+        if len(writes) == 3:
+            # 청크 삽입과 체크포인트 기록 뒤, 커밋 전에 중단
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(bulk_ingest, "_write_checkpoint", crash_on_third_chunk)
+    with pytest.raises(KeyboardInterrupt):
+        bulk_ingest.ingest_csv(db.engine, "foot-traffic", csv_path, chunk_size=10)
+    assert _counts() == (20, 2000)
+    assert db.session.execute(select(IngestCheckpoint.rows)).scalar() == 20
+
+    monkeypatch.setattr(bulk_ingest, "_write_checkpoint", write_checkpoint)
+    stats = bulk_ingest.ingest_csv(db.engine, "foot-traffic", csv_path, chunk_size=10)
+    assert (stats["resumed_from"], stats["rows"]) == (20, 5)
+    assert _counts() == (ROWS, ROWS * 100)
+    # 완료되면 체크포인트 행 삭제
+    assert db.session.execute(select(func.count()).select_from(IngestCheckpoint)).scalar() == 0
+
+def test_ingest_clears_result_caches(app, csv_path, monkeypatch):
+    cleared = []
+    monkeypatch.setattr(result_cache, "clear_all", lambda: cleared.append(True))
+    bulk_ingest.ingest_csv(db.engine, "foot-traffic", csv_path, chunk_size=10)
+    assert cleared
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+사업체 생존/폐업 분석 테스트
+벡터화 Kaplan-Meier가 그룹별 단순 계산과 같은지, business_data 개업/폐업 이력으로
+상권 창업·폐업 비율과 업종별 생존율/폐업율 API가 계산되는지 확인
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+from sqlalchemy import insert
+
+from app import create_app
+from config import Config
+from extensions import db
+from models import BusinessData, CommercialArea
+from services import business_survival
+from services.core_diagnosis_service import CoreDiagnosisService
+
+AS_OF = date(2024, 6, 30)
+
+def _naive_km(durations, events, time):
+    survival = 1.0
+    for t in sorted(set(durations[events])):
+        if t > time:
+            break
+        at_risk = (durations >= t).sum()
+        survival *= 1 - (events & (durations == t)).sum() / at_risk
+    return survival
+
+def test_kaplan_meier_matches_naive():
+    rng = np.random.default_rng(49)
+    groups = rng.integers(0, 7, 3000)
+    durations = rng.integers(0, 2000, 3000)
+    events = rng.random(3000) < 0.4
+    times = np.array([0, 365, 1095, 1826])
+
+    estimate = business_survival.kaplan_meier(groups, durations, events, 7, times)
+    for group in range(7):
+        mask = groups == group
+        for column, time in enumerate(times):
+            expected = _naive_km(durations[mask], events[mask], time)
+            assert estimate["survival"][group, column] == pytest.approx(expected)
+            assert estimate["at_risk"][group, column] == (durations[mask] >= time).sum()
+
+@pytest.fixture
+def app(tmp_path):
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'survival.db'}"
+        RESULT_CACHE_ENABLED = False
+        SURVIVAL_VERSION_CHECK = 0
+
+    app = create_app(TestConfig, components=["core_diagnosis", "industry_analysis"])
+    with app.app_context():
+        db.create_all(bind_key=None)
+        db.session.add_all([
+            CommercialArea(id=1, area_code="DJ001", area_name="동구 전통시장", address="대전 동구", latitude=36.306, longitude=127.456),
+            CommercialArea(id=2, area_code="DJ006", area_name="동구 역 상권", address="대전 동구", latitude=36.33, longitude=127.43),
+        ])
+        db.session.commit()
+        yield app
+    business_survival.clear()
+
+def _add(rows):
+    db.session.execute(insert(BusinessData.__table__), [
+        {"area_id": area_id, "business_type": business_type, "business_name": "가게", "address": "대전",
+         "latitude": 36.3, "longitude": 127.4, "status": "closed" if closed_days is not None else "active",
+         "opened_date": AS_OF - timedelta(days=opened_days),
+         "closed_date": AS_OF - timedelta(days=closed_days) if closed_days is not None else None}
+        for area_id, business_type, opened_days, closed_days in rows
+    ])
+    db.session.commit()
+
+def test_rates_from_business_history(app):
+    _add([
+        # DJ001 식음료업: 1년 전 영업 중 4곳 중 1곳 폐업, 최근 1년 개업 1곳
+        (1, "식음료업", 1500, None), (1, "식음료업", 1500, None), (1, "식음료업", 1500, None),
+        (1, "식음료업", 1500, 1300), (1, "식음료업", 1500, 100), (1, "식음료업", 100, None),
+        (2, "소매업", 800, None), (2, "소매업", 800, 500),
+    ])
+
+    result = CoreDiagnosisService().get_business_rates_analysis("DJ001")
+    assert result["source"] == "business_data"
+    assert result["sample_size"] == 6
+    assert (result["startup_rate"], result["closure_rate"]) == (25.0, 25.0)
+    # 1년 생존: 1500일 전 개업 5곳 중 200일 만에 1곳 폐업
+    assert result["survival_rate"] == 80.0
+    assert result["closure_rates"] == {"1year": 20.0, "3year": 20.0, "5year": None}
+
+    client = app.test_client()
+    survival = client.get("/api/v1/industry-analysis/survival-rates?period=1year").get_json()["data"]
+    # 관측 종료일 = 가장 늦은 개업/폐업일
+    assert survival["source"] == "business_data"
+    assert survival["last_updated"] == (AS_OF - timedelta(days=100)).isoformat()
+    rates = {rate["industry"]: rate for rate in survival["survival_rates"]}
+    assert rates["식음료업"]["survival_rate"] == 80.0 and rates["식음료업"]["sample_size"] == 6
+    assert rates["소매업"]["survival_rate"] == 50.0
+
+    closure = client.get("/api/v1/industry-analysis/closure-rates?period=3year&market_code=DJ006").get_json()["data"]
+    # DJ006은 관측 기간(800일)이 3년보다 짧음
+    assert closure["closure_rates"] == []
+    closure = client.get("/api/v1/industry-analysis/closure-rates?industry=식음료&period=3year").get_json()["data"]
+    assert [(rate["industry"], rate["closure_rate"], rate["risk_level"]) for rate in closure["closure_rates"]] == [("식음료업", 20.0, "LOW")]
+
+def test_falls_back_without_business_data(app):
+    result = CoreDiagnosisService().get_business_rates_analysis("DJ001")
+    assert "source" not in result
+    survival = app.test_client().get("/api/v1/industry-analysis/survival-rates").get_json()["data"]
+    assert "source" not in survival and len(survival["survival_rates"]) == 10
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+상권 목록/상세/분석 API 쿼리 수 테스트
+상권과 관계 행 수가 늘어도 요청당 쿼리 수가 일정한지(N+1 없음) X-Query-Count 헤더로 확인하고,
+엔드포인트 상한(query_budget)을 넘으면 QUERY_BUDGET_STRICT에서 예외가 발생하는지 확인
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from datetime import date
+
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.exc import InvalidRequestError
+
+from app import create_app
+from config import Config
+from extensions import db
+from models import BusinessData, CommercialArea, FootTrafficMonthlyRollup, RiskAnalysis, SalesMonthlyRollup
+from services import commercial_areas
+from services.query_counter import QueryBudgetExceeded, query_budget
+
+AREAS = 30
+
+@pytest.fixture
+def app(tmp_path):
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'areas.db'}"
+        RESULT_CACHE_ENABLED = False
+        TESTING = True
+        QUERY_COUNT_HEADER = True
+        QUERY_BUDGET_STRICT = True
+
+    app = create_app(TestConfig, components=["market_diagnosis"])
+    with app.app_context():
+        db.create_all(bind_key=None)
+        _seed()
+        yield app
+
+def _seed():
+    db.session.execute(insert(CommercialArea.__table__), [
+        {"id": area_id, "area_code": f"DJ{area_id:03d}", "area_name": f"상권 {area_id}", "address": "대전",
+         "latitude": 36.35, "longitude": 127.38}
+        for area_id in range(1, AREAS + 1)
+    ])
+    db.session.execute(insert(BusinessData.__table__), [
+        {"area_id": area_id, "business_type": business_type, "business_name": "가게", "address": "대전",
+         "latitude": 36.35, "longitude": 127.38, "status": status}
+        for area_id in range(1, AREAS + 1)
+        for business_type, status in (("식음료업", "active"), ("식음료업", "closed"), ("소매업", "new"))
+    ])
+    db.session.execute(insert(RiskAnalysis.__table__), [
+        {"area_id": area_id, "business_type": business_type, "risk_type": "성장잠재형", "risk_score": 30.0,
+         "health_score": 70.0, "analysis_data": {}}
+        for area_id in range(1, AREAS + 1) for business_type in ("전체", "식음료업")
+    ])
+    db.session.execute(insert(FootTrafficMonthlyRollup.__table__), [
+        {"area_id": 1, "month": date(2024, month, 1), "total_count": 1000 * month, "dwell_time_sum": 300.0, "row_count": 10}
+        for month in range(1, 13)
+    ])
+    db.session.execute(insert(SalesMonthlyRollup.__table__), [
+        {"area_id": 1, "business_type": business_type, "month": date(2024, month, 1), "total_sales": 100, "transaction_count": 1}
+        for month in range(1, 13) for business_type in ("식음료업", "소매업")
+    ])
+    db.session.commit()
+
+def test_query_counts_do_not_grow_with_rows(app):
+    client = app.test_client()
+
+    response = client.get("/api/v1/market-diagnosis/areas?limit=100")
+    assert response.headers["X-Query-Count"] == "2"
+    assert response.get_json()["data"]["pagination"]["total"] == AREAS
+
+    response = client.get("/api/v1/market-diagnosis/areas/DJ001")
+    assert response.headers["X-Query-Count"] == "3"
+    detail = response.get_json()["data"]
+    assert detail["business_summary"] == {
+        "total": 3, "active": 2, "closed": 1,
+        "by_type": {"소매업": {"active": 1, "closed": 0}, "식음료업": {"active": 1, "closed": 1}}
+    }
+    assert [risk["business_type"] for risk in detail["risk_summary"]] == ["식음료업", "전체"]
+
+    response = client.get("/api/v1/market-diagnosis/areas/DJ001/analytics?months=6")
+    assert response.headers["X-Query-Count"] == "3"
+    analytics = response.get_json()["data"]
+    assert [row["month"] for row in analytics["foot_traffic"]] == [f"2024-{month:02d}" for month in range(7, 13)]
+    assert analytics["sales"][-1]["total_sales"] == 200
+
+    assert client.get("/api/v1/market-diagnosis/areas/XX999").status_code == 404
+
+def test_list_profile_does_not_lazy_load(app):
+    area = db.session.execute(select(CommercialArea).options(*commercial_areas.LIST)).scalars().first()
+    with pytest.raises(InvalidRequestError):
+        area.business_data
+
+def test_budget_exceeded_fails_in_strict_mode(app):
+    @query_budget(2)
+    def lazy_areas():
+        # 상권마다 사업체를 지연 로딩 (N+1)
+        areas = db.session.execute(select(CommercialArea)).scalars().all()
+        return {"businesses": sum(len(area.business_data) for area in areas)}
+
+    app.add_url_rule("/test/lazy-areas", view_func=lazy_areas)
+    with pytest.raises(QueryBudgetExceeded):
+        app.test_client().get("/test/lazy-areas")
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+경쟁 사업체 밀도 테스트
+상권 경계 다각형(benchmarks/fixtures 상권 CSV)과 CommercialArea 반경 안의 영업 중 사업체 수,
+지역구 분포 대비 백분위, 데이터 버전이 바뀔 때만 밀도 표를 다시 계산하는지 확인
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from sqlalchemy import insert
+
+from app import create_app
+from config import Config
+from extensions import db
+from models import BusinessData, CommercialArea
+from services import competitor_density
+from services.core_diagnosis_service import CoreDiagnosisService
+from services.data_loader import DataLoader
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks", "fixtures")
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'competition.db'}"
+        RESULT_CACHE_ENABLED = False
+        COMPETITION_VERSION_CHECK = 0
+
+    monkeypatch.setenv("SODAM_DATA_DIR", FIXTURES)
+    monkeypatch.setattr(DataLoader, "get_district_population", lambda self: {"동구": 200000})
+
+    app = create_app(TestConfig, components=["core_diagnosis"])
+    with app.app_context():
+        db.create_all(bind_key=None)
+        db.session.add_all([
+            CommercialArea(id=1, area_code="DJ001", area_name="동구 전통시장", address="대전 동구", latitude=36.306, longitude=127.456),
+            CommercialArea(id=2, area_code="DJ006", area_name="동구 역 상권", address="대전 동구", latitude=36.33, longitude=127.43),
+            CommercialArea(id=3, area_code="DB900", area_name="반경 상권", address="대전", latitude=36.40, longitude=127.30, radius=300),
+        ])
+        db.session.commit()
+        yield app
+    competitor_density.clear()
+
+def _center(market_code):
+    coordinates = DataLoader().get_market_by_code(market_code)["coordinates"]
+    return (sum(coord["lat"] for coord in coordinates) / len(coordinates),
+            sum(coord["lng"] for coord in coordinates) / len(coordinates))
+
+def _add(rows):
+    db.session.execute(insert(BusinessData.__table__), [
+        {"area_id": area_id, "business_type": business_type, "business_name": "가게", "address": "대전",
+         "latitude": lat, "longitude": lng, "status": status}
+        for area_id, (lat, lng), business_type, status in rows
+    ])
+    db.session.commit()
+
+def test_density_from_business_locations(app):
+    dj001, dj006 = _center("DJ001"), _center("DJ006")
+    _add([
+        (1, dj001, "식음료업", "active"), (1, dj001, "식음료업", "new"), (1, dj001, "식음료업", "active"),
+        (1, dj001, "식음료업", "closed"), (1, dj001, "소매업", "active"),
+        (2, dj006, "식음료업", "active"),
+        (3, (36.401, 127.30), "식음료업", "active"), (3, (36.41, 127.30), "식음료업", "active"),  # 약 110m, 1.1km
+    ])
+
+    result = CoreDiagnosisService().get_same_industry_analysis("DJ001", "식음료")
+    assert result["source"] == "business_data"
+    assert (result["business_type"], result["business_count"], result["total_businesses"]) == ("식음료업", 3, 4)
+    assert result["industry_ratio"] == 75.0
+    assert result["density_per_km2"] == pytest.approx(3 / result["area_km2"], rel=1e-3)
+    # 동구 상권 4곳 중 DJ001 밀도가 가장 높음 (나머지 DJ006 > DJ011 = DJ016 = 0)
+    assert result["density_percentile"] == 87.5
+    assert (result["competition_level"], result["grade"]) == ("매우 높음", "D")
+    assert result["district_stats"]["market_count"] == 4
+    assert result["district_stats"]["business_count"] == 4
+    assert result["district_stats"]["per_10k_residents"] == 0.2
+
+    breakdown = CoreDiagnosisService().get_same_industry_analysis("DJ001")
+    assert breakdown["industry_breakdown"] == {"소매업": 1, "식음료업": 3}
+
+    radius = competitor_density.market_competition("DB900", "식음료업")
+    assert radius["business_count"] == 1
+    assert radius["district"] is None and radius["density_percentile"] is None
+
+def test_table_rebuilt_only_when_data_changes(app, monkeypatch):
+    builds = []
+    original = competitor_density.build
+
+    def counting(version=None):
+        builds.append(version)
+        return original(version)
+
+    monkeypatch.setattr(competitor_density, "build", counting)
+    dj001 = _center("DJ001")
+    _add([(1, dj001, "식음료업", "active")])
+
+    assert competitor_density.market_competition("DJ001", "식음료업")["business_count"] == 1
+    assert competitor_density.market_competition("DJ001", "식음료업")["business_count"] == 1
+    assert len(builds) == 1
+
+    # 폐업 처리도 버전을 바꿈
+    db.session.get(BusinessData, 1).status = "closed"
+    db.session.commit()
+    assert competitor_density.market_competition("DJ001", "식음료업") is None
+    _add([(1, dj001, "식음료업", "active"), (1, dj001, "식음료업", "active")])
+    assert competitor_density.market_competition("DJ001", "식음료업")["business_count"] == 2
+    assert len(builds) == 3
+
+def test_falls_back_without_business_data(app):
+    result = CoreDiagnosisService().get_same_industry_analysis("DJ001", "식음료")
+    assert "source" not in result
+    assert result["industry"] == "식음료"
+
+def test_health_score_for_all_industries(app):
+    dj001 = _center("DJ001")
+    _add([(1, dj001, "식음료업", "active"), (1, dj001, "소매업", "active")])
+
+    result = CoreDiagnosisService().calculate_health_score("DJ001", industry="전체")
+    assert "error" not in result
+    specific = CoreDiagnosisService().calculate_health_score("DJ001", industry="식음료업")
+    assert "error" not in specific
+
+    response = app.test_client().post("/api/v1/sodam/core-diagnosis/health-score/DJ001", json={"industry": "전체"})
+    assert response.status_code == 200
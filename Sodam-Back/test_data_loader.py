@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+데이터셋 캐시 메모리 테스트
+preload 후 공유 배열(memmap)로 옮긴 데이터(관광 소비 전체, 상권 경계 좌표)가 데이터프레임 캐시에서 해제되고,
+해제 후에도 조회 결과가 CSV 원본과 같은지 확인
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pytest
+
+from services import shared_arrays
+from services.data_loader import DataLoader
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks", "fixtures")
+REGION = "대전광역시"
+DISTRICT = "유성구"
+
+@pytest.fixture
+def loader(tmp_path, monkeypatch):
+    monkeypatch.setattr(shared_arrays, "store", shared_arrays.SharedArrayStore(str(tmp_path / "arrays")))
+    loader = DataLoader(FIXTURES)
+    loader.clear_cache()
+    yield loader
+    loader.clear_cache()
+
+def test_preload_releases_frames_backed_by_shared_arrays(loader):
+    markets = loader.load_market_data()
+    expected_markets = markets[markets['district_name'] == DISTRICT].to_dict('records')
+    tourism = loader.load_tourism_consumption()
+    expected_trend = tourism[(tourism['region'] == REGION) & (tourism['category'] == '관광총소비')].tail(12).to_dict('records')
+
+    loader.preload()
+
+    assert 'tourism_consumption' not in loader._cache
+    assert 'coordinates' not in loader.load_market_data().columns
+    assert isinstance(loader._cache['market_index']['points'], np.memmap)
+    assert isinstance(loader._cache['tourism_index']['consumption_amount'], np.memmap)
+
+    assert expected_markets
+    assert loader.get_markets_by_district(DISTRICT) == expected_markets
+    assert loader.get_tourism_trend(REGION) == expected_trend
+    first = expected_markets[0]
+    assert loader.get_market_by_code(first['market_code'])['coordinates'] == first['coordinates']
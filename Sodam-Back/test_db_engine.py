@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+DB 엔진 프로파일 테스트
+SQLite 프로파일의 연결별 PRAGMA 적용(메모리 DB는 WAL/mmap 제외), auto 판단,
+server 프로파일의 풀 옵션과 복제본 bind 옵션, 직접 지정한 엔진 옵션 우선 여부를 확인
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from flask import Flask
+from sqlalchemy import text
+
+from app import create_app
+from config import Config
+from extensions import REPLICA_BIND, db
+from services import db_engine
+
+def _pragmas(app, names):
+    with app.app_context():
+        with db.engine.connect() as connection:
+            return {name: connection.execute(text(f"PRAGMA {name}")).scalar() for name in names}
+
+def _app(uri, profile="auto"):
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = uri
+        RESULT_CACHE_ENABLED = False
+        DB_ENGINE_PROFILE = profile
+        SQLITE_CACHE_SIZE_MB = 32
+
+    return create_app(TestConfig, components=["admin"])
+
+def test_sqlite_profile_applies_pragmas(tmp_path):
+    app = _app(f"sqlite:///{tmp_path / 'pragmas.db'}")
+    assert app.config["DB_ENGINE_PROFILE_RESOLVED"] == "sqlite"
+    assert _pragmas(app, ("journal_mode", "synchronous", "busy_timeout", "cache_size", "temp_store", "mmap_size")) == {
+        "journal_mode": "wal", "synchronous": 1, "busy_timeout": 5000, "cache_size": -32 * 1024,
+        "temp_store": 2, "mmap_size": 256 * 1024 * 1024
+    }
+
+def test_memory_database_skips_wal_and_mmap():
+    app = _app("sqlite://")
+    pragmas = _pragmas(app, ("journal_mode", "mmap_size", "synchronous"))
+    assert pragmas["journal_mode"] == "memory"
+    assert not pragmas["mmap_size"]
+    assert pragmas["synchronous"] == 1
+
+def test_none_profile_keeps_sqlite_defaults(tmp_path):
+    app = _app(f"sqlite:///{tmp_path / 'defaults.db'}", profile="none")
+    assert _pragmas(app, ("journal_mode", "synchronous", "temp_store")) == {
+        "journal_mode": "delete", "synchronous": 2, "temp_store": 0}
+
+def _configure(**config):
+    app = Flask(__name__)
+    app.config.from_object(Config)
+    app.config.update(config)
+    db_engine.configure(app)
+    return app.config
+
+def test_server_profile_pool_options():
+    config = _configure(SQLALCHEMY_DATABASE_URI="postgresql://sodam@db/sodam", DB_POOL_SIZE=8,
+                        SQLALCHEMY_ENGINE_OPTIONS={"pool_recycle": 60},
+                        DATABASE_REPLICA_URL="postgresql://sodam@replica/sodam")
+    assert config["DB_ENGINE_PROFILE_RESOLVED"] == "server"
+    options = config["SQLALCHEMY_ENGINE_OPTIONS"]
+    assert options["pool_size"] == 8
+    assert options["pool_recycle"] == 60  # 직접 지정한 값 우선
+    assert config["SQLALCHEMY_BINDS"][REPLICA_BIND] == dict(options, url="postgresql://sodam@replica/sodam")
+
+def test_unknown_profile():
+    with pytest.raises(ValueError):
+        _configure(DB_ENGINE_PROFILE="fast")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+읽기/쓰기 세션 라우팅 테스트
+주 DB와 복제본을 두 개의 SQLite 파일로 두고, 복제본에는 다른 값(복제 지연)을 넣어
+조회가 어느 쪽에서 실행되었는지 확인
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from datetime import date
+
+import pytest
+from sqlalchemy import insert, select
+
+from app import create_app
+from config import Config
+from extensions import REPLICA_BIND, db, read_your_writes, replica_reads
+from models import CommercialArea, SalesData
+from services.analytics_query_service import AnalyticsQueryService
+
+DAY = date(2024, 1, 1)
+
+def _seed(connection, total_sales):
+    connection.execute(insert(CommercialArea.__table__), [{
+        "id": 1, "area_code": "DJ001", "area_name": "DJ001", "address": "대전", "latitude": 36.35, "longitude": 127.38
+    }])
+    connection.execute(insert(SalesData.__table__), [{
+        "area_id": 1, "date": DAY, "business_type": "식음료업", "total_sales": total_sales,
+        "transaction_count": 10, "avg_transaction_amount": total_sales / 10
+    }])
+
+@pytest.fixture
+def app(tmp_path):
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'primary.db'}"
+        DATABASE_REPLICA_URL = f"sqlite:///{tmp_path / 'replica.db'}"
+        RESULT_CACHE_ENABLED = False
+
+    app = create_app(TestConfig, components=["admin"])
+    with app.app_context():
+        db.create_all()
+        db.metadata.create_all(db.engines[REPLICA_BIND])
+        with db.engines[None].begin() as connection:
+            _seed(connection, 1000)
+        with db.engines[REPLICA_BIND].begin() as connection:
+            _seed(connection, 900)
+    return app
+
+def _total_sales():
+    return AnalyticsQueryService().sales_summary(1, "식음료업", DAY, DAY)["total_sales"]
+
+def test_service_reads_use_replica(app):
+    with app.test_request_context():
+        assert _total_sales() == 900
+        # 범위 밖 조회와 FOR UPDATE는 주 DB
+        assert db.session.execute(select(SalesData.total_sales)).scalar() == 1000
+        with replica_reads():
+            assert db.session.execute(select(SalesData.total_sales)).scalar() == 900
+            assert db.session.execute(select(SalesData.total_sales).with_for_update()).scalar() == 1000
+
+def test_write_pins_request_to_primary(app):
+    with app.test_request_context():
+        assert _total_sales() == 900
+        db.session.add(SalesData(area_id=1, date=DAY, business_type="식음료업", total_sales=50,
+                                 transaction_count=1, avg_transaction_amount=50.0))
+        # 커밋 전(보류 중인 변경)과 커밋 후 모두 자신이 쓴 값을 읽음
+        assert _total_sales() == 1050
+        db.session.commit()
+        assert _total_sales() == 1050
+
+    # 다음 요청은 다시 복제본
+    with app.test_request_context():
+        assert _total_sales() == 900
+
+def test_read_your_writes_override(app):
+    with app.test_request_context():
+        read_your_writes()
+        assert _total_sales() == 1000
+
+def test_without_replica_reads_use_primary(tmp_path):
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'primary.db'}"
+        RESULT_CACHE_ENABLED = False
+
+    app = create_app(TestConfig, components=["admin"])
+    with app.app_context():
+        # 앞선 테스트에서 등록된 replica 메타데이터는 이 앱에 엔진이 없으므로 기본 bind만 생성
+        db.create_all(bind_key=None)
+        with db.engines[None].begin() as connection:
+            _seed(connection, 1000)
+    with app.test_request_context():
+        assert _total_sales() == 1000
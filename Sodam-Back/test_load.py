@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+부하 테스트 스크립트(benchmarks/load.py) 테스트
+흐름 조합 파싱, 같은 시드의 요청 순서 재현, 가중치 비율, 백분위수 집계를 확인하고
+프로세스 내부 앱을 짧게 실행해 모든 흐름이 에러 없이 보고되는지 확인
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import json
+import subprocess
+import time
+from collections import Counter
+
+import pytest
+
+BENCH_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks")
+sys.path.append(BENCH_DIR)
+
+import load  # noqa: E402
+
+class RecordingClient:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def request(self, method, path, body):
+        self.calls.append((method, path, json.dumps(body, sort_keys=True, ensure_ascii=False)))
+        return 200, b"{}"
+
+def _run_worker(flows, seed, seconds=0.05):
+    calls = []
+    recorder = load.Recorder()
+    load.worker(lambda: RecordingClient(calls), flows, ["DJ001", "DJ002"], time.perf_counter() + seconds,
+                recorder, seed, 0.0)
+    return calls, recorder
+
+def test_parse_mix():
+    assert [flow.name for flow in load.parse_mix(None)] == [
+        "login", "market_list", "health_score", "comprehensive", "risk_classify", "strategy_generate", "recommendations"]
+    assert {flow.name: flow.weight for flow in load.parse_mix("write")} == {"login": 20, "health_score": 20, "register": 60}
+    assert {flow.name: flow.weight for flow in load.parse_mix("market_list=3,login")} == {"login": 1, "market_list": 3}
+    with pytest.raises(SystemExit):
+        load.parse_mix("unknown=1")
+
+def test_same_seed_replays_same_requests():
+    flows = load.parse_mix(None)
+    first, _ = _run_worker(flows, seed=7)
+    second, _ = _run_worker(flows, seed=7)
+    other, _ = _run_worker(flows, seed=8)
+
+    count = min(len(first), len(second), len(other), 200)
+    assert count >= 100
+    assert first[:count] == second[:count]
+    assert first[:count] != other[:count]
+
+def test_weighted_mix_ratio():
+    flows = load.parse_mix("market_list=3,health_score=1")
+    _, recorder = _run_worker(flows, seed=1, seconds=0.2)
+
+    counts = Counter({name: len(samples) for name, samples in recorder.latencies.items()})
+    assert set(counts) == {"market_list", "health_score"}
+    assert 2.4 < counts["market_list"] / counts["health_score"] < 3.6
+    assert recorder.report(1.0)["total"]["error_rate"] == 0.0
+
+def test_recorder_percentiles():
+    recorder = load.Recorder()
+    for ms in range(1, 101):
+        recorder.record("market_list", ms / 1000, "200", False)
+    recorder.record("login", 0.5, "ConnectionError", True)
+
+    report = recorder.report(2.0)
+    stats = report["routes"]["market_list"]
+    assert (stats["p50_ms"], stats["p95_ms"], stats["p99_ms"], stats["max_ms"]) == (50.0, 95.0, 99.0, 100.0)
+    assert stats["throughput_rps"] == 50.0
+    assert report["routes"]["login"]["statuses"] == {"ConnectionError": 1}
+    assert report["total"]["requests"] == 101
+    assert report["total"]["error_rate"] == round(1 / 101, 4)
+
+def test_in_process_run_reports_every_flow(tmp_path):
+    output = tmp_path / "load.json"
+    env = dict(os.environ)
+    env.pop("DATABASE_URL", None)
+    subprocess.run([sys.executable, os.path.join(BENCH_DIR, "load.py"), "--duration", "1", "--warmup", "0",
+                    "--concurrency", "2", "--bcrypt-rounds", "4", "--output", str(output)],
+                   check=True, capture_output=True, env=env, timeout=120)
+
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert set(report["routes"]) <= {flow.name for flow in load.parse_mix(None)}
+    assert report["total"]["requests"] > 0
+    assert report["total"]["error_rate"] == 0.0
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+메트릭 레지스트리 테스트
+METRICS_DIR 모드에서 fork 된 워커 프로세스들의 카운터/히스토그램은 합산되고 게이지는 mode별(sum/max)로 집계되며,
+종료된 워커의 게이지만 제외되는지, 요청 훅이 상태 코드와 error 본문을 구분해 기록하는지 확인
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from flask import jsonify
+
+from app import create_app
+from config import Config
+from services import metrics
+from services.metrics import MetricsRegistry
+
+def _registry(directory):
+    registry = MetricsRegistry()
+    registry.configure(str(directory))
+    return registry, (
+        registry.counter('test_requests_total', '요청 수', ('worker',)),
+        registry.gauge('test_queue_depth', '대기열', mode='sum'),
+        registry.gauge('test_rows', '행 수', mode='max'),
+        registry.histogram('test_seconds', '시간', buckets=(0.1, 1.0)),
+    )
+
+def _in_child(func) -> int:
+    pid = os.fork()
+    if pid == 0:
+        try:
+            func()
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+    return pid
+
+def _samples(text):
+    return dict(line.rsplit(' ', 1) for line in text.splitlines() if not line.startswith('#'))
+
+def test_worker_values_are_aggregated(tmp_path):
+    registry, (requests, queue, rows, seconds) = _registry(tmp_path)
+    requests.inc(worker='a')
+    queue.inc(2)
+    rows.set(100)
+    seconds.observe(0.05)
+
+    def worker():
+        requests.inc(3, worker='a')
+        requests.inc(worker='b')
+        queue.inc(5)
+        rows.set(80)
+        seconds.observe(0.5)
+        seconds.observe(5)
+
+    child = _in_child(worker)
+    assert os.path.exists(tmp_path / f'counters_{child}.db')
+
+    samples = _samples(registry.render())
+    assert samples['test_requests_total{worker="a"}'] == '4.0'
+    assert samples['test_requests_total{worker="b"}'] == '1.0'
+    assert samples['test_queue_depth'] == '7.0'
+    assert samples['test_rows'] == '100.0'
+    assert samples['test_seconds_bucket{le="0.1"}'] == '1.0'
+    assert samples['test_seconds_bucket{le="1.0"}'] == '2.0'
+    assert samples['test_seconds_bucket{le="+Inf"}'] == '3.0'
+    assert samples['test_seconds_count'] == '3.0'
+    assert samples['test_seconds_sum'] == '5.55'
+
+    # 종료된 워커: 게이지는 제외, 카운터 합계는 유지
+    metrics.mark_process_dead(child, str(tmp_path))
+    samples = _samples(registry.render())
+    assert samples['test_queue_depth'] == '2.0'
+    assert samples['test_requests_total{worker="a"}'] == '4.0'
+
+def test_mmap_store_grows_and_reopens(tmp_path):
+    registry, (requests, *_) = _registry(tmp_path)
+    for worker in range(3000):
+        requests.inc(worker=f'worker-{worker:05d}')
+
+    reopened, _ = _registry(tmp_path)
+    samples = _samples(reopened.render())
+    assert len([key for key in samples if key.startswith('test_requests_total')]) == 3000
+    assert samples['test_requests_total{worker="worker-02999"}'] == '1.0'
+
+def test_request_hooks_record_status_and_error_payload(tmp_path):
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'metrics.db'}"
+        RESULT_CACHE_ENABLED = False
+        METRICS_DIR = str(tmp_path / "metrics")
+        ADMIN_TOKEN = "token"
+
+    app = create_app(TestConfig, components=["admin"])
+    app.add_url_rule("/test/ok", "test_ok", view_func=lambda: jsonify({"success": True}))
+    app.add_url_rule("/test/error-body", "test_error_body", view_func=lambda: jsonify({"data": {"error": "데이터 없음"}}))
+    client = app.test_client()
+    client.get("/test/ok")
+    client.get("/test/error-body")
+    client.get("/test/missing")
+
+    text = client.get("/api/v1/admin/metrics", headers={"X-Admin-Token": "token"}).get_data(as_text=True)
+    samples = _samples(text)
+    assert samples['sodam_http_requests_total{endpoint="/test/ok",method="GET",status="200"}'] == '1.0'
+    assert samples['sodam_http_request_errors_total{endpoint="/test/error-body",kind="error_payload"}'] == '1.0'
+    assert samples['sodam_http_request_errors_total{endpoint="unmatched",kind="status"}'] == '1.0'
+    assert not any(key.startswith('sodam_http_request_errors_total{endpoint="/test/ok"') for key in samples)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+비밀번호 해싱 풀 과부하 테스트
+대기열 초과, 시간 초과, 풀 프로세스 종료가 모두 HashingBusyError(503 + Retry-After)로 바뀌고,
+시간 초과로 포기한 작업이 끝날 때까지 대기열 자리를 차지하는지 확인
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import threading
+import time
+
+import pytest
+
+from app import create_app
+from config import Config
+from extensions import db
+from services import password_hashing
+from services.password_hashing import HashingBusyError
+
+@pytest.fixture
+def pool(monkeypatch):
+    """스레드 풀 1개, 대기열 없음"""
+    monkeypatch.setattr(password_hashing, "_settings", dict(
+        password_hashing._settings, mode="thread", pool_size=1, queue_limit=0, admission_timeout=0.01, timeout=0.05))
+    monkeypatch.setattr(password_hashing, "_admission", threading.BoundedSemaphore(1))
+    monkeypatch.setattr(password_hashing, "_pool", None)
+    yield password_hashing._settings
+    if password_hashing._pool is not None:
+        password_hashing._pool.shutdown(wait=True)
+
+def test_timeout_is_busy_and_keeps_slot_until_done(pool):
+    release = threading.Event()
+    with pytest.raises(HashingBusyError):
+        password_hashing._run('hash', release.wait)
+
+    # 포기한 작업이 아직 실행 중이므로 새 요청은 대기열 한도에 걸림
+    with pytest.raises(HashingBusyError):
+        password_hashing._run('hash', lambda: True)
+
+    release.set()
+    deadline = time.time() + 2
+    while time.time() < deadline:
+        try:
+            assert password_hashing._run('hash', lambda: True)
+            break
+        except HashingBusyError:
+            time.sleep(0.01)
+    else:
+        pytest.fail("작업이 끝난 뒤에도 대기열 자리가 반환되지 않음")
+
+def test_broken_process_pool_is_busy_and_recreated(pool):
+    pool.update(mode="process", timeout=30)
+    with pytest.raises(HashingBusyError):
+        password_hashing._run('hash', os._exit, 1)
+    assert password_hashing._pool is None
+    assert password_hashing.check_password(password_hashing._run('hash', password_hashing._hash, b"pw", 4).decode(), "pw")
+
+def test_register_returns_503_with_retry_after(pool, tmp_path):
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'auth.db'}"
+        RESULT_CACHE_ENABLED = False
+
+    app = create_app(TestConfig, components=["auth"])
+    # create_app이 BCRYPT_* 설정으로 바꾼 풀 설정을 다시 지정
+    pool.update(mode="thread", admission_timeout=0.01)
+    password_hashing._admission = threading.BoundedSemaphore(1)
+    with app.app_context():
+        db.create_all(bind_key=None)
+
+    assert password_hashing._admission.acquire(blocking=False)
+    try:
+        response = app.test_client().post("/api/v1/sodam/auth/register", json={
+            "username": "daejeon_user", "email": "user@daejeon.kr", "password": "password123", "name": "홍길동"})
+    finally:
+        password_hashing._admission.release()
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+지원 정책 카탈로그 테스트
+정규화된 대상 테이블 조회 결과가 기존 목록 필터(_is_policy_relevant)와 같은지,
+조건 조회가 대상 인덱스를 사용하는지(EXPLAIN QUERY PLAN), 신청 기간이 없는 정책도 추천하는지 확인
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import itertools
+import random
+
+import pytest
+from sqlalchemy import event
+
+from app import create_app
+from config import Config
+from extensions import db
+from services import policy_catalog
+from services.support_tools_service import SupportToolsService
+
+REGIONS = ["대전광역시", "대전광역시 유성구", "대전광역시 동구", "대전광역시 서구"]
+BUSINESS_TYPES = ["식음료업", "의류업", "생활용품", "전자제품", "화장품"]
+USER_TYPES = ["ENTREPRENEUR", "PRE_ENTREPRENEUR"]
+STAGES = ["PLANNING", "STARTUP", "GROWTH"]
+
+def _synthetic_policies(count):
+    rng = random.Random(7)
+    return [
+        {
+            "id": f"bench_{index:05d}", "name": f"지원사업 {index}", "region": rng.choice(REGIONS),
+            "organization": "대전광역시청", "support_amount": "최대 100만원", "support_type": "자금지원",
+            "target_business": rng.sample(BUSINESS_TYPES, rng.randint(1, 3)),
+            "target_stage": rng.sample(STAGES, rng.randint(1, 2)),
+            "target_user": rng.sample(USER_TYPES, rng.randint(1, 2)),
+            "application_period": "2024-01-01 ~ 2024-12-31", "priority": rng.randint(0, 100),
+            "description": "", "requirements": [], "contact": "042-000-0000"
+        }
+        for index in range(count)
+    ]
+
+@pytest.fixture
+def app(tmp_path):
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'policies.db'}"
+        RESULT_CACHE_ENABLED = False
+
+    app = create_app(TestConfig, components=["support_tools"])
+    with app.app_context():
+        db.create_all(bind_key=None)
+    return app
+
+def _profile(region, business_type, user_type, stage):
+    return {"preferredAreas": [region], "interestedBusinessTypes": [business_type],
+            "userType": user_type, "businessStage": stage}
+
+def test_catalog_matches_list_filter(app):
+    service = SupportToolsService()
+    service.policies = service.policies + _synthetic_policies(500)
+    # 부분 문자열 비교와 단어 단위 비교가 같은 결과를 내는 지역 (시/구 이름 단위)
+    regions = ["대전광역시", "유성구", "동구", "대전광역시 유성구", "서울특별시"]
+
+    with app.test_request_context():
+        for region, business_type, user_type, stage in itertools.product(regions, BUSINESS_TYPES, USER_TYPES, STAGES):
+            expected = sorted(
+                (policy for policy in service.policies
+                 if service._is_policy_relevant(policy, region, business_type, user_type, stage)),
+                key=lambda x: x["priority"], reverse=True
+            )
+            actual = service._find_policies(region, business_type, user_type, stage)
+            assert [policy["id"] for policy in actual] == [policy["id"] for policy in expected]
+            assert service._policy_details(actual[:10]) == expected[:10]
+
+        result = service.get_policy_recommendations(_profile("대전광역시", "식음료업", "ENTREPRENEUR", "STARTUP"))
+        builtin = next(policy for policy in result["recommended_policies"] if policy["id"] == "policy_001")
+        assert builtin == next(policy for policy in SupportToolsService().policies if policy["id"] == "policy_001")
+
+def test_sync_updates_targets(app):
+    with app.app_context():
+        policy = dict(SupportToolsService().policies[0])
+        policy_catalog.sync([policy])
+        assert policy_catalog.find("대전광역시", "의류업", "ENTREPRENEUR", "PLANNING")
+
+        policy_catalog.sync([dict(policy, target_business=["식음료업"], region="대전광역시 중구")])
+        assert not policy_catalog.find("대전광역시", "의류업", "ENTREPRENEUR", "PLANNING")
+        assert [item["id"] for item in policy_catalog.find("중구", "식음료업", "ENTREPRENEUR", "PLANNING")] == [policy["id"]]
+
+        policy_catalog.sync([], replace=True)
+        assert not policy_catalog.find("중구", "식음료업", "ENTREPRENEUR", "PLANNING")
+
+def test_find_uses_target_index(app):
+    with app.app_context():
+        policy_catalog.sync(_synthetic_policies(200))
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append((statement, parameters))
+
+        event.listen(db.engine, "before_cursor_execute", capture)
+        try:
+            policy_catalog.find("유성구", "식음료업", "ENTREPRENEUR", "STARTUP")
+        finally:
+            event.remove(db.engine, "before_cursor_execute", capture)
+
+        # 조건 필터는 차원마다 대상 인덱스만 읽음 (정책/대상 테이블 전체 스캔 없음)
+        assert len(statements) == 1
+        connection = db.session.connection().connection.driver_connection
+        plan = " | ".join(row[-1] for row in connection.execute(f"EXPLAIN QUERY PLAN {statements[0][0]}", statements[0][1]))
+        assert plan.count("USING COVERING INDEX ix_policy_target_lookup (dimension=? AND value=?") == 4, plan
+        assert "SCAN policy_support" not in plan and "SCAN policy_target" not in plan, plan
+
+def test_policies_without_application_period(app):
+    policy = dict(_synthetic_policies(1)[0], region="대전광역시", target_business=["식음료업"],
+                  target_stage=["STARTUP"], target_user=["ENTREPRENEUR"], priority=1000)
+    del policy["application_period"]
+
+    with app.test_request_context():
+        policy_catalog.sync([policy])
+        result = SupportToolsService().get_policy_recommendations(
+            _profile("대전광역시", "식음료업", "ENTREPRENEUR", "STARTUP"))
+        assert "error" not in result
+        assert result["recommended_policies"][0]["id"] == policy["id"]
+        assert result["recommended_policies"][0]["application_period"] is None
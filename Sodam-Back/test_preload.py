@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+pre-fork 데이터셋 사전 로드 테스트
+PRELOAD_DATASETS면 create_app(마스터)에서 데이터셋/인덱스와 지연 서비스를 모두 만들어 두고,
+fork 된 워커는 CSV를 다시 읽지 않고 같은 캐시로 응답하는지 확인
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+import pytest
+
+from app import create_app
+from config import Config
+from services.data_loader import DataLoader
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks", "fixtures")
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'preload.db'}"
+        RESULT_CACHE_ENABLED = False
+        PRELOAD_DATASETS = True
+
+    monkeypatch.setenv("SODAM_DATA_DIR", FIXTURES)
+    DataLoader().clear_cache()
+    yield create_app(TestConfig, components=["scoring"])
+    DataLoader().clear_cache()
+
+def test_preload_builds_shared_cache_and_services(app):
+    from blueprints import scoring
+
+    cache = DataLoader()._cache
+    assert {'market_index', 'tourism_index', 'industry_index', 'regional_index', 'dataset_version'} <= set(cache)
+    assert DataLoader()._cache is cache  # 모든 인스턴스가 같은 프로세스 캐시 사용
+    assert "not loaded" not in repr(scoring.scoring_service)
+
+def test_forked_worker_reuses_preloaded_data(app):
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            # 워커에서 CSV를 다시 읽으면 실패하도록 막음
+            pd.read_csv = None
+            response = app.test_client().post("/api/v1/scoring/calculate", json={
+                "market_code": "DJ001", "industry": "식음료업", "region": "유성구"})
+            market = DataLoader().get_market_by_code("DJ001")
+            os.write(write, f"{response.status_code} {market['market_code']}".encode())
+        finally:
+            os._exit(0)
+    os.close(write)
+    os.waitpid(pid, 0)
+    with os.fdopen(read) as f:
+        assert f.read() == "200 DJ001"
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+온디맨드 프로파일링 트리거 인증 테스트
+X-Profile 서명이 만료 시각/메서드/경로를 함께 서명하고, 만료되거나 재사용된 서명과
+기본 SECRET_KEY에서의 서명 방식은 거부되는지 확인
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import time
+
+import pytest
+
+from app import create_app
+from config import Config
+from services import profiling
+from services.profiling import profile_signature
+
+SECRET = "profiling-test-secret"
+
+def _client(tmp_path, secret_key=SECRET):
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'profiling.db'}"
+        RESULT_CACHE_ENABLED = False
+        PROFILING_ENABLED = True
+        PROFILE_DIR = str(tmp_path / "profiles")
+        SECRET_KEY = secret_key
+
+    app = create_app(TestConfig, components=["admin"])
+    app.add_url_rule("/test/ping", view_func=lambda: "pong")
+    return app.test_client()
+
+@pytest.fixture(autouse=True)
+def used_signatures(monkeypatch):
+    monkeypatch.setattr(profiling, "_used_signatures", {})
+
+def _profiled(client, header):
+    return "X-Profile-Id" in client.get("/test/ping", headers={"X-Profile": header}).headers
+
+def test_signature_is_single_use(tmp_path):
+    client = _client(tmp_path)
+    header = profile_signature(SECRET, "/test/ping")
+    assert _profiled(client, header)
+    assert not _profiled(client, header)
+    assert os.listdir(tmp_path / "profiles")
+
+def test_rejects_stale_forged_or_far_future_signatures(tmp_path):
+    client = _client(tmp_path)
+    now = int(time.time())
+    assert not _profiled(client, profile_signature(SECRET, "/test/ping", expires=now - 1))
+    assert not _profiled(client, profile_signature(SECRET, "/test/ping", expires=now + 3600))
+    assert not _profiled(client, profile_signature(SECRET, "/other/path"))
+    assert not _profiled(client, profile_signature(SECRET, "/test/ping", method="POST"))
+    assert not _profiled(client, profile_signature("wrong-secret", "/test/ping"))
+    assert not _profiled(client, "1")
+
+def test_default_secret_key_disables_signatures(tmp_path):
+    client = _client(tmp_path, secret_key=profiling.DEFAULT_SECRET_KEY)
+    assert not _profiled(client, profile_signature(profiling.DEFAULT_SECRET_KEY, "/test/ping"))
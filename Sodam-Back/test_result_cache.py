@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+서비스 결과 캐시 테스트
+캐시를 켠 상태에서 DB 집계/사업체 데이터가 바뀌면 캐시 키의 데이터 버전이 바뀌어
+프로세스 캐시와 워커 공유 캐시 모두 새로 계산한 결과를 반환하는지 확인
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from datetime import date
+
+import pytest
+from sqlalchemy import insert
+
+from app import create_app
+from config import Config
+from extensions import db
+from models import BusinessData, CommercialArea, FootTrafficData
+from services import result_cache, rollups, shared_cache
+from services.core_diagnosis_service import CoreDiagnosisService
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'cache.db'}"
+        RESULT_CACHE_ENABLED = True
+        SHARED_CACHE_PATH = str(tmp_path / "results.db")
+        COMPETITION_VERSION_CHECK = 0
+        SURVIVAL_VERSION_CHECK = 0
+
+    # 전역 캐시 설정/공유 캐시는 테스트가 끝나면 원래대로
+    monkeypatch.setattr(result_cache, "_settings", dict(result_cache._settings))
+    monkeypatch.setattr(shared_cache, "store", None)
+
+    app = create_app(TestConfig, components=["core_diagnosis"])
+    with app.app_context():
+        db.create_all(bind_key=None)
+        db.session.add(CommercialArea(id=1, area_code="DJ001", area_name="동구 전통시장", address="대전 동구",
+                                      latitude=36.306, longitude=127.456))
+        db.session.commit()
+        yield app
+        result_cache.clear_all()
+
+def _traffic(day, count):
+    return FootTrafficData(area_id=1, date=day, day_of_week=day.weekday(), hour=12, foot_traffic_count=count)
+
+def test_orm_rollup_update_refreshes_cached_indicator(app):
+    db.session.add_all([_traffic(date(2024, 1, 1), 1000), _traffic(date(2024, 2, 1), 2400)])
+    db.session.commit()
+
+    service = CoreDiagnosisService()
+    assert service.get_foot_traffic_analysis("DJ001")["current_monthly_traffic"] == 2400
+    assert service.get_foot_traffic_analysis("DJ001")["current_monthly_traffic"] == 2400
+
+    # 같은 프로세스의 ORM 추가는 커밋 직후 집계 버전을 다시 읽음 (확인 주기를 기다리지 않음)
+    db.session.add(_traffic(date(2024, 2, 2), 600))
+    db.session.commit()
+    assert service.get_foot_traffic_analysis("DJ001")["current_monthly_traffic"] == 3000
+
+def test_other_process_writes_change_cache_key(app, monkeypatch):
+    monkeypatch.setitem(result_cache._settings, "version_check", 0)
+    db.session.add_all([_traffic(date(2024, 1, 1), 1000), _traffic(date(2024, 2, 1), 2400)])
+    db.session.commit()
+
+    service = CoreDiagnosisService()
+    assert service.get_foot_traffic_analysis("DJ001")["current_monthly_traffic"] == 2400
+
+    # 다른 워커/CLI의 Core 일괄 적재 (이 프로세스의 세션 이벤트를 거치지 않음)
+    row = {"area_id": 1, "date": date(2024, 2, 3), "day_of_week": 5, "hour": 9, "foot_traffic_count": 100}
+    db.session.execute(insert(FootTrafficData.__table__), [row])
+    rollups.apply_foot_traffic(db.session.connection(), [row])
+    db.session.commit()
+    assert service.get_foot_traffic_analysis("DJ001")["current_monthly_traffic"] == 2500
+
+    # 프로세스 캐시를 비워도 공유 캐시의 이전 버전 결과는 쓰이지 않음
+    for cache in result_cache._caches.values():
+        cache.clear()
+    assert service.get_foot_traffic_analysis("DJ001")["current_monthly_traffic"] == 2500
+
+    before = service.get_business_rates_analysis("DJ001")
+    assert "source" not in before
+    db.session.execute(insert(BusinessData.__table__), [
+        {"area_id": 1, "business_type": "식음료업", "business_name": "가게", "address": "대전", "latitude": 36.3,
+         "longitude": 127.4, "status": "active", "opened_date": date(2022, 1, 1)},
+        {"area_id": 1, "business_type": "식음료업", "business_name": "가게", "address": "대전", "latitude": 36.3,
+         "longitude": 127.4, "status": "new", "opened_date": date(2024, 1, 1)},
+    ])
+    db.session.commit()
+    assert service.get_business_rates_analysis("DJ001")["source"] == "business_data"
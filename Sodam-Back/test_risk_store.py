@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+리스크 분류 저장소 테스트
+같은 데이터 버전에서는 저장된 결과로 응답하고, 버전이 바뀌면 재분류하는지,
+지역구 일괄 조회가 저장된 결과를 돌려주는지 확인 (상권 CSV 조회와 건강 점수는 고정값으로 대체)
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from datetime import date
+
+import pytest
+from sqlalchemy import insert
+
+from app import create_app
+from config import Config
+from extensions import db
+from models import BusinessData, CommercialArea, FootTrafficData, RiskAnalysis
+from services import risk_store, rollups
+from services.risk_analysis_service import RiskAnalysisService
+
+MARKETS = {
+    "10000": {"market_code": "10000", "market_name": "대전역", "city_name": "대전광역시", "district_name": "동구",
+              "coordinates": [{"lng": 127.43, "lat": 36.33}, {"lng": 127.44, "lat": 36.34}]},
+    "20000": {"market_code": "20000", "market_name": "유성온천역", "city_name": "대전광역시", "district_name": "유성구",
+              "coordinates": [{"lng": 127.34, "lat": 36.35}]},
+    "20001": {"market_code": "20001", "market_name": "봉명동", "city_name": "대전광역시", "district_name": "유성구",
+              "coordinates": []},
+}
+
+DATA_VERSION = risk_store.data_version
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'risk.db'}"
+        RESULT_CACHE_ENABLED = False
+
+    monkeypatch.setattr(risk_store, "_market_info", MARKETS.get)
+    monkeypatch.setattr(risk_store, "_health_score", lambda market_code, industry: 70.0)
+    monkeypatch.setattr(risk_store, "data_version", lambda: "1.v1")
+
+    app = create_app(TestConfig, components=["risk_classification"])
+    with app.app_context():
+        db.create_all(bind_key=None)
+    return app
+
+@pytest.fixture
+def classify_calls(monkeypatch):
+    calls = []
+    original = RiskAnalysisService._classify
+
+    def counting(self, market_code, industry=None):
+        calls.append((market_code, industry))
+        return original(self, market_code, industry)
+
+    monkeypatch.setattr(RiskAnalysisService, "_classify", counting)
+    return calls
+
+def test_fresh_rows_are_served_from_store(app, classify_calls):
+    with app.test_request_context():
+        first = RiskAnalysisService().classify_risk_type("10000", "식음료업")
+        second = RiskAnalysisService().classify_risk_type("10000", "식음료업")
+
+        assert classify_calls == [("10000", "식음료업")]
+        assert first == second
+        assert second["health_score"] == 70.0 and second["stale"] is False
+
+        row = db.session.execute(db.select(RiskAnalysis)).scalar_one()
+        area = db.session.get(CommercialArea, row.area_id)
+        assert (area.area_code, area.area_name, row.district) == ("10000", "대전역", "동구")
+        assert row.risk_type == first["primary_risk_type"]
+
+def test_version_change_reclassifies(app, classify_calls, monkeypatch):
+    with app.test_request_context():
+        RiskAnalysisService().classify_risk_type("20000")
+        RiskAnalysisService().classify_risk_type("20001")
+
+    monkeypatch.setattr(risk_store, "data_version", lambda: "1.v2")
+    with app.test_request_context():
+        assert risk_store.district_risk_types("유성구")["stale_count"] == 2
+        # 조회 시 stale 행 재분류
+        assert RiskAnalysisService().classify_risk_type("20000")["data_version"] == "1.v2"
+        # 나머지는 백그라운드 갱신과 같은 경로로 재분류
+        assert risk_store.refresh_stale(limit=10) == 1
+        assert len(classify_calls) == 4
+        assert risk_store.district_risk_types("유성구")["stale_count"] == 0
+
+def test_district_endpoint(app):
+    with app.test_request_context():
+        for market_code in MARKETS:
+            RiskAnalysisService().classify_risk_type(market_code, "식음료업")
+
+    client = app.test_client()
+    data = client.get("/api/v1/risk-classification/districts/유성구/risk-types?industry=식음료업").get_json()["data"]
+    assert data["count"] == 2
+    assert {market["market_code"] for market in data["markets"]} == {"20000", "20001"}
+    assert all(market["risk_type"] and market["health_score"] == 70.0 for market in data["markets"])
+
+    # 업종 미지정 분류는 따로 저장되므로 아직 없음
+    data = client.get("/api/v1/risk-classification/districts/유성구/risk-types").get_json()["data"]
+    assert data["count"] == 0
+
+def test_data_version_tracks_rollups_and_business_data(app):
+    with app.app_context():
+        db.session.add(CommercialArea(id=1, area_code="10000", area_name="대전역", address="대전 동구",
+                                      latitude=36.33, longitude=127.43))
+        db.session.commit()
+        versions = [DATA_VERSION()]
+
+        row = {"area_id": 1, "date": date(2024, 1, 1), "day_of_week": 0, "hour": 9, "foot_traffic_count": 100}
+        db.session.execute(insert(FootTrafficData.__table__), [row])
+        rollups.apply_foot_traffic(db.session.connection(), [row])
+        db.session.commit()
+        versions.append(DATA_VERSION())
+
+        db.session.execute(insert(BusinessData.__table__), [
+            {"area_id": 1, "business_type": "식음료업", "business_name": "가게", "address": "대전",
+             "latitude": 36.33, "longitude": 127.43, "status": "active"}
+        ])
+        db.session.commit()
+        versions.append(DATA_VERSION())
+
+    assert len(set(versions)) == 3
+    assert all(version.startswith(f"{risk_store.CLASSIFIER_VERSION}.") and len(version) <= 64 for version in versions)
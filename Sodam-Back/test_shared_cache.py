@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+워커 공유 결과 캐시(SQLite) 테스트
+TTL 만료, 용량 초과 시 LRU 삭제, 재시작(새 인스턴스) 후 유지, 오류와 이전 코드가 저장한 값을 미스로 처리하는지 확인
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import types
+
+import pytest
+
+from services import shared_cache
+from services.shared_cache import MISSING, SharedResultCache
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(shared_cache, "time", types.SimpleNamespace(time=clock.time))
+    return clock
+
+def test_entries_expire_after_ttl(tmp_path, clock):
+    cache = SharedResultCache(str(tmp_path / "results.db"), max_bytes=1 << 20, ttl=60)
+    cache.set("a", "test", {"value": 1})
+    clock.now += 59
+    assert cache.get("a") == {"value": 1}
+    clock.now += 1
+    assert cache.get("a") is MISSING
+    assert cache.stats()["entries"] == 0
+
+def test_evicts_least_recently_accessed(tmp_path, clock):
+    value = "x" * 1000
+    cache = SharedResultCache(str(tmp_path / "results.db"), max_bytes=3500, ttl=3600)
+    for key in ("a", "b", "c"):
+        cache.set(key, "test", value)
+        clock.now += 60
+
+    # 조회 시각 갱신 간격이 지난 뒤 조회한 a는 최근 사용으로 바뀜
+    assert cache.get("a") == value
+    clock.now += 60
+    cache.set("d", "test", value)
+    cache.evict()
+
+    assert cache.get("b") is MISSING
+    assert all(cache.get(key) == value for key in ("a", "c", "d"))
+    assert cache.stats()["bytes"] <= 3500
+
+def test_survives_restart_and_treats_errors_as_miss(tmp_path, clock):
+    path = str(tmp_path / "results.db")
+    SharedResultCache(path, max_bytes=1 << 20, ttl=3600).set("a", "test", [1, 2, 3])
+
+    cache = SharedResultCache(path, max_bytes=1 << 20, ttl=3600)
+    assert cache.get("a") == [1, 2, 3]
+
+    # 직렬화할 수 없는 값은 저장하지 않고, 깨진 값은 미스로 처리
+    cache.set("b", "test", lambda: None)
+    assert cache.get("b") is MISSING
+    cache._connection().execute("UPDATE result_cache SET value = ? WHERE key = 'a'", (b"broken",))
+    assert cache.get("a") is MISSING
+
+@pytest.mark.parametrize("payload", [
+    b"cno_such_module_for_cache\nResult\n.",  # 삭제/이동된 모듈 (ModuleNotFoundError)
+    b"cservices.shared_cache\nRenamedResult\n.",  # 이름이 바뀐 클래스 (AttributeError)
+    b"cservices.shared_cache\nSharedResultCache\n(tR.",  # 생성자 인자가 바뀐 클래스 (TypeError)
+])
+def test_stale_pickles_are_dropped(tmp_path, clock, payload):
+    cache = SharedResultCache(str(tmp_path / "results.db"), max_bytes=1 << 20, ttl=3600)
+    cache.set("a", "test", {"value": 1})
+    cache._connection().execute("UPDATE result_cache SET value = ? WHERE key = 'a'", (payload,))
+
+    assert cache.get("a") is MISSING
+    assert cache.stats()["entries"] == 0
+    cache.set("a", "test", {"value": 2})
+    assert cache.get("a") == {"value": 2}
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+single-flight 결과 캐시 테스트
+동시에 들어온 같은 계산의 합치기, XFetch 조기 갱신과 갱신 중 기존 값 반환,
+데이터 갱신 명령(flask cache clear, flask rollups backfill)의 캐시 비우기를 확인
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import threading
+import time
+
+import pytest
+
+from app import create_app
+from config import Config
+from extensions import db
+from services import result_cache, shared_cache
+from services.result_cache import SingleFlightCache, _Entry, single_flight
+
+@pytest.fixture
+def settings(monkeypatch):
+    monkeypatch.setattr(result_cache, "_settings", dict(result_cache._settings, enabled=True, ttl=60.0, beta=1.0))
+    return result_cache._settings
+
+def test_concurrent_calls_compute_once(settings):
+    calls = []
+    started = threading.Event()
+
+    def compute():
+        calls.append(1)
+        started.set()
+        time.sleep(0.1)
+        return {"value": len(calls)}
+
+    cache = SingleFlightCache("test.coalesce")
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute("key", compute))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert results == [{"value": 1}] * 8
+
+def test_xfetch_refreshes_early_and_serves_stale_meanwhile(settings, monkeypatch):
+    cache = SingleFlightCache("test.xfetch")
+    now = time.monotonic()
+    # 만료까지 10초, 계산 시간 1초
+    cache._store("key", _Entry("old", 1.0, now + 10))
+
+    # -ln(1 - r)이 작으면 만료 전에는 갱신하지 않음
+    monkeypatch.setattr(result_cache.random, "random", lambda: 0.0)
+    assert cache.get_or_compute("key", lambda: "new") == "old"
+
+    # -ln(1 - r) > 10이면 조기 갱신, 갱신 중인 동안 다른 호출은 기존 값을 바로 받음
+    monkeypatch.setattr(result_cache.random, "random", lambda: 1 - 1e-6)
+    release = threading.Event()
+
+    def slow_refresh():
+        release.wait()
+        return "new"
+
+    leader = threading.Thread(target=cache.get_or_compute, args=("key", slow_refresh))
+    leader.start()
+    deadline = time.time() + 2
+    while "key" not in cache._inflight and time.time() < deadline:
+        time.sleep(0.001)
+    assert cache.get_or_compute("key", lambda: "other") == "old"
+    release.set()
+    leader.join()
+
+    monkeypatch.setattr(result_cache.random, "random", lambda: 0.0)
+    assert cache.get_or_compute("key", lambda: "other") == "new"
+
+def test_errors_are_not_cached_and_results_are_copies(settings):
+    calls = []
+
+    class Service:
+        @single_flight("test.service")
+        def compute(self, code, fail=False):
+            calls.append(code)
+            if fail:
+                return {"error": "실패"}
+            return {"code": code, "items": [1, 2]}
+
+    service = Service()
+    first = service.compute("DJ001")
+    first["items"].append(3)
+    assert service.compute("DJ001") == {"code": "DJ001", "items": [1, 2]}
+    assert service.compute(code="DJ001") == {"code": "DJ001", "items": [1, 2]}
+    service.compute("DJ002", fail=True)
+    service.compute("DJ002", fail=True)
+    assert calls == ["DJ001", "DJ002", "DJ002"]
+
+def test_refresh_commands_clear_caches(tmp_path, monkeypatch):
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'commands.db'}"
+        RESULT_CACHE_ENABLED = True
+        SHARED_CACHE_PATH = str(tmp_path / "results.db")
+
+    monkeypatch.setattr(result_cache, "_settings", dict(result_cache._settings))
+    monkeypatch.setattr(shared_cache, "store", None)
+    app = create_app(TestConfig, components=["core_diagnosis"])
+    with app.app_context():
+        db.create_all(bind_key=None)
+    runner = app.test_cli_runner()
+
+    cache = result_cache._caches.setdefault("test.commands", SingleFlightCache("test.commands"))
+    cache.get_or_compute("key", lambda: "value")
+    shared_cache.store.set("test.commands:key", "test.commands", "value")
+
+    result = runner.invoke(args=["cache", "clear"])
+    assert result.exit_code == 0, result.output
+    assert "key" not in cache._entries
+    assert shared_cache.store.get("test.commands:key") is shared_cache.MISSING
+
+    cleared = []
+    monkeypatch.setattr(result_cache, "clear_all", lambda: cleared.append(True))
+    # flask CLI는 앱 컨텍스트 안에서 명령을 실행함
+    with app.app_context():
+        result = runner.invoke(args=["rollups", "backfill"])
+    assert result.exit_code == 0, result.output
+    assert cleared
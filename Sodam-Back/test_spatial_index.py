@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+사업체 위치 공간 인덱스 테스트
+business_data 추가/좌표 수정/삭제가 R*Tree에 반영되는지, 반경/경계 상자 조회 결과와
+조회가 R*Tree 인덱스를 사용하는지(EXPLAIN QUERY PLAN) 확인
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from sqlalchemy import event, insert, text
+
+from app import create_app
+from config import Config
+from extensions import db
+from models import BusinessData, CommercialArea
+from services import spatial_index
+
+CENTER = (36.3504, 127.3845)
+
+@pytest.fixture
+def app(tmp_path):
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'spatial.db'}"
+        RESULT_CACHE_ENABLED = False
+
+    app = create_app(TestConfig, components=["core_diagnosis"])
+    with app.app_context():
+        db.create_all(bind_key=None)
+        db.session.add(CommercialArea(id=1, area_code="DJ001", area_name="둔산동", address="대전",
+                                      latitude=CENTER[0], longitude=CENTER[1]))
+        db.session.commit()
+        yield app
+
+def _business(business_id, lat, lng, business_type="식음료업", status="active"):
+    return {"id": business_id, "area_id": 1, "business_type": business_type, "business_name": f"가게{business_id}",
+            "address": "대전", "latitude": lat, "longitude": lng, "status": status}
+
+def _rtree_ids():
+    return [row[0] for row in db.session.execute(text("SELECT id FROM business_data_rtree ORDER BY id"))]
+
+def test_rtree_follows_business_rows(app):
+    db.session.execute(insert(BusinessData.__table__), [_business(1, 36.3510, 127.3850), _business(2, 36.40, 127.45)])
+    db.session.add(BusinessData(**_business(3, 36.3490, 127.3840)))
+    db.session.commit()
+    assert _rtree_ids() == [1, 2, 3]
+
+    # 좌표 수정
+    db.session.get(BusinessData, 2).latitude = 36.3505
+    db.session.get(BusinessData, 2).longitude = 127.3846
+    db.session.commit()
+    row = db.session.execute(text("SELECT min_lat, min_lng FROM business_data_rtree WHERE id = 2")).one()
+    assert row == pytest.approx((36.3505, 127.3846), abs=1e-5)
+
+    db.session.delete(db.session.get(BusinessData, 1))
+    db.session.commit()
+    assert _rtree_ids() == [2, 3]
+
+def test_radius_and_bbox_queries(app):
+    db.session.execute(insert(BusinessData.__table__), [
+        _business(1, 36.3510, 127.3850),                    # 약 80m
+        _business(2, 36.3530, 127.3845),                    # 약 290m
+        _business(3, 36.3504, 127.3905),                    # 약 540m (경계 상자 안, 반경 밖)
+        _business(4, 36.3506, 127.3846, "소매업"),
+        _business(5, 36.3505, 127.3845, status="closed"),
+        _business(6, 36.4000, 127.4500),
+    ])
+    db.session.commit()
+
+    nearby = spatial_index.within_radius(*CENTER, 500, business_type="식음료업")
+    assert [business["id"] for business in nearby] == [1, 2]
+    assert nearby[0]["distance_m"] < nearby[1]["distance_m"] < 500
+
+    assert spatial_index.count_within_radius(*CENTER, 500, business_type="식음료업") == 2
+    assert spatial_index.count_within_radius(*CENTER, 500, status=None) == 4
+    assert spatial_index.count_within_radius(*CENTER, 600, business_type=["식음료업", "소매업"]) == 4
+
+    box = spatial_index.radius_bbox(*CENTER, 600)
+    inside = spatial_index.within_bbox(box["min_lat"], box["min_lng"], box["max_lat"], box["max_lng"])
+    assert sorted(business["id"] for business in inside) == [1, 2, 3, 4]
+
+def test_radius_query_uses_rtree(app):
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        spatial_index.count_within_radius(*CENTER, 500, business_type="식음료업")
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+
+    connection = db.session.connection().connection.driver_connection
+    statement, parameters = statements[-1]
+    plan = " | ".join(row[-1] for row in connection.execute(f"EXPLAIN QUERY PLAN {statement}", parameters))
+    assert "SCAN business_data_rtree VIRTUAL TABLE INDEX" in plan, plan
+    assert "business_data USING INTEGER PRIMARY KEY" in plan, plan
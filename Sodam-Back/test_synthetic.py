@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+합성 데이터 생성 스크립트(benchmarks/synthetic.py) 테스트
+같은 옵션과 시드로 두 번 생성하면 CSV/JSON과 DB 행이 똑같고 시드가 다르면 달라지는지,
+배수만큼 상권/지역이 늘어나고 DataLoader가 생성된 디렉터리를 그대로 읽는지 확인
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import json
+import subprocess
+
+from sqlalchemy import create_engine, text
+
+from services.data_loader import DataLoader
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks", "synthetic.py")
+FILES = ["market_data.csv", "tourism_consumption.csv", "industry_expenditure.csv", "regional_expenditure.csv", "markets.json"]
+
+def _generate(out, *options):
+    subprocess.run([sys.executable, SCRIPT, "--out", str(out), *options], check=True, capture_output=True, timeout=120)
+    return {name: (out / name).read_bytes() for name in FILES}
+
+def _db_rows(path):
+    """삽입 시각(created_at)을 뺀 행"""
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.connect() as connection:
+        rows = {}
+        for table in ("foot_traffic_data", "sales_data", "foot_traffic_monthly_rollup"):
+            result = connection.execute(text(f"SELECT * FROM {table} ORDER BY 1"))
+            keys = [key for key in result.keys() if key not in ("created_at", "updated_at")]
+            rows[table] = [tuple(row[key] for key in keys) for row in result.mappings()]
+    engine.dispose()
+    return rows
+
+def test_same_seed_is_reproducible(tmp_path):
+    options = ["--scale", "2", "--months", "6", "--days", "2"]
+    first = _generate(tmp_path / "a", *options, "--database-url", f"sqlite:///{tmp_path / 'a.db'}")
+    second = _generate(tmp_path / "b", *options, "--database-url", f"sqlite:///{tmp_path / 'b.db'}")
+    other = _generate(tmp_path / "c", *options, "--seed", "32")
+
+    assert first == second
+    assert first["market_data.csv"] != other["market_data.csv"]
+    assert first["tourism_consumption.csv"] != other["tourism_consumption.csv"]
+
+    rows = _db_rows(tmp_path / "a.db")
+    assert rows == _db_rows(tmp_path / "b.db")
+    assert len(rows["foot_traffic_data"]) == 100 * 2 * 24
+    assert len(rows["sales_data"]) == 100 * 2 * 6
+
+    manifest = json.loads((tmp_path / "a" / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest["rows"]["market_data"] == 100
+    assert manifest["rows"]["foot_traffic_data"] == len(rows["foot_traffic_data"])
+
+def test_scale_grows_markets_and_regions(tmp_path):
+    _generate(tmp_path / "x4", "--scale", "4", "--months", "3")
+    loader = DataLoader(str(tmp_path / "x4"))
+
+    markets = loader.load_market_data()
+    assert len(markets) == 50 * 4
+    assert markets["market_code"].is_unique
+    assert markets["city_name"].nunique() == 2  # ceil(sqrt(4))
+    assert loader.get_market_by_code("DJ001")["district_name"] in set(loader.load_regional_expenditure()["region"])
+
+    tourism = loader.load_tourism_consumption()
+    assert tourism["year_month"].nunique() == 3
+    assert (tourism["consumption_amount"] >= 0).all()
+    assert abs(loader.load_regional_expenditure()["expenditure_ratio"].sum() - 100) < 0.5
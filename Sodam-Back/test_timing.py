@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+요청 단계별 시간 측정(Server-Timing) 테스트
+중첩 단계는 자기 시간만 집계되고, SERVER_TIMING_ENABLED면 응답에 단계별/전체 시간이 붙으며
+꺼져 있으면 헤더와 측정이 모두 없는지 확인
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import re
+import types
+
+import pytest
+from flask import jsonify
+
+from app import create_app
+from config import Config
+from services import timing
+from services.timing import RequestTimings, stage, timed
+
+HEADER = re.compile(r"^[a-z_]+;dur=\d+\.\d{2}(, [a-z_]+;dur=\d+\.\d{2})*$")
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def perf_counter(self):
+        return self.now
+
+@pytest.fixture(autouse=True)
+def restore_enabled(monkeypatch):
+    monkeypatch.setattr(timing, "_enabled", timing._enabled)
+
+def test_nested_stages_record_self_time(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(timing, "time", types.SimpleNamespace(perf_counter=clock.perf_counter))
+    timings = RequestTimings()
+    timings.enter("metric")
+    clock.now = 1.0
+    timings.enter("filter")
+    clock.now = 3.0
+    timings.exit()
+    clock.now = 4.0
+    timings.exit()
+    timings.enter("filter")
+    clock.now = 4.5
+    timings.exit()
+    assert timings.totals == {"metric": 2.0, "filter": 2.5}
+    assert timings.header_value() == "metric;dur=2000.00, filter;dur=2500.00, total;dur=4500.00"
+
+def _app(tmp_path, enabled):
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'timing.db'}"
+        RESULT_CACHE_ENABLED = False
+        SERVER_TIMING_ENABLED = enabled
+
+    app = create_app(TestConfig, components=["admin"])
+
+    @timed("metric")
+    def compute():
+        with stage("filter"):
+            return {"rows": [1, 2, 3]}
+
+    app.add_url_rule("/test/timed", view_func=lambda: jsonify(compute()))
+    return app
+
+def test_server_timing_header(tmp_path):
+    response = _app(tmp_path, True).test_client().get("/test/timed")
+    header = response.headers["Server-Timing"]
+    assert HEADER.match(header), header
+    assert [part.split(";")[0] for part in header.split(", ")] == ["metric", "filter", "json", "total"]
+
+def test_disabled_adds_no_header(tmp_path):
+    response = _app(tmp_path, False).test_client().get("/test/timed")
+    assert response.get_json() == {"rows": [1, 2, 3]}
+    assert "Server-Timing" not in response.headers
+    assert stage("filter") is timing._NULL_STAGE
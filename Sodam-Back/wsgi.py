@@ -1,6 +1,12 @@
-from backend.app import create_app
+"""
+운영 WSGI 진입점 (gunicorn -c gunicorn.conf.py wsgi:app)
+preload_app 설정으로 마스터 프로세스에서 한 번만 import 되며,
+create_app이 데이터셋과 인덱스를 모두 로드한 뒤 워커가 fork 된다.
+"""
+from app import create_app
+from config import ProductionConfig
 
-app = create_app()
+app = create_app(ProductionConfig)
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5001, debug=True)
+    app.run(host="0.0.0.0", port=5001, debug=False)